@@ -4,6 +4,9 @@ ClaimPilot API
 Product-agnostic insurance claims evaluation engine.
 """
 
+import hashlib
+import json
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -30,8 +33,14 @@ from claimpilot.models import Policy
 # Precedent system imports
 from kernel.foundation.chain import Chain
 from kernel.foundation.cell import NULL_HASH
+from kernel.foundation.persistent_chain import (
+    PersistentChain,
+    mark_seed_load_complete,
+    open_seeded_chain,
+)
 from kernel.precedent.precedent_registry import PrecedentRegistry
 from kernel.foundation.judgment import create_judgment_cell
+from kernel.foundation.seed_cache import generator_digest, load_or_generate_seeds
 from claimpilot.precedent.cli import generate_all_insurance_seeds
 
 from api.routes import policies, evaluate, demo, verify, memo, templates
@@ -53,6 +62,27 @@ PRECEDENT_REGISTRY: Optional[PrecedentRegistry] = None
 PRECEDENTS_LOADED = False
 PRECEDENT_COUNT = 0
 
+# Optional WAL directory: persist the seeded chain once, rehydrate on later boots
+# as long as the load completed under the same seed configuration
+PRECEDENT_WAL_DIR = os.getenv("CLAIMPILOT_PRECEDENT_WAL_DIR", "")
+# Optional directory for the generated seed pool cache (see kernel.foundation.seed_cache)
+SEED_CACHE_DIR = os.getenv("CLAIMPILOT_SEED_CACHE_DIR", "")
+
+
+def precedent_seed_config_digest() -> str:
+    """
+    Digest of everything the seeded precedent chain is derived from.
+
+    Stored in the precedent WAL checkpoint once the bulk load finishes; a
+    WAL written by a different seed generator is not reused.
+    """
+    config = {
+        "graph_name": "ClaimPilotPrecedents",
+        "generator": generator_digest(generate_all_insurance_seeds),
+    }
+    encoded = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
 
 def load_precedent_seeds() -> int:
     """
@@ -64,12 +94,34 @@ def load_precedent_seeds() -> int:
     global PRECEDENT_CHAIN, PRECEDENT_REGISTRY, PRECEDENTS_LOADED, PRECEDENT_COUNT
 
     try:
-        # Generate all seed precedents
-        seeds = generate_all_insurance_seeds()
+        warm_chain = None
+        if PRECEDENT_WAL_DIR and PersistentChain.exists(PRECEDENT_WAL_DIR):
+            # A corrupt, interrupted or stale WAL is moved aside and regenerated
+            warm_chain = open_seeded_chain(PRECEDENT_WAL_DIR, precedent_seed_config_digest())
+            if warm_chain is None:
+                print("  [WARN] Precedent WAL unreadable, incomplete or stale; regenerating")
+        if warm_chain is not None:
+            # Warm start: replay the WAL, verifying only the post-checkpoint tail
+            PRECEDENT_CHAIN = warm_chain
+            PRECEDENT_COUNT = len(PRECEDENT_CHAIN) - 1  # exclude Genesis
+            PRECEDENT_REGISTRY = PrecedentRegistry(PRECEDENT_CHAIN)
+            PRECEDENTS_LOADED = True
+            return PRECEDENT_COUNT
+
+        # Generate all seed precedents (or load them from the seed cache)
+        if SEED_CACHE_DIR:
+            seeds = load_or_generate_seeds(generate_all_insurance_seeds, SEED_CACHE_DIR).payloads
+        else:
+            seeds = generate_all_insurance_seeds()
         PRECEDENT_COUNT = len(seeds)
 
         # Create and initialize the chain
-        PRECEDENT_CHAIN = Chain()
+        if PRECEDENT_WAL_DIR:
+            PRECEDENT_CHAIN = PersistentChain(
+                wal_dir=Path(PRECEDENT_WAL_DIR), fsync_policy="manual"
+            )
+        else:
+            PRECEDENT_CHAIN = Chain()
         genesis = PRECEDENT_CHAIN.initialize(
             graph_name="ClaimPilotPrecedents",
             root_namespace="claims_precedents",
@@ -96,6 +148,12 @@ def load_precedent_seeds() -> int:
             PRECEDENT_CHAIN.append(cell)
             prev_hash = cell.cell_id
 
+        if isinstance(PRECEDENT_CHAIN, PersistentChain):
+            # Written only now: a WAL without it is an interrupted load
+            mark_seed_load_complete(
+                PRECEDENT_CHAIN, precedent_seed_config_digest(), len(seeds)
+            )
+
         # Create the registry for queries
         PRECEDENT_REGISTRY = PrecedentRegistry(PRECEDENT_CHAIN)
         PRECEDENTS_LOADED = True
@@ -19,6 +19,7 @@ Endpoints:
 
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
 from typing import Any
 
@@ -38,6 +39,7 @@ from domains.insurance_claims.policy_shifts import (
 )
 from domains.insurance_claims.seed_generator import generate_all_insurance_seeds
 from domains.insurance_claims.domain import create_insurance_domain_registry
+from kernel.foundation.seed_cache import load_or_generate_seeds
 
 
 # ---------------------------------------------------------------------------
@@ -56,7 +58,11 @@ _cache: dict = {}
 
 def _get_seeds():
     if "seeds" not in _cache:
-        _cache["seeds"] = generate_all_insurance_seeds()
+        cache_dir = os.getenv("CLAIMPILOT_SEED_CACHE_DIR", "")
+        if cache_dir:
+            _cache["seeds"] = load_or_generate_seeds(generate_all_insurance_seeds, cache_dir).payloads
+        else:
+            _cache["seeds"] = generate_all_insurance_seeds()
     return _cache["seeds"]
 
 
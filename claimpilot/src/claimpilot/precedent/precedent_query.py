@@ -54,6 +54,7 @@ from kernel.precedent.precedent_registry import (
     PrecedentRegistry,
     PrecedentStatistics,
     AppealStatistics,
+    compute_precedent_statistics,
 )
 
 from .fingerprint_schema import FingerprintSchemaRegistry
@@ -450,7 +451,7 @@ class PrecedentQueryEngine:
 
         # Tier 0.5: Same exclusion codes + same outcome
         if exclusion_codes:
-            tier05_results = self.precedent_registry.find_by_exclusion_codes(
+            tier05_results, tier05_stats = self.precedent_registry.find_with_statistics_by_codes(
                 codes=exclusion_codes,
                 namespace_prefix=self.namespace_prefix,
                 outcome=proposed_outcome,
@@ -466,11 +467,12 @@ class PrecedentQueryEngine:
                     payloads=payloads,
                     proposed_outcome=proposed_outcome,
                     query_params=query_params,
+                    statistics=tier05_stats,
                 )
 
         # Tier 1: Overlapping exclusion codes
         if exclusion_codes:
-            tier1_results = self.precedent_registry.find_by_exclusion_codes(
+            tier1_results, tier1_stats = self.precedent_registry.find_with_statistics_by_codes(
                 codes=exclusion_codes,
                 namespace_prefix=self.namespace_prefix,
                 outcome=None,  # Any outcome
@@ -488,6 +490,7 @@ class PrecedentQueryEngine:
                     proposed_outcome=proposed_outcome,
                     query_params=query_params,
                     overlap_count=max_overlap,
+                    statistics=tier1_stats,
                 )
 
         # No matches at any tier
@@ -512,8 +515,14 @@ class PrecedentQueryEngine:
         proposed_outcome: str,
         query_params: PrecedentQueryParams,
         overlap_count: int = 0,
+        statistics: Optional[PrecedentStatistics] = None,
     ) -> PrecedentQueryResult:
-        """Build a PrecedentQueryResult from payloads."""
+        """
+        Build a PrecedentQueryResult from payloads.
+
+        If the registry already aggregated ``statistics`` for these payloads
+        (find_with_statistics_by_codes), they are reused instead of recomputed.
+        """
         matches: list[PrecedentMatch] = []
 
         for payload in payloads:
@@ -523,8 +532,9 @@ class PrecedentQueryEngine:
         # Sort matches: supporting first, then by match_score descending
         matches.sort(key=lambda m: (m.is_caution, -m.match_score))
 
-        # Compute statistics
-        statistics = self._compute_statistics(payloads)
+        # Compute statistics (unless the registry already did)
+        if statistics is None:
+            statistics = self._compute_statistics(payloads)
 
         # Compute summary
         same_outcome_count = sum(1 for p in payloads if p.outcome_code == proposed_outcome)
@@ -634,40 +644,7 @@ class PrecedentQueryEngine:
         payloads: list[JudgmentPayload],
     ) -> PrecedentStatistics:
         """Compute aggregated statistics from payloads."""
-        if not payloads:
-            return PrecedentStatistics()
-
-        stats = PrecedentStatistics(total_matched=len(payloads))
-
-        for payload in payloads:
-            # Count by outcome
-            outcome = payload.outcome_code
-            stats.by_outcome[outcome] = stats.by_outcome.get(outcome, 0) + 1
-
-            # Count by decision level
-            level = payload.decision_level
-            stats.by_decision_level[level] = stats.by_decision_level.get(level, 0) + 1
-
-            # Appeal statistics
-            if payload.appealed:
-                stats.appeal_stats.total_appealed += 1
-                if payload.appeal_outcome == "upheld":
-                    stats.appeal_stats.upheld += 1
-                elif payload.appeal_outcome == "overturned":
-                    stats.appeal_stats.overturned += 1
-                elif payload.appeal_outcome == "settled":
-                    stats.appeal_stats.settled += 1
-                elif payload.appeal_outcome == "pending":
-                    stats.appeal_stats.pending += 1
-
-            # Track temporal range
-            decided_at = payload.decided_at
-            if stats.most_recent_decided_at is None or decided_at > stats.most_recent_decided_at:
-                stats.most_recent_decided_at = decided_at
-            if stats.oldest_decided_at is None or decided_at < stats.oldest_decided_at:
-                stats.oldest_decided_at = decided_at
-
-        return stats
+        return compute_precedent_statistics(payloads)
 
     def _compute_confidence(
         self,
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark canonical JSON encoding: fast encoder vs the reference encoder."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from kernel.foundation import canon  # noqa: E402
+from kernel.foundation.canon import canonical_json_bytes, cell_to_canonical_dict  # noqa: E402
+from kernel.foundation.cell import (  # noqa: E402
+    HASH_SCHEME_CANONICAL,
+    CellType,
+    DecisionCell,
+    Evidence,
+    Fact,
+    Header,
+    LogicAnchor,
+    Proof,
+    SourceQuality,
+)
+
+
+def judgment_cell(i: int) -> DecisionCell:
+    """A JUDGMENT-shaped cell: the fact object is an embedded JSON payload."""
+    payload = {
+        "precedent_id": f"prec-{i:06d}",
+        "case_id_hash": f"{i:064x}",
+        "jurisdiction_code": "CA-ON",
+        "fingerprint_hash": f"{i * 7:064x}",
+        "outcome_code": "pay" if i % 3 else "deny",
+        "reason_codes": [f"RC-{j:03d}" for j in range(i % 6)],
+        "anchor_facts": [
+            {"field_id": f"claim.field_{j}", "value": str(j * 100), "label": "Montant réclamé"}
+            for j in range(8)
+        ],
+        "notes": "Adjuster wrote: \"see attached\"\nfollow-up pending",
+    }
+    return DecisionCell(
+        header=Header(
+            version="1.3",
+            graph_id="graph:00000000-0000-4000-8000-000000000000",
+            cell_type=CellType.JUDGMENT,
+            system_time="2026-01-27T11:00:00Z",
+            prev_cell_hash="a" * 64,
+            hash_scheme=HASH_SCHEME_CANONICAL,
+        ),
+        fact=Fact(
+            namespace="claims.precedents",
+            subject=f"precedent:{i}",
+            predicate="judgment",
+            object=json.dumps(payload, sort_keys=True),
+            confidence=0.9,
+            source_quality=SourceQuality.SELF_REPORTED,
+            valid_from="2026-01-27T11:00:00Z",
+        ),
+        logic_anchor=LogicAnchor(rule_id="rule:judgment", rule_logic_hash="b" * 64),
+        evidence=[Evidence(type="document", cid=f"cid-{j}", source="dms") for j in range(i % 4)],
+        proof=Proof(signer_id="system:claims"),
+    )
+
+
+def per_item_us(fn, items, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark canonical JSON encoding")
+    parser.add_argument("--cells", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cells = [judgment_cell(i) for i in range(args.cells)]
+    workloads = {
+        "cell canonical dict": [cell_to_canonical_dict(c) for c in cells],
+        "judgment payload (decoded)": [json.loads(c.fact.object) for c in cells],
+        "short ascii strings": [f"employee:{i}" for i in range(args.cells)],
+    }
+
+    def reference(value):
+        return canon._encode_value(value).encode("utf-8")
+
+    print(f"{'workload':<30}{'reference us':>14}{'fast us':>10}{'speedup':>9}")
+    for name, items in workloads.items():
+        for item in items:
+            assert canonical_json_bytes(item) == reference(item)
+        ref_us = per_item_us(reference, items, args.repeat)
+        fast_us = per_item_us(canonical_json_bytes, items, args.repeat)
+        print(f"{name:<30}{ref_us:>14.2f}{fast_us:>10.2f}{ref_us / fast_us:>8.1f}x")
+
+    ref_us = per_item_us(lambda c: c.compute_cell_id(), cells, args.repeat)
+    print(f"{'compute_cell_id (fast)':<30}{'':>14}{ref_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
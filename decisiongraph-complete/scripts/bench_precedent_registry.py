@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Benchmark PrecedentRegistry vs IndexedPrecedentRegistry query latency by pool size."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from kernel.foundation.cell import HASH_SCHEME_CANONICAL  # noqa: E402
+from kernel.foundation.chain import Chain  # noqa: E402
+from kernel.foundation.judgment import (  # noqa: E402
+    AnchorFact,
+    JudgmentPayload,
+    create_judgment_cell,
+)
+from kernel.precedent.precedent_registry import (  # noqa: E402
+    IndexedPrecedentRegistry,
+    PrecedentRegistry,
+)
+
+CODES = [f"RC-TXN-{i:02d}" for i in range(40)]
+OUTCOMES = ["pay", "deny", "escalate"]
+NAMESPACES = ["banking.aml.txn", "banking.aml.kyc", "banking.aml.general"]
+
+
+def build_chain(size: int, rng: random.Random) -> tuple[Chain, list[str]]:
+    """Build a canonical-scheme chain of ``size`` synthetic JUDGMENT cells."""
+    chain = Chain()
+    genesis = chain.initialize(
+        graph_name="BenchPrecedents",
+        root_namespace="banking",
+        hash_scheme=HASH_SCHEME_CANONICAL,
+    )
+    prev_hash = genesis.cell_id
+    fingerprints = [f"{i:064x}" for i in range(max(1, size // 50))]
+
+    for i in range(size):
+        payload = JudgmentPayload.create(
+            case_id_hash=f"{i:064x}",
+            jurisdiction_code="CA",
+            fingerprint_hash=rng.choice(fingerprints),
+            fingerprint_schema_id="bench:v1",
+            exclusion_codes=rng.sample(CODES, 3),
+            reason_codes=rng.sample(CODES, 2),
+            reason_code_registry_id="bench:v1",
+            outcome_code=rng.choice(OUTCOMES),
+            certainty="high",
+            anchor_facts=[AnchorFact(field_id="bench.i", value=i, label="i")],
+            policy_pack_hash="c" * 64,
+            policy_pack_id="bench",
+            policy_version="1.0",
+            decision_level="adjuster",
+            decided_at="2026-01-15T12:00:00Z",
+            decided_by_role="adjuster",
+        )
+        cell = create_judgment_cell(
+            payload=payload,
+            namespace=rng.choice(NAMESPACES),
+            graph_id=genesis.header.graph_id,
+            prev_cell_hash=prev_hash,
+        )
+        chain.append(cell)
+        prev_hash = cell.cell_id
+    return chain, fingerprints
+
+
+def time_queries(registry: PrecedentRegistry, fingerprints: list[str], repeat: int) -> dict[str, float]:
+    """Return mean latency in ms per query type."""
+    timings: dict[str, float] = {}
+    queries = {
+        "find_by_fingerprint": lambda: registry.find_by_fingerprint(fingerprints[0], "banking"),
+        "find_by_exclusion_codes": lambda: registry.find_by_exclusion_codes(CODES[:3], "banking.aml"),
+        "find_by_reason_codes": lambda: registry.find_by_reason_codes(CODES[3:5], "banking"),
+        "count_by_outcome": lambda: registry.count_by_outcome("banking.aml.txn"),
+    }
+    for name, query in queries.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            query()
+        timings[name] = (time.perf_counter() - start) * 1000 / repeat
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark precedent registry query latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=5, help="Queries per measurement")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'pool':>8}  {'query':<26}{'scan ms':>10}{'indexed ms':>12}{'speedup':>9}")
+    for size in args.sizes:
+        chain, fingerprints = build_chain(size, rng)
+
+        start = time.perf_counter()
+        indexed = IndexedPrecedentRegistry(chain)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        scan_times = time_queries(PrecedentRegistry(chain), fingerprints, args.repeat)
+        indexed_times = time_queries(indexed, fingerprints, args.repeat)
+        for name, scan_ms in scan_times.items():
+            idx_ms = indexed_times[name]
+            speedup = scan_ms / idx_ms if idx_ms else float("inf")
+            print(f"{size:>8}  {name:<26}{scan_ms:>10.2f}{idx_ms:>12.3f}{speedup:>8.1f}x")
+        print(f"{size:>8}  {'(index build)':<26}{'':>10}{build_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""Benchmark Scholar bitemporal lookups: interval index vs full candidate scan."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from kernel.foundation.cell import (  # noqa: E402
+    CellType,
+    DecisionCell,
+    Fact,
+    Header,
+    LogicAnchor,
+    Proof,
+    SourceQuality,
+    compute_rule_logic_hash,
+)
+from kernel.foundation.chain import create_chain  # noqa: E402
+from kernel.foundation.scholar import Scholar, create_scholar  # noqa: E402
+
+NAMESPACE = "corp.hr"
+EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+RULE_HASH = compute_rule_logic_hash("HRIS Export")
+
+
+def ts(second: int) -> str:
+    return (EPOCH + timedelta(seconds=second)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_chain(subjects: int, versions: int, closed: bool):
+    """Every subject gets `versions` salary revisions, interleaved in time."""
+    chain = create_chain(graph_name="Bench", root_namespace="corp", creator="bench", system_time=ts(0))
+    total = subjects * versions
+    for i in range(total):
+        subject = f"employee:{i % subjects}"
+        # With closed histories, each revision is valid until the next one
+        valid_to = ts(i + 1 + subjects) if closed else None
+        chain.append(DecisionCell(
+            header=Header(
+                version="1.3",
+                graph_id=chain.graph_id,
+                cell_type=CellType.FACT,
+                system_time=ts(i + 1),
+                prev_cell_hash=chain.head.cell_id,
+            ),
+            fact=Fact(
+                namespace=NAMESPACE,
+                subject=subject,
+                predicate="has_salary",
+                object=str(100000 + i),
+                confidence=1.0,
+                source_quality=SourceQuality.VERIFIED,
+                valid_from=ts(i + 1),
+                valid_to=valid_to,
+            ),
+            logic_anchor=LogicAnchor(rule_id="source:hris", rule_logic_hash=RULE_HASH),
+            proof=Proof(signer_id="system:hris"),
+        ))
+    return chain, total
+
+
+def scan_namespace(scholar: Scholar, valid_time: str, system_time: str):
+    """The pre-index path: every version in the namespace, then filter."""
+    return [
+        c for c in scholar.index.get_by_namespace(NAMESPACE)
+        if scholar._is_valid_at_time(c, valid_time, system_time)
+    ]
+
+
+def scan_key(scholar: Scholar, subject: str, valid_time: str, system_time: str):
+    return [
+        c for c in scholar.index.get_by_key(NAMESPACE, subject, "has_salary")
+        if scholar._is_valid_at_time(c, valid_time, system_time)
+    ]
+
+
+def per_query_us(fn, queries, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for q in queries:
+            fn(*q)
+        best = min(best, time.perf_counter() - start)
+    return best / len(queries) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Scholar bitemporal queries")
+    parser.add_argument("--subjects", type=int, default=50)
+    parser.add_argument("--versions", type=int, default=400, help="History depth per subject")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'history':<8}{'query':<34}{'scan us':>10}{'index us':>10}{'speedup':>9}")
+    for closed in (True, False):
+        chain, total = build_chain(args.subjects, args.versions, closed)
+        scholar = create_scholar(chain)
+        label = "closed" if closed else "open"
+        now = ts(total + 1)
+
+        def audit_time():
+            return ts(rng.randrange(1, total))
+
+        workloads = {
+            "namespace, point-in-time (now)": (
+                lambda vt, st: scan_namespace(scholar, vt, st),
+                lambda vt, st: scholar.index.query_by_namespace(NAMESPACE, vt, st),
+                [(now, now)] * max(1, args.queries // 20),
+            ),
+            "namespace, time-travel audit": (
+                lambda vt, st: scan_namespace(scholar, vt, st),
+                lambda vt, st: scholar.index.query_by_namespace(NAMESPACE, vt, st),
+                [(audit_time(), audit_time()) for _ in range(max(1, args.queries // 20))],
+            ),
+            "key, point-in-time (now)": (
+                lambda subj, vt, st: scan_key(scholar, subj, vt, st),
+                lambda subj, vt, st: scholar.index.query_by_key(NAMESPACE, subj, "has_salary", vt, st),
+                [(f"employee:{rng.randrange(args.subjects)}", now, now) for _ in range(args.queries)],
+            ),
+            "key, time-travel audit": (
+                lambda subj, vt, st: scan_key(scholar, subj, vt, st),
+                lambda subj, vt, st: scholar.index.query_by_key(NAMESPACE, subj, "has_salary", vt, st),
+                [(f"employee:{rng.randrange(args.subjects)}", audit_time(), audit_time())
+                 for _ in range(args.queries)],
+            ),
+        }
+        for name, (scan, indexed, queries) in workloads.items():
+            for q in queries:
+                assert scan(*q) == indexed(*q)
+            scan_us = per_query_us(scan, queries, args.repeat)
+            index_us = per_query_us(indexed, queries, args.repeat)
+            print(f"{label:<8}{name:<34}{scan_us:>10.1f}{index_us:>10.1f}{scan_us / index_us:>8.1f}x")
+
+        start = time.perf_counter()
+        scholar.query_facts(
+            requester_namespace=NAMESPACE, namespace=NAMESPACE,
+            at_valid_time=audit_time(), as_of_system_time=audit_time(),
+        )
+        print(f"{label:<8}{'query_facts, namespace audit (ms)':<34}"
+              f"{(time.perf_counter() - start) * 1000:>20.1f}")
+        print(f"{label:<8}{'cells':<34}{total:>20}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Benchmark precedent cold start: seed generation vs the seed cache, plus chain build."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+# domains.insurance_claims re-exports claimpilot (sibling project)
+sys.path.insert(1, str(Path(__file__).resolve().parent.parent.parent / "claimpilot" / "src"))
+
+from domains.banking_aml.seed_generator import generate_all_banking_seeds  # noqa: E402
+from domains.insurance_claims.seed_generator import generate_all_insurance_seeds  # noqa: E402
+from kernel.foundation.chain import Chain  # noqa: E402
+from kernel.foundation.judgment import create_judgment_cell  # noqa: E402
+from kernel.foundation.persistent_chain import PersistentChain  # noqa: E402
+from kernel.foundation.seed_cache import load_or_generate_seeds, read_seed_cache  # noqa: E402
+
+GENERATORS = {
+    "banking": generate_all_banking_seeds,
+    "insurance": generate_all_insurance_seeds,
+}
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def build_chain(seeds, chain: Chain) -> Chain:
+    """Append every seed as a JUDGMENT cell, as the service loaders do."""
+    genesis = chain.initialize(
+        graph_name="BenchPrecedents",
+        root_namespace="bench",
+        creator="system:seed_loader",
+        hash_scheme="canon:rfc8785:v1",
+    )
+    for payload in seeds:
+        chain.append(create_judgment_cell(
+            payload=payload,
+            namespace="bench.seeds",
+            graph_id=genesis.header.graph_id,
+            prev_cell_hash=chain.head.cell_id,
+        ))
+    return chain
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark precedent cold start")
+    parser.add_argument("--generators", nargs="+", default=list(GENERATORS), choices=GENERATORS)
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of runs for cached loads")
+    parser.add_argument("--skip-chain", action="store_true", help="Only time seed loading")
+    args = parser.parse_args()
+
+    print(f"{'generator':<11}{'stage':<34}{'ms':>10}")
+    for name in args.generators:
+        generator = GENERATORS[name]
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp) / "seeds"
+            rows = []
+
+            generate_ms, seeds = timed(generator)
+            rows.append((f"generate ({len(seeds)} seeds)", generate_ms))
+
+            miss_ms, miss = timed(lambda: load_or_generate_seeds(generator, cache_dir))
+            assert not miss.hit
+            rows.append((f"cache miss (+write {miss.path.stat().st_size // 1024} KiB)", miss_ms))
+
+            hit_ms = min(
+                timed(lambda: load_or_generate_seeds(generator, cache_dir))[0]
+                for _ in range(args.repeat)
+            )
+            mmap_ms, cached = min(
+                (timed(lambda: read_seed_cache(miss.path)) for _ in range(args.repeat)),
+                key=lambda run: run[0],
+            )
+            assert cached == miss.payloads
+            rows.append(("cache hit (key + mmap decode)", hit_ms))
+            rows.append(("  of which mmap decode", mmap_ms))
+
+            if not args.skip_chain:
+                chain_ms, _ = timed(lambda: build_chain(cached, Chain()))
+                rows.append(("chain build (in memory)", chain_ms))
+
+                wal_dir = Path(tmp) / "wal"
+                persisted = build_chain(cached, PersistentChain(wal_dir=wal_dir, fsync_policy="manual"))
+                persisted.close()
+                warm_ms, reopened = timed(lambda: PersistentChain.open(wal_dir))
+                reopened.close()
+                rows.append(("chain rehydrate (WAL checkpoint)", warm_ms))
+
+                rows.append(("cold start: generate + build", generate_ms + chain_ms))
+                rows.append(("cold start: seed cache + build", hit_ms + chain_ms))
+
+            for stage, ms in rows:
+                print(f"{name:<11}{stage:<34}{ms:>10.1f}")
+            print(f"{name:<11}{'seed load speedup':<34}{generate_ms / hit_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""Benchmark segmented WAL validation: read()-based vs mmap vs parallel segments."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from kernel.foundation.segmented_wal import (  # noqa: E402
+    SegmentedWALReader,
+    SegmentedWALWriter,
+    list_segment_files,
+)
+from kernel.foundation.wal import (  # noqa: E402
+    HEADER_SIZE,
+    MAX_RECORD_SIZE,
+    MIN_RECORD_SIZE,
+    NULL_HASH_BYTES,
+    WALCorruptionError,
+    WALRecord,
+)
+
+
+def build_wal(wal_dir: Path, records: int, payload_bytes: int, segment_bytes: int) -> None:
+    """Write ``records`` synthetic records with manual fsync."""
+    with SegmentedWALWriter.create(
+        wal_dir, "bench", "graph:bench", max_bytes=segment_bytes, fsync_policy="manual"
+    ) as writer:
+        for i in range(records):
+            writer.append(b'{"i":%d,"pad":"%s"}' % (i, b"x" * payload_bytes))
+
+
+def validate_with_reads(wal_dir: Path) -> tuple[int, bytes]:
+    """Previous validate(): two read() calls and a concatenation per record."""
+    last_seq, prev_hash = -1, NULL_HASH_BYTES
+    for _, path in list_segment_files(wal_dir):
+        with open(path, "rb") as f:
+            f.seek(HEADER_SIZE)
+            while True:
+                len_bytes = f.read(4)
+                if len(len_bytes) < 4:
+                    break
+                record_len = struct.unpack("<I", len_bytes)[0]
+                if record_len < MIN_RECORD_SIZE or record_len > MAX_RECORD_SIZE:
+                    break
+                rest = f.read(record_len - 4)
+                if len(rest) < record_len - 4:
+                    break
+                try:
+                    record = WALRecord.from_bytes(len_bytes + rest)
+                except WALCorruptionError:
+                    break
+                assert record.prev_hash == prev_hash
+                # Old records re-packed every field to compute the record hash
+                prev_hash = WALRecord(
+                    record.sequence, record.flags, record.prev_hash,
+                    record.cell_hash, record.canonical_bytes, record.record_crc,
+                ).compute_record_hash()
+                last_seq = record.sequence
+    return last_seq, prev_hash
+
+
+def timed(fn) -> tuple[float, tuple[int, bytes]]:
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark segmented WAL validation")
+    parser.add_argument("--records", type=int, nargs="+", default=[20000, 100000])
+    parser.add_argument("--payload-bytes", type=int, default=1024)
+    parser.add_argument("--segment-mb", type=float, default=8.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    print(f"{'records':>9}{'segments':>10}{'read() ms':>12}{'mmap ms':>10}{'parallel ms':>13}{'speedup':>9}")
+    for records in args.records:
+        with tempfile.TemporaryDirectory() as tmp:
+            wal_dir = Path(tmp) / "wal"
+            build_wal(wal_dir, records, args.payload_bytes, int(args.segment_mb * 1024 * 1024))
+            reader = SegmentedWALReader(wal_dir)
+
+            legacy_ms, expected = timed(lambda: validate_with_reads(wal_dir))
+            mmap_ms, sequential = timed(reader.validate)
+            parallel_ms, parallel = timed(
+                lambda: reader.validate(parallel=True, max_workers=args.workers)
+            )
+            assert expected == sequential == parallel
+
+            print(
+                f"{records:>9}{len(list_segment_files(wal_dir)):>10}{legacy_ms:>12.1f}"
+                f"{mmap_ms:>10.1f}{parallel_ms:>13.1f}{legacy_ms / parallel_ms:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Decision pipeline executor.
+
+Runs the synchronous, CPU-bound /decide pipeline off the asyncio event loop
+so a slow decision cannot stall /health, /ready or other requests.
+
+Modes (DG_DECIDE_EXECUTOR):
+    inline  - run on the event loop (pre-pool behaviour)
+    thread  - ThreadPoolExecutor; shares the process's precedent pool
+    process - ProcessPoolExecutor (spawn); each worker preloads the
+              precedent pool through the initializer (start()'s initargs
+              carry what the serving process hands over)
+
+Admission is bounded: at most ``max_pending`` decisions may be running or
+queued. Further submissions raise ExecutorSaturated, which the endpoint
+maps to HTTP 429.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+EXECUTOR_MODES = ("inline", "thread", "process")
+
+
+class ExecutorSaturated(Exception):
+    """Raised when the pending-decision limit is reached."""
+
+
+class DecisionExecutor:
+    """
+    Bounded dispatcher for the decision pipeline.
+
+    submit() must be awaited from the event loop thread; the pending count
+    is only touched there, so it needs no lock.
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        max_workers: int = 4,
+        max_pending: int = 32,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode '{mode}'. Must be one of: {EXECUTOR_MODES}")
+        if max_workers < 1 or max_pending < 1:
+            raise ValueError("max_workers and max_pending must be at least 1")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._initializer = initializer
+        self._pool: Optional[Executor] = None
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self, initargs: Tuple[Any, ...] = ()) -> None:
+        """
+        Create the worker pool (idempotent; called lazily by submit()).
+
+        ``initargs`` are passed to the initializer in each worker process.
+        """
+        if self._pool is not None or self.mode == "inline":
+            return
+        if self.mode == "thread":
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="dg-decide",
+            )
+        else:
+            # spawn, not fork: the parent runs an event loop and other threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self._initializer,
+                initargs=initargs,
+            )
+
+    async def submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``fn(*args)`` according to the execution mode.
+
+        Raises:
+            ExecutorSaturated: If max_pending decisions are already in flight
+        """
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise ExecutorSaturated(
+                f"{self._pending} decisions pending (limit {self.max_pending})"
+            )
+        self._pending += 1
+        try:
+            if self.mode == "inline":
+                result = fn(*args)
+            else:
+                self.start()
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._pool, fn, *args)
+            self._completed += 1
+            return result
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for readiness/diagnostics endpoints."""
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
@@ -18,7 +18,9 @@ import hashlib
 import json
 import logging
 import os
+import shutil
 import sys
+import tempfile
 import time
 import uuid
 from dataclasses import dataclass
@@ -60,8 +62,12 @@ from decisiongraph.str_gate import run_str_gate, dual_gate_decision
 # Precedent system imports
 from kernel.foundation.chain import Chain
 from kernel.foundation.cell import NULL_HASH
-from kernel.precedent.precedent_registry import PrecedentRegistry
-from decisiongraph.aml_seed_generator import generate_all_banking_seeds
+from kernel.foundation.persistent_chain import (
+    PersistentChain,
+    mark_seed_load_complete,
+    open_seeded_chain,
+)
+from kernel.precedent.precedent_registry import PrecedentRegistry, IndexedPrecedentRegistry
 from decisiongraph.aml_fingerprint import (
     AMLFingerprintSchemaRegistry,
     apply_aml_banding,
@@ -76,19 +82,18 @@ from kernel.foundation.judgment import (
 # v3 Precedent Engine imports (conditional usage based on DG_PRECEDENT_VERSION)
 from decisiongraph.banking_domain import create_banking_domain_registry
 from kernel.precedent.comparability_gate import (
-    evaluate_gates,
+    GateClassIndex,
     extract_gate_facts_from_case,
-    extract_gate_facts_from_precedent,
 )
 from kernel.precedent.precedent_scorer import (
     SimilarityResult,
     TwoAxisClassification,
-    score_similarity,
     classify_match_v3,
     classify_match_two_axis,
     detect_primary_typology,
-    anchor_facts_to_dict,
 )
+from kernel.precedent.precedent_matrix import PrecedentMatrix
+from kernel.precedent.precedent_retrieval import BucketedTopK
 from kernel.precedent.governed_confidence import (
     compute_governed_confidence,
     GovernedConfidenceResult,
@@ -105,6 +110,16 @@ from service.routers import demo, report, verify, templates, policy_shifts, simu
 from service.template_loader import TemplateLoader, set_cache_decision, set_precedent_query
 from service.suspicion_classifier import CLASSIFIER_VERSION, classify as classify_suspicion
 from service.validate_output import validate_decision_output
+from service.decision_executor import DecisionExecutor, ExecutorSaturated
+from service.seed_pool import (
+    SeedPool,
+    export_seed_pool,
+    get_seed_pool,
+    import_seed_pool,
+    set_seed_pool,
+)
+from kernel.foundation.seed_cache import generator_digest
+from decisiongraph.aml_seed_generator import generate_all_banking_seeds
 
 # Log module versions at import time so deploy logs confirm the correct code shipped
 print(f"[startup] report module version: {report.REPORT_MODULE_VERSION}")
@@ -130,6 +145,16 @@ DG_PRECEDENT_THRESHOLD_DEMO = float(os.getenv("DG_PRECEDENT_THRESHOLD_DEMO", "0.
 DG_PRECEDENT_MIN_SCORE = float(os.getenv("DG_PRECEDENT_MIN_SCORE", "0.6"))
 DG_PRECEDENT_SALT = os.getenv("DG_PRECEDENT_SALT", "decisiongraph-banking-seed-v1")
 DG_PRECEDENT_VERSION = os.getenv("DG_PRECEDENT_VERSION", "v3")
+DG_PRECEDENT_INDEXED = os.getenv("DG_PRECEDENT_INDEXED", "false").lower() == "true"
+# Optional WAL directory for the precedent chain. When set, the first boot
+# persists the seeded chain; later boots rehydrate it instead of regenerating,
+# as long as it was built from the same seed configuration (see
+# precedent_seed_config_digest) and the load completed.
+DG_PRECEDENT_WAL_DIR = os.getenv("DG_PRECEDENT_WAL_DIR", "")
+# /decide execution: inline | thread | process (see service/decision_executor.py)
+DG_DECIDE_EXECUTOR = os.getenv("DG_DECIDE_EXECUTOR", "thread").lower()
+DG_DECIDE_WORKERS = int(os.getenv("DG_DECIDE_WORKERS", str(min(4, os.cpu_count() or 1))))
+DG_DECIDE_MAX_PENDING = int(os.getenv("DG_DECIDE_MAX_PENDING", "32"))
 
 # Get git commit: prefer env var (set at build time), fallback to git command
 DG_ENGINE_COMMIT = os.getenv("DG_ENGINE_COMMIT")
@@ -160,18 +185,85 @@ PRECEDENTS_LOADED = False
 PRECEDENT_COUNT = 0
 FINGERPRINT_REGISTRY = AMLFingerprintSchemaRegistry()
 
-def load_precedent_seeds():
-    """Load the 3,000 banking seed precedents into a Chain."""
+def precedent_seed_config_digest() -> str:
+    """
+    Digest of everything the seeded precedent chain is derived from.
+
+    Stored in the precedent WAL checkpoint once the bulk load finishes; a
+    WAL written under a different salt, precedent or engine version, or
+    seed generator is not reused.
+    """
+    config = {
+        "salt": DG_PRECEDENT_SALT,
+        "precedent_version": DG_PRECEDENT_VERSION,
+        "engine_version": DG_ENGINE_VERSION,
+        "generator": generator_digest(generate_all_banking_seeds),
+    }
+    encoded = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _open_precedent_wal(read_only: bool) -> Optional[PersistentChain]:
+    """
+    Rehydrate the precedent WAL if it holds a complete load of the current
+    seed configuration; otherwise discard it (the caller regenerates).
+
+    A corrupt WAL, or a load that stopped part-way and never wrote its
+    checkpoint metadata, is rejected like a configuration change. Read-only
+    openers (decision workers) leave a rejected WAL in place for the serving
+    process.
+    """
+    chain = open_seeded_chain(
+        DG_PRECEDENT_WAL_DIR, precedent_seed_config_digest(), read_only=read_only
+    )
+    if chain is None:
+        logger.warning(
+            "Precedent WAL in %s is unreadable, incomplete or does not match "
+            "the current seed configuration; regenerating", DG_PRECEDENT_WAL_DIR,
+        )
+    return chain
+
+
+def load_precedent_seeds(read_only: bool = False):
+    """
+    Load the 3,000 banking seed precedents into a Chain.
+
+    read_only is used by decision worker processes: they replay an existing
+    WAL without opening it for writing (the serving process owns it).
+    """
     global PRECEDENT_CHAIN, PRECEDENT_REGISTRY, PRECEDENTS_LOADED, PRECEDENT_COUNT
 
     try:
-        # Generate all banking seeds
-        seeds = generate_all_banking_seeds()
+        warm_chain = None
+        if DG_PRECEDENT_WAL_DIR and PersistentChain.exists(DG_PRECEDENT_WAL_DIR):
+            warm_chain = _open_precedent_wal(read_only)
+        if warm_chain is not None:
+            # Warm start: the WAL was replayed, fully verifying only the tail
+            # past the stored checkpoint
+            PRECEDENT_CHAIN = warm_chain
+            PRECEDENT_COUNT = len(PRECEDENT_CHAIN) - 1  # exclude Genesis
+            registry_cls = IndexedPrecedentRegistry if DG_PRECEDENT_INDEXED else PrecedentRegistry
+            PRECEDENT_REGISTRY = registry_cls(PRECEDENT_CHAIN)
+            # Share the persisted seeds (and their precedent_ids) instead of
+            # generating a second, differently-keyed pool
+            set_seed_pool(SeedPool.from_chain(PRECEDENT_CHAIN))
+            _warm_precedent_indexes(get_seed_pool().payloads)
+            PRECEDENTS_LOADED = True
+            return PRECEDENT_COUNT
+
+        # Generate all banking seeds (once per process, shared with routers)
+        seeds = get_seed_pool().payloads
         PRECEDENT_COUNT = len(seeds)
 
         # Create a chain and initialize with Genesis
         # Use canonical hash scheme to match JUDGMENT cells
-        PRECEDENT_CHAIN = Chain()
+        if DG_PRECEDENT_WAL_DIR and not read_only:
+            # Bulk load without per-record fsync; checkpoint() syncs at the end
+            PRECEDENT_CHAIN = PersistentChain(
+                wal_dir=Path(DG_PRECEDENT_WAL_DIR), fsync_policy="manual"
+            )
+        else:
+            PRECEDENT_CHAIN = Chain()
         genesis = PRECEDENT_CHAIN.initialize(
             graph_name="BankingPrecedents",
             root_namespace="banking",
@@ -203,8 +295,16 @@ def load_precedent_seeds():
             PRECEDENT_CHAIN.append(cell)
             prev_hash = cell.cell_id
 
-        # Create the registry
-        PRECEDENT_REGISTRY = PrecedentRegistry(PRECEDENT_CHAIN)
+        if isinstance(PRECEDENT_CHAIN, PersistentChain):
+            # Written only now: a WAL without it is an interrupted load
+            mark_seed_load_complete(
+                PRECEDENT_CHAIN, precedent_seed_config_digest(), len(seeds)
+            )
+
+        # Create the registry (indexed variant is opt-in via DG_PRECEDENT_INDEXED)
+        registry_cls = IndexedPrecedentRegistry if DG_PRECEDENT_INDEXED else PrecedentRegistry
+        PRECEDENT_REGISTRY = registry_cls(PRECEDENT_CHAIN)
+        _warm_precedent_indexes(seeds)
         PRECEDENTS_LOADED = True
 
         return PRECEDENT_COUNT
@@ -247,6 +347,10 @@ class JSONFormatter(logging.Formatter):
             log_entry["policy_hash_short"] = record.policy_hash_short
         if hasattr(record, "duration_ms"):
             log_entry["duration_ms"] = record.duration_ms
+        if hasattr(record, "stage_ms"):
+            log_entry["stage_ms"] = record.stage_ms
+        if hasattr(record, "executor"):
+            log_entry["executor"] = record.executor
         return json.dumps(log_entry)
 
 # Configure logging
@@ -974,734 +1078,824 @@ def _convert_demo_facts(body: dict) -> dict:
         "_canonical_facts": canonical_facts,  # translated to 28 registry fields
     }
 
-@app.post("/decide", tags=["Decision"])
-async def decide(request: Request):
+class StageTimer:
+    """Per-stage wall-clock timings (ms) for the structured decision log."""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.stages[stage] = round((now - self._last) * 1000, 2)
+        self._last = now
+
+
+def _init_decision_worker(seed_pool_path: str = ""):
     """
-    Run decision engine on a case.
+    Process-pool initializer: preload the precedent pool in each worker.
 
-    Returns a complete Decision Pack JSON with:
-    - meta: Reproducibility metadata (engine_version, policy_version, input_hash, etc.)
-    - decision: Final verdict, action, STR required, escalation path
-    - layers: 6-layer taxonomy analysis
-    - gates: Dual-gate results (Gate 1 + Gate 2)
-    - rationale: Summary and justification
-    - compliance: Regulatory details
+    seed_pool_path is the serving process's exported seed pool. Importing it
+    gives the worker the same precedent_ids as the parent and skips
+    regenerating the seeds (the generator assigns fresh uuid4 ids).
+    """
+    if seed_pool_path:
+        import_seed_pool(seed_pool_path)
+    load_precedent_seeds(read_only=True)
 
-    The response includes a decision_id that can be used to replay the decision.
+
+# Directory holding the seed pool exported for process workers (removed on shutdown)
+_SEED_POOL_HANDOFF_DIR: Optional[str] = None
+
+
+def _decision_worker_initargs() -> tuple:
+    """Export the loaded seed pool for process workers; no-op for other modes."""
+    global _SEED_POOL_HANDOFF_DIR
+    if DECISION_EXECUTOR.mode != "process":
+        return ()
+    _SEED_POOL_HANDOFF_DIR = tempfile.mkdtemp(prefix="dg-seed-pool-")
+    path = export_seed_pool(Path(_SEED_POOL_HANDOFF_DIR) / "seed_pool.dgseeds")
+    return (str(path),)
+
+
+DECISION_EXECUTOR = DecisionExecutor(
+    mode=DG_DECIDE_EXECUTOR,
+    max_workers=DG_DECIDE_WORKERS,
+    max_pending=DG_DECIDE_MAX_PENDING,
+    initializer=_init_decision_worker,
+)
+
+
+def run_decision_pipeline(body: dict, request_id: str = "unknown") -> tuple:
     """
-    request_id = getattr(request.state, "request_id", "unknown")
-    start_time = getattr(request.state, "start_time", time.time())
+    Run the synchronous decision pipeline for a parsed /decide body.
 
-    try:
-        # Parse request body
-        body = await request.json()
+    Everything here is CPU-bound and blocking, so the endpoint dispatches it
+    through DECISION_EXECUTOR (thread or process pool). Must stay a
+    module-level function taking picklable arguments.
 
-        # ── Demo-format detection ────────────────────────────────────────
-        # Demo cases use a flat facts-array format [{field, value}, ...]
-        # that doesn't conform to the bank-grade input schema.
-        # Convert them into engine-compatible inputs and skip validation.
-        is_demo = _is_demo_format(body)
-
-        if not is_demo:
-            # Validate input against schema
-            valid, errors = validate_input(body)
-            if not valid:
-                logger.warning(
-                    "Schema validation failed",
-                    extra={"request_id": request_id}
-                )
-                return JSONResponse(
-                    status_code=400,
-                    content={
-                        "error": "Schema validation failed",
-                        "code": "SCHEMA_VALIDATION_ERROR",
-                        "details": {"errors": errors},
-                        "request_id": request_id,
-                    }
-                )
+    Returns:
+        (status_code, content, stage_timings_ms)
+    """
+    timer = StageTimer()
 
-        # Extract case metadata
-        external_id = body.get("alert_details", {}).get("external_id",
-                      body.get("case_id", "DEMO"))
-        input_hash = compute_input_hash(body)
-        decision_id = compute_decision_id(input_hash)
-
-        if is_demo:
-            # Convert facts-array to engine format
-            demo_inputs = _convert_demo_facts(body)
-            facts = demo_inputs["facts"]
-            obligations = demo_inputs["obligations"]
-            indicators = demo_inputs["indicators"]
-            instrument_type = demo_inputs["instrument_type"]
-            suspicion_evidence = demo_inputs["suspicion_evidence"]
-            typology_maturity = demo_inputs.get("typology_maturity", "FORMING")
-            mitigations = demo_inputs.get("mitigations", [])
-            evidence_quality = demo_inputs.get("evidence_quality", {})
-            mitigation_status = demo_inputs.get("mitigation_status", {})
-            typology_confirmed = demo_inputs.get("typology_confirmed", False)
-            fintrac_indicators = demo_inputs.get("fintrac_indicators", [])
-            logger.info(f"Demo case processed: {external_id}",
-                        extra={"request_id": request_id})
-        else:
-            # Extract engine inputs from schema-compliant body
-            facts = body.get("facts", extract_facts(body))
-            obligations = body.get("obligations", extract_obligations(body))
-            indicators = body.get("indicators", [])
-            typology_maturity = body.get("typology_maturity", "FORMING")
-            mitigations = body.get("mitigations", [])
-            suspicion_evidence = body.get("suspicion_evidence", {
-                "has_intent": False,
-                "has_deception": False,
-                "has_sustained_pattern": False,
-            })
-            instrument_type = body.get("instrument_type", extract_instrument_type(body))
-            evidence_quality = body.get("evidence_quality", {})
-            mitigation_status = body.get("mitigation_status", {})
-            typology_confirmed = body.get("typology_confirmed", False)
-            fintrac_indicators = body.get("fintrac_indicators", [])
-
-        # Run Gate 1
-        esc_result = run_escalation_gate(
-            facts=facts,
-            instrument_type=instrument_type,
-            obligations=obligations,
-            indicators=indicators,
-            typology_maturity=typology_maturity,
-            mitigations=mitigations,
-            suspicion_evidence=suspicion_evidence,
-        )
+    # ── Demo-format detection ────────────────────────────────────────
+    # Demo cases use a flat facts-array format [{field, value}, ...]
+    # that doesn't conform to the bank-grade input schema.
+    # Convert them into engine-compatible inputs and skip validation.
+    is_demo = _is_demo_format(body)
 
-        # Run Gate 2
-        str_result = run_str_gate(
-            suspicion_evidence=suspicion_evidence,
-            evidence_quality=evidence_quality,
-            mitigation_status=mitigation_status,
-            typology_confirmed=typology_confirmed,
-            facts=facts,
-        )
+    if not is_demo:
+        # Validate input against schema
+        valid, errors = validate_input(body)
+        if not valid:
+            logger.warning(
+                "Schema validation failed",
+                extra={"request_id": request_id}
+            )
+            return 400, {
+                "error": "Schema validation failed",
+                "code": "SCHEMA_VALIDATION_ERROR",
+                "details": {"errors": errors},
+                "request_id": request_id,
+            }, timer.stages
+
+    # Extract case metadata
+    external_id = body.get("alert_details", {}).get("external_id",
+                  body.get("case_id", "DEMO"))
+    input_hash = compute_input_hash(body)
+    decision_id = compute_decision_id(input_hash)
+
+    if is_demo:
+        # Convert facts-array to engine format
+        demo_inputs = _convert_demo_facts(body)
+        facts = demo_inputs["facts"]
+        obligations = demo_inputs["obligations"]
+        indicators = demo_inputs["indicators"]
+        instrument_type = demo_inputs["instrument_type"]
+        suspicion_evidence = demo_inputs["suspicion_evidence"]
+        typology_maturity = demo_inputs.get("typology_maturity", "FORMING")
+        mitigations = demo_inputs.get("mitigations", [])
+        evidence_quality = demo_inputs.get("evidence_quality", {})
+        mitigation_status = demo_inputs.get("mitigation_status", {})
+        typology_confirmed = demo_inputs.get("typology_confirmed", False)
+        fintrac_indicators = demo_inputs.get("fintrac_indicators", [])
+        logger.info(f"Demo case processed: {external_id}",
+                    extra={"request_id": request_id})
+    else:
+        # Extract engine inputs from schema-compliant body
+        facts = body.get("facts", extract_facts(body))
+        obligations = body.get("obligations", extract_obligations(body))
+        indicators = body.get("indicators", [])
+        typology_maturity = body.get("typology_maturity", "FORMING")
+        mitigations = body.get("mitigations", [])
+        suspicion_evidence = body.get("suspicion_evidence", {
+            "has_intent": False,
+            "has_deception": False,
+            "has_sustained_pattern": False,
+        })
+        instrument_type = body.get("instrument_type", extract_instrument_type(body))
+        evidence_quality = body.get("evidence_quality", {})
+        mitigation_status = body.get("mitigation_status", {})
+        typology_confirmed = body.get("typology_confirmed", False)
+        fintrac_indicators = body.get("fintrac_indicators", [])
+    timer.mark("inputs")
+
+    # Run Gate 1
+    esc_result = run_escalation_gate(
+        facts=facts,
+        instrument_type=instrument_type,
+        obligations=obligations,
+        indicators=indicators,
+        typology_maturity=typology_maturity,
+        mitigations=mitigations,
+        suspicion_evidence=suspicion_evidence,
+    )
 
-        # Combine decisions
-        final_decision = dual_gate_decision(
-            escalation_allowed=(esc_result.decision == EscalationDecision.PERMITTED),
-            str_result=str_result,
-        )
+    # Run Gate 2
+    str_result = run_str_gate(
+        suspicion_evidence=suspicion_evidence,
+        evidence_quality=evidence_quality,
+        mitigation_status=mitigation_status,
+        typology_confirmed=typology_confirmed,
+        facts=facts,
+    )
 
-        # ── CLASSIFIER SOVEREIGNTY GATE ──────────────────────────────────
-        # The Suspicion Classifier is the SUPREME AUTHORITY.
-        # It runs BEFORE the verdict is finalized.
-        # If Tier 1 == 0, STR is IMPOSSIBLE. No rule, gate, or precedent
-        # can bypass this. This is non-negotiable regulatory architecture.
-        #
-        # Decision Hierarchy (frozen):
-        #   1. Suspicion Classifier (sovereign)
-        #   2. Rules / Gates (support the classifier, never contradict)
-        #   3. Narrative Engine (explains the classifier outcome)
-        #   4. Governance Engine (controls escalation path)
-        # ─────────────────────────────────────────────────────────────────
-
-        # Build evidence_used and rules_fired for the classifier
-        # (mirrors what decision_pack.py constructs, but available pre-pack)
-        hard_stop_triggered = any([
-            facts.get("sanctions_result") == "MATCH",
-            facts.get("document_status") == "FALSE",
-            facts.get("customer_response") == "REFUSAL",
-            facts.get("legal_prohibition", False),
-            facts.get("adverse_media_mltf", False),
-        ])
-        has_pep = "PEP_FOREIGN" in obligations or "PEP_DOMESTIC" in obligations
-        suspicion_activated = (
-            hard_stop_triggered or
-            suspicion_evidence.get("has_intent", False) or
-            suspicion_evidence.get("has_deception", False) or
-            suspicion_evidence.get("has_sustained_pattern", False)
-        )
-        suspicion_basis = (
-            "HARD_STOP" if hard_stop_triggered
-            else "BEHAVIORAL" if suspicion_activated
-            else "NONE"
-        )
+    # Combine decisions
+    final_decision = dual_gate_decision(
+        escalation_allowed=(esc_result.decision == EscalationDecision.PERMITTED),
+        str_result=str_result,
+    )
+    timer.mark("gates")
 
-        pre_evidence_used = [
-            {"field": "facts.sanctions_result", "value": facts.get("sanctions_result", "NO_MATCH")},
-            {"field": "facts.adverse_media_mltf", "value": facts.get("adverse_media_mltf", False)},
-            {"field": "suspicion.has_intent", "value": suspicion_evidence.get("has_intent", False)},
-            {"field": "suspicion.has_deception", "value": suspicion_evidence.get("has_deception", False)},
-            {"field": "suspicion.has_sustained_pattern", "value": suspicion_evidence.get("has_sustained_pattern", False)},
-            {"field": "obligations.count", "value": len(obligations)},
-            {"field": "mitigations.count", "value": len(mitigations)},
-            {"field": "typology.maturity", "value": typology_maturity},
-        ]
+    # ── CLASSIFIER SOVEREIGNTY GATE ──────────────────────────────────
+    # The Suspicion Classifier is the SUPREME AUTHORITY.
+    # It runs BEFORE the verdict is finalized.
+    # If Tier 1 == 0, STR is IMPOSSIBLE. No rule, gate, or precedent
+    # can bypass this. This is non-negotiable regulatory architecture.
+    #
+    # Decision Hierarchy (frozen):
+    #   1. Suspicion Classifier (sovereign)
+    #   2. Rules / Gates (support the classifier, never contradict)
+    #   3. Narrative Engine (explains the classifier outcome)
+    #   4. Governance Engine (controls escalation path)
+    # ─────────────────────────────────────────────────────────────────
+
+    # Build evidence_used and rules_fired for the classifier
+    # (mirrors what decision_pack.py constructs, but available pre-pack)
+    hard_stop_triggered = any([
+        facts.get("sanctions_result") == "MATCH",
+        facts.get("document_status") == "FALSE",
+        facts.get("customer_response") == "REFUSAL",
+        facts.get("legal_prohibition", False),
+        facts.get("adverse_media_mltf", False),
+    ])
+    has_pep = "PEP_FOREIGN" in obligations or "PEP_DOMESTIC" in obligations
+    suspicion_activated = (
+        hard_stop_triggered or
+        suspicion_evidence.get("has_intent", False) or
+        suspicion_evidence.get("has_deception", False) or
+        suspicion_evidence.get("has_sustained_pattern", False)
+    )
+    suspicion_basis = (
+        "HARD_STOP" if hard_stop_triggered
+        else "BEHAVIORAL" if suspicion_activated
+        else "NONE"
+    )
 
-        # Populate registry-keyed evidence for the Evidence Gap Tracker (27 banking fields).
-        # For demo/seed cases, use the _canonical_facts (translated to registry vocabulary);
-        # for schema cases, derive from body.
-        _reg_src: dict = {}
-        if is_demo and isinstance(demo_inputs.get("_canonical_facts"), dict):
-            _reg_src = demo_inputs["_canonical_facts"]
-        elif is_demo and isinstance(demo_inputs.get("_demo_facts"), dict):
-            _reg_src = demo_inputs["_demo_facts"]
-        else:
-            # Flatten structured input (customer_record, screening_payload, etc.)
-            for section_key in ("customer_record", "screening_payload", "transaction_history_slice"):
-                section = body.get(section_key, {})
-                if isinstance(section, dict):
-                    for k, v in section.items():
-                        _reg_src[k] = v
-
-        # Map registry fields to evidence entries the frontend can match
-        _REGISTRY_FIELDS = [
-            "customer.type", "customer.relationship_length", "customer.pep",
-            "customer.high_risk_jurisdiction", "customer.high_risk_industry", "customer.cash_intensive",
-            "txn.type", "txn.amount_band", "txn.cross_border", "txn.destination_country_risk",
-            "txn.round_amount", "txn.just_below_threshold", "txn.multiple_same_day",
-            "txn.pattern_matches_profile", "txn.source_of_funds_clear", "txn.stated_purpose",
-            "flag.structuring", "flag.rapid_movement", "flag.layering",
-            "flag.unusual_for_profile", "flag.third_party", "flag.shell_company",
-            "screening.sanctions_match", "screening.pep_match",
-            "screening.adverse_media_level", "screening.adverse_media",
-            "prior.sars_filed", "prior.account_closures",
-            "trade.goods_description", "trade.pricing_consistent", "trade.is_letter_of_credit",
-        ]
-        # Also derive some from engine facts
-        _derived_reg = {
-            "screening.sanctions_match": facts.get("sanctions_result") == "MATCH",
-            "screening.adverse_media_level": "confirmed_mltf" if facts.get("adverse_media_mltf") else "none",
-            "screening.adverse_media": bool(facts.get("adverse_media_mltf")),
-            "customer.pep": has_pep,
-            "txn.type": instrument_type if instrument_type != "unknown" else None,
-        }
-        for rf in _REGISTRY_FIELDS:
-            val = _reg_src.get(rf)
-            if val is None:
-                val = _derived_reg.get(rf)
-            if val is not None:
-                pre_evidence_used.append({"field": rf, "value": val})
-
-        # ── FINTRAC Citation Reference Map ─────────────────────────────────
-        # Maps rule/typology codes to actual regulatory text for VerbatimCitations.
-        # These are the real PCMLTFA / FINTRAC references that a compliance officer
-        # or regulator would expect to see in an audit package.
-        _CITATION_MAP = {
-            "HARD_STOP_CHECK": {
-                "ref": "PCMLTFA s. 7(1), FINTRAC Guideline 3",
-                "text": "Proceeds of Crime (Money Laundering) and Terrorist Financing Act — Where a reporting entity has reasonable grounds to suspect that a transaction or attempted transaction is related to the commission or attempted commission of a money laundering offence or a terrorist activity financing offence, the entity shall report the transaction or attempted transaction to the Centre.",
-            },
-            "PEP_ISOLATION": {
-                "ref": "PCMLTFA s. 9.3, FINTRAC Guideline 4 — PEP/HIO",
-                "text": "A reporting entity shall take reasonable measures to determine whether a person is a politically exposed foreign person, a politically exposed domestic person, or a head of an international organization. PEP status alone does not constitute reasonable grounds to suspect — additional risk factors must be present.",
-            },
-            "SUSPICION_TEST": {
-                "ref": "PCMLTFA s. 7(1)(a), FINTRAC Guideline 3 — STR",
-                "text": "A suspicious transaction report shall be submitted when there are reasonable grounds to suspect that the transaction is related to the commission of a money laundering offence or a terrorist activity financing offence. Suspicion must be fact-based and articulable.",
-            },
-            "STRUCTURING_PATTERN": {
-                "ref": "FINTRAC Guideline 3 — Structuring Indicators",
-                "text": "Structuring involves conducting transactions below the $10,000 reporting threshold to avoid triggering a Large Cash Transaction Report. This includes patterns of deposits/withdrawals just below the threshold, multiple same-day transactions, and the use of multiple accounts or locations.",
-            },
-            "LAYERING": {
-                "ref": "FINTRAC ML/TF Typologies — Layering",
-                "text": "Layering is the second stage of money laundering, involving complex layers of financial transactions designed to distance illicitly derived funds from their source. This may involve multiple transfers between accounts, use of shell companies, or cross-border movements.",
-            },
-            "SHELL_ENTITY": {
-                "ref": "FINTRAC ML/TF Typologies — Shell Companies",
-                "text": "Shell company indicators include nominee directors, registered agents in high-risk jurisdictions, no apparent legitimate business activity, and use of corporate structures to obscure beneficial ownership contrary to PCMLTFA s. 11.1 beneficial ownership requirements.",
-            },
-            "THIRD_PARTY_UNEXPLAINED": {
-                "ref": "FINTRAC Guideline 2 — Third-Party Determination",
-                "text": "A reporting entity shall take reasonable measures to determine whether a transaction is being conducted on behalf of a third party. Unexplained third-party involvement in financial transactions is a recognized ML/TF indicator.",
-            },
-            "FALSE_SOURCE": {
-                "ref": "PCMLTFA s. 6.1, FINTRAC Guideline 6 — Record Keeping",
-                "text": "Source of funds declarations that cannot be verified or are inconsistent with the client's known profile constitute a suspicious indicator. Reporting entities must keep records of information used to identify clients and verify their identity.",
-            },
-            "SANCTIONS_SIGNAL": {
-                "ref": "SEMA s. 4(1), PCMLTFA s. 11.42, UN Regulations",
-                "text": "Under the Special Economic Measures Act and United Nations Act regulations, it is prohibited to deal in property of designated persons. A confirmed sanctions match requires immediate blocking and reporting to FINTRAC and OSFI.",
-            },
-            "ADVERSE_MEDIA_CONFIRMED": {
-                "ref": "FINTRAC Guideline 4 — Risk Assessment, OSFI B-10 s. 7",
-                "text": "Confirmed adverse media linking a client to money laundering, terrorist financing, fraud, corruption, or organized crime is a key risk factor requiring enhanced due diligence measures and potential STR filing.",
-            },
-            "SAR_PATTERN": {
-                "ref": "PCMLTFA s. 7(1), FINTRAC Guideline 3 — Pattern of SARs",
-                "text": "A history of prior Suspicious Transaction Reports filed on a client indicates an established pattern of suspicious activity. Multiple prior SARs elevate the risk assessment and may trigger enhanced monitoring, exit consideration, or mandatory escalation.",
-            },
-            "EVASION_BEHAVIOR": {
-                "ref": "FINTRAC Guideline 3 — Unusual Activity Indicators",
-                "text": "Behaviour inconsistent with the client's known transaction profile or sudden spikes in transaction velocity are recognized indicators of potential money laundering. The reporting entity must assess whether such activity has a reasonable explanation.",
-            },
-            "ROUND_TRIP": {
-                "ref": "FINTRAC ML/TF Typologies — Round-Trip Transactions",
-                "text": "Round-trip transactions involve funds being sent to a jurisdiction and returned in a manner designed to disguise their origin. This is a recognized money laundering technique used to create the appearance of legitimate business transactions.",
-            },
-            "TRADE_BASED_LAUNDERING": {
-                "ref": "FINTRAC ML/TF Typologies — Trade-Based ML",
-                "text": "Trade-based money laundering involves the exploitation of international trade transactions to transfer value and obscure the origins of criminal proceeds. Indicators include over/under-invoicing, phantom shipments, and misrepresentation of trade goods.",
-            },
-            "FUNNEL": {
-                "ref": "FINTRAC ML/TF Typologies — Funnel Accounts",
-                "text": "Funnel account activity involves the use of bank accounts in one geographic area to consolidate and redirect funds to another area, often across borders. This is a recognized technique for integrating proceeds of crime.",
-            },
-            "VIRTUAL_ASSET_LAUNDERING": {
-                "ref": "PCMLTFA s. 1 (virtual currency), FINTRAC Guideline 5",
-                "text": "Virtual currency transactions require the same AML/ATF compliance obligations as fiat currency transactions. Indicators of virtual asset laundering include conversion to/from privacy coins, use of mixing services, and transactions with unhosted wallets.",
-            },
-            "TERRORIST_FINANCING": {
-                "ref": "PCMLTFA s. 7.1, Criminal Code s. 83.02-83.04",
-                "text": "Terrorist activity financing offences include providing or collecting property for terrorist purposes. Any transaction suspected of being related to terrorist financing must be reported to FINTRAC immediately. There is no monetary threshold for TF reporting.",
-            },
-        }
+    pre_evidence_used = [
+        {"field": "facts.sanctions_result", "value": facts.get("sanctions_result", "NO_MATCH")},
+        {"field": "facts.adverse_media_mltf", "value": facts.get("adverse_media_mltf", False)},
+        {"field": "suspicion.has_intent", "value": suspicion_evidence.get("has_intent", False)},
+        {"field": "suspicion.has_deception", "value": suspicion_evidence.get("has_deception", False)},
+        {"field": "suspicion.has_sustained_pattern", "value": suspicion_evidence.get("has_sustained_pattern", False)},
+        {"field": "obligations.count", "value": len(obligations)},
+        {"field": "mitigations.count", "value": len(mitigations)},
+        {"field": "typology.maturity", "value": typology_maturity},
+    ]
 
-        pre_rules_fired = [
-            {"code": "HARD_STOP_CHECK", "result": "TRIGGERED" if hard_stop_triggered else "CLEAR",
-             "reason": "Hard stop conditions detected" if hard_stop_triggered else "No hard stop conditions",
-             "citation_ref": _CITATION_MAP["HARD_STOP_CHECK"]["ref"],
-             "citation_text": _CITATION_MAP["HARD_STOP_CHECK"]["text"]},
-            {"code": "PEP_ISOLATION", "result": "APPLIED" if has_pep else "NOT_APPLICABLE",
-             "reason": "PEP status alone cannot escalate" if has_pep else "Not a PEP",
-             "citation_ref": _CITATION_MAP["PEP_ISOLATION"]["ref"],
-             "citation_text": _CITATION_MAP["PEP_ISOLATION"]["text"]},
-            {"code": "SUSPICION_TEST", "result": "ACTIVATED" if suspicion_activated else "CLEAR",
-             "reason": suspicion_basis,
-             "citation_ref": _CITATION_MAP["SUSPICION_TEST"]["ref"],
-             "citation_text": _CITATION_MAP["SUSPICION_TEST"]["text"]},
-        ]
+    # Populate registry-keyed evidence for the Evidence Gap Tracker (27 banking fields).
+    # For demo/seed cases, use the _canonical_facts (translated to registry vocabulary);
+    # for schema cases, derive from body.
+    _reg_src: dict = {}
+    if is_demo and isinstance(demo_inputs.get("_canonical_facts"), dict):
+        _reg_src = demo_inputs["_canonical_facts"]
+    elif is_demo and isinstance(demo_inputs.get("_demo_facts"), dict):
+        _reg_src = demo_inputs["_demo_facts"]
+    else:
+        # Flatten structured input (customer_record, screening_payload, etc.)
+        for section_key in ("customer_record", "screening_payload", "transaction_history_slice"):
+            section = body.get(section_key, {})
+            if isinstance(section, dict):
+                for k, v in section.items():
+                    _reg_src[k] = v
+
+    # Map registry fields to evidence entries the frontend can match
+    _REGISTRY_FIELDS = [
+        "customer.type", "customer.relationship_length", "customer.pep",
+        "customer.high_risk_jurisdiction", "customer.high_risk_industry", "customer.cash_intensive",
+        "txn.type", "txn.amount_band", "txn.cross_border", "txn.destination_country_risk",
+        "txn.round_amount", "txn.just_below_threshold", "txn.multiple_same_day",
+        "txn.pattern_matches_profile", "txn.source_of_funds_clear", "txn.stated_purpose",
+        "flag.structuring", "flag.rapid_movement", "flag.layering",
+        "flag.unusual_for_profile", "flag.third_party", "flag.shell_company",
+        "screening.sanctions_match", "screening.pep_match",
+        "screening.adverse_media_level", "screening.adverse_media",
+        "prior.sars_filed", "prior.account_closures",
+        "trade.goods_description", "trade.pricing_consistent", "trade.is_letter_of_credit",
+    ]
+    # Also derive some from engine facts
+    _derived_reg = {
+        "screening.sanctions_match": facts.get("sanctions_result") == "MATCH",
+        "screening.adverse_media_level": "confirmed_mltf" if facts.get("adverse_media_mltf") else "none",
+        "screening.adverse_media": bool(facts.get("adverse_media_mltf")),
+        "customer.pep": has_pep,
+        "txn.type": instrument_type if instrument_type != "unknown" else None,
+    }
+    for rf in _REGISTRY_FIELDS:
+        val = _reg_src.get(rf)
+        if val is None:
+            val = _derived_reg.get(rf)
+        if val is not None:
+            pre_evidence_used.append({"field": rf, "value": val})
+
+    # ── FINTRAC Citation Reference Map ─────────────────────────────────
+    # Maps rule/typology codes to actual regulatory text for VerbatimCitations.
+    # These are the real PCMLTFA / FINTRAC references that a compliance officer
+    # or regulator would expect to see in an audit package.
+    _CITATION_MAP = {
+        "HARD_STOP_CHECK": {
+            "ref": "PCMLTFA s. 7(1), FINTRAC Guideline 3",
+            "text": "Proceeds of Crime (Money Laundering) and Terrorist Financing Act — Where a reporting entity has reasonable grounds to suspect that a transaction or attempted transaction is related to the commission or attempted commission of a money laundering offence or a terrorist activity financing offence, the entity shall report the transaction or attempted transaction to the Centre.",
+        },
+        "PEP_ISOLATION": {
+            "ref": "PCMLTFA s. 9.3, FINTRAC Guideline 4 — PEP/HIO",
+            "text": "A reporting entity shall take reasonable measures to determine whether a person is a politically exposed foreign person, a politically exposed domestic person, or a head of an international organization. PEP status alone does not constitute reasonable grounds to suspect — additional risk factors must be present.",
+        },
+        "SUSPICION_TEST": {
+            "ref": "PCMLTFA s. 7(1)(a), FINTRAC Guideline 3 — STR",
+            "text": "A suspicious transaction report shall be submitted when there are reasonable grounds to suspect that the transaction is related to the commission of a money laundering offence or a terrorist activity financing offence. Suspicion must be fact-based and articulable.",
+        },
+        "STRUCTURING_PATTERN": {
+            "ref": "FINTRAC Guideline 3 — Structuring Indicators",
+            "text": "Structuring involves conducting transactions below the $10,000 reporting threshold to avoid triggering a Large Cash Transaction Report. This includes patterns of deposits/withdrawals just below the threshold, multiple same-day transactions, and the use of multiple accounts or locations.",
+        },
+        "LAYERING": {
+            "ref": "FINTRAC ML/TF Typologies — Layering",
+            "text": "Layering is the second stage of money laundering, involving complex layers of financial transactions designed to distance illicitly derived funds from their source. This may involve multiple transfers between accounts, use of shell companies, or cross-border movements.",
+        },
+        "SHELL_ENTITY": {
+            "ref": "FINTRAC ML/TF Typologies — Shell Companies",
+            "text": "Shell company indicators include nominee directors, registered agents in high-risk jurisdictions, no apparent legitimate business activity, and use of corporate structures to obscure beneficial ownership contrary to PCMLTFA s. 11.1 beneficial ownership requirements.",
+        },
+        "THIRD_PARTY_UNEXPLAINED": {
+            "ref": "FINTRAC Guideline 2 — Third-Party Determination",
+            "text": "A reporting entity shall take reasonable measures to determine whether a transaction is being conducted on behalf of a third party. Unexplained third-party involvement in financial transactions is a recognized ML/TF indicator.",
+        },
+        "FALSE_SOURCE": {
+            "ref": "PCMLTFA s. 6.1, FINTRAC Guideline 6 — Record Keeping",
+            "text": "Source of funds declarations that cannot be verified or are inconsistent with the client's known profile constitute a suspicious indicator. Reporting entities must keep records of information used to identify clients and verify their identity.",
+        },
+        "SANCTIONS_SIGNAL": {
+            "ref": "SEMA s. 4(1), PCMLTFA s. 11.42, UN Regulations",
+            "text": "Under the Special Economic Measures Act and United Nations Act regulations, it is prohibited to deal in property of designated persons. A confirmed sanctions match requires immediate blocking and reporting to FINTRAC and OSFI.",
+        },
+        "ADVERSE_MEDIA_CONFIRMED": {
+            "ref": "FINTRAC Guideline 4 — Risk Assessment, OSFI B-10 s. 7",
+            "text": "Confirmed adverse media linking a client to money laundering, terrorist financing, fraud, corruption, or organized crime is a key risk factor requiring enhanced due diligence measures and potential STR filing.",
+        },
+        "SAR_PATTERN": {
+            "ref": "PCMLTFA s. 7(1), FINTRAC Guideline 3 — Pattern of SARs",
+            "text": "A history of prior Suspicious Transaction Reports filed on a client indicates an established pattern of suspicious activity. Multiple prior SARs elevate the risk assessment and may trigger enhanced monitoring, exit consideration, or mandatory escalation.",
+        },
+        "EVASION_BEHAVIOR": {
+            "ref": "FINTRAC Guideline 3 — Unusual Activity Indicators",
+            "text": "Behaviour inconsistent with the client's known transaction profile or sudden spikes in transaction velocity are recognized indicators of potential money laundering. The reporting entity must assess whether such activity has a reasonable explanation.",
+        },
+        "ROUND_TRIP": {
+            "ref": "FINTRAC ML/TF Typologies — Round-Trip Transactions",
+            "text": "Round-trip transactions involve funds being sent to a jurisdiction and returned in a manner designed to disguise their origin. This is a recognized money laundering technique used to create the appearance of legitimate business transactions.",
+        },
+        "TRADE_BASED_LAUNDERING": {
+            "ref": "FINTRAC ML/TF Typologies — Trade-Based ML",
+            "text": "Trade-based money laundering involves the exploitation of international trade transactions to transfer value and obscure the origins of criminal proceeds. Indicators include over/under-invoicing, phantom shipments, and misrepresentation of trade goods.",
+        },
+        "FUNNEL": {
+            "ref": "FINTRAC ML/TF Typologies — Funnel Accounts",
+            "text": "Funnel account activity involves the use of bank accounts in one geographic area to consolidate and redirect funds to another area, often across borders. This is a recognized technique for integrating proceeds of crime.",
+        },
+        "VIRTUAL_ASSET_LAUNDERING": {
+            "ref": "PCMLTFA s. 1 (virtual currency), FINTRAC Guideline 5",
+            "text": "Virtual currency transactions require the same AML/ATF compliance obligations as fiat currency transactions. Indicators of virtual asset laundering include conversion to/from privacy coins, use of mixing services, and transactions with unhosted wallets.",
+        },
+        "TERRORIST_FINANCING": {
+            "ref": "PCMLTFA s. 7.1, Criminal Code s. 83.02-83.04",
+            "text": "Terrorist activity financing offences include providing or collecting property for terrorist purposes. Any transaction suspected of being related to terrorist financing must be reported to FINTRAC immediately. There is no monetary threshold for TF reporting.",
+        },
+    }
 
-        # Add typology-specific rule codes for the Typology Map component.
-        # The frontend TypologyMap matches these codes against 14 known typologies.
-        _TYPOLOGY_RULES = {
-            "STRUCTURING_PATTERN": lambda: any(i.get("code") == "STRUCTURING" for i in indicators),
-            "LAYERING": lambda: any(i.get("code") == "LAYERING" for i in indicators),
-            "SHELL_ENTITY": lambda: any(i.get("code") == "SHELL_COMPANY" for i in indicators),
-            "THIRD_PARTY_UNEXPLAINED": lambda: any(i.get("code") == "THIRD_PARTY" for i in indicators),
-            "FALSE_SOURCE": lambda: not facts.get("source_verified", True) and not facts.get("docs_complete", True),
-            "SANCTIONS_SIGNAL": lambda: facts.get("sanctions_result") == "MATCH",
-            "ADVERSE_MEDIA_CONFIRMED": lambda: bool(facts.get("adverse_media_mltf")),
-            "SAR_PATTERN": lambda: any(i.get("code") == "PRIOR_SARS" for i in indicators),
-            "EVASION_BEHAVIOR": lambda: any(i.get("code") in ("UNUSUAL_FOR_PROFILE", "VELOCITY_SPIKE") for i in indicators),
-            "ROUND_TRIP": lambda: any(i.get("code") == "ROUND_TRIP" for i in indicators),
-            "TRADE_BASED_LAUNDERING": lambda: any(i.get("code") == "TRADE_BASED" for i in indicators),
-            "FUNNEL": lambda: any(i.get("code") == "FUNNEL_ACCOUNT" for i in indicators),
-            "VIRTUAL_ASSET_LAUNDERING": lambda: instrument_type == "crypto",
-            "TERRORIST_FINANCING": lambda: any(i.get("code") == "TERRORIST_FINANCING" for i in indicators),
-        }
-        for t_code, t_check in _TYPOLOGY_RULES.items():
-            try:
-                if t_check():
-                    cite = _CITATION_MAP.get(t_code, {})
-                    pre_rules_fired.append({
-                        "code": t_code, "result": "TRIGGERED",
-                        "reason": f"{t_code} typology detected",
-                        "citation_ref": cite.get("ref", ""),
-                        "citation_text": cite.get("text", ""),
-                    })
-            except Exception:
-                pass
+    pre_rules_fired = [
+        {"code": "HARD_STOP_CHECK", "result": "TRIGGERED" if hard_stop_triggered else "CLEAR",
+         "reason": "Hard stop conditions detected" if hard_stop_triggered else "No hard stop conditions",
+         "citation_ref": _CITATION_MAP["HARD_STOP_CHECK"]["ref"],
+         "citation_text": _CITATION_MAP["HARD_STOP_CHECK"]["text"]},
+        {"code": "PEP_ISOLATION", "result": "APPLIED" if has_pep else "NOT_APPLICABLE",
+         "reason": "PEP status alone cannot escalate" if has_pep else "Not a PEP",
+         "citation_ref": _CITATION_MAP["PEP_ISOLATION"]["ref"],
+         "citation_text": _CITATION_MAP["PEP_ISOLATION"]["text"]},
+        {"code": "SUSPICION_TEST", "result": "ACTIVATED" if suspicion_activated else "CLEAR",
+         "reason": suspicion_basis,
+         "citation_ref": _CITATION_MAP["SUSPICION_TEST"]["ref"],
+         "citation_text": _CITATION_MAP["SUSPICION_TEST"]["text"]},
+    ]
 
-        # Also include any indicators from the input payload as evidence
-        for ind in indicators:
-            ind_field = f"indicator.{ind.get('code', 'unknown')}"
-            pre_evidence_used.append({"field": ind_field, "value": ind.get("corroborated", False)})
-
-        # Construct classifier inputs from layers
-        # Build typology label from indicators for driver derivation
-        _typology_label = "primary"
-        _indicator_codes = [ind.get("code", "") for ind in indicators]
-        if "ADVERSE_MEDIA" in _indicator_codes:
-            _typology_label = "adverse_media"
-        elif "STRUCTURING" in _indicator_codes:
-            _typology_label = "structuring"
-        elif "LAYERING" in _indicator_codes:
-            _typology_label = "layering"
-        elif "VELOCITY_SPIKE" in _indicator_codes:
-            _typology_label = "unusual_activity"
-        elif "SHELL_COMPANY" in _indicator_codes:
-            _typology_label = "shell_company"
-        elif "THIRD_PARTY" in _indicator_codes:
-            _typology_label = "third_party"
-        elif facts.get("sanctions_result") == "MATCH":
-            _typology_label = "sanctions"
-        layer4_typologies_pre = {
-            "typologies": [{"name": _typology_label, "maturity": typology_maturity}],
+    # Add typology-specific rule codes for the Typology Map component.
+    # The frontend TypologyMap matches these codes against 14 known typologies.
+    _TYPOLOGY_RULES = {
+        "STRUCTURING_PATTERN": lambda: any(i.get("code") == "STRUCTURING" for i in indicators),
+        "LAYERING": lambda: any(i.get("code") == "LAYERING" for i in indicators),
+        "SHELL_ENTITY": lambda: any(i.get("code") == "SHELL_COMPANY" for i in indicators),
+        "THIRD_PARTY_UNEXPLAINED": lambda: any(i.get("code") == "THIRD_PARTY" for i in indicators),
+        "FALSE_SOURCE": lambda: not facts.get("source_verified", True) and not facts.get("docs_complete", True),
+        "SANCTIONS_SIGNAL": lambda: facts.get("sanctions_result") == "MATCH",
+        "ADVERSE_MEDIA_CONFIRMED": lambda: bool(facts.get("adverse_media_mltf")),
+        "SAR_PATTERN": lambda: any(i.get("code") == "PRIOR_SARS" for i in indicators),
+        "EVASION_BEHAVIOR": lambda: any(i.get("code") in ("UNUSUAL_FOR_PROFILE", "VELOCITY_SPIKE") for i in indicators),
+        "ROUND_TRIP": lambda: any(i.get("code") == "ROUND_TRIP" for i in indicators),
+        "TRADE_BASED_LAUNDERING": lambda: any(i.get("code") == "TRADE_BASED" for i in indicators),
+        "FUNNEL": lambda: any(i.get("code") == "FUNNEL_ACCOUNT" for i in indicators),
+        "VIRTUAL_ASSET_LAUNDERING": lambda: instrument_type == "crypto",
+        "TERRORIST_FINANCING": lambda: any(i.get("code") == "TERRORIST_FINANCING" for i in indicators),
+    }
+    for t_code, t_check in _TYPOLOGY_RULES.items():
+        try:
+            if t_check():
+                cite = _CITATION_MAP.get(t_code, {})
+                pre_rules_fired.append({
+                    "code": t_code, "result": "TRIGGERED",
+                    "reason": f"{t_code} typology detected",
+                    "citation_ref": cite.get("ref", ""),
+                    "citation_text": cite.get("text", ""),
+                })
+        except Exception:
+            pass
+
+    # Also include any indicators from the input payload as evidence
+    for ind in indicators:
+        ind_field = f"indicator.{ind.get('code', 'unknown')}"
+        pre_evidence_used.append({"field": ind_field, "value": ind.get("corroborated", False)})
+
+    # Construct classifier inputs from layers
+    # Build typology label from indicators for driver derivation
+    _typology_label = "primary"
+    _indicator_codes = [ind.get("code", "") for ind in indicators]
+    if "ADVERSE_MEDIA" in _indicator_codes:
+        _typology_label = "adverse_media"
+    elif "STRUCTURING" in _indicator_codes:
+        _typology_label = "structuring"
+    elif "LAYERING" in _indicator_codes:
+        _typology_label = "layering"
+    elif "VELOCITY_SPIKE" in _indicator_codes:
+        _typology_label = "unusual_activity"
+    elif "SHELL_COMPANY" in _indicator_codes:
+        _typology_label = "shell_company"
+    elif "THIRD_PARTY" in _indicator_codes:
+        _typology_label = "third_party"
+    elif facts.get("sanctions_result") == "MATCH":
+        _typology_label = "sanctions"
+    layer4_typologies_pre = {
+        "typologies": [{"name": _typology_label, "maturity": typology_maturity}],
+    }
+    layer6_suspicion_pre = {
+        "activated": suspicion_activated,
+        "basis": suspicion_basis,
+        "elements": {
+            "has_intent": suspicion_evidence.get("has_intent", False),
+            "has_deception": suspicion_evidence.get("has_deception", False),
+            "has_sustained_pattern": suspicion_evidence.get("has_sustained_pattern", False),
+        },
+    }
+
+    # Build layer1_facts for classifier (transaction + customer context)
+    layer1_facts_pre = {}
+    primary_txn_pre = None
+    if isinstance(body.get("transaction"), dict):
+        primary_txn_pre = body.get("transaction")
+    elif isinstance(body.get("events"), list):
+        for event in body.get("events", []):
+            if isinstance(event, dict) and event.get("event_type") == "transaction":
+                primary_txn_pre = event
+                break
+    if primary_txn_pre:
+        layer1_facts_pre["transaction"] = {
+            "cross_border": primary_txn_pre.get("cross_border", False),
+            "destination": primary_txn_pre.get("destination_country", ""),
+            "method": primary_txn_pre.get("payment_method") or primary_txn_pre.get("method", ""),
         }
-        layer6_suspicion_pre = {
-            "activated": suspicion_activated,
-            "basis": suspicion_basis,
-            "elements": {
-                "has_intent": suspicion_evidence.get("has_intent", False),
-                "has_deception": suspicion_evidence.get("has_deception", False),
-                "has_sustained_pattern": suspicion_evidence.get("has_sustained_pattern", False),
-            },
+    elif is_demo and isinstance(demo_inputs.get("_canonical_facts"), dict):
+        # For demo cases, derive transaction context from canonical facts
+        _cf = demo_inputs["_canonical_facts"]
+        _df = demo_inputs.get("_demo_facts", {})
+        layer1_facts_pre["transaction"] = {
+            "cross_border": _cf.get("txn.cross_border", False),
+            "destination": _df.get("transaction.destination", ""),
+            "method": _df.get("transaction.method", ""),
         }
+        # Also add hard_stop_triggered to help driver derivation
+        if hard_stop_triggered:
+            layer1_facts_pre["hard_stop_triggered"] = True
+            if facts.get("adverse_media_mltf"):
+                layer1_facts_pre["hard_stop_reason"] = "ADVERSE_MEDIA_MLTF"
+            elif facts.get("sanctions_result") == "MATCH":
+                layer1_facts_pre["hard_stop_reason"] = "SANCTIONS_MATCH"
+            else:
+                layer1_facts_pre["hard_stop_reason"] = "Triggered"
+    customer_record = body.get("customer_record", {})
+    layer1_facts_pre["customer"] = {
+        "pep_flag": customer_record.get("pep_flag") == "Y" or has_pep,
+    }
 
-        # Build layer1_facts for classifier (transaction + customer context)
-        layer1_facts_pre = {}
-        primary_txn_pre = None
-        if isinstance(body.get("transaction"), dict):
-            primary_txn_pre = body.get("transaction")
-        elif isinstance(body.get("events"), list):
-            for event in body.get("events", []):
-                if isinstance(event, dict) and event.get("event_type") == "transaction":
-                    primary_txn_pre = event
-                    break
-        if primary_txn_pre:
-            layer1_facts_pre["transaction"] = {
-                "cross_border": primary_txn_pre.get("cross_border", False),
-                "destination": primary_txn_pre.get("destination_country", ""),
-                "method": primary_txn_pre.get("payment_method") or primary_txn_pre.get("method", ""),
+    # Run classifier as SOVEREIGN AUTHORITY
+    classifier_result = classify_suspicion(
+        evidence_used=pre_evidence_used,
+        rules_fired=pre_rules_fired,
+        layer4_typologies=layer4_typologies_pre,
+        layer6_suspicion=layer6_suspicion_pre,
+        layer1_facts=layer1_facts_pre,
+        mitigations=mitigations or None,
+    )
+    timer.mark("classifier")
+
+    # ── HARD GATE: Classifier Sovereignty ────────────────────────────
+    # IF Tier 1 == 0 → STR is impossible. Period.
+    classifier_override_applied = False
+    classifier_original_verdict = None
+
+    if classifier_result.suspicion_count == 0 and final_decision.get("str_required", False):
+        # CRITICAL: Rules engine tried to file STR without suspicion.
+        # This is a regulatory control violation. Override immediately.
+        classifier_override_applied = True
+        classifier_original_verdict = "STR"
+        logger.warning(
+            "CLASSIFIER SOVEREIGNTY: STR blocked — Tier 1 suspicion count is 0. "
+            "Rules engine verdict overridden to protect regulatory integrity.",
+            extra={"request_id": request_id, "external_id": external_id},
+        )
+        # Downgrade to EDD if investigative signals exist, else NO_REPORT
+        if classifier_result.investigative_count >= 1:
+            final_decision = {
+                "verdict": "REVIEW",
+                "action": "EDD_REQUIRED",
+                "str_required": False,
+                "escalation_blocked_by_classifier": True,
+                "classifier_override_reason": (
+                    f"Tier 1 suspicion indicators: 0. "
+                    f"Tier 2 investigative signals: {classifier_result.investigative_count}. "
+                    "STR filing prohibited by classifier sovereignty. EDD required."
+                ),
             }
-        elif is_demo and isinstance(demo_inputs.get("_canonical_facts"), dict):
-            # For demo cases, derive transaction context from canonical facts
-            _cf = demo_inputs["_canonical_facts"]
-            _df = demo_inputs.get("_demo_facts", {})
-            layer1_facts_pre["transaction"] = {
-                "cross_border": _cf.get("txn.cross_border", False),
-                "destination": _df.get("transaction.destination", ""),
-                "method": _df.get("transaction.method", ""),
+        else:
+            final_decision = {
+                "verdict": "PASS",
+                "action": "CLOSE",
+                "str_required": False,
+                "escalation_blocked_by_classifier": True,
+                "classifier_override_reason": (
+                    "Tier 1 suspicion indicators: 0. "
+                    "Tier 2 investigative signals: 0. "
+                    "No reporting or escalation obligation."
+                ),
             }
-            # Also add hard_stop_triggered to help driver derivation
-            if hard_stop_triggered:
-                layer1_facts_pre["hard_stop_triggered"] = True
-                if facts.get("adverse_media_mltf"):
-                    layer1_facts_pre["hard_stop_reason"] = "ADVERSE_MEDIA_MLTF"
-                elif facts.get("sanctions_result") == "MATCH":
-                    layer1_facts_pre["hard_stop_reason"] = "SANCTIONS_MATCH"
-                else:
-                    layer1_facts_pre["hard_stop_reason"] = "Triggered"
-        customer_record = body.get("customer_record", {})
-        layer1_facts_pre["customer"] = {
-            "pep_flag": customer_record.get("pep_flag") == "Y" or has_pep,
-        }
 
-        # Run classifier as SOVEREIGN AUTHORITY
-        classifier_result = classify_suspicion(
-            evidence_used=pre_evidence_used,
-            rules_fired=pre_rules_fired,
-            layer4_typologies=layer4_typologies_pre,
-            layer6_suspicion=layer6_suspicion_pre,
-            layer1_facts=layer1_facts_pre,
-            mitigations=mitigations or None,
-        )
-
-        # ── HARD GATE: Classifier Sovereignty ────────────────────────────
-        # IF Tier 1 == 0 → STR is impossible. Period.
-        classifier_override_applied = False
-        classifier_original_verdict = None
+    elif classifier_result.suspicion_count == 0 and (
+        esc_result.decision == EscalationDecision.PERMITTED
+        and not final_decision.get("str_required", False)
+    ):
+        # Escalation was permitted but no Tier 1 — downgrade to EDD
+        if classifier_result.investigative_count >= 1:
+            classifier_override_applied = True
+            classifier_original_verdict = final_decision.get("verdict", "ESCALATE")
+            logger.info(
+                "CLASSIFIER SOVEREIGNTY: Escalation downgraded to EDD — "
+                "no Tier 1 suspicion indicators.",
+                extra={"request_id": request_id, "external_id": external_id},
+            )
+            final_decision = {
+                "verdict": "REVIEW",
+                "action": "EDD_REQUIRED",
+                "str_required": False,
+                "escalation_blocked_by_classifier": True,
+                "classifier_override_reason": (
+                    f"Tier 1 suspicion indicators: 0. "
+                    f"Tier 2 investigative signals: {classifier_result.investigative_count}. "
+                    "Escalation downgraded to EDD by classifier sovereignty."
+                ),
+            }
 
-        if classifier_result.suspicion_count == 0 and final_decision.get("str_required", False):
-            # CRITICAL: Rules engine tried to file STR without suspicion.
-            # This is a regulatory control violation. Override immediately.
+    # ── Must-investigate EDD enforcement ──────────────────────────────
+    # Certain Tier 2 signals represent regulatory investigation requirements
+    # that must not be cleared without EDD, even when the engine says PASS.
+    # Contextual signals (HIGH_VALUE, CROSS_BORDER) do NOT force EDD alone.
+    _MUST_INVESTIGATE_T2 = frozenset({
+        "ADVERSE_MEDIA_UNCONFIRMED",
+        "TRADE_FINANCE_SUSPICIOUS",
+        "COMBO_MODERATE_MULTI_FLAG",
+    })
+    if (
+        not classifier_override_applied
+        and classifier_result.suspicion_count == 0
+        and classifier_result.investigative_count >= 1
+        and final_decision.get("final_decision") == "PASS"
+    ):
+        t2_codes = {s.get("code") for s in classifier_result.tier2_signals}
+        must_investigate = t2_codes & _MUST_INVESTIGATE_T2
+        if must_investigate:
             classifier_override_applied = True
-            classifier_original_verdict = "STR"
-            logger.warning(
-                "CLASSIFIER SOVEREIGNTY: STR blocked — Tier 1 suspicion count is 0. "
-                "Rules engine verdict overridden to protect regulatory integrity.",
+            classifier_original_verdict = "PASS"
+            logger.info(
+                "CLASSIFIER SOVEREIGNTY: PASS upgraded to EDD — "
+                "must-investigate Tier 2 signal(s): %s",
+                ", ".join(sorted(must_investigate)),
                 extra={"request_id": request_id, "external_id": external_id},
             )
-            # Downgrade to EDD if investigative signals exist, else NO_REPORT
-            if classifier_result.investigative_count >= 1:
-                final_decision = {
-                    "verdict": "REVIEW",
-                    "action": "EDD_REQUIRED",
-                    "str_required": False,
-                    "escalation_blocked_by_classifier": True,
-                    "classifier_override_reason": (
-                        f"Tier 1 suspicion indicators: 0. "
-                        f"Tier 2 investigative signals: {classifier_result.investigative_count}. "
-                        "STR filing prohibited by classifier sovereignty. EDD required."
-                    ),
-                }
-            else:
-                final_decision = {
-                    "verdict": "PASS",
-                    "action": "CLOSE",
-                    "str_required": False,
-                    "escalation_blocked_by_classifier": True,
-                    "classifier_override_reason": (
-                        "Tier 1 suspicion indicators: 0. "
-                        "Tier 2 investigative signals: 0. "
-                        "No reporting or escalation obligation."
-                    ),
-                }
+            final_decision = {
+                "verdict": "REVIEW",
+                "action": "EDD_REQUIRED",
+                "str_required": False,
+                "must_investigate_edd": True,
+                "classifier_override_reason": (
+                    f"Tier 1 suspicion indicators: 0. "
+                    f"Must-investigate Tier 2 signal(s): "
+                    f"{', '.join(sorted(must_investigate))}. "
+                    "Engine PASS overridden — investigation required before clearing."
+                ),
+            }
 
-        elif classifier_result.suspicion_count == 0 and (
-            esc_result.decision == EscalationDecision.PERMITTED
-            and not final_decision.get("str_required", False)
-        ):
-            # Escalation was permitted but no Tier 1 — downgrade to EDD
-            if classifier_result.investigative_count >= 1:
-                classifier_override_applied = True
-                classifier_original_verdict = final_decision.get("verdict", "ESCALATE")
-                logger.info(
-                    "CLASSIFIER SOVEREIGNTY: Escalation downgraded to EDD — "
-                    "no Tier 1 suspicion indicators.",
-                    extra={"request_id": request_id, "external_id": external_id},
-                )
-                final_decision = {
-                    "verdict": "REVIEW",
-                    "action": "EDD_REQUIRED",
-                    "str_required": False,
-                    "escalation_blocked_by_classifier": True,
-                    "classifier_override_reason": (
-                        f"Tier 1 suspicion indicators: 0. "
-                        f"Tier 2 investigative signals: {classifier_result.investigative_count}. "
-                        "Escalation downgraded to EDD by classifier sovereignty."
-                    ),
-                }
+    # Build decision pack
+    decision_pack = build_decision_pack(
+        case_id=external_id,
+        input_data=body,
+        facts=facts,
+        obligations=obligations,
+        indicators=indicators,
+        typology_maturity=typology_maturity,
+        mitigations=mitigations,
+        suspicion_evidence=suspicion_evidence,
+        esc_result=esc_result,
+        str_result=str_result,
+        final_decision=final_decision,
+        jurisdiction=DG_JURISDICTION,
+        fintrac_indicators=fintrac_indicators,
+        domain=DG_DOMAIN,
+    )
+    timer.mark("decision_pack")
+
+    # ── Override evaluation_trace with enhanced evidence + rules ────────
+    # build_decision_pack() constructs a minimal 8-element evidence list.
+    # Replace with the full pre_evidence_used (27 registry fields + indicators)
+    # and pre_rules_fired (typology-specific rule codes) so the report
+    # pipeline and frontend Evidence Gap Tracker / Typology Map work.
+    decision_pack["evaluation_trace"]["evidence_used"] = pre_evidence_used
+    decision_pack["evaluation_trace"]["rules_fired"] = pre_rules_fired
+
+    # Add engine commit (decision_pack.py doesn't know about git)
+    decision_pack["meta"]["engine_commit"] = DG_ENGINE_COMMIT
+    # Note: policy_hash and decision_id are computed by decision_pack.py with full SHA-256
+
+    # Attach optional classification metadata for audit/reporting
+    meta_block = body.get("meta") or {}
+    source_type = meta_block.get("source_type") or body.get("source_type") or "prod"
+    scenario_code = meta_block.get("scenario_code") or body.get("scenario_code")
+    seed_category = meta_block.get("seed_category") or body.get("seed_category")
+    decision_pack["meta"]["source_type"] = str(source_type).lower()
+    decision_pack["meta"]["scenario_code"] = normalize_scenario_code(scenario_code)
+    decision_pack["meta"]["seed_category"] = normalize_seed_category(seed_category)
+
+    # ── Attach classifier result to decision pack ──
+    decision_pack["classifier"] = classifier_result.to_dict()
+    decision_pack["classifier"]["sovereign"] = True
+    if classifier_override_applied:
+        decision_pack["classifier"]["override_applied"] = True
+        decision_pack["classifier"]["original_verdict"] = classifier_original_verdict
+        decision_pack["classifier"]["override_reason"] = final_decision.get(
+            "classifier_override_reason", "Classifier sovereignty enforced"
+        )
+        # Patch decision block to reflect override
+        decision_pack["decision"]["verdict"] = final_decision.get("verdict", "REVIEW")
+        decision_pack["decision"]["action"] = final_decision.get("action", "EDD_REQUIRED")
+        decision_pack["decision"]["str_required"] = "NO"
+        decision_pack["decision"]["classifier_override"] = True
+        # Update rationale
+        decision_pack["rationale"]["summary"] = (
+            f"Classifier sovereignty override: {classifier_result.outcome}. "
+            f"{classifier_result.outcome_reason}"
+        )
+        decision_pack["rationale"]["str_rationale"] = None
+
+    # Build fingerprint facts for precedent similarity
+    fingerprint_facts = {}
+    if isinstance(body.get("facts"), dict):
+        fingerprint_facts.update(body.get("facts", {}))
+    # For demo/seed cases, merge the CANONICAL registry fields into fingerprint
+    # (translated to proper vocabulary: "individual" not "IND", etc.)
+    if is_demo and isinstance(demo_inputs.get("_canonical_facts"), dict):
+        for k, v in demo_inputs["_canonical_facts"].items():
+            fingerprint_facts.setdefault(k, v)
+    elif is_demo and isinstance(demo_inputs.get("_demo_facts"), dict):
+        for k, v in demo_inputs["_demo_facts"].items():
+            if "." in k:  # only registry-style fields
+                fingerprint_facts.setdefault(k, v)
+    fingerprint_facts.update(facts)
+    fingerprint_facts.setdefault("txn.type", instrument_type)
+    fingerprint_facts.setdefault(
+        "screening.sanctions_match",
+        True if facts.get("sanctions_result") == "MATCH" else False,
+    )
+    fingerprint_facts.setdefault(
+        "screening.adverse_media_level",
+        "confirmed_mltf" if facts.get("adverse_media_mltf") else ("confirmed" if facts.get("adverse_media") else "none"),
+    )
+    fingerprint_facts.setdefault(
+        "screening.adverse_media",
+        bool(facts.get("adverse_media_mltf")) or bool(facts.get("adverse_media")),
+    )
+    fingerprint_facts.setdefault("customer.pep", any("PEP" in str(o) for o in obligations))
+    fingerprint_facts.setdefault("customer.pep_type", "foreign" if any("FOREIGN" in str(o) for o in obligations) else "domestic")
+    fingerprint_facts["gate1_allowed"] = esc_result.decision == EscalationDecision.PERMITTED
+    fingerprint_facts["gate2_str_required"] = final_decision.get("str_required", False)
+    fingerprint_facts["classifier_str_required"] = (
+        classifier_result.outcome == "STR_REQUIRED"
+    )
 
-        # ── Must-investigate EDD enforcement ──────────────────────────────
-        # Certain Tier 2 signals represent regulatory investigation requirements
-        # that must not be cleared without EDD, even when the engine says PASS.
-        # Contextual signals (HIGH_VALUE, CROSS_BORDER) do NOT force EDD alone.
-        _MUST_INVESTIGATE_T2 = frozenset({
-            "ADVERSE_MEDIA_UNCONFIRMED",
-            "TRADE_FINANCE_SUSPICIOUS",
-            "COMBO_MODERATE_MULTI_FLAG",
-        })
-        if (
-            not classifier_override_applied
-            and classifier_result.suspicion_count == 0
-            and classifier_result.investigative_count >= 1
-            and final_decision.get("final_decision") == "PASS"
-        ):
-            t2_codes = {s.get("code") for s in classifier_result.tier2_signals}
-            must_investigate = t2_codes & _MUST_INVESTIGATE_T2
-            if must_investigate:
-                classifier_override_applied = True
-                classifier_original_verdict = "PASS"
-                logger.info(
-                    "CLASSIFIER SOVEREIGNTY: PASS upgraded to EDD — "
-                    "must-investigate Tier 2 signal(s): %s",
-                    ", ".join(sorted(must_investigate)),
-                    extra={"request_id": request_id, "external_id": external_id},
-                )
-                final_decision = {
-                    "verdict": "REVIEW",
-                    "action": "EDD_REQUIRED",
-                    "str_required": False,
-                    "must_investigate_edd": True,
-                    "classifier_override_reason": (
-                        f"Tier 1 suspicion indicators: 0. "
-                        f"Must-investigate Tier 2 signal(s): "
-                        f"{', '.join(sorted(must_investigate))}. "
-                        "Engine PASS overridden — investigation required before clearing."
-                    ),
-                }
+    # Enrich fingerprint facts from input payload when available
+    primary_txn = None
+    if isinstance(body.get("transaction"), dict):
+        primary_txn = body.get("transaction")
+    elif isinstance(body.get("events"), list):
+        for event in body.get("events", []):
+            if isinstance(event, dict) and event.get("event_type") == "transaction":
+                primary_txn = event
+                break
+
+    if primary_txn:
+        txn_method = (
+            primary_txn.get("payment_method")
+            or primary_txn.get("method")
+            or primary_txn.get("type")
+        )
+        if txn_method:
+            fingerprint_facts.setdefault("txn.type", txn_method)
 
-        # Build decision pack
-        decision_pack = build_decision_pack(
-            case_id=external_id,
-            input_data=body,
-            facts=facts,
-            obligations=obligations,
-            indicators=indicators,
-            typology_maturity=typology_maturity,
-            mitigations=mitigations,
-            suspicion_evidence=suspicion_evidence,
-            esc_result=esc_result,
-            str_result=str_result,
-            final_decision=final_decision,
-            jurisdiction=DG_JURISDICTION,
-            fintrac_indicators=fintrac_indicators,
-            domain=DG_DOMAIN,
+        txn_amount = (
+            primary_txn.get("amount_cad")
+            or primary_txn.get("amount")
+            or primary_txn.get("amount_value")
         )
+        if txn_amount is not None and "txn.amount_band" not in fingerprint_facts:
+            try:
+                amount_band = create_txn_amount_banding().apply(txn_amount)
+                fingerprint_facts["txn.amount_band"] = amount_band
+            except Exception:
+                pass
 
-        # ── Override evaluation_trace with enhanced evidence + rules ────────
-        # build_decision_pack() constructs a minimal 8-element evidence list.
-        # Replace with the full pre_evidence_used (27 registry fields + indicators)
-        # and pre_rules_fired (typology-specific rule codes) so the report
-        # pipeline and frontend Evidence Gap Tracker / Typology Map work.
-        decision_pack["evaluation_trace"]["evidence_used"] = pre_evidence_used
-        decision_pack["evaluation_trace"]["rules_fired"] = pre_rules_fired
-
-        # Add engine commit (decision_pack.py doesn't know about git)
-        decision_pack["meta"]["engine_commit"] = DG_ENGINE_COMMIT
-        # Note: policy_hash and decision_id are computed by decision_pack.py with full SHA-256
-
-        # Attach optional classification metadata for audit/reporting
-        meta_block = body.get("meta") or {}
-        source_type = meta_block.get("source_type") or body.get("source_type") or "prod"
-        scenario_code = meta_block.get("scenario_code") or body.get("scenario_code")
-        seed_category = meta_block.get("seed_category") or body.get("seed_category")
-        decision_pack["meta"]["source_type"] = str(source_type).lower()
-        decision_pack["meta"]["scenario_code"] = normalize_scenario_code(scenario_code)
-        decision_pack["meta"]["seed_category"] = normalize_seed_category(seed_category)
-
-        # ── Attach classifier result to decision pack ──
-        decision_pack["classifier"] = classifier_result.to_dict()
-        decision_pack["classifier"]["sovereign"] = True
-        if classifier_override_applied:
-            decision_pack["classifier"]["override_applied"] = True
-            decision_pack["classifier"]["original_verdict"] = classifier_original_verdict
-            decision_pack["classifier"]["override_reason"] = final_decision.get(
-                "classifier_override_reason", "Classifier sovereignty enforced"
+        destination_country = (
+            primary_txn.get("destination_country")
+            or primary_txn.get("counterparty_country")
+        )
+        if destination_country and "txn.cross_border" not in fingerprint_facts:
+            case_jurisdiction = (
+                (body.get("meta") or {}).get("jurisdiction")
+                or DG_JURISDICTION
             )
-            # Patch decision block to reflect override
-            decision_pack["decision"]["verdict"] = final_decision.get("verdict", "REVIEW")
-            decision_pack["decision"]["action"] = final_decision.get("action", "EDD_REQUIRED")
-            decision_pack["decision"]["str_required"] = "NO"
-            decision_pack["decision"]["classifier_override"] = True
-            # Update rationale
-            decision_pack["rationale"]["summary"] = (
-                f"Classifier sovereignty override: {classifier_result.outcome}. "
-                f"{classifier_result.outcome_reason}"
+            fingerprint_facts["txn.cross_border"] = str(destination_country) != str(case_jurisdiction)
+
+        if primary_txn.get("destination_country_risk") is not None:
+            fingerprint_facts.setdefault(
+                "txn.destination_country_risk",
+                primary_txn.get("destination_country_risk"),
             )
-            decision_pack["rationale"]["str_rationale"] = None
-
-        # Build fingerprint facts for precedent similarity
-        fingerprint_facts = {}
-        if isinstance(body.get("facts"), dict):
-            fingerprint_facts.update(body.get("facts", {}))
-        # For demo/seed cases, merge the CANONICAL registry fields into fingerprint
-        # (translated to proper vocabulary: "individual" not "IND", etc.)
-        if is_demo and isinstance(demo_inputs.get("_canonical_facts"), dict):
-            for k, v in demo_inputs["_canonical_facts"].items():
-                fingerprint_facts.setdefault(k, v)
-        elif is_demo and isinstance(demo_inputs.get("_demo_facts"), dict):
-            for k, v in demo_inputs["_demo_facts"].items():
-                if "." in k:  # only registry-style fields
-                    fingerprint_facts.setdefault(k, v)
-        fingerprint_facts.update(facts)
-        fingerprint_facts.setdefault("txn.type", instrument_type)
-        fingerprint_facts.setdefault(
-            "screening.sanctions_match",
-            True if facts.get("sanctions_result") == "MATCH" else False,
-        )
-        fingerprint_facts.setdefault(
-            "screening.adverse_media_level",
-            "confirmed_mltf" if facts.get("adverse_media_mltf") else ("confirmed" if facts.get("adverse_media") else "none"),
-        )
-        fingerprint_facts.setdefault(
-            "screening.adverse_media",
-            bool(facts.get("adverse_media_mltf")) or bool(facts.get("adverse_media")),
-        )
-        fingerprint_facts.setdefault("customer.pep", any("PEP" in str(o) for o in obligations))
-        fingerprint_facts.setdefault("customer.pep_type", "foreign" if any("FOREIGN" in str(o) for o in obligations) else "domestic")
-        fingerprint_facts["gate1_allowed"] = esc_result.decision == EscalationDecision.PERMITTED
-        fingerprint_facts["gate2_str_required"] = final_decision.get("str_required", False)
-        fingerprint_facts["classifier_str_required"] = (
-            classifier_result.outcome == "STR_REQUIRED"
-        )
 
-        # Enrich fingerprint facts from input payload when available
-        primary_txn = None
-        if isinstance(body.get("transaction"), dict):
-            primary_txn = body.get("transaction")
-        elif isinstance(body.get("events"), list):
-            for event in body.get("events", []):
-                if isinstance(event, dict) and event.get("event_type") == "transaction":
-                    primary_txn = event
+    if "customer.type" not in fingerprint_facts:
+        primary_entity_type = (body.get("meta") or {}).get("primary_entity_type")
+        if primary_entity_type:
+            fingerprint_facts["customer.type"] = primary_entity_type
+        else:
+            has_orgs = bool(body.get("organizations"))
+            has_inds = bool(body.get("individuals"))
+            if has_orgs and not has_inds:
+                fingerprint_facts["customer.type"] = "corporation"
+            elif has_inds and not has_orgs:
+                fingerprint_facts["customer.type"] = "individual"
+            elif has_orgs and has_inds:
+                fingerprint_facts["customer.type"] = "mixed"
+
+    if "customer.relationship_length" not in fingerprint_facts and isinstance(body.get("assertions"), list):
+        for assertion in body.get("assertions", []):
+            if not isinstance(assertion, dict):
+                continue
+            if assertion.get("predicate") in {"relationship_tenure", "relationship_length"}:
+                value = assertion.get("value")
+                if value is not None:
+                    fingerprint_facts["customer.relationship_length"] = value
                     break
 
-        if primary_txn:
-            txn_method = (
-                primary_txn.get("payment_method")
-                or primary_txn.get("method")
-                or primary_txn.get("type")
-            )
-            if txn_method:
-                fingerprint_facts.setdefault("txn.type", txn_method)
+    # Query similar precedents and add to decision pack
+    reason_codes = extract_reason_codes(facts, indicators, obligations)
+    proposed_outcome = decision_pack["decision"]["verdict"].lower()
+    # Map engine verdict to precedent outcome codes (banking vocabulary)
+    # The scorer uses v2 three-field canonical outcomes internally;
+    # this v1 mapping exists for backward compat with precedent comparison.
+    outcome_map = {
+        "str": "escalate",
+        "escalate": "escalate",
+        "hard_stop": "deny",
+        "pass": "pay",
+        "pass_with_edd": "escalate",
+        "block": "deny",
+        "edd": "escalate",
+        "allow": "pay",
+    }
+    proposed_outcome = outcome_map.get(proposed_outcome, "escalate")
+
+    # ── Classifier sovereignty override ──────────────────────────────
+    # When the classifier independently determined STR_REQUIRED but the
+    # engine returned PASS/PAY (gates blocked escalation), the governed
+    # disposition is EDD_REQUIRED, not ALLOW.  The precedent comparison
+    # must use the governed outcome so operational and regulatory alignment
+    # metrics reflect what the compliance officer actually sees.
+    if (classifier_result.outcome == "STR_REQUIRED"
+            and proposed_outcome == "pay"):
+        proposed_outcome = "escalate"
+
+    precedent_analysis = query_similar_precedents(
+        reason_codes=reason_codes,
+        proposed_outcome=proposed_outcome,
+        domain=decision_pack.get("meta", {}).get("domain"),
+        case_facts=fingerprint_facts,
+        jurisdiction=DG_JURISDICTION,
+    )
+    decision_pack["precedent_analysis"] = precedent_analysis
+    timer.mark("precedents")
 
-            txn_amount = (
-                primary_txn.get("amount_cad")
-                or primary_txn.get("amount")
-                or primary_txn.get("amount_value")
-            )
-            if txn_amount is not None and "txn.amount_band" not in fingerprint_facts:
-                try:
-                    amount_band = create_txn_amount_banding().apply(txn_amount)
-                    fingerprint_facts["txn.amount_band"] = amount_band
-                except Exception:
-                    pass
-
-            destination_country = (
-                primary_txn.get("destination_country")
-                or primary_txn.get("counterparty_country")
-            )
-            if destination_country and "txn.cross_border" not in fingerprint_facts:
-                case_jurisdiction = (
-                    (body.get("meta") or {}).get("jurisdiction")
-                    or DG_JURISDICTION
-                )
-                fingerprint_facts["txn.cross_border"] = str(destination_country) != str(case_jurisdiction)
+    # Runtime invariant checks (PRECEDENT_OUTCOME_MODEL_V2.md §10)
+    invariant_violations = check_precedent_invariants(
+        precedent_analysis=precedent_analysis,
+        decision_id=decision_pack["meta"]["decision_id"],
+    )
+    if invariant_violations:
+        decision_pack["invariant_violations"] = invariant_violations
 
-            if primary_txn.get("destination_country_risk") is not None:
-                fingerprint_facts.setdefault(
-                    "txn.destination_country_risk",
-                    primary_txn.get("destination_country_risk"),
-                )
+    # Self-validate output consistency (runs for ALL inputs)
+    decision_pack = validate_decision_output(decision_pack)
+    timer.mark("validate_output")
 
-        if "customer.type" not in fingerprint_facts:
-            primary_entity_type = (body.get("meta") or {}).get("primary_entity_type")
-            if primary_entity_type:
-                fingerprint_facts["customer.type"] = primary_entity_type
-            else:
-                has_orgs = bool(body.get("organizations"))
-                has_inds = bool(body.get("individuals"))
-                if has_orgs and not has_inds:
-                    fingerprint_facts["customer.type"] = "corporation"
-                elif has_inds and not has_orgs:
-                    fingerprint_facts["customer.type"] = "individual"
-                elif has_orgs and has_inds:
-                    fingerprint_facts["customer.type"] = "mixed"
-
-        if "customer.relationship_length" not in fingerprint_facts and isinstance(body.get("assertions"), list):
-            for assertion in body.get("assertions", []):
-                if not isinstance(assertion, dict):
-                    continue
-                if assertion.get("predicate") in {"relationship_tenure", "relationship_length"}:
-                    value = assertion.get("value")
-                    if value is not None:
-                        fingerprint_facts["customer.relationship_length"] = value
-                        break
-
-        # Query similar precedents and add to decision pack
-        reason_codes = extract_reason_codes(facts, indicators, obligations)
-        proposed_outcome = decision_pack["decision"]["verdict"].lower()
-        # Map engine verdict to precedent outcome codes (banking vocabulary)
-        # The scorer uses v2 three-field canonical outcomes internally;
-        # this v1 mapping exists for backward compat with precedent comparison.
-        outcome_map = {
-            "str": "escalate",
-            "escalate": "escalate",
-            "hard_stop": "deny",
-            "pass": "pay",
-            "pass_with_edd": "escalate",
-            "block": "deny",
-            "edd": "escalate",
-            "allow": "pay",
-        }
-        proposed_outcome = outcome_map.get(proposed_outcome, "escalate")
-
-        # ── Classifier sovereignty override ──────────────────────────────
-        # When the classifier independently determined STR_REQUIRED but the
-        # engine returned PASS/PAY (gates blocked escalation), the governed
-        # disposition is EDD_REQUIRED, not ALLOW.  The precedent comparison
-        # must use the governed outcome so operational and regulatory alignment
-        # metrics reflect what the compliance officer actually sees.
-        if (classifier_result.outcome == "STR_REQUIRED"
-                and proposed_outcome == "pay"):
-            proposed_outcome = "escalate"
-
-        precedent_analysis = query_similar_precedents(
-            reason_codes=reason_codes,
-            proposed_outcome=proposed_outcome,
-            domain=decision_pack.get("meta", {}).get("domain"),
-            case_facts=fingerprint_facts,
-            jurisdiction=DG_JURISDICTION,
-        )
-        decision_pack["precedent_analysis"] = precedent_analysis
+    return 200, decision_pack, timer.stages
 
-        # Runtime invariant checks (PRECEDENT_OUTCOME_MODEL_V2.md §10)
-        invariant_violations = check_precedent_invariants(
-            precedent_analysis=precedent_analysis,
-            decision_id=decision_pack["meta"]["decision_id"],
-        )
-        if invariant_violations:
-            decision_pack["invariant_violations"] = invariant_violations
 
-        # Self-validate output consistency (runs for ALL inputs)
-        decision_pack = validate_decision_output(decision_pack)
+@app.post("/decide", tags=["Decision"])
+async def decide(request: Request):
+    """
+    Run decision engine on a case.
+
+    Returns a complete Decision Pack JSON with:
+    - meta: Reproducibility metadata (engine_version, policy_version, input_hash, etc.)
+    - decision: Final verdict, action, STR required, escalation path
+    - layers: 6-layer taxonomy analysis
+    - gates: Dual-gate results (Gate 1 + Gate 2)
+    - rationale: Summary and justification
+    - compliance: Regulatory details
+
+    The response includes a decision_id that can be used to replay the decision.
+    """
+    request_id = getattr(request.state, "request_id", "unknown")
+    start_time = getattr(request.state, "start_time", time.time())
+
+    try:
+        # Parse request body
+        body = await request.json()
+
+        try:
+            status_code, content, stage_ms = await DECISION_EXECUTOR.submit(
+                run_decision_pipeline, body, request_id
+            )
+        except ExecutorSaturated as e:
+            logger.warning(
+                f"Decision rejected: {e}",
+                extra={"request_id": request_id},
+            )
+            return JSONResponse(
+                status_code=429,
+                headers={"Retry-After": "1"},
+                content={
+                    "error": "Decision capacity exhausted",
+                    "code": "TOO_MANY_REQUESTS",
+                    "details": DECISION_EXECUTOR.stats(),
+                    "request_id": request_id,
+                }
+            )
+        if status_code != 200:
+            return JSONResponse(status_code=status_code, content=content)
+        decision_pack = content
 
         # Calculate duration
         duration_ms = int((time.time() - start_time) * 1000)
@@ -1711,17 +1905,20 @@ async def decide(request: Request):
             "Decision complete",
             extra={
                 "request_id": request_id,
-                "external_id": external_id,
+                "external_id": body.get("alert_details", {}).get("external_id",
+                               body.get("case_id", "DEMO")),
                 "input_hash_short": decision_pack["meta"]["input_hash"][:16],
                 "decision_id_short": decision_pack["meta"]["decision_id"][:16],
                 "verdict": decision_pack["decision"]["verdict"],
                 "policy_version": DG_POLICY_VERSION,
                 "policy_hash_short": decision_pack["meta"]["policy_hash"][:16],
                 "duration_ms": duration_ms,
+                "stage_ms": stage_ms,
+                "executor": DECISION_EXECUTOR.mode,
             }
         )
 
-        # Cache decision for report generation
+        # Cache decision for report generation (in the serving process)
         report.cache_decision(decision_pack["meta"]["decision_id"], decision_pack)
 
         return JSONResponse(content=decision_pack)
@@ -2192,6 +2389,27 @@ def _get_banking_domain():
     return _BANKING_DOMAIN
 
 
+# Precompiled v3 views of the precedent pool, keyed by precedent_id:
+# (registry, gate-class index, columnar scoring matrix)
+_PRECEDENT_INDEXES = None
+
+def _get_precedent_indexes() -> tuple[GateClassIndex, PrecedentMatrix]:
+    """Lazy-create the v3 gate index and scoring matrix for the current registry."""
+    global _PRECEDENT_INDEXES
+    if _PRECEDENT_INDEXES is None or _PRECEDENT_INDEXES[0] is not PRECEDENT_REGISTRY:
+        domain = _get_banking_domain()
+        _PRECEDENT_INDEXES = (PRECEDENT_REGISTRY, GateClassIndex(domain), PrecedentMatrix(domain))
+    return _PRECEDENT_INDEXES[1], _PRECEDENT_INDEXES[2]
+
+
+def _warm_precedent_indexes(payloads) -> None:
+    """Classify and encode the loaded precedents up front (not on first query)."""
+    gate_index, precedent_matrix = _get_precedent_indexes()
+    for payload in payloads:
+        gate_index.add_payload(payload)
+        precedent_matrix.add_payload(payload)
+
+
 AML_SIMILARITY_WEIGHTS_V1 = {
     "rules_overlap": 30,
     "gate_match": 25,
@@ -2603,16 +2821,9 @@ def query_similar_precedents(
         case_gate1_allowed = (case_facts or {}).get("gate1_allowed")
         case_gate2_str_required = (case_facts or {}).get("gate2_str_required")
 
-        # Get statistics by reason codes
-        stats = PRECEDENT_REGISTRY.get_statistics_by_codes(
-            exclusion_codes=reason_codes,
-            namespace_prefix=resolved_prefix,
-            min_overlap=1,
-        )
-
-        # Find matching precedents (Tier 1 - overlapping codes)
-        # Returns list sorted by overlap descending
-        precedent_matches = PRECEDENT_REGISTRY.find_by_exclusion_codes(
+        # Find matching precedents (Tier 1 - overlapping codes) and their
+        # statistics in one registry pass. Matches sorted by overlap descending.
+        precedent_matches, stats = PRECEDENT_REGISTRY.find_with_statistics_by_codes(
             codes=reason_codes,
             namespace_prefix=resolved_prefix,
             min_overlap=1,
@@ -3079,68 +3290,58 @@ def query_similar_precedents_v3(
             else banking_domain.similarity_floor
         )
 
-        # Find matching precedents (Tier 1 — overlapping reason codes)
-        precedent_matches = PRECEDENT_REGISTRY.find_by_exclusion_codes(
+        # Find matching precedents (Tier 1 — overlapping reason codes) and
+        # their statistics in one registry pass
+        precedent_matches, stats = PRECEDENT_REGISTRY.find_with_statistics_by_codes(
             codes=reason_codes,
             namespace_prefix=resolved_prefix,
             min_overlap=1,
         )
 
-        stats = PRECEDENT_REGISTRY.get_statistics_by_codes(
-            exclusion_codes=reason_codes,
-            namespace_prefix=resolved_prefix,
-            min_overlap=1,
-        )
-
         # ── Layer 1: Comparability Gate Filtering ─────────────────────
+        # Each precedent's gate classes are precomputed (gate key); the
+        # gates pass exactly when that key is one of the class tuples
+        # compatible with the case (same rules as evaluate_gates)
+        gate_index, precedent_matrix = _get_precedent_indexes()
+        schema_matches = [
+            (payload, overlap, gate_index.add_payload(payload))
+            for payload, overlap in precedent_matches
+            if payload.fingerprint_schema_id == schema_id  # Schema filter (same as v2)
+        ]
+        compatible_gate_keys = gate_index.compatible(case_gate_facts)
         gate_passed_matches = []
         gate_excluded_count = 0
-        for payload, overlap in precedent_matches:
-            # Schema filter (same as v2)
-            if payload.fingerprint_schema_id != schema_id:
-                continue
-
-            # Build precedent gate facts
-            prec_anchor_dict = {
-                af.field_id: af.value for af in payload.anchor_facts
-            }
-            prec_gate_facts = extract_gate_facts_from_precedent(
-                prec_anchor_dict,
-                jurisdiction_code=payload.jurisdiction_code,
-                disposition_basis=getattr(payload, "disposition_basis", "UNKNOWN"),
-            )
-
-            # Evaluate all comparability gates
-            gates_ok, gate_results = evaluate_gates(
-                banking_domain, case_gate_facts, prec_gate_facts,
-            )
-
-            if gates_ok:
-                gate_passed_matches.append((payload, overlap, gate_results))
+        for payload, overlap, gate_key in schema_matches:
+            if gate_key in compatible_gate_keys:
+                gate_passed_matches.append((payload, overlap, gate_key))
             else:
                 gate_excluded_count += 1
 
         # ── Layer 2: Field-by-Field Scoring ──────────────────────────
+        # The gate-passed pool is scored in one vectorized pass over the
+        # precompiled precedent matrix (same scores as score_similarity).
+        # The per-field SimilarityResult breakdown is only built for the
+        # sampled matches below.
+        matrix_rows = {
+            id(payload): precedent_matrix.add_payload(payload)
+            for payload, _, _ in gate_passed_matches
+        }
+        pool_scores, pool_non_transferable = precedent_matrix.score(
+            case_scoring_facts,
+            [matrix_rows[id(payload)] for payload, _, _ in gate_passed_matches],
+        )
+
         scored_matches = []
         non_transferable_count = 0
 
-        for payload, overlap, gate_results in gate_passed_matches:
-            # Build precedent scoring facts from anchor_facts
-            prec_scoring_facts = anchor_facts_to_dict(payload.anchor_facts)
-
-            # Get decision drivers from payload (v3 field)
-            precedent_drivers = getattr(payload, "decision_drivers", []) or []
-
-            # Score similarity using v3 field-by-field engine
-            sim_result = score_similarity(
-                banking_domain,
-                case_scoring_facts,
-                prec_scoring_facts,
-                precedent_drivers=precedent_drivers,
-            )
+        for (payload, overlap, gate_key), sim_score, non_transferable in zip(
+            gate_passed_matches, pool_scores, pool_non_transferable,
+        ):
+            sim_score = float(sim_score)
+            non_transferable = bool(non_transferable)
 
             # Apply similarity floor
-            if sim_result.score < similarity_floor:
+            if sim_score < similarity_floor:
                 continue
 
             # v2 canonical outcome for classification
@@ -3169,7 +3370,7 @@ def query_similar_precedents_v3(
                 precedent_disposition=prec_canonical.disposition,
                 case_basis=case_basis,
                 precedent_basis=prec_canonical.disposition_basis,
-                non_transferable=sim_result.non_transferable,
+                non_transferable=non_transferable,
             )
 
             # Two-axis classification (operational disposition × regulatory suspicion)
@@ -3178,29 +3379,29 @@ def query_similar_precedents_v3(
                 precedent_disposition=prec_canonical.disposition,
                 case_reporting=proposed_canonical.reporting,
                 precedent_reporting=prec_canonical.reporting,
-                non_transferable=sim_result.non_transferable,
+                non_transferable=non_transferable,
             )
 
-            if sim_result.non_transferable:
+            if non_transferable:
                 non_transferable_count += 1
 
             # Rank-ordering factors (same as v2)
             decision_weight = _decision_level_weight(payload.decision_level)
             recency_weight = _recency_weight(payload.decided_at)
-            combined = sim_result.score * decision_weight * recency_weight
+            combined = sim_score * decision_weight * recency_weight
 
             # Only include matches above threshold
-            if sim_result.score >= threshold_used:
+            if sim_score >= threshold_used:
                 scored_matches.append((
                     payload,
                     overlap,
                     combined,
-                    sim_result,
+                    sim_score,
                     decision_weight,
                     recency_weight,
                     prec_canonical,
                     classification,
-                    gate_results,
+                    gate_key,
                     two_axis,
                 ))
 
@@ -3239,42 +3440,28 @@ def query_similar_precedents_v3(
             post_shift_matches = list(scored_matches)
 
         # ── Stratified Sampling ──────────────────────────────────────
-        # Build v2-compatible tuples for stratified_precedent_sample
-        v2_tuples = [
-            (payload, overlap, classification, combined, {})
-            for payload, overlap, combined, sim_result, dw, rw, co, classification, gr, _ta
-            in scored_matches
-        ]
+        # Bounded per-classification heaps keep the highest-scoring
+        # v2-compatible tuples (ties keep scored_matches order, as the
+        # stable sort did) without sorting the whole pool
+        sample_heaps = BucketedTopK({"supporting": 35, "contrary": 10, "neutral": 15})
+        for order, (payload, overlap, combined, sim_score, dw, rw, co, classification, gr, _ta) in (
+            enumerate(scored_matches)
+        ):
+            sample_heaps.offer(
+                classification, combined, order,
+                (payload, overlap, classification, combined, {}),
+            )
 
-        # Sort by score descending
-        v2_tuples.sort(key=lambda x: x[3], reverse=True)
-
-        # Apply stratified sampling limits
-        sampled_supporting = []
-        sampled_contrary = []
-        sampled_neutral = []
-        for t in v2_tuples:
-            cls = t[2]
-            if cls == "supporting" and len(sampled_supporting) < 35:
-                sampled_supporting.append(t)
-            elif cls == "contrary" and len(sampled_contrary) < 10:
-                sampled_contrary.append(t)
-            elif cls == "neutral" and len(sampled_neutral) < 15:
-                sampled_neutral.append(t)
-
-        sampled = (sampled_supporting + sampled_contrary + sampled_neutral)[:50]
-        counts = {
-            "supporting": len(sampled_supporting),
-            "contrary": len(sampled_contrary),
-            "neutral": len(sampled_neutral),
-        }
+        sampled = sample_heaps.selected(limit=50)
+        sampled_ids = {id(t[0]) for t in sampled}
+        counts = sample_heaps.counts()
 
         # ── Confidence: Governed 4-Dimension Model (v3) ────────────
         decisive_supporting = 0
         decisive_total = 0
         sim_scores_for_avg = []
-        for payload, _ov, _sc, sim_r, _dw, _rw, prec_co, _cls, _gr, _ta in scored_matches:
-            sim_scores_for_avg.append(sim_r.score)
+        for payload, _ov, _sc, sim_score, _dw, _rw, prec_co, _cls, _gr, _ta in scored_matches:
+            sim_scores_for_avg.append(sim_score)
             prec_disp = prec_co.disposition
             prec_basis = prec_co.disposition_basis
             if prec_disp not in ("ALLOW", "BLOCK"):
@@ -3319,7 +3506,7 @@ def query_similar_precedents_v3(
 
         # ── Top-k similarity ─────────────────────────────────────────
         sorted_scores = sorted(
-            (sim.score for _, _, _, sim, _, _, _, _, _, _ in scored_matches),
+            (sim_score for _, _, _, sim_score, _, _, _, _, _, _ in scored_matches),
             reverse=True,
         )
         top_scores = sorted_scores[:5]
@@ -3349,10 +3536,15 @@ def query_similar_precedents_v3(
         # ── Sample cases with v3 field scores ────────────────────────
         sample_cases = []
         exact_match_count = 0
-        # Build lookups from scored_matches for sim_result and two-axis data
+        # Build lookups from scored_matches for sim_result and two-axis data;
+        # the field-level breakdown is materialized for sampled payloads only
         sim_lookup = {
-            id(payload): (sim_result, gate_results)
-            for payload, _, _, sim_result, _, _, _, _, gate_results, _ in scored_matches
+            id(payload): (
+                precedent_matrix.similarity(matrix_rows[id(payload)], case_scoring_facts),
+                gate_key,
+            )
+            for payload, _, _, _, _, _, _, _, gate_key, _ in scored_matches
+            if id(payload) in sampled_ids
         }
         two_axis_lookup = {
             id(payload): two_axis
@@ -3894,6 +4086,11 @@ async def startup_event():
     # Wire up precedent query for Build Your Own Case reports
     set_precedent_query(query_similar_precedents)
 
+    # Start /decide workers after the pool is loaded (process workers
+    # import this process's seed pool and replay the WAL written above)
+    DECISION_EXECUTOR.start(initargs=_decision_worker_initargs())
+    logger.info(f"Decision executor: {DECISION_EXECUTOR.stats()}")
+
 # =============================================================================
 # Dashboard API endpoints (stats, fields, seeds, audit)
 # =============================================================================
@@ -3946,14 +4143,7 @@ async def list_seeds():
     if not PRECEDENTS_LOADED:
         return []
     try:
-        seeds = generate_all_banking_seeds()
-        scenarios: dict = {}
-        for s in seeds:
-            sc = s.scenario_code or "unknown"
-            if sc not in scenarios:
-                scenarios[sc] = {"scenario_code": sc, "count": 0, "sample_id": s.precedent_id}
-            scenarios[sc]["count"] += 1
-        return list(scenarios.values())
+        return get_seed_pool().scenario_histogram
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
 
@@ -3962,11 +4152,10 @@ async def list_seeds():
 async def get_seed(seed_id: str):
     """Return a specific seed by precedent_id."""
     try:
-        seeds = generate_all_banking_seeds()
-        for s in seeds:
-            if s.precedent_id == seed_id:
-                return s.to_dict()
-        raise HTTPException(status_code=404, detail=f"Seed {seed_id} not found")
+        seed = get_seed_pool().get(seed_id)
+        if seed is None:
+            raise HTTPException(status_code=404, detail=f"Seed {seed_id} not found")
+        return seed.to_dict()
     except HTTPException:
         raise
     except Exception as e:
@@ -4024,3 +4213,6 @@ async def serve_spa_catchall(full_path: str):
 async def shutdown_event():
     """Log shutdown."""
     logger.info("DecisionGraph shutting down")
+    DECISION_EXECUTOR.shutdown(wait=False)
+    if _SEED_POOL_HANDOFF_DIR:
+        shutil.rmtree(_SEED_POOL_HANDOFF_DIR, ignore_errors=True)
@@ -14,7 +14,6 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
-from decisiongraph.aml_seed_generator import generate_all_banking_seeds
 from decisiongraph.policy_shift_shadows import (
     POLICY_SHIFTS,
     generate_policy_shift_shadows,
@@ -22,6 +21,7 @@ from decisiongraph.policy_shift_shadows import (
     get_shift_metadata,
     summarize_case_facts,
 )
+from service.seed_pool import get_seed_pool
 
 logger = logging.getLogger(__name__)
 
@@ -34,48 +34,19 @@ router = APIRouter(prefix="/api/policy-shifts", tags=["Policy Shifts"])
 _cache: dict[str, Any] = {}
 
 
-_V1_TO_DISPOSITION = {"pay": "ALLOW", "escalate": "EDD", "deny": "BLOCK"}
-
-
-def _payload_to_shadow_dict(payload) -> dict:
-    """Convert a JudgmentPayload dataclass to the dict format expected by
-    the policy-shift shadow module.
-
-    JudgmentPayload stores outcome as flat fields (outcome_code,
-    disposition_basis, reporting_obligation).  The shadow module expects
-    a nested ``outcome`` dict with keys ``disposition``, ``disposition_basis``,
-    and ``reporting``.
-    """
-    d = payload.to_dict()
-    # Reconstruct the three-field outcome dict
-    d["outcome"] = {
-        "disposition": _V1_TO_DISPOSITION.get(d.get("outcome_code", ""), d.get("outcome_code", "")),
-        "disposition_basis": d.get("disposition_basis", "DISCRETIONARY"),
-        "reporting": d.get("reporting_obligation", "NO_REPORT"),
-    }
-    return d
-
-
 def _ensure_shadows() -> tuple[list[dict], dict[str, list[dict]], dict[str, dict]]:
-    """Lazily generate seeds + shadows and cache them."""
-    if "seeds" not in _cache:
-        logger.info("Generating banking seeds for policy shift analysis …")
-        payloads = generate_all_banking_seeds()
-        logger.info("Generated %d seeds — computing shadows …", len(payloads))
+    """Lazily compute shadows over the shared seed pool and cache them."""
+    if "shadows" not in _cache:
+        pool = get_seed_pool()
+        logger.info("Computing policy shift shadows over %d seeds …", len(pool))
 
-        # Convert JudgmentPayload dataclass objects to dicts
-        seeds = [_payload_to_shadow_dict(p) for p in payloads]
-
-        shadows_by_shift = generate_policy_shift_shadows(seeds)
+        shadows_by_shift = generate_policy_shift_shadows(pool.seed_dicts)
         total = sum(len(v) for v in shadows_by_shift.values())
         logger.info("Generated %d shadow records across %d shifts", total, len(shadows_by_shift))
 
-        # Build lookup: precedent_id → seed  (for case summaries)
-        seeds_lookup = {s["precedent_id"]: s for s in seeds}
-
-        _cache["seeds"] = seeds
+        _cache["seeds"] = pool.seed_dicts
         _cache["shadows"] = shadows_by_shift
-        _cache["seeds_lookup"] = seeds_lookup
+        _cache["seeds_lookup"] = pool.seed_dicts_by_id
 
     return _cache["seeds"], _cache["shadows"], _cache["seeds_lookup"]
 
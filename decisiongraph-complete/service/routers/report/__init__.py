@@ -8,6 +8,9 @@ Pipeline stages:
   B. derive     → DerivedRegulatoryModel
   C. view_model → ReportViewModel
   D. render_*   → HTML / Markdown / JSON
+
+Stages A–C (and the Markdown render) are memoized per decision by
+``report_cache`` so the format endpoints share one compilation.
 """
 
 # ── Router (FastAPI) ──────────────────────────────────────────────────────────
@@ -26,7 +29,10 @@ from .view_model import build_view_model  # noqa: F401
 from .render_md import render_markdown  # noqa: F401
 
 # ── Single compile_report entry point ─────────────────────────────────────────
-from .pipeline import compile_report, compile_report_context  # noqa: F401
+from .pipeline import compile_report, compile_report_context, compile_report_stages  # noqa: F401
+
+# ── Memoized compilation shared by the format endpoints ───────────────────────
+from .cache import ReportCache, report_cache  # noqa: F401
 
 # ── Backward-compat: build_report_context ─────────────────────────────────────
 # Alias kept for callers that used the old name.
@@ -0,0 +1,117 @@
+"""ReportCache — memoized report compilation shared by every format endpoint.
+
+The UI typically requests two or three formats (HTML, JSON, Markdown,
+export) for the same decision. Each used to re-run normalize → derive →
+view_model from scratch. Compiled stages are kept in an LRU keyed by
+decision_id + pipeline version; Markdown is rendered once per entry.
+
+An entry remembers the decision pack object it was built from: if the
+DecisionStore now holds a different pack under the same id (decision
+re-run), the entry is recompiled.
+
+Cached stages are shared between requests — renderers must treat them as
+read-only (copy the view-model before adding request-specific keys).
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .pipeline import PIPELINE_VERSION, compile_report_stages
+from .render_md import render_markdown
+
+# ── Configuration ─────────────────────────────────────────────────────────────
+# Max compiled reports kept in memory (0 disables caching)
+REPORT_CACHE_SIZE = int(os.getenv("DG_REPORT_CACHE_SIZE", "64"))
+
+
+@dataclass
+class CompiledReport:
+    """Pipeline stages for one decision."""
+    decision: dict = field(repr=False)
+    normalized: dict = field(repr=False)
+    derived: dict = field(repr=False)
+    view_model: dict = field(repr=False)
+    markdown: Optional[str] = field(default=None, repr=False)
+
+
+class ReportCache:
+    """Thread-safe LRU of CompiledReport entries with hit/miss counters."""
+
+    def __init__(self, max_entries: int = REPORT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple[str, str], CompiledReport]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.markdown_hits = 0
+        self.markdown_misses = 0
+
+    def compile(self, decision: dict) -> CompiledReport:
+        """Return the compiled stages for ``decision``, compiling on a miss."""
+        decision_id = (decision.get("meta", {}) or {}).get("decision_id")
+        if not decision_id or self.max_entries <= 0:
+            with self._lock:
+                self.misses += 1
+            return CompiledReport(decision, *compile_report_stages(decision))
+
+        key = (decision_id, PIPELINE_VERSION)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.decision is decision:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss just compiles twice
+        entry = CompiledReport(decision, *compile_report_stages(decision))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def context(self, decision: dict) -> dict:
+        """Cached view-model (shared — do not mutate)."""
+        return self.compile(decision).view_model
+
+    def markdown(self, decision: dict) -> str:
+        """Cached Markdown rendering of the view-model."""
+        entry = self.compile(decision)
+        if entry.markdown is None:
+            entry.markdown = render_markdown(entry.view_model)
+            with self._lock:
+                self.markdown_misses += 1
+        else:
+            with self._lock:
+                self.markdown_hits += 1
+        return entry.markdown
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "pipeline_version": PIPELINE_VERSION,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "markdown_hits": self.markdown_hits,
+                "markdown_misses": self.markdown_misses,
+            }
+
+
+# ── Process-wide instance used by the router ─────────────────────────────────
+report_cache = ReportCache()
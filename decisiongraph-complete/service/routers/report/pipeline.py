@@ -6,9 +6,12 @@ There is exactly ONE rendering path in the codebase.
 
 from .normalize import normalize_decision
 from .derive import derive_regulatory_model
-from .view_model import build_view_model
+from .view_model import build_view_model, REPORT_MODULE_VERSION, NARRATIVE_COMPILER_VERSION
 from .render_md import render_markdown
 
+# Identifies the compiler output; part of the ReportCache key
+PIPELINE_VERSION = f"{REPORT_MODULE_VERSION}|{NARRATIVE_COMPILER_VERSION}"
+
 
 def compile_report(decision_pack: dict) -> str:
     """Run the full 4-stage report compiler and return Markdown.
@@ -30,9 +33,7 @@ def compile_report(decision_pack: dict) -> str:
     str
         Rendered Markdown report.
     """
-    normalized = normalize_decision(decision_pack)
-    derived = derive_regulatory_model(normalized)
-    view_model = build_view_model(normalized, derived)
+    _, _, view_model = compile_report_stages(decision_pack)
     return render_markdown(view_model)
 
 
@@ -41,6 +42,14 @@ def compile_report_context(decision_pack: dict) -> dict:
 
     Used by the API endpoints that need the context dict (HTML, JSON).
     """
+    return compile_report_stages(decision_pack)[2]
+
+
+def compile_report_stages(decision_pack: dict) -> tuple[dict, dict, dict]:
+    """Run normalize → derive → view_model and return all three stages.
+
+    The report router memoizes these per decision (see ``cache.py``).
+    """
     normalized = normalize_decision(decision_pack)
     derived = derive_regulatory_model(normalized)
-    return build_view_model(normalized, derived)
+    return normalized, derived, build_view_model(normalized, derived)
@@ -12,7 +12,7 @@ from datetime import datetime
 from pathlib import Path
 
 from .store import resolve, ALLOW_RAW_DECISION
-from .pipeline import compile_report, compile_report_context
+from .cache import report_cache
 
 router = APIRouter(prefix="/report", tags=["Report"])
 
@@ -46,6 +46,14 @@ def _redact_decision(decision: dict) -> dict:
     }
 
 
+# ── Cache metrics ────────────────────────────────────────────────────────────
+
+@router.get("/cache/stats")
+async def get_report_cache_stats():
+    """Report compilation cache hit/miss counters."""
+    return report_cache.stats()
+
+
 # ── HTML ─────────────────────────────────────────────────────────────────────
 
 @router.get("/{decision_id}", response_class=HTMLResponse)
@@ -53,8 +61,8 @@ async def get_report_html(request: Request, decision_id: str):
     """Generate a regulator-grade HTML decision report."""
     decision = resolve(decision_id)
     try:
-        ctx = compile_report_context(decision)
-        ctx["request"] = request
+        # Copy: the cached view-model is shared across requests
+        ctx = {**report_cache.context(decision), "request": request}
         return _jinja.TemplateResponse("decision_report.html", ctx)
     except Exception as e:
         error_html = (
@@ -74,7 +82,7 @@ async def get_report_html(request: Request, decision_id: str):
 async def get_report_json(decision_id: str, include_raw: bool = False):
     """Get decision report as structured JSON."""
     decision = resolve(decision_id)
-    ctx = compile_report_context(decision)
+    ctx = report_cache.context(decision)
 
     response = {
         "format": "json",
@@ -94,7 +102,7 @@ async def get_report_json(decision_id: str, include_raw: bool = False):
 async def get_report_markdown(decision_id: str):
     """Generate a Markdown decision report."""
     decision = resolve(decision_id)
-    md = compile_report(decision)
+    md = report_cache.markdown(decision)
 
     return {
         "decision_id": decision_id,
@@ -126,8 +134,7 @@ async def export_html(request: Request, decision_id: str):
     """Download a self-contained HTML decision report file."""
     decision = resolve(decision_id)
     try:
-        ctx = compile_report_context(decision)
-        ctx["request"] = request
+        ctx = {**report_cache.context(decision), "request": request}
         template = _jinja.get_template("decision_report.html")
         html = template.render(ctx)
     except Exception as e:
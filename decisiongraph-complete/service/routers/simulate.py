@@ -17,46 +17,29 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from decisiongraph.aml_seed_generator import generate_all_banking_seeds
 from kernel.policy.policy_simulation import (
     DEMO_DRAFTS,
     DEMO_DRAFTS_BY_ID,
     PolicySimulator,
     SimulationReport,
 )
+from service.seed_pool import get_seed_pool
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/simulate", tags=["Policy Simulation"])
 
 # ---------------------------------------------------------------------------
-# Module-level cache (seeds generated once on first request)
+# Module-level cache (simulator built once on first request)
 # ---------------------------------------------------------------------------
 
 _cache: dict[str, Any] = {}
 
-_V1_TO_DISPOSITION = {"pay": "ALLOW", "escalate": "EDD", "deny": "BLOCK"}
-
-
-def _payload_to_seed_dict(payload) -> dict:
-    """Convert JudgmentPayload to the dict format used by the simulator."""
-    d = payload.to_dict()
-    d["outcome"] = {
-        "disposition": _V1_TO_DISPOSITION.get(
-            d.get("outcome_code", ""), d.get("outcome_code", ""),
-        ),
-        "disposition_basis": d.get("disposition_basis", "DISCRETIONARY"),
-        "reporting": d.get("reporting_obligation", "NO_REPORT"),
-    }
-    return d
-
 
 def _get_simulator() -> PolicySimulator:
-    """Lazily create the simulator with generated seeds."""
+    """Lazily create the simulator over the shared seed pool."""
     if "simulator" not in _cache:
-        logger.info("Generating banking seeds for policy simulation …")
-        payloads = generate_all_banking_seeds()
-        seeds = [_payload_to_seed_dict(p) for p in payloads]
+        seeds = get_seed_pool().seed_dicts
         logger.info("Created simulator with %d seeds", len(seeds))
         _cache["simulator"] = PolicySimulator(seeds)
     return _cache["simulator"]
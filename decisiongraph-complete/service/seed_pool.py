@@ -0,0 +1,152 @@
+"""
+Process-wide banking seed pool.
+
+generate_all_banking_seeds() assigns fresh uuid4 precedent_ids on every
+call, so each consumer that generated its own copy (precedent chain,
+simulator, policy-shift shadows, /api/seeds) saw different ids, and
+/api/seeds/{id} searched a freshly generated list for an id returned by an
+earlier call. The pool is built once per process (or recovered from the
+persisted precedent chain) and every consumer reads the same views.
+
+With DG_SEED_CACHE_DIR set, generation goes through the content-addressed
+seed cache (kernel.foundation.seed_cache): the first process of the day
+writes it, later boots memory-map it. Decision worker processes never
+generate their own pool: the serving process exports its pool
+(export_seed_pool) and each worker imports it (import_seed_pool), so
+precedent_ids match across processes.
+
+The views are shared: treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from kernel.foundation.judgment import JudgmentPayload, is_judgment_cell, parse_judgment_payload
+from kernel.foundation.seed_cache import load_or_generate_seeds, read_seed_cache, write_seed_cache
+from decisiongraph.aml_seed_generator import generate_all_banking_seeds
+
+logger = logging.getLogger(__name__)
+
+# Optional directory for the generated seed pool cache
+DG_SEED_CACHE_DIR = os.getenv("DG_SEED_CACHE_DIR", "")
+
+_V1_TO_DISPOSITION = {"pay": "ALLOW", "escalate": "EDD", "deny": "BLOCK"}
+
+
+def payload_to_seed_dict(payload: JudgmentPayload) -> dict:
+    """
+    Convert a JudgmentPayload to the seed dict used by PolicySimulator and
+    the policy-shift shadow module.
+
+    JudgmentPayload stores outcome as flat fields (outcome_code,
+    disposition_basis, reporting_obligation); the seed dict adds a nested
+    ``outcome`` with ``disposition``, ``disposition_basis`` and ``reporting``.
+    """
+    d = payload.to_dict()
+    d["outcome"] = {
+        "disposition": _V1_TO_DISPOSITION.get(d.get("outcome_code", ""), d.get("outcome_code", "")),
+        "disposition_basis": d.get("disposition_basis", "DISCRETIONARY"),
+        "reporting": d.get("reporting_obligation", "NO_REPORT"),
+    }
+    return d
+
+
+class SeedPool:
+    """Seed payloads plus the precomputed views the service reads."""
+
+    def __init__(self, payloads: Iterable[JudgmentPayload], source: str = "generated"):
+        self.payloads: tuple[JudgmentPayload, ...] = tuple(payloads)
+        self.source = source
+        self.by_id: dict[str, JudgmentPayload] = {p.precedent_id: p for p in self.payloads}
+        self.seed_dicts: list[dict] = [payload_to_seed_dict(p) for p in self.payloads]
+        self.seed_dicts_by_id: dict[str, dict] = {d["precedent_id"]: d for d in self.seed_dicts}
+
+        scenarios: dict[str, dict[str, Any]] = {}
+        for p in self.payloads:
+            sc = p.scenario_code or "unknown"
+            if sc not in scenarios:
+                scenarios[sc] = {"scenario_code": sc, "count": 0, "sample_id": p.precedent_id}
+            scenarios[sc]["count"] += 1
+        self.scenario_histogram: list[dict[str, Any]] = list(scenarios.values())
+
+    @classmethod
+    def generate(cls, cache_dir: str = "", **kwargs: Any) -> "SeedPool":
+        """
+        Run the seed generator (kwargs are passed through).
+
+        With ``cache_dir``, load from the seed cache and generate only on a miss.
+        """
+        if not cache_dir:
+            return cls(generate_all_banking_seeds(**kwargs), source="generated")
+        result = load_or_generate_seeds(generate_all_banking_seeds, cache_dir, **kwargs)
+        return cls(result.payloads, source="cache" if result.hit else "generated")
+
+    @classmethod
+    def from_chain(cls, chain) -> "SeedPool":
+        """Recover the pool from the JUDGMENT cells of a loaded precedent chain."""
+        return cls(
+            (parse_judgment_payload(c) for c in chain.cells if is_judgment_cell(c)),
+            source="chain",
+        )
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def get(self, precedent_id: str) -> Optional[JudgmentPayload]:
+        """O(1) lookup by precedent_id."""
+        return self.by_id.get(precedent_id)
+
+
+_pool: Optional[SeedPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_seed_pool() -> SeedPool:
+    """Return the process-wide pool, generating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                start = time.perf_counter()
+                _pool = SeedPool.generate(cache_dir=DG_SEED_CACHE_DIR)
+                logger.info(
+                    "Seed pool ready: %d seeds (%s) in %.0f ms",
+                    len(_pool), _pool.source, (time.perf_counter() - start) * 1000,
+                )
+    return _pool
+
+
+def set_seed_pool(pool: Optional[SeedPool]) -> None:
+    """Install a pool built elsewhere (e.g. recovered from the precedent WAL)."""
+    global _pool
+    with _pool_lock:
+        _pool = pool
+
+
+def reset_seed_pool() -> None:
+    """Drop the process-wide pool (tests)."""
+    set_seed_pool(None)
+
+
+def export_seed_pool(path: Union[str, Path]) -> Path:
+    """Write the process-wide pool to ``path`` (seed cache format) for worker processes."""
+    path = Path(path)
+    payloads = get_seed_pool().payloads
+    # Keyed by the pool's precedent_ids; the file's CRC guards the content
+    key = hashlib.sha256("\n".join(p.precedent_id for p in payloads).encode("utf-8")).hexdigest()
+    write_seed_cache(path, payloads, key, meta={"source": "seed_pool_handoff"})
+    return path
+
+
+def import_seed_pool(path: Union[str, Path]) -> SeedPool:
+    """Install a pool exported by export_seed_pool() as this process's pool."""
+    pool = SeedPool(read_seed_cache(path), source="parent")
+    set_seed_pool(pool)
+    return pool
@@ -79,6 +79,31 @@ from .chain import (
     create_chain
 )
 
+# Chain secondary indexes
+from .chain_index import (
+    ChainIndex,
+    NamespaceTrie,
+)
+
+# Copy-on-write overlay chains (simulation forks)
+from .overlay_chain import OverlayChain
+
+# Chain validation engine (parallel seals, verified-prefix checkpoints)
+from .chain_validation import (
+    ValidationCheckpoint,
+    create_validation_checkpoint,
+    write_validation_checkpoint,
+    read_validation_checkpoint,
+)
+
+# Streaming chain import/export (JSON Lines, optional msgpack)
+from .chain_stream import (
+    ChainStreamError,
+    export_chain,
+    iter_cells,
+    import_chain,
+)
+
 # Namespace
 from .namespace import (
     Permission,
@@ -146,6 +171,8 @@ from .policyhead import (
     get_current_policy_head,
     get_policy_head_chain,
     get_policy_head_at_time,
+    get_policy_head_timeline,
+    PolicyHeadTimeline,
     parse_policy_data,
     verify_policy_hash,
     validate_policy_head_chain,
@@ -235,13 +262,35 @@ from .segmented_wal import (
     Manifest,
     SegmentedWALWriter,
     SegmentedWALReader,
+    SegmentVerification,
     segment_path,
     list_segment_files,
     rebuild_manifest_from_segments,
+    verify_segment,
     write_manifest_atomic,
     read_manifest,
 )
 
+# WAL index sidecars (random access into segmented WALs)
+from .wal_index import (
+    DEFAULT_INDEX_INTERVAL,
+    WALIndexError,
+    SegmentIndex,
+    WALIndex,
+    rebuild_indexes_from_segments,
+)
+
+# Persistent Chain (WAL-backed Chain with checkpointed rehydration)
+from .persistent_chain import (
+    PersistentChainError,
+    ChainCheckpoint,
+    RehydrationStats,
+    PersistentChain,
+    read_checkpoint,
+    mark_seed_load_complete,
+    open_seeded_chain,
+)
+
 # Canonical JSON - RFC 8785 (v2.0 foundation)
 from .canon import (
     canonical_json_bytes,
@@ -495,6 +544,11 @@ __all__ = [
     'Chain', 'ChainError', 'IntegrityViolation', 'ChainBreak',
     'GenesisViolation', 'TemporalViolation', 'GraphIdMismatch', 'HashSchemeMismatch',
     'ValidationResult', 'create_chain',
+    'ChainIndex', 'NamespaceTrie',
+    'OverlayChain',
+    'ValidationCheckpoint', 'create_validation_checkpoint',
+    'write_validation_checkpoint', 'read_validation_checkpoint',
+    'ChainStreamError', 'export_chain', 'iter_cells', 'import_chain',
     # Namespace
     'Permission', 'BridgeStatus', 'NamespaceMetadata', 'Signature', 'NamespaceRegistry',
     'NamespaceError', 'AccessDeniedError', 'BridgeRequiredError', 'BridgeApprovalError',
@@ -517,7 +571,8 @@ __all__ = [
     'Engine', 'process_rfa', 'verify_proof_packet',
     # PolicyHead (v1.5)
     'create_policy_head', 'get_current_policy_head', 'get_policy_head_chain',
-    'get_policy_head_at_time', 'parse_policy_data', 'verify_policy_hash',
+    'get_policy_head_at_time', 'get_policy_head_timeline', 'PolicyHeadTimeline',
+    'parse_policy_data', 'verify_policy_hash',
     'validate_policy_head_chain', 'validate_threshold',
     'is_bootstrap_threshold', 'is_production_threshold',
     'POLICY_PROMOTION_RULE_HASH', 'POLICYHEAD_SCHEMA_VERSION',
@@ -570,11 +625,27 @@ __all__ = [
     'Manifest',
     'SegmentedWALWriter',
     'SegmentedWALReader',
+    'SegmentVerification',
     'segment_path',
     'list_segment_files',
     'rebuild_manifest_from_segments',
+    'verify_segment',
     'write_manifest_atomic',
     'read_manifest',
+    # WAL index sidecars (random access into segmented WALs)
+    'DEFAULT_INDEX_INTERVAL',
+    'WALIndexError',
+    'SegmentIndex',
+    'WALIndex',
+    'rebuild_indexes_from_segments',
+    # Persistent Chain (WAL-backed Chain with checkpointed rehydration)
+    'PersistentChainError',
+    'ChainCheckpoint',
+    'RehydrationStats',
+    'PersistentChain',
+    'read_checkpoint',
+    'mark_seed_load_complete',
+    'open_seeded_chain',
     # Canonical JSON - RFC 8785 (v2.0 foundation)
     'canonical_json_bytes',
     'canonical_json_string',
@@ -769,12 +840,21 @@ __all__ = [
     'JUDGMENT_RULE_ID',
     'JUDGMENT_RULE_HASH',
     'JUDGMENT_INTERPRETER',
+    # Seed cache (content-addressed generated seed pools)
+    'SeedCacheError',
+    'SeedCacheResult',
+    'seed_cache_key',
+    'read_seed_cache',
+    'write_seed_cache',
+    'load_or_generate_seeds',
     # Precedent Registry (v2.0 - Precedent System)
     'PrecedentRegistryError',
     'InvalidQueryError',
     'AppealStatistics',
     'PrecedentStatistics',
+    'compute_precedent_statistics',
     'PrecedentRegistry',
+    'IndexedPrecedentRegistry',
     # AML Fingerprint Schema (v2.1 - Banking/AML Precedent System)
     'AMLFingerprintSchemaError',
     'AMLSchemaNotFoundError',
@@ -902,13 +982,25 @@ from .judgment import (
     JUDGMENT_INTERPRETER,
 )
 
+# Seed cache (content-addressed generated seed pools)
+from .seed_cache import (
+    SeedCacheError,
+    SeedCacheResult,
+    seed_cache_key,
+    read_seed_cache,
+    write_seed_cache,
+    load_or_generate_seeds,
+)
+
 # Precedent Registry (v2.0 - Precedent System)
 from .precedent_registry import (
     PrecedentRegistryError,
     InvalidQueryError,
     AppealStatistics,
     PrecedentStatistics,
+    compute_precedent_statistics,
     PrecedentRegistry,
+    IndexedPrecedentRegistry,
 )
 
 # AML Fingerprint Schema (v2.1 - Banking/AML Precedent System)
@@ -12,12 +12,22 @@ Key Components:
 1. BatchBacktestResult: Frozen dataclass containing batch backtest results
 2. _sort_results(): Deterministic sorting by (subject, valid_time, system_time)
 3. _count_cells_in_simulation(): Count cells from base and shadow proof bundles
+4. _inline_backtest_chunks() / _pooled_backtest_chunks(): Simulate RFAs
+   against one shadow session per simulation_spec, in-process or sharded
+   across a process pool, yielding outcomes in input order
 
 Architecture:
 - Follows SimulationResult pattern for immutability (frozen=True)
 - Results list is deterministically sorted for reproducibility (BAT-03)
 - Execution budget tracking prevents DoS (max_cases, max_runtime_ms, max_cells_touched)
 - backtest_incomplete flag signals when limits exceeded (BAT-02)
+- Every RFA in a batch shares the simulation_spec, so the shadow chain and
+  shadow Scholar are built once per batch (once per worker when pooled)
+  instead of once per RFA
+- Pool workers check max_runtime_ms before each case against the batch's
+  ExecutionBudget; the caller applies max_cases and max_cells_touched to
+  outcomes in input order, so a pooled batch stops exactly where a
+  sequential one would
 
 Example:
     >>> result = BatchBacktestResult(
@@ -30,10 +40,26 @@ Example:
     >>> dict_result = result.to_dict()
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, Sequence, Tuple
 
-from .simulation import SimulationResult
+from .anchors import ExecutionBudget
+from .chain import Chain
+from .exceptions import DecisionGraphError
+from .scholar import Scholar
+from .shadow import OverlayContext
+from .simulation import SimulationContext, SimulationResult
+
+if TYPE_CHECKING:
+    from .engine import Engine
+
+DEFAULT_BACKTEST_CHUNK_SIZE = 8
+
+# One chunk of a batch: (rfas, results, error). results may be shorter than
+# rfas: simulation stops at the first error or once the runtime budget is spent.
+BacktestChunk = Tuple[List[Dict[str, Any]], List[SimulationResult], Optional[DecisionGraphError]]
 
 
 @dataclass(frozen=True)
@@ -124,6 +150,161 @@ def _count_cells_in_simulation(sim_result: SimulationResult) -> int:
     return base_cells + shadow_cells
 
 
+def _simulate_cases(
+    engine: 'Engine',
+    shadow_scholar: Scholar,
+    rfas: Sequence[Dict[str, Any]],
+    simulation_spec: Dict[str, Any],
+    at_valid_time: str,
+    as_of_system_time: str,
+    budget: ExecutionBudget
+) -> Tuple[List[SimulationResult], Optional[DecisionGraphError]]:
+    """Simulate rfas in order against a shared shadow Scholar (BAT-01).
+
+    Stops before a case once budget's runtime is spent (BAT-02), or at the
+    first failing RFA, whose error is returned rather than raised so the
+    caller can decide whether a sequential run would have reached it.
+    """
+    results: List[SimulationResult] = []
+    for rfa_dict in rfas:
+        if budget.elapsed_ms() >= budget.max_runtime_ms:
+            break
+        try:
+            results.append(engine.simulate_rfa(
+                rfa_dict=rfa_dict,
+                simulation_spec=simulation_spec,
+                at_valid_time=at_valid_time,
+                as_of_system_time=as_of_system_time,
+                shadow_scholar=shadow_scholar
+            ))
+        except DecisionGraphError as error:
+            return results, error
+    return results, None
+
+
+def _inline_backtest_chunks(
+    engine: 'Engine',
+    overlay_context: OverlayContext,
+    rfas: Sequence[Dict[str, Any]],
+    simulation_spec: Dict[str, Any],
+    at_valid_time: str,
+    as_of_system_time: str,
+    budget: ExecutionBudget
+) -> Iterator[BacktestChunk]:
+    """Simulate rfas one at a time in-process, inside one shadow session."""
+    with SimulationContext(
+        engine.chain, overlay_context, at_valid_time, as_of_system_time,
+        base_scholar=engine.scholar
+    ) as sim_ctx:
+        for rfa_dict in rfas:
+            results, error = _simulate_cases(
+                engine, sim_ctx.shadow_scholar, [rfa_dict], simulation_spec,
+                at_valid_time, as_of_system_time, budget
+            )
+            yield [rfa_dict], results, error
+
+
+# Per-process state of a backtest pool worker:
+# (engine, entered SimulationContext, simulation_spec, at_valid_time, as_of_system_time)
+_worker_session: Optional[Tuple['Engine', SimulationContext, Dict[str, Any], str, str]] = None
+
+
+def _init_backtest_worker(
+    cells: List[Any],
+    graph_id: Optional[str],
+    root_namespace: Optional[str],
+    secondary_indexes: bool,
+    verify_cell_signatures: bool,
+    overlay_context: OverlayContext,
+    simulation_spec: Dict[str, Any],
+    at_valid_time: str,
+    as_of_system_time: str
+) -> None:
+    """Rebuild the base chain and enter one shadow session (pool initializer).
+
+    Chains are not picklable (Scholars subscribe to them through weak
+    methods), so each worker rebuilds the chain from its cells once and
+    keeps the shadow session open for every chunk it is given.
+    """
+    from .engine import Engine  # engine imports this module
+
+    global _worker_session
+    chain = Chain(
+        cells=list(cells),
+        index={cell.cell_id: position for position, cell in enumerate(cells)},
+        _graph_id=graph_id,
+        _root_namespace=root_namespace
+    )
+    if secondary_indexes:
+        chain.enable_secondary_indexes()
+    engine = Engine(chain, verify_cell_signatures=verify_cell_signatures)
+    sim_ctx = SimulationContext(
+        chain, overlay_context, at_valid_time, as_of_system_time,
+        base_scholar=engine.scholar
+    ).__enter__()
+    _worker_session = (engine, sim_ctx, simulation_spec, at_valid_time, as_of_system_time)
+
+
+def _run_backtest_chunk(
+    task: Tuple[List[Dict[str, Any]], ExecutionBudget]
+) -> Tuple[List[SimulationResult], Optional[DecisionGraphError]]:
+    """Simulate one chunk in this worker's shadow session (pool worker)."""
+    rfas, budget = task
+    engine, sim_ctx, simulation_spec, at_valid_time, as_of_system_time = _worker_session
+    return _simulate_cases(
+        engine, sim_ctx.shadow_scholar, rfas, simulation_spec,
+        at_valid_time, as_of_system_time, budget
+    )
+
+
+def _pooled_backtest_chunks(
+    engine: 'Engine',
+    overlay_context: OverlayContext,
+    rfas: Sequence[Dict[str, Any]],
+    simulation_spec: Dict[str, Any],
+    at_valid_time: str,
+    as_of_system_time: str,
+    budget: ExecutionBudget,
+    workers: int,
+    chunk_size: int = DEFAULT_BACKTEST_CHUNK_SIZE
+) -> Iterator[BacktestChunk]:
+    """Shard rfas across a process pool; yield chunks in input order.
+
+    At most 2 * workers chunks are in flight, so a caller that stops early
+    (max_cells_touched) wastes little work. No chunk is started once the
+    budget's runtime is spent. Closing the iterator cancels pending chunks.
+    """
+    chain = engine.chain
+    chunks = [list(rfas[start:start + chunk_size]) for start in range(0, len(rfas), chunk_size)]
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_backtest_worker,
+        initargs=(
+            chain.cells, chain.graph_id, chain.root_namespace, chain.secondary_indexes,
+            engine.verify_cell_signatures, overlay_context, simulation_spec,
+            at_valid_time, as_of_system_time
+        )
+    )
+    try:
+        pending: deque = deque()
+        submitted = 0
+        while submitted < len(chunks) or pending:
+            while (submitted < len(chunks) and len(pending) < 2 * workers
+                   and budget.elapsed_ms() < budget.max_runtime_ms):
+                chunk = chunks[submitted]
+                pending.append((chunk, pool.submit(_run_backtest_chunk, (chunk, budget))))
+                submitted += 1
+            if not pending:
+                # Runtime spent before the remaining chunks could start
+                yield chunks[submitted], [], None
+                return
+            chunk, future = pending.popleft()
+            results, error = future.result()
+            yield chunk, results, error
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 # Export public interface
 __all__ = [
     'BatchBacktestResult',
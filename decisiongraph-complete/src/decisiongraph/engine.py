@@ -36,10 +36,17 @@ from .shadow import (
     create_shadow_bridge
 )
 from .anchors import detect_counterfactual_anchors, AnchorResult, ExecutionBudget
-from .backtest import BatchBacktestResult, _sort_results, _count_cells_in_simulation
+from .backtest import (
+    DEFAULT_BACKTEST_CHUNK_SIZE,
+    BatchBacktestResult,
+    _count_cells_in_simulation,
+    _inline_backtest_chunks,
+    _pooled_backtest_chunks,
+    _sort_results
+)
 
 from .chain import Chain
-from .scholar import create_scholar
+from .scholar import Scholar, create_scholar
 from .policyhead import create_policy_head, get_current_policy_head, verify_policy_hash
 from .validators import (
     validate_subject_field,
@@ -686,7 +693,8 @@ class Engine:
         at_valid_time: str,
         as_of_system_time: str,
         max_anchor_attempts: int = 100,
-        max_runtime_ms: int = 5000
+        max_runtime_ms: int = 5000,
+        shadow_scholar: Optional[Scholar] = None
     ) -> SimulationResult:
         """
         Simulate an RFA against shadow reality (SIM-01 through SIM-06, SHD-03, SHD-05, SHD-06, CTF-01 through CTF-04).
@@ -725,6 +733,9 @@ class Engine:
             as_of_system_time: Freeze system time coordinate (ISO 8601 UTC)
             max_anchor_attempts: Max simulation attempts for anchor detection (default 100, CTF-02)
             max_runtime_ms: Max runtime for anchor detection in milliseconds (default 5000, CTF-02)
+            shadow_scholar: Scholar over a shadow chain already built from
+                simulation_spec (run_backtest builds one per batch); when
+                given, no shadow chain is forked for this RFA
 
         Returns:
             SimulationResult with base_result, shadow_result, delta_report,
@@ -773,28 +784,27 @@ class Engine:
             )
             base_result = base_query_result.to_proof_bundle()
 
-            # Step 5: Build OverlayContext from simulation_spec
-            overlay_ctx = self._build_overlay_context(simulation_spec)
-
-            # Step 6: Run shadow query in context manager (SIM-03, cleanup guaranteed)
-            # NOTE: SimulationContext.__enter__ appends shadow cells from overlay_ctx
-            # to shadow_chain BEFORE creating shadow_scholar, so Scholar sees them.
-            with SimulationContext(
-                self.chain, overlay_ctx, at_valid_time, as_of_system_time
-            ) as sim_ctx:
-                # Query shadow reality (same RFA, same frozen coordinates)
-                shadow_query_result = sim_ctx.shadow_scholar.query_facts(
-                    requester_namespace=canonical_rfa['requester_namespace'],
-                    namespace=canonical_rfa['namespace'],
-                    subject=canonical_rfa.get('subject'),
-                    predicate=canonical_rfa.get('predicate'),
-                    object_value=canonical_rfa.get('object'),
-                    at_valid_time=at_valid_time,
-                    as_of_system_time=as_of_system_time,
-                    requester_id=canonical_rfa['requester_id']
+            if shadow_scholar is not None:
+                # Steps 5-6 done once by the caller: query its shadow session (SIM-03)
+                shadow_result = self._query_shadow(
+                    shadow_scholar, canonical_rfa, at_valid_time, as_of_system_time
                 )
-                shadow_result = shadow_query_result.to_proof_bundle()
-            # Context manager __exit__ called here - shadow_chain discarded
+            else:
+                # Step 5: Build OverlayContext from simulation_spec
+                overlay_ctx = self._build_overlay_context(simulation_spec)
+
+                # Step 6: Run shadow query in context manager (SIM-03, cleanup guaranteed)
+                # NOTE: SimulationContext.__enter__ appends shadow cells from overlay_ctx
+                # to shadow_chain BEFORE creating shadow_scholar, so Scholar sees them.
+                with SimulationContext(
+                    self.chain, overlay_ctx, at_valid_time, as_of_system_time,
+                    base_scholar=self.scholar
+                ) as sim_ctx:
+                    # Query shadow reality (same RFA, same frozen coordinates)
+                    shadow_result = self._query_shadow(
+                        sim_ctx.shadow_scholar, canonical_rfa, at_valid_time, as_of_system_time
+                    )
+                # Context manager __exit__ called here - shadow_chain discarded
 
             # Step 7: Capture chain head AFTER simulation (SHD-06)
             chain_head_after = self.chain.head.cell_id
@@ -874,6 +884,26 @@ class Engine:
                 e, details={"operation": "simulate_rfa"}
             ) from e
 
+    def _query_shadow(
+        self,
+        shadow_scholar: Scholar,
+        canonical_rfa: dict,
+        at_valid_time: str,
+        as_of_system_time: str
+    ) -> dict:
+        """Run a canonical RFA against shadow reality; returns its proof bundle."""
+        shadow_query_result = shadow_scholar.query_facts(
+            requester_namespace=canonical_rfa['requester_namespace'],
+            namespace=canonical_rfa['namespace'],
+            subject=canonical_rfa.get('subject'),
+            predicate=canonical_rfa.get('predicate'),
+            object_value=canonical_rfa.get('object'),
+            at_valid_time=at_valid_time,
+            as_of_system_time=as_of_system_time,
+            requester_id=canonical_rfa['requester_id']
+        )
+        return shadow_query_result.to_proof_bundle()
+
     def _build_overlay_context(self, simulation_spec: dict) -> OverlayContext:
         """
         Build OverlayContext from simulation_spec.
@@ -950,15 +980,22 @@ class Engine:
         as_of_system_time: str,
         max_cases: int = 1000,
         max_runtime_ms: int = 60000,
-        max_cells_touched: int = 100000
+        max_cells_touched: int = 100000,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_BACKTEST_CHUNK_SIZE
     ) -> BatchBacktestResult:
         """
         Run simulations over multiple RFAs (BAT-01, BAT-02, BAT-03).
 
-        Iterates over rfa_list, calling simulate_rfa() for each with the same
+        Iterates over rfa_list, simulating each with the same
         simulation_spec and bitemporal coordinates. Results are collected,
         sorted deterministically, and returned with execution metrics.
 
+        Every RFA shares the simulation_spec, so the shadow chain and shadow
+        Scholar are built once for the batch rather than once per RFA. With
+        workers > 1 the RFAs are sharded across a process pool; each worker
+        builds its own shadow session once.
+
         Bounded execution (BAT-02):
         - max_cases: Stop after N RFAs processed
         - max_runtime_ms: Stop after timeout exceeded
@@ -966,6 +1003,10 @@ class Engine:
 
         When any limit is exceeded, returns partial results with
         backtest_incomplete=True. This prevents DoS via large batches.
+        The limits are global to the batch: workers stop starting cases once
+        the runtime is spent, and max_cases / max_cells_touched are applied
+        to outcomes in input order, so a pooled run processes the same RFAs
+        as a sequential one (up to the runtime cut-off).
 
         Args:
             rfa_list: List of RFA dicts to simulate (same format as process_rfa)
@@ -975,6 +1016,8 @@ class Engine:
             max_cases: Max RFAs to process (default 1000, BAT-02)
             max_runtime_ms: Max runtime in ms (default 60000 = 60s, BAT-02)
             max_cells_touched: Max cumulative cells (default 100000, BAT-02)
+            workers: Process pool size; 1 simulates in-process
+            chunk_size: RFAs per pool task
 
         Returns:
             BatchBacktestResult with:
@@ -994,7 +1037,8 @@ class Engine:
             ...     ],
             ...     simulation_spec={"shadow_facts": [...]},
             ...     at_valid_time="2025-01-15T00:00:00Z",
-            ...     as_of_system_time="2025-01-15T00:00:00Z"
+            ...     as_of_system_time="2025-01-15T00:00:00Z",
+            ...     workers=4
             ... )
             >>> print(result.cases_processed)  # 2
             >>> print(result.backtest_incomplete)  # False
@@ -1015,49 +1059,63 @@ class Engine:
         results: List[SimulationResult] = []
         cells_touched = 0
 
-        for rfa_dict in rfa_list:
-            # Check max_cases and max_runtime_ms limits (BAT-02)
-            if budget.is_exceeded():
-                return BatchBacktestResult(
-                    results=_sort_results(results),  # BAT-03
-                    backtest_incomplete=True,
-                    cases_processed=len(results),
-                    runtime_ms=budget.elapsed_ms(),
-                    cells_touched=cells_touched
-                )
-
-            # Check max_cells_touched limit (BAT-02)
-            if cells_touched >= max_cells_touched:
-                return BatchBacktestResult(
-                    results=_sort_results(results),
-                    backtest_incomplete=True,
-                    cases_processed=len(results),
-                    runtime_ms=budget.elapsed_ms(),
-                    cells_touched=cells_touched
-                )
-
-            # Run simulation for this RFA
-            sim_result = self.simulate_rfa(
-                rfa_dict=rfa_dict,
-                simulation_spec=simulation_spec,
-                at_valid_time=at_valid_time,
-                as_of_system_time=as_of_system_time
+        def finish(incomplete: bool) -> BatchBacktestResult:
+            return BatchBacktestResult(
+                results=_sort_results(results),  # BAT-03: deterministic order
+                backtest_incomplete=incomplete,
+                cases_processed=len(results),
+                runtime_ms=budget.elapsed_ms(),
+                cells_touched=cells_touched
             )
 
-            results.append(sim_result)
-            budget.increment()
+        # max_cases (BAT-02): never simulate more than the budget allows
+        cases = rfa_list[:max(max_cases, 0)]
+
+        try:
+            overlay_ctx = self._build_overlay_context(simulation_spec)
+        except DecisionGraphError:
+            raise
+        except Exception as e:
+            raise wrap_internal_exception(
+                e, details={"operation": "run_backtest"}
+            ) from e
 
-            # Track cells touched for limit check
-            cells_touched += _count_cells_in_simulation(sim_result)
+        if workers > 1 and len(cases) > chunk_size:
+            chunks = _pooled_backtest_chunks(
+                self, overlay_ctx, cases, simulation_spec, at_valid_time,
+                as_of_system_time, budget, workers, chunk_size
+            )
+        else:
+            chunks = _inline_backtest_chunks(
+                self, overlay_ctx, cases, simulation_spec, at_valid_time,
+                as_of_system_time, budget
+            )
 
-        # All cases completed within budget
-        return BatchBacktestResult(
-            results=_sort_results(results),  # BAT-03: deterministic order
-            backtest_incomplete=False,
-            cases_processed=len(results),
-            runtime_ms=budget.elapsed_ms(),
-            cells_touched=cells_touched
-        )
+        try:
+            for chunk, chunk_results, error in chunks:
+                for sim_result in chunk_results:
+                    # Check max_cells_touched limit before each case (BAT-02)
+                    if cells_touched >= max_cells_touched:
+                        return finish(True)
+                    results.append(sim_result)
+                    budget.increment()
+
+                    # Track cells touched for limit check
+                    cells_touched += _count_cells_in_simulation(sim_result)
+
+                if error is not None:
+                    # A sequential run stops at the cell limit before reaching this RFA
+                    if cells_touched >= max_cells_touched:
+                        return finish(True)
+                    raise error
+                if len(chunk_results) < len(chunk):
+                    # max_runtime_ms spent before the rest of the chunk started
+                    return finish(True)
+        finally:
+            chunks.close()
+
+        # Cases beyond max_cases were never simulated
+        return finish(len(cases) < len(rfa_list))
 
 
 def process_rfa(
@@ -44,6 +44,7 @@ from .cell import (
     compute_policy_hash
 )
 from .chain import Chain
+from .overlay_chain import OverlayChain
 
 
 def _replace_fact_fields(base_fact: Fact, **kwargs) -> Fact:
@@ -489,22 +490,23 @@ class OverlayContext:
 
 def fork_shadow_chain(base_chain: Chain) -> Chain:
     """
-    Create a shadow chain as a structural copy of the base chain.
+    Create a shadow chain layered over the base chain (copy-on-write).
 
     This is the core contamination prevention mechanism. The shadow chain
-    is a SEPARATE Chain instance that shares cell references with the base
-    chain (memory-efficient) but has its own cells list and index.
+    is a SEPARATE Chain instance (an OverlayChain) that reads through to
+    the base chain's cells and index as they were at fork time, and keeps
+    its own appended cells and their index entries in a delta layer.
 
     Structural isolation means:
-    - shadow_chain.append() modifies shadow_chain.cells
-    - base_chain.cells is NEVER modified by shadow operations
-    - Impossible to contaminate base chain because it's a different object
+    - shadow_chain.append() only writes to the shadow's delta layer
+    - base_chain.cells and base_chain.index are NEVER modified by shadow operations
+    - Base cells appended after the fork are not visible in the shadow
 
     Args:
         base_chain: The production chain to fork from
 
     Returns:
-        New Chain instance with shallow copy of cells and index
+        New OverlayChain over base_chain
 
     Example:
         shadow_chain = fork_shadow_chain(base_chain)
@@ -512,16 +514,12 @@ def fork_shadow_chain(base_chain: Chain) -> Chain:
         assert len(base_chain.cells) == original_length  # Base unchanged
 
     Note:
-        Uses shallow copy of cells list - individual Cell objects are shared
-        (they're immutable frozen dataclasses). Only the list container is new.
+        Forking is O(1): nothing is copied. Individual Cell objects are
+        shared (their seals are verified before they enter any chain).
+        Scholar(shadow_chain, base=base_scholar) likewise reads through
+        to the base Scholar's indexes and indexes only the shadow cells.
     """
-    return Chain(
-        cells=list(base_chain.cells),  # New list, shared cell references
-        index=dict(base_chain.index),  # New dict, same mappings
-        _graph_id=base_chain.graph_id,
-        _root_namespace=base_chain.root_namespace
-    )
-
+    return OverlayChain(base_chain)
 
 # Export public interface
 __all__ = [
@@ -81,7 +81,8 @@ class SimulationContext:
         base_chain: Chain,
         overlay_context: OverlayContext,
         at_valid_time: str,
-        as_of_system_time: str
+        as_of_system_time: str,
+        base_scholar: Optional[Scholar] = None
     ):
         """
         Initialize SimulationContext.
@@ -91,8 +92,12 @@ class SimulationContext:
             overlay_context: Container of shadow cells to apply
             at_valid_time: Valid-time coordinate (ISO 8601 UTC)
             as_of_system_time: System-time coordinate (ISO 8601 UTC)
+            base_scholar: Optional Scholar over base_chain; when given, the
+                shadow Scholar reads through to its indexes and only
+                indexes the shadow cells
         """
         self.base_chain = base_chain
+        self.base_scholar = base_scholar
         self.overlay_context = overlay_context
         self._at_valid_time = at_valid_time
         self._as_of_system_time = as_of_system_time
@@ -127,7 +132,7 @@ class SimulationContext:
             Order matters! Shadow cells appended BEFORE scholar creation
             ensures Scholar sees shadow cells during query.
         """
-        # Step 1: Fork chain (structural isolation)
+        # Step 1: Fork chain (structural isolation, O(1) copy-on-write overlay)
         self.shadow_chain = fork_shadow_chain(self.base_chain)
 
         # Step 2: Append shadow cells from OverlayContext
@@ -154,7 +159,11 @@ class SimulationContext:
         # Step 3: Create shadow scholar AFTER shadow cells appended
         # Scholar queries the chain it's given - by appending shadow cells first,
         # the Scholar will see them during query execution
-        self.shadow_scholar = create_scholar(self.shadow_chain)
+        if self.base_scholar is not None:
+            # Reuse the base indexes; only the shadow cells are indexed
+            self.shadow_scholar = Scholar(self.shadow_chain, base=self.base_scholar)
+        else:
+            self.shadow_scholar = create_scholar(self.shadow_chain)
 
         # Return self for use in with block
         return self
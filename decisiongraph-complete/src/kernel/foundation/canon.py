@@ -33,7 +33,8 @@ Usage:
 import json
 import re
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
+from itertools import chain, repeat
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 class CanonicalEncodingError(Exception):
@@ -166,6 +167,133 @@ def _encode_value(value: Any, path: str = "") -> str:
     )
 
 
+# ============================================================================
+# FAST ENCODER
+# ============================================================================
+#
+# _encode_value above is the reference encoder. _encode_fast produces the
+# same string with three shortcuts:
+# - strings with nothing to escape (the common case) skip escaping entirely
+#   via one regex search; others use str.replace plus a control-char regex
+# - containers are walked with an explicit stack instead of recursion
+# - the UTF-8 key order and encoded '"key":' prefixes of each dict shape
+#   (its keys in insertion order) are cached, since cell payloads repeat
+#   the same few shapes
+#
+# It does not track paths for error messages: on any encoding error the
+# reference encoder is re-run to raise the exact same exception.
+
+# Anything that needs escaping in a JSON string
+NEEDS_ESCAPE_PATTERN = re.compile(r'["\\\x00-\x1f]')
+
+# Max cached dict shapes; the cache is cleared when full
+KEY_ORDER_CACHE_SIZE = 1024
+
+_key_orders: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+_EMPTY_PREFIX = ("",)
+
+
+def _quote_fast(s: str) -> str:
+    """Same result as '"' + _escape_string(s) + '"'."""
+    if NEEDS_ESCAPE_PATTERN.search(s) is None:
+        return '"' + s + '"'
+    s = s.replace('\\', '\\\\').replace('"', '\\"')
+    if CONTROL_CHAR_PATTERN.search(s) is not None:
+        s = CONTROL_CHAR_PATTERN.sub(lambda m: CONTROL_CHAR_MAP[m.group()], s)
+    return '"' + s + '"'
+
+
+def _key_order(value: dict) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """(keys in UTF-8 byte order, encoded '"key":' prefixes with separators) for a dict shape."""
+    shape = tuple(value)
+    cached = _key_orders.get(shape)
+    if cached is not None:
+        return cached
+    for key in shape:
+        if not isinstance(key, str):
+            raise CanonicalEncodingError("non-string key")
+    keys = tuple(sorted(shape, key=lambda k: k.encode('utf-8')))
+    prefixes = tuple(
+        ('' if i == 0 else ',') + _quote_fast(key) + ':'
+        for i, key in enumerate(keys)
+    )
+    if len(_key_orders) >= KEY_ORDER_CACHE_SIZE:
+        _key_orders.clear()
+    _key_orders[shape] = (keys, prefixes)
+    return keys, prefixes
+
+
+def _encode_fast(obj: Any) -> str:
+    """
+    Iterative encoder; see FAST ENCODER above.
+
+    Raises:
+        CanonicalEncodingError (without path details) or UnicodeEncodeError
+    """
+    parts: List[str] = []
+    append = parts.append
+    stack = []  # (items, closer) of the enclosing containers
+    items = iter(((_EMPTY_PREFIX[0], obj),))
+    closer = ''
+
+    while True:
+        descended = False
+        for prefix, value in items:
+            if prefix:
+                append(prefix)
+            while True:
+                t = type(value)
+                if t is str:
+                    append(_quote_fast(value))
+                elif value is None:
+                    append('null')
+                elif isinstance(value, bool):
+                    append('true' if value else 'false')
+                elif isinstance(value, int):
+                    append(str(value))
+                elif isinstance(value, (float, Decimal)):
+                    raise CanonicalEncodingError("non-canonical number")
+                elif isinstance(value, str):
+                    append(_quote_fast(value))
+                elif isinstance(value, (list, tuple)):
+                    append('[')
+                    stack.append((items, closer))
+                    items = zip(chain(_EMPTY_PREFIX, repeat(',')), value)
+                    closer = ']'
+                    descended = True
+                elif isinstance(value, dict):
+                    keys, prefixes = _key_order(value)
+                    append('{')
+                    stack.append((items, closer))
+                    items = zip(prefixes, [value[key] for key in keys])
+                    closer = '}'
+                    descended = True
+                elif hasattr(value, 'value'):
+                    # Enum handling - use .value
+                    value = value.value
+                    continue
+                else:
+                    raise CanonicalEncodingError("unsupported type")
+                break
+            if descended:
+                break
+        if descended:
+            continue
+        append(closer)
+        if not stack:
+            return ''.join(parts)
+        items, closer = stack.pop()
+
+
+def _encode(obj: Any) -> str:
+    """Canonical JSON string: fast path, reference encoder for exact errors."""
+    try:
+        return _encode_fast(obj)
+    except (CanonicalEncodingError, UnicodeEncodeError):
+        return _encode_value(obj)
+
+
 def canonical_json_bytes(obj: Any) -> bytes:
     """
     Convert object to canonical JSON bytes per RFC 8785.
@@ -189,7 +317,7 @@ def canonical_json_bytes(obj: Any) -> bytes:
 
         >>> canonical_json_bytes({"value": 1.5})  # Raises FloatNotAllowedError
     """
-    json_str = _encode_value(obj)
+    json_str = _encode(obj)
     return json_str.encode('utf-8')
 
 
@@ -206,7 +334,7 @@ def canonical_json_string(obj: Any) -> str:
     Returns:
         Canonical JSON string
     """
-    return _encode_value(obj)
+    return _encode(obj)
 
 
 def validate_canonical_safe(obj: Any, path: str = "") -> None:
@@ -32,7 +32,8 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional, List, Dict, Any, Union
+from operator import is_
+from typing import Optional, List, Dict, Any, Tuple, Union
 
 
 class CellType(str, Enum):
@@ -473,6 +474,8 @@ class DecisionCell:
     evidence: List[Evidence] = field(default_factory=list)
     proof: Proof = field(default_factory=Proof)
     cell_id: str = field(default="", init=False)
+    # Verified-seal memo: the seal input objects as of the last successful check
+    _seal_memo: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate constraints and compute cell_id after initialization."""
@@ -489,6 +492,7 @@ class DecisionCell:
             self._validate_structured_object(self.fact.object, "fact.object")
 
         self.cell_id = self.compute_cell_id()
+        self._seal_memo = self._seal_inputs()
 
     def _validate_structured_object(self, obj: Any, path: str) -> None:
         """
@@ -597,9 +601,60 @@ class DecisionCell:
         """
         Verify that the cell_id matches the computed hash.
         
+        A cell remembers the objects it was sealed from at its last
+        successful check (construction counts as one). If every one of
+        them is still the same object, the SHA-256 is not recomputed, so
+        re-appending the same cell to many chains (e.g. shadow cells across
+        simulations) costs no hashing. Cells with a structured fact.object
+        (dict/list) can be edited in place and are always rehashed. Use
+        reverify() to always recompute.
+        
         Returns True if cell is valid, False if tampered.
         """
-        return self.cell_id == self.compute_cell_id()
+        memo = self._seal_memo
+        if memo is not None:
+            current = self._seal_inputs()
+            if current is not None and len(current) == len(memo) and all(map(is_, current, memo)):
+                return True
+        return self.reverify()
+    
+    def reverify(self) -> bool:
+        """
+        Recompute the seal unconditionally, ignoring the verified-seal memo.
+        
+        For paranoid audits. Returns True if cell is valid, False if tampered.
+        """
+        valid = self.cell_id == self.compute_cell_id()
+        self._seal_memo = self._seal_inputs() if valid else None
+        return valid
+    
+    def _seal_inputs(self) -> Optional[tuple]:
+        """
+        The objects compute_cell_id() reads: the header, fact, logic_anchor,
+        proof and evidence objects plus each field value it hashes, compared
+        by identity (any reassignment, even to an equal value, misses).
+        
+        Returns:
+            Tuple of input objects, or None if fact.object is structured
+            (mutable in place, so never memoized)
+        """
+        header, fact, anchor, proof, evidence = (
+            self.header, self.fact, self.logic_anchor, self.proof, self.evidence
+        )
+        if fact.has_structured_object():
+            return None
+        inputs = [
+            self.cell_id, header, fact, anchor, proof, evidence,
+            header.version, header.graph_id, header.cell_type, header.system_time,
+            header.prev_cell_hash, header.hash_scheme,
+            fact.namespace, fact.subject, fact.predicate, fact.object, fact.confidence,
+            fact.source_quality, fact.valid_from, fact.valid_to,
+            anchor.rule_id, anchor.rule_logic_hash, anchor.interpreter,
+            proof.signer_id, proof.signer_key_id, proof.signature_required,
+        ]
+        for e in evidence:
+            inputs += (e, e.type, e.cid, e.source, e.payload_hash, e.description)
+        return tuple(inputs)
     
     def is_genesis(self) -> bool:
         """Check if this is the Genesis cell"""
@@ -626,6 +681,51 @@ class DecisionCell:
     @classmethod
     def from_dict(cls, data: dict) -> 'DecisionCell':
         """Create a cell from dictionary"""
+        header, fact, logic_anchor, evidence, proof = cls._components_from_dict(data)
+
+        cell = cls(
+            header=header,
+            fact=fact,
+            logic_anchor=logic_anchor,
+            evidence=evidence,
+            proof=proof
+        )
+        
+        # Verify the cell_id matches
+        if cell.cell_id != data.get("cell_id"):
+            raise ValueError(
+                f"Cell ID mismatch! Computed: {cell.cell_id}, "
+                f"Provided: {data.get('cell_id')}. Cell may be tampered."
+            )
+        
+        return cell
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> 'DecisionCell':
+        """
+        Restore a cell from dictionary WITHOUT recomputing the seal.
+
+        The stored cell_id is taken as-is. Only use this for data whose
+        integrity was already established elsewhere (e.g. WAL records covered
+        by a verified checkpoint); use from_dict() for anything untrusted.
+        """
+        header, fact, logic_anchor, evidence, proof = cls._components_from_dict(data)
+
+        cell = cls.__new__(cls)
+        cell.header = header
+        cell.fact = fact
+        cell.logic_anchor = logic_anchor
+        cell.evidence = evidence
+        cell.proof = proof
+        cell.cell_id = data["cell_id"]
+        cell._seal_memo = None  # Not verified here; the first verify_integrity() hashes
+        return cell
+
+    @staticmethod
+    def _components_from_dict(
+        data: dict,
+    ) -> Tuple['Header', 'Fact', 'LogicAnchor', List['Evidence'], 'Proof']:
+        """Parse the component dataclasses of a serialized cell."""
         header = Header(
             version=data["header"]["version"],
             graph_id=data["header"]["graph_id"],
@@ -667,25 +767,11 @@ class DecisionCell:
             signer_id=data.get("proof", {}).get("signer_id"),
             signer_key_id=data.get("proof", {}).get("signer_key_id"),
             signature=data.get("proof", {}).get("signature"),
-            merkle_root=data.get("proof", {}).get("merkle_root")
-        )
-        
-        cell = cls(
-            header=header,
-            fact=fact,
-            logic_anchor=logic_anchor,
-            evidence=evidence,
-            proof=proof
+            merkle_root=data.get("proof", {}).get("merkle_root"),
+            signature_required=data.get("proof", {}).get("signature_required", False)
         )
-        
-        # Verify the cell_id matches
-        if cell.cell_id != data.get("cell_id"):
-            raise ValueError(
-                f"Cell ID mismatch! Computed: {cell.cell_id}, "
-                f"Provided: {data.get('cell_id')}. Cell may be tampered."
-            )
-        
-        return cell
+
+        return header, fact, logic_anchor, evidence, proof
 
 
 # Export public interface
@@ -19,8 +19,10 @@ v1.3 CHANGES:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Iterator, Tuple, Set
+from typing import Callable, List, Dict, Optional, Iterator, Tuple
+import inspect
 import json
+import weakref
 
 from .cell import (
     DecisionCell,
@@ -28,6 +30,13 @@ from .cell import (
     NULL_HASH,
     get_current_timestamp
 )
+from .chain_index import ChainIndex
+from .chain_validation import (
+    DEFAULT_CHUNK_SIZE,
+    ValidationCheckpoint,
+    find_integrity_failures,
+    validate_cells,
+)
 from .genesis import (
     create_genesis_cell,
     verify_genesis,
@@ -80,6 +89,8 @@ class ValidationResult:
     root_namespace: Optional[str] = None
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    trusted_cells: int = 0  # Prefix covered by a validation checkpoint, not re-checked
+    cell_ids_digest: Optional[str] = None  # Running digest of all covered cell ids
     
     def __bool__(self) -> bool:
         return self.is_valid
@@ -95,6 +106,8 @@ class ValidationResult:
             f"  Errors: {len(self.errors)}",
             f"  Warnings: {len(self.warnings)}"
         ]
+        if self.trusted_cells:
+            lines.insert(2, f"  Trusted (checkpoint): {self.trusted_cells}")
         if self.errors:
             lines.append("  Error details:")
             for err in self.errors[:5]:  # Show first 5
@@ -125,6 +138,15 @@ class Chain:
     _graph_id: Optional[str] = field(default=None)       # Cached graph_id
     _root_namespace: Optional[str] = field(default=None) # Cached root namespace
     _hash_scheme: Optional[str] = field(default=None)    # Cached hash_scheme (v2.0)
+    # Append subscribers (see subscribe); not part of chain state
+    _subscribers: List[Callable[[], Optional[Callable]]] = field(
+        default_factory=list, repr=False, compare=False
+    )
+    # PolicyHead timeline (see policyhead.get_policy_head_timeline)
+    _policy_timeline: Optional[object] = field(default=None, repr=False, compare=False)
+    # Optional type/subject/rule/namespace indexes behind the find_* methods
+    secondary_indexes: bool = field(default=False, compare=False)
+    _secondary: Optional[ChainIndex] = field(default=None, repr=False, compare=False)
     
     @property
     def length(self) -> int:
@@ -190,6 +212,39 @@ class Chain:
         """Check if a cell exists in the chain"""
         return cell_id in self.index
     
+    def subscribe(self, callback: Callable[[DecisionCell], None]) -> None:
+        """
+        Call ``callback(cell)`` after every cell stored in this chain.
+        
+        Bound methods are held weakly, so a subscriber (e.g. a Scholar)
+        is not kept alive by the chain it reads. Cells that enter the
+        chain without going through append()/_store() (such as a chain
+        constructed with ``cells=``) are not announced.
+        """
+        if inspect.ismethod(callback):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731
+        self._subscribers.append(ref)
+    
+    def unsubscribe(self, callback: Callable[[DecisionCell], None]) -> None:
+        """Remove a callback registered with subscribe()."""
+        self._subscribers[:] = [
+            ref for ref in self._subscribers
+            if ref() is not None and ref() != callback
+        ]
+    
+    def _notify(self, cell: DecisionCell) -> None:
+        dead = False
+        for ref in list(self._subscribers):
+            callback = ref()
+            if callback is None:
+                dead = True
+            else:
+                callback(cell)
+        if dead:
+            self._subscribers[:] = [ref for ref in self._subscribers if ref() is not None]
+    
     def initialize(
         self,
         graph_name: str = "UniversalDecisionGraph",
@@ -230,11 +285,7 @@ class Chain:
             hash_scheme=hash_scheme
         )
 
-        self.cells.append(genesis)
-        self.index[genesis.cell_id] = 0
-        self._graph_id = genesis.header.graph_id
-        self._root_namespace = genesis.fact.namespace
-        self._hash_scheme = genesis.header.hash_scheme
+        self._store(genesis)
 
         return genesis
     
@@ -269,6 +320,21 @@ class Chain:
             SignatureInvalidError: If verify_signatures=True and cell requires
                                    signature but has none, or signature is invalid
         """
+        self._append(cell, verify_signatures=verify_signatures, verify_integrity=True)
+    
+    def _append(
+        self,
+        cell: DecisionCell,
+        verify_signatures: bool = False,
+        verify_integrity: bool = True
+    ) -> None:
+        """
+        append() checks and store.
+        
+        verify_integrity=False skips recomputing the seal; only for cells
+        whose seals were already checked (e.g. a trusted bulk load that
+        verified them in parallel batches). Every other rule still applies.
+        """
         # Check Genesis rules
         if is_genesis(cell):
             if self.has_genesis():
@@ -278,18 +344,14 @@ class Chain:
             if not is_valid:
                 raise GenesisViolation(f"Invalid Genesis cell: {', '.join(failed_checks[:3])}")
             # Add Genesis and cache its constitution
-            self.cells.append(cell)
-            self.index[cell.cell_id] = 0
-            self._graph_id = cell.header.graph_id
-            self._root_namespace = cell.fact.namespace
-            self._hash_scheme = cell.header.hash_scheme  # Graph's hash scheme (v2.0)
+            self._store(cell)
             return
         
         if not self.has_genesis():
             raise GenesisViolation("Cannot add cells before Genesis exists.")
         
         # Verify cell integrity
-        if not cell.verify_integrity():
+        if verify_integrity and not cell.verify_integrity():
             raise IntegrityViolation(
                 f"Cell {cell.cell_id[:16]}... failed integrity check. "
                 f"Computed hash doesn't match cell_id."
@@ -374,10 +436,35 @@ class Chain:
                 # For now, signature presence check satisfies the requirement.
 
         # All checks passed - append
+        self._store(cell)
+
+    def _store(self, cell: DecisionCell) -> None:
+        """
+        Insert an already-validated cell.
+
+        This is the single point where cells enter the chain; subclasses
+        (e.g. PersistentChain) hook it to persist or index cells.
+        """
         self.cells.append(cell)
         self.index[cell.cell_id] = len(self.cells) - 1
+        if len(self.cells) == 1:
+            # Cache the Genesis constitution
+            self._graph_id = cell.header.graph_id
+            self._root_namespace = cell.fact.namespace
+            self._hash_scheme = cell.header.hash_scheme  # Graph's hash scheme (v2.0)
+        if self._secondary is not None:
+            self._secondary.sync(self.cells)
+        if self._subscribers:
+            self._notify(cell)
     
-    def validate(self) -> ValidationResult:
+    def validate(
+        self,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checkpoint: Optional[ValidationCheckpoint] = None,
+        public_key: Optional[bytes] = None,
+        reverify: bool = False
+    ) -> ValidationResult:
         """
         Validate the entire chain.
         
@@ -389,83 +476,25 @@ class Chain:
         5. No duplicate cell_ids
         6. All cells have same graph_id (v1.3)
         
+        Args:
+            workers: Process pool size for hashing cells; 1 hashes in-process
+            chunk_size: Cells per pool task
+            checkpoint: Signed ValidationCheckpoint from an earlier run; only
+                cells past it are validated (see chain_validation)
+            public_key: Ed25519 public key of the checkpoint signer
+            reverify: Recompute every seal even if the cell's verified-seal
+                memo is current (see DecisionCell.reverify)
+        
         Returns:
             ValidationResult with details
         """
-        errors = []
-        warnings = []
-        
-        if self.is_empty():
-            return ValidationResult(
-                is_valid=True,
-                cells_checked=0,
-                warnings=["Chain is empty"]
-            )
-        
-        # Get graph_id from genesis
-        chain_graph_id = self.cells[0].header.graph_id if self.cells else None
-        chain_root_ns = self.cells[0].fact.namespace if self.cells else None
-        
-        # Check Genesis
-        if not is_genesis(self.cells[0]):
-            errors.append("First cell is not Genesis")
-        else:
-            is_valid, failed_checks = verify_genesis(self.cells[0])
-            if not is_valid:
-                for check in failed_checks:
-                    errors.append(f"Genesis: {check}")
-        
-        # Check for duplicate Genesis
-        genesis_count = sum(1 for c in self.cells if is_genesis(c))
-        if genesis_count > 1:
-            errors.append(f"Multiple Genesis cells found: {genesis_count}")
-        
-        # Check each cell
-        seen_ids: Set[str] = set()
-        prev_timestamp: Optional[str] = None
-        
-        for i, cell in enumerate(self.cells):
-            # Check for duplicates
-            if cell.cell_id in seen_ids:
-                errors.append(f"Duplicate cell_id at position {i}: {cell.cell_id[:16]}...")
-            seen_ids.add(cell.cell_id)
-            
-            # Verify integrity
-            if not cell.verify_integrity():
-                errors.append(f"Integrity violation at position {i}: {cell.cell_id[:16]}...")
-            
-            # Check graph_id (NEW in v1.3)
-            if cell.header.graph_id != chain_graph_id:
-                errors.append(
-                    f"Graph ID mismatch at position {i}: "
-                    f"expected '{chain_graph_id}', got '{cell.header.graph_id}'"
-                )
-            
-            # Check chain link (skip Genesis)
-            if i > 0:
-                if cell.header.prev_cell_hash == NULL_HASH:
-                    errors.append(f"Non-genesis cell at position {i} has NULL_HASH")
-                elif not self.cell_exists(cell.header.prev_cell_hash):
-                    errors.append(
-                        f"Broken chain at position {i}: prev_cell_hash "
-                        f"{cell.header.prev_cell_hash[:16]}... not found"
-                    )
-            
-            # Check temporal consistency
-            if prev_timestamp and cell.header.system_time < prev_timestamp:
-                warnings.append(
-                    f"Temporal inconsistency at position {i}: "
-                    f"{cell.header.system_time} < {prev_timestamp}"
-                )
-            prev_timestamp = cell.header.system_time
-        
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            cells_checked=len(self.cells),
-            graph_id=chain_graph_id,
-            root_namespace=chain_root_ns,
-            errors=errors,
-            warnings=warnings
+        return validate_cells(
+            self,
+            workers=workers,
+            chunk_size=chunk_size,
+            checkpoint=checkpoint,
+            public_key=public_key,
+            reverify=reverify
         )
     
     def trace_to_genesis(self, cell_id: str) -> List[DecisionCell]:
@@ -497,18 +526,23 @@ class Chain:
         
         return path
     
-    def find_integrity_violations(self) -> List[Tuple[int, DecisionCell]]:
+    def find_integrity_violations(
+        self,
+        workers: int = 1,
+        reverify: bool = False
+    ) -> List[Tuple[int, DecisionCell]]:
         """
         Find all cells with integrity violations.
         
+        Args:
+            workers: Process pool size for hashing cells; 1 hashes in-process
+            reverify: Recompute every seal, ignoring verified-seal memos
+        
         Returns:
             List of (position, cell) tuples for invalid cells
         """
-        violations = []
-        for i, cell in enumerate(self.cells):
-            if not cell.verify_integrity():
-                violations.append((i, cell))
-        return violations
+        failures = find_integrity_failures(self.cells, workers=workers, reverify=reverify)
+        return [(i, self.cells[i]) for i in failures]
     
     def find_graph_id_mismatches(self) -> List[Tuple[int, DecisionCell]]:
         """
@@ -526,12 +560,52 @@ class Chain:
                 mismatches.append((i, cell))
         return mismatches
     
+    # ========================================================================
+    # SECONDARY INDEXES
+    # ========================================================================
+    
+    def enable_secondary_indexes(self) -> None:
+        """Build the type/subject/rule/namespace indexes and keep them on append."""
+        self.secondary_indexes = True
+        self._indexes()
+    
+    def disable_secondary_indexes(self) -> None:
+        """Drop the secondary indexes; find_* methods go back to scanning."""
+        self.secondary_indexes = False
+        self._secondary = None
+    
+    def secondary_index_stats(self) -> Dict:
+        """Entry counts and approximate memory overhead of the secondary indexes."""
+        index = self._indexes()
+        if index is None:
+            return {"enabled": False}
+        return {"enabled": True, **index.stats()}
+    
+    def _indexes(self) -> Optional[ChainIndex]:
+        """Secondary indexes synced with self.cells, or None when disabled."""
+        if not self.secondary_indexes:
+            return None
+        if self._secondary is None:
+            self._secondary = ChainIndex()
+        self._secondary.sync(self.cells)
+        return self._secondary
+    
+    def _cells_at(self, positions) -> List[DecisionCell]:
+        cells = self.cells
+        return [cells[p] for p in positions]
+    
     def find_by_type(self, cell_type: CellType) -> List[DecisionCell]:
         """Find all cells of a given type"""
+        index = self._indexes()
+        if index is not None:
+            return self._cells_at(index.type_positions(cell_type))
         return [c for c in self.cells if c.header.cell_type == cell_type]
     
     def find_by_subject(self, subject: str) -> List[DecisionCell]:
         """Find all cells about a given subject"""
+        index = self._indexes()
+        if index is not None:
+            return self._cells_at(index.subject_positions(subject))
         return [c for c in self.cells if c.fact.subject == subject]
     
     def find_by_namespace(self, namespace: str, include_children: bool = True) -> List[DecisionCell]:
@@ -542,6 +616,10 @@ class Chain:
             namespace: The namespace to search
             include_children: If True, include child namespaces (e.g., "corp.hr" includes "corp.hr.compensation")
         """
+        index = self._indexes()
+        if index is not None:
+            return self._cells_at(index.namespace_positions(namespace, include_children))
+        
         from .cell import is_namespace_prefix
         
         results = []
@@ -556,6 +634,9 @@ class Chain:
     
     def find_by_rule(self, rule_id: str) -> List[DecisionCell]:
         """Find all cells that used a given rule"""
+        index = self._indexes()
+        if index is not None:
+            return self._cells_at(index.rule_positions(rule_id))
         return [c for c in self.cells if c.logic_anchor.rule_id == rule_id]
     
     def find_decisions_with_rule_mismatch(
@@ -573,9 +654,17 @@ class Chain:
         Returns:
             List of decision cells with mismatched rule hashes
         """
+        index = self._indexes()
+        if index is not None:
+            # Only cells that used one of the given rules, in chain order
+            positions = sorted(p for rule_id in rule_cells for p in index.rule_positions(rule_id))
+            candidates = self._cells_at(positions)
+        else:
+            candidates = self.cells
+        
         mismatches = []
         
-        for cell in self.cells:
+        for cell in candidates:
             if cell.header.cell_type == CellType.DECISION:
                 rule_id = cell.logic_anchor.rule_id
                 if rule_id in rule_cells:
@@ -598,7 +687,7 @@ class Chain:
         return self.cells[index]
     
     def to_json(self, indent: int = 2) -> str:
-        """Export chain to JSON"""
+        """Export chain to JSON (see chain_stream.export_chain for large chains)"""
         return json.dumps({
             "graph_id": self.graph_id,
             "root_namespace": self.root_namespace,
@@ -607,7 +696,7 @@ class Chain:
     
     @classmethod
     def from_json(cls, json_str: str) -> 'Chain':
-        """Import chain from JSON"""
+        """Import chain from JSON (see chain_stream.import_chain for large chains)"""
         data = json.loads(json_str)
         chain = cls()
         
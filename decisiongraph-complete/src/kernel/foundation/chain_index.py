@@ -0,0 +1,196 @@
+"""
+DecisionGraph Core: Chain Secondary Indexes
+
+Optional position indexes behind Chain.find_by_type, find_by_subject,
+find_by_rule, find_by_namespace and find_decisions_with_rule_mismatch.
+Without them every lookup is a scan of chain.cells.
+
+- cell_type -> positions
+- subject   -> positions
+- rule_id   -> positions
+- namespace trie (one node per dotted segment) for prefix queries with
+  include_children
+
+Positions are chain offsets stored in compact ``array('I')`` buffers, so
+results come back in chain order. Like the Scholar indexes, a ChainIndex
+keeps a high-water mark and only processes cells appended since the last
+sync; a chain whose cell list was replaced is re-indexed from scratch.
+
+Enable per chain with ``Chain(secondary_indexes=True)`` or
+``chain.enable_secondary_indexes()``; ``chain.secondary_index_stats()``
+reports entry counts and memory overhead.
+"""
+
+import sys
+from array import array
+from itertools import chain as iter_chain
+from typing import Dict, Iterator, List, Optional
+
+from .cell import CellType, DecisionCell
+
+# Position typecode: unsigned 32-bit offsets into chain.cells
+POSITION_TYPECODE = "I"
+
+
+class NamespaceTrie:
+    """Dotted-namespace trie: each node holds the positions of its exact namespace."""
+
+    __slots__ = ("children", "positions")
+
+    def __init__(self):
+        self.children: Dict[str, "NamespaceTrie"] = {}
+        self.positions: Optional[array] = None
+
+    def add(self, namespace: str, position: int) -> None:
+        node = self
+        for segment in namespace.split("."):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = NamespaceTrie()
+            node = child
+        if node.positions is None:
+            node.positions = array(POSITION_TYPECODE)
+        node.positions.append(position)
+
+    def find(self, namespace: str) -> Optional["NamespaceTrie"]:
+        node = self
+        for segment in namespace.split("."):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def walk(self) -> Iterator["NamespaceTrie"]:
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children.values())
+
+    def copy(self) -> "NamespaceTrie":
+        clone = NamespaceTrie()
+        clone.positions = array(POSITION_TYPECODE, self.positions) if self.positions is not None else None
+        clone.children = {segment: child.copy() for segment, child in self.children.items()}
+        return clone
+
+
+class ChainIndex:
+    """Secondary position indexes over one chain's cells."""
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        self.by_type: Dict[CellType, array] = {}
+        self.by_subject: Dict[str, array] = {}
+        self.by_rule: Dict[str, array] = {}
+        self.namespaces = NamespaceTrie()
+        self.indexed_upto = 0
+        self._last_indexed: Optional[DecisionCell] = None
+
+    def copy(self) -> "ChainIndex":
+        """Independent copy for a chain that extends this one (e.g. a shadow fork)."""
+        clone = ChainIndex()
+        clone.by_type = {k: array(POSITION_TYPECODE, v) for k, v in self.by_type.items()}
+        clone.by_subject = {k: array(POSITION_TYPECODE, v) for k, v in self.by_subject.items()}
+        clone.by_rule = {k: array(POSITION_TYPECODE, v) for k, v in self.by_rule.items()}
+        clone.namespaces = self.namespaces.copy()
+        clone.indexed_upto = self.indexed_upto
+        clone._last_indexed = self._last_indexed
+        return clone
+
+    def sync(self, cells: List[DecisionCell]) -> int:
+        """Index cells past the high-water mark; returns how many were processed."""
+        upto = self.indexed_upto
+        if upto == len(cells) and (not upto or cells[-1] is self._last_indexed):
+            return 0
+        if upto > len(cells) or (upto and cells[upto - 1] is not self._last_indexed):
+            # Cell list was replaced, not extended: start over
+            self._reset()
+            upto = 0
+
+        by_type, by_subject, by_rule = self.by_type, self.by_subject, self.by_rule
+        trie_add = self.namespaces.add
+        for position in range(upto, len(cells)):
+            cell = cells[position]
+            for buckets, key in (
+                (by_type, cell.header.cell_type),
+                (by_subject, cell.fact.subject),
+                (by_rule, cell.logic_anchor.rule_id),
+            ):
+                positions = buckets.get(key)
+                if positions is None:
+                    positions = buckets[key] = array(POSITION_TYPECODE)
+                positions.append(position)
+            trie_add(cell.fact.namespace, position)
+
+        self.indexed_upto = len(cells)
+        self._last_indexed = cells[-1] if cells else None
+        return len(cells) - upto
+
+    # ------------------------------------------------------------------
+    # Lookups (positions in chain order)
+    # ------------------------------------------------------------------
+
+    def type_positions(self, cell_type: CellType) -> array:
+        return self.by_type.get(cell_type, array(POSITION_TYPECODE))
+
+    def subject_positions(self, subject: str) -> array:
+        return self.by_subject.get(subject, array(POSITION_TYPECODE))
+
+    def rule_positions(self, rule_id: str) -> array:
+        return self.by_rule.get(rule_id, array(POSITION_TYPECODE))
+
+    def namespace_positions(self, namespace: str, include_children: bool = True) -> List[int]:
+        node = self.namespaces.find(namespace)
+        if node is None:
+            return []
+        if not include_children:
+            return list(node.positions or ())
+        buckets = [n.positions for n in node.walk() if n.positions is not None]
+        if len(buckets) == 1:
+            return list(buckets[0])
+        return sorted(iter_chain.from_iterable(buckets))
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def memory_bytes(self) -> Dict[str, int]:
+        """
+        Approximate container overhead per index, in bytes.
+
+        Keys are the cells' own strings/enums and are not counted.
+        """
+        def mapping_bytes(mapping: Dict) -> int:
+            return sys.getsizeof(mapping) + sum(sys.getsizeof(v) for v in mapping.values())
+
+        trie_bytes = 0
+        for node in self.namespaces.walk():
+            trie_bytes += sys.getsizeof(node) + sys.getsizeof(node.children)
+            if node.positions is not None:
+                trie_bytes += sys.getsizeof(node.positions)
+        sizes = {
+            "by_type": mapping_bytes(self.by_type),
+            "by_subject": mapping_bytes(self.by_subject),
+            "by_rule": mapping_bytes(self.by_rule),
+            "namespace_trie": trie_bytes,
+        }
+        sizes["total"] = sum(sizes.values())
+        return sizes
+
+    def stats(self) -> Dict:
+        return {
+            "cells": self.indexed_upto,
+            "types": len(self.by_type),
+            "subjects": len(self.by_subject),
+            "rules": len(self.by_rule),
+            "namespaces": sum(1 for n in self.namespaces.walk() if n.positions is not None),
+            "memory_bytes": self.memory_bytes(),
+        }
+
+
+__all__ = [
+    "ChainIndex",
+    "NamespaceTrie",
+]
@@ -0,0 +1,299 @@
+"""
+DecisionGraph Core: Streaming Chain Import/Export
+
+Chain.to_json() / Chain.from_json() handle the whole chain as one
+document. This module writes and reads the chain one cell at a time, so
+export and import need memory for the current batch only. The chain
+itself is the exception on import, since it is being built.
+
+Formats
+-------
+- ``jsonl``: JSON Lines. One header object comes first, then one
+  ``cell.to_dict()`` per line.
+- ``msgpack``: The same records as a stream of MessagePack maps. This
+  needs the optional ``msgpack`` package.
+
+The header record is::
+
+    {"format": "decisiongraph.chain", "version": 1,
+     "graph_id": ..., "root_namespace": ..., "hash_scheme": ...}
+
+Import modes
+------------
+- default: every cell goes through Chain.append(), which recomputes its
+  seal once and checks every chain rule.
+- ``trusted=True`` (bulk load): cells are decoded in batches, and each
+  batch's seals are verified with find_integrity_failures (optionally
+  across a process pool). The cells are then appended without
+  re-hashing. Linkage, Genesis, graph_id, hash_scheme and temporal rules
+  are still enforced per cell.
+
+Example:
+    >>> export_chain(chain, "graph.jsonl")
+    >>> restored = import_chain("graph.jsonl", trusted=True, workers=8)
+"""
+
+import io
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
+
+from .cell import DecisionCell
+from .chain import Chain, ChainError, IntegrityViolation
+from .chain_validation import DEFAULT_CHUNK_SIZE, find_integrity_failures
+
+# Optional binary format
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+STREAM_FORMAT = "decisiongraph.chain"
+STREAM_VERSION = 1
+STREAM_FORMATS = ("jsonl", "msgpack")
+DEFAULT_BATCH_SIZE = 8 * DEFAULT_CHUNK_SIZE
+
+Source = Union[str, Path, IO]
+
+
+class ChainStreamError(ChainError):
+    """Raised when a chain stream cannot be written or read."""
+    pass
+
+
+def _check_format(fmt: str) -> None:
+    if fmt not in STREAM_FORMATS:
+        raise ChainStreamError(f"Unknown stream format '{fmt}' (expected one of {STREAM_FORMATS})")
+    if fmt == "msgpack" and msgpack is None:
+        raise ChainStreamError("msgpack format requires the 'msgpack' package")
+
+
+def _header(chain: Chain) -> Dict[str, Any]:
+    return {
+        "format": STREAM_FORMAT,
+        "version": STREAM_VERSION,
+        "graph_id": chain.graph_id,
+        "root_namespace": chain.root_namespace,
+        "hash_scheme": chain.hash_scheme,
+    }
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def iter_chain_records(chain: Chain) -> Iterator[Dict[str, Any]]:
+    """Yield the stream header, then one dict per cell, in chain order."""
+    yield _header(chain)
+    for cell in chain.cells:
+        yield cell.to_dict()
+
+
+def iter_chain_jsonl(chain: Chain) -> Iterator[str]:
+    """Yield the chain as JSON Lines (each line ends with a newline)."""
+    for record in iter_chain_records(chain):
+        yield json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def export_chain(chain: Chain, target: Source, fmt: str = "jsonl") -> int:
+    """
+    Stream ``chain`` to a path or an open file.
+
+    Args:
+        chain: The chain to export
+        target: File path, or a file object (text or binary for jsonl,
+            binary for msgpack)
+        fmt: "jsonl" or "msgpack"
+
+    Returns:
+        Number of cells written
+    """
+    _check_format(fmt)
+    if isinstance(target, (str, Path)):
+        with open(target, "wb") as f:
+            return export_chain(chain, f, fmt)
+
+    count = -1  # the header is not a cell
+    if fmt == "msgpack":
+        packer = msgpack.Packer()
+        for record in iter_chain_records(chain):
+            target.write(packer.pack(record))
+            count += 1
+        return count
+
+    text = isinstance(target, io.TextIOBase)
+    for line in iter_chain_jsonl(chain):
+        target.write(line if text else line.encode("utf-8"))
+        count += 1
+    return count
+
+
+# =============================================================================
+# IMPORT
+# =============================================================================
+
+def _iter_records(source: IO, fmt: str) -> Iterator[Dict[str, Any]]:
+    if fmt == "msgpack":
+        yield from msgpack.Unpacker(source, raw=False)
+        return
+    for number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ChainStreamError(f"Malformed JSON on line {number}: {e}") from e
+
+
+def _cell_records(source: IO, fmt: str) -> Iterator[Dict[str, Any]]:
+    """Check the header, then yield the cell records."""
+    records = _iter_records(source, fmt)
+    header = next(records, None)
+    if header is None:
+        raise ChainStreamError("Empty chain stream")
+    if not isinstance(header, dict) or header.get("format") != STREAM_FORMAT:
+        raise ChainStreamError("Not a chain stream (missing header)")
+    if header.get("version") != STREAM_VERSION:
+        raise ChainStreamError(f"Unsupported chain stream version {header.get('version')}")
+    yield from records
+
+
+def _decode(record: Dict[str, Any], position: int) -> DecisionCell:
+    try:
+        return DecisionCell.from_trusted_dict(record)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ChainStreamError(f"Malformed cell record at position {position}: {e}") from e
+
+
+def iter_cells(source: Source, fmt: str = "jsonl", trusted: bool = False) -> Iterator[DecisionCell]:
+    """
+    Yield cells from a chain stream one at a time.
+
+    Args:
+        source: File path or open file
+        fmt: "jsonl" or "msgpack"
+        trusted: If False, each cell's seal is recomputed and a mismatch
+            raises IntegrityViolation
+
+    Raises:
+        ChainStreamError: On a malformed stream
+        IntegrityViolation: On a tampered cell (trusted=False)
+    """
+    _check_format(fmt)
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            yield from iter_cells(f, fmt, trusted)
+        return
+
+    for position, record in enumerate(_cell_records(source, fmt)):
+        cell = _decode(record, position)
+        if not trusted and not cell.verify_integrity():
+            raise IntegrityViolation(f"Cell at position {position} failed integrity check")
+        yield cell
+
+
+def import_chain(
+    source: Source,
+    fmt: str = "jsonl",
+    trusted: bool = False,
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    chain: Optional[Chain] = None
+) -> Chain:
+    """
+    Build a chain from a stream.
+
+    Args:
+        source: File path or open file
+        fmt: "jsonl" or "msgpack"
+        trusted: Bulk load. Seals are verified per batch, then cells are
+            appended without re-hashing.
+        workers: Process pool size for trusted batch seal checks
+        batch_size: Cells decoded and seal-checked together (trusted)
+        chain: Empty chain to load into (e.g. a PersistentChain); a new
+            Chain by default
+
+    Returns:
+        The loaded chain
+
+    Raises:
+        ChainStreamError: On a malformed stream
+        ChainError: Any append rule violation (IntegrityViolation,
+            ChainBreak, GenesisViolation, TemporalViolation, ...)
+    """
+    _check_format(fmt)
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            return import_chain(f, fmt, trusted, workers, batch_size, chain)
+
+    if chain is None:
+        chain = Chain()
+    if not chain.is_empty():
+        raise ChainStreamError("import_chain needs an empty chain")
+
+    if not trusted:
+        for position, record in enumerate(_cell_records(source, fmt)):
+            # append() recomputes the seal, so no from_dict() double-hashing
+            chain.append(_decode(record, position))
+        return chain
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            _bulk_load(chain, _cell_records(source, fmt), batch_size, workers, pool)
+    else:
+        _bulk_load(chain, _cell_records(source, fmt), batch_size, workers, None)
+    return chain
+
+
+def _bulk_load(
+    chain: Chain,
+    records: Iterator[Dict[str, Any]],
+    batch_size: int,
+    workers: int,
+    pool: Optional[Executor]
+) -> None:
+    batch: List[DecisionCell] = []
+    position = 0
+    for record in records:
+        batch.append(_decode(record, position + len(batch)))
+        if len(batch) >= batch_size:
+            _load_batch(chain, batch, position, workers, pool)
+            position += len(batch)
+            batch = []
+    if batch:
+        _load_batch(chain, batch, position, workers, pool)
+
+
+def _load_batch(
+    chain: Chain,
+    batch: List[DecisionCell],
+    position: int,
+    workers: int,
+    pool: Optional[Executor]
+) -> None:
+    # Split each batch evenly across the pool
+    chunk_size = max(1, -(-len(batch) // workers))
+    failures = find_integrity_failures(batch, chunk_size=chunk_size, executor=pool)
+    if failures:
+        bad = batch[failures[0]]
+        raise IntegrityViolation(
+            f"Cell {bad.cell_id[:16]}... at position {position + failures[0]} "
+            f"failed integrity check"
+        )
+    for cell in batch:
+        chain._append(cell, verify_integrity=False)
+
+
+__all__ = [
+    'STREAM_FORMAT',
+    'STREAM_VERSION',
+    'STREAM_FORMATS',
+    'DEFAULT_BATCH_SIZE',
+    'ChainStreamError',
+    'iter_chain_records',
+    'iter_chain_jsonl',
+    'export_chain',
+    'iter_cells',
+    'import_chain',
+]
@@ -0,0 +1,441 @@
+"""
+DecisionGraph Core: Chain Validation Engine
+
+Backs Chain.validate() and Chain.find_integrity_violations().
+
+The work splits in two:
+
+1. Seal checks: verify_integrity() recomputes every cell's SHA-256
+   (canonical JSON for canon-scheme cells). This is where almost all the
+   time goes. With ``workers > 1`` the cells are hashed in chunks across
+   a process pool. Otherwise they are hashed in-process.
+2. Structural checks: duplicate ids, graph_id, prev_cell_hash links,
+   Genesis placement and temporal order. These run as one pass over
+   header columns that are extracted once. The old code needed a
+   separate pass just to count Genesis cells.
+
+Verified-prefix checkpoints
+---------------------------
+A successful validation can be sealed into a ValidationCheckpoint. It
+records "verified up to position N, head cell H" together with a running
+digest of the first N cell ids, and is signed with Ed25519. Passing the
+checkpoint (and the signer's public key) to a later validation skips the
+prefix entirely, so only the new tail is covered: the prefix is trusted
+as long as position N-1 still holds H (each cell_id seals its
+prev_cell_hash, so H pins the prefix it was validated with), tail
+duplicates are found through chain.index, and the running digest is
+extended over the tail ids only. This is the same trust model as the
+PersistentChain WAL checkpoint. If the checkpoint does not describe the
+chain, or its signature does not verify, it is ignored and the whole
+chain is validated. A warning in the result says why.
+
+Example:
+    >>> result = chain.validate(workers=8)
+    >>> checkpoint = create_validation_checkpoint(chain, result, priv, "auditor:nightly")
+    >>> write_validation_checkpoint(path, checkpoint)
+    >>> # next night, after more appends
+    >>> chain.validate(workers=8, checkpoint=read_validation_checkpoint(path), public_key=pub)
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .cell import NULL_HASH, CellType, DecisionCell
+from .genesis import verify_genesis
+
+VALIDATION_CHECKPOINT_VERSION = 2  # 2: running (chained) cell id digest
+DEFAULT_CHUNK_SIZE = 2048
+
+
+# =============================================================================
+# SEAL CHECKS
+# =============================================================================
+
+def _verify_chunk(task: Tuple[int, Sequence[DecisionCell], bool]) -> List[int]:
+    """Positions of cells in one chunk whose seal does not verify (pool worker)."""
+    start, cells, reverify = task
+    if reverify:
+        return [start + offset for offset, cell in enumerate(cells) if not cell.reverify()]
+    return [start + offset for offset, cell in enumerate(cells) if not cell.verify_integrity()]
+
+
+def find_integrity_failures(
+    cells: Sequence[DecisionCell],
+    start: int = 0,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    reverify: bool = False
+) -> List[int]:
+    """
+    Positions (ascending) of cells[start:] whose cell_id does not match
+    their recomputed hash.
+
+    Args:
+        cells: The chain's cells
+        start: First position to check
+        workers: Process pool size; 1 hashes in-process
+        chunk_size: Cells per pool task
+        executor: Existing pool to use instead of starting one (callers
+            checking many batches keep one pool open)
+        reverify: Recompute every seal, ignoring verified-seal memos
+            (DecisionCell.reverify)
+    """
+    total = len(cells) - start
+    if total <= 0:
+        return []
+    if executor is None and (workers <= 1 or total <= chunk_size):
+        return _verify_chunk((start, cells[start:], reverify))
+
+    tasks = [
+        (position, cells[position:position + chunk_size], reverify)
+        for position in range(start, len(cells), chunk_size)
+    ]
+    failures: List[int] = []
+    if executor is not None:
+        # map() preserves task order, so positions stay ascending
+        for bad in executor.map(_verify_chunk, tasks):
+            failures.extend(bad)
+        return failures
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for bad in pool.map(_verify_chunk, tasks):
+            failures.extend(bad)
+    return failures
+
+
+# =============================================================================
+# CHECKPOINTS
+# =============================================================================
+
+# Running digest of zero cell ids
+EMPTY_CELL_IDS_DIGEST = "0" * 64
+
+
+def extend_cell_ids_digest(digest: str, cell_ids: Sequence[str]) -> str:
+    """
+    Fold ``cell_ids`` into a running digest: d = sha256(d || cell_id).
+
+    Chained rather than one hash over all ids, so a checkpoint's digest can
+    be extended over a new tail without re-reading the prefix.
+    """
+    state = bytes.fromhex(digest)
+    sha256 = hashlib.sha256
+    for cell_id in cell_ids:
+        state = sha256(state + cell_id.encode("ascii")).digest()
+    return state.hex()
+
+
+@dataclass(frozen=True)
+class ValidationCheckpoint:
+    """Signed statement that a chain prefix passed validation."""
+    version: int
+    graph_id: str
+    cell_count: int
+    head_cell_id: str
+    cell_ids_digest: str  # running digest of the first cell_count cell ids
+    signer_id: str
+    signature: str = ""   # hex Ed25519 signature over payload()
+
+    def payload(self) -> bytes:
+        """Bytes covered by the signature (every field except the signature)."""
+        body = self.to_dict()
+        del body["signature"]
+        return json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+    def verify(self, public_key: bytes) -> bool:
+        from .signing import verify_signature  # signing -> exceptions -> chain
+
+        try:
+            signature = bytes.fromhex(self.signature)
+        except ValueError:
+            return False
+        if len(signature) != 64:
+            return False
+        return verify_signature(public_key, self.payload(), signature)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "graph_id": self.graph_id,
+            "cell_count": self.cell_count,
+            "head_cell_id": self.head_cell_id,
+            "cell_ids_digest": self.cell_ids_digest,
+            "signer_id": self.signer_id,
+            "signature": self.signature,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ValidationCheckpoint':
+        return ValidationCheckpoint(
+            version=data["version"],
+            graph_id=data["graph_id"],
+            cell_count=data["cell_count"],
+            head_cell_id=data["head_cell_id"],
+            cell_ids_digest=data["cell_ids_digest"],
+            signer_id=data["signer_id"],
+            signature=data["signature"],
+        )
+
+
+def create_validation_checkpoint(
+    chain,
+    result,
+    private_key: bytes,
+    signer_id: str
+) -> ValidationCheckpoint:
+    """
+    Seal a successful validation of ``chain`` into a signed checkpoint.
+
+    Args:
+        chain: The chain that was validated
+        result: ValidationResult from chain.validate()
+        private_key: 32-byte Ed25519 private key seed
+        signer_id: Who vouches for the validation
+
+    Raises:
+        ChainError: If the result is invalid or no longer covers the chain
+    """
+    from .chain import ChainError
+    from .signing import sign_bytes
+
+    if not result.is_valid:
+        raise ChainError("Cannot checkpoint a chain that failed validation")
+    covered = result.trusted_cells + result.cells_checked
+    if covered != len(chain.cells) or covered == 0:
+        raise ChainError(
+            f"Validation covered {covered} cells but the chain has {len(chain.cells)}"
+        )
+    digest = result.cell_ids_digest
+    if digest is None:
+        digest = extend_cell_ids_digest(
+            EMPTY_CELL_IDS_DIGEST, [c.cell_id for c in chain.cells[:covered]]
+        )
+
+    unsigned = ValidationCheckpoint(
+        version=VALIDATION_CHECKPOINT_VERSION,
+        graph_id=chain.graph_id,
+        cell_count=covered,
+        head_cell_id=chain.cells[covered - 1].cell_id,
+        cell_ids_digest=digest,
+        signer_id=signer_id,
+    )
+    signature = sign_bytes(private_key, unsigned.payload())
+    return ValidationCheckpoint(**{**unsigned.to_dict(), "signature": signature.hex()})
+
+
+def write_validation_checkpoint(path: Union[str, Path], checkpoint: ValidationCheckpoint) -> None:
+    """Write checkpoint via tmp file + fsync + atomic rename."""
+    path = Path(path)
+    tmp_file = path.with_name(path.name + ".tmp")
+
+    with open(tmp_file, 'w') as f:
+        f.write(json.dumps(checkpoint.to_dict(), indent=2))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_file, path)
+
+
+def read_validation_checkpoint(path: Union[str, Path]) -> Optional[ValidationCheckpoint]:
+    """Read checkpoint. Returns None if missing, corrupted or unsupported."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r') as f:
+            checkpoint = ValidationCheckpoint.from_dict(json.load(f))
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None
+    if checkpoint.version != VALIDATION_CHECKPOINT_VERSION:
+        return None
+    return checkpoint
+
+
+def _checkpoint_problem(
+    chain,
+    checkpoint: ValidationCheckpoint,
+    public_key: Optional[bytes]
+) -> Optional[str]:
+    """
+    Why ``checkpoint`` cannot be trusted for ``chain``, or None if it can.
+
+    O(1): only Genesis and the checkpointed head are read, never the rest
+    of the prefix.
+    """
+    cells = chain.cells
+    if public_key is None:
+        return "no public key to verify its signature"
+    if not checkpoint.verify(public_key):
+        return "signature does not verify"
+    if checkpoint.version != VALIDATION_CHECKPOINT_VERSION:
+        return f"unsupported version {checkpoint.version}"
+    count = checkpoint.cell_count
+    if count <= 0 or count > len(cells):
+        return f"covers {count} cells but the chain has {len(cells)}"
+    if cells[0].header.graph_id != checkpoint.graph_id:
+        return "graph_id does not match"
+    if (cells[count - 1].cell_id != checkpoint.head_cell_id
+            or chain.index.get(checkpoint.head_cell_id) != count - 1):
+        return "head cell does not match"
+    return None
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+# Per-position error order matches the original single loop
+_DUPLICATE, _INTEGRITY, _GRAPH_ID, _LINK = range(4)
+
+
+def validate_cells(
+    chain,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint: Optional[ValidationCheckpoint] = None,
+    public_key: Optional[bytes] = None,
+    reverify: bool = False
+):
+    """
+    Validate ``chain`` (see Chain.validate for the invariants checked).
+
+    Args:
+        chain: The chain to validate
+        workers: Process pool size for seal checks; 1 hashes in-process
+        chunk_size: Cells per pool task
+        checkpoint: Optional verified-prefix checkpoint; cells it covers
+            are not re-checked
+        public_key: Ed25519 public key of the checkpoint signer
+        reverify: Recompute every seal, ignoring verified-seal memos
+
+    Returns:
+        ValidationResult. cells_checked counts the cells validated in this
+        call, and trusted_cells counts those covered by the checkpoint.
+        Cells covered by a trusted checkpoint are never read, apart from
+        its head cell.
+    """
+    from .chain import ValidationResult
+
+    cells = chain.cells
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    if not cells:
+        return ValidationResult(is_valid=True, cells_checked=0, warnings=["Chain is empty"])
+
+    genesis = cells[0]
+    chain_graph_id = genesis.header.graph_id
+    chain_root_ns = genesis.fact.namespace
+
+    start = 0
+    ids_digest = EMPTY_CELL_IDS_DIGEST
+    if checkpoint is not None:
+        problem = _checkpoint_problem(chain, checkpoint, public_key)
+        if problem is None:
+            start = checkpoint.cell_count
+            ids_digest = checkpoint.cell_ids_digest
+        else:
+            warnings.append(f"Validation checkpoint ignored: {problem}")
+
+    tail = cells[start:]
+
+    # Header columns for the tail, extracted once
+    ids = [c.cell_id for c in tail]
+    headers = [c.header for c in tail]
+    graph_ids = [h.graph_id for h in headers]
+    prevs = [h.prev_cell_hash for h in headers]
+    times = [h.system_time for h in headers]
+    genesis_positions = [
+        start + offset for offset, h in enumerate(headers)
+        if h.cell_type == CellType.GENESIS and h.prev_cell_hash == NULL_HASH
+    ]
+
+    # Genesis (already covered when a checkpoint is trusted)
+    if start == 0:
+        if not genesis_positions or genesis_positions[0] != 0:
+            errors.append("First cell is not Genesis")
+        else:
+            is_valid, failed_checks = verify_genesis(genesis)
+            if not is_valid:
+                for check in failed_checks:
+                    errors.append(f"Genesis: {check}")
+    genesis_count = len(genesis_positions) + (1 if start else 0)
+    if genesis_count > 1:
+        errors.append(f"Multiple Genesis cells found: {genesis_count}")
+
+    issues: List[Tuple[int, int, str]] = []
+
+    # Prefix duplicates via the chain index (a prefix cell's id maps to a
+    # position below start); tail duplicates via a set of tail ids
+    index = chain.index
+    seen_ids: set = set()
+    for offset, cell_id in enumerate(ids):
+        indexed = index.get(cell_id) if start else None
+        if cell_id in seen_ids or (indexed is not None and indexed < start):
+            issues.append((start + offset, _DUPLICATE,
+                           f"Duplicate cell_id at position {start + offset}: {cell_id[:16]}..."))
+        seen_ids.add(cell_id)
+
+    for position in find_integrity_failures(cells, start, workers, chunk_size, reverify=reverify):
+        issues.append((position, _INTEGRITY,
+                       f"Integrity violation at position {position}: {cells[position].cell_id[:16]}..."))
+
+    for offset, graph_id in enumerate(graph_ids):
+        if graph_id != chain_graph_id:
+            issues.append((start + offset, _GRAPH_ID,
+                           f"Graph ID mismatch at position {start + offset}: "
+                           f"expected '{chain_graph_id}', got '{graph_id}'"))
+
+    for offset, prev in enumerate(prevs):
+        position = start + offset
+        if position == 0:
+            continue
+        if prev == NULL_HASH:
+            issues.append((position, _LINK, f"Non-genesis cell at position {position} has NULL_HASH"))
+        elif prev not in index:
+            issues.append((position, _LINK,
+                           f"Broken chain at position {position}: prev_cell_hash "
+                           f"{prev[:16]}... not found"))
+
+    issues.sort(key=lambda issue: (issue[0], issue[1]))
+    errors.extend(message for _, _, message in issues)
+
+    # Temporal order, continuing from the last trusted cell
+    previous_times = ([cells[start - 1].header.system_time] if start else []) + times[:-1]
+    first = start if start else 1
+    for offset, (before, current) in enumerate(zip(previous_times, times[first - start:])):
+        if current < before:
+            warnings.append(
+                f"Temporal inconsistency at position {first + offset}: "
+                f"{current} < {before}"
+            )
+
+    return ValidationResult(
+        is_valid=len(errors) == 0,
+        cells_checked=len(tail),
+        graph_id=chain_graph_id,
+        root_namespace=chain_root_ns,
+        errors=errors,
+        warnings=warnings,
+        trusted_cells=start,
+        cell_ids_digest=extend_cell_ids_digest(ids_digest, ids)
+    )
+
+
+__all__ = [
+    'VALIDATION_CHECKPOINT_VERSION',
+    'DEFAULT_CHUNK_SIZE',
+    'EMPTY_CELL_IDS_DIGEST',
+    'ValidationCheckpoint',
+    'find_integrity_failures',
+    'extend_cell_ids_digest',
+    'validate_cells',
+    'create_validation_checkpoint',
+    'write_validation_checkpoint',
+    'read_validation_checkpoint',
+]
@@ -419,36 +419,54 @@ class NamespaceRegistry:
         if namespace in self.namespaces:
             return self.namespaces[namespace].owner
         return None
-
-
-def build_registry_from_chain(cells: List[DecisionCell]) -> NamespaceRegistry:
-    """Build a namespace registry by scanning the chain."""
-    registry = NamespaceRegistry()
     
-    for cell in cells:
-        if cell.header.cell_type == CellType.NAMESPACE_DEF:
+    def apply_cell(self, cell: DecisionCell):
+        """
+        Fold one chain cell into the registry.
+        
+        Cells must be applied in chain order; non-registry cells are ignored.
+        """
+        cell_type = cell.header.cell_type
+        if cell_type == CellType.NAMESPACE_DEF:
             try:
                 import ast
                 metadata_dict = ast.literal_eval(cell.fact.object)
                 metadata = NamespaceMetadata(**metadata_dict)
-                registry.register_namespace(cell.fact.subject, metadata)
+                self.register_namespace(cell.fact.subject, metadata)
             except:
                 pass
         
-        elif cell.header.cell_type == CellType.ACCESS_RULE:
+        elif cell_type == CellType.ACCESS_RULE:
             try:
                 permission = Permission(cell.fact.predicate)
-                registry.grant_access(cell.fact.subject, cell.fact.object, permission)
+                self.grant_access(cell.fact.subject, cell.fact.object, permission)
             except:
                 pass
         
-        elif cell.header.cell_type == CellType.BRIDGE_RULE:
-            registry.register_bridge(cell.fact.subject, cell.fact.object, cell)
+        elif cell_type == CellType.BRIDGE_RULE:
+            self.register_bridge(cell.fact.subject, cell.fact.object, cell)
         
-        elif cell.header.cell_type == CellType.OVERRIDE:
+        elif cell_type == CellType.OVERRIDE:
             if cell.fact.namespace == "system.bridges":
                 if cell.fact.predicate == "status" and cell.fact.object == "revoked":
-                    registry.revoke_bridge(cell.fact.subject)
+                    self.revoke_bridge(cell.fact.subject)
+    
+    def copy(self) -> 'NamespaceRegistry':
+        """Independent copy (cells and metadata are shared, containers are not)."""
+        return NamespaceRegistry(
+            namespaces=dict(self.namespaces),
+            access_rules={role: list(rules) for role, rules in self.access_rules.items()},
+            bridges=dict(self.bridges),
+            revoked_bridges=set(self.revoked_bridges),
+        )
+
+
+def build_registry_from_chain(cells: List[DecisionCell]) -> NamespaceRegistry:
+    """Build a namespace registry by scanning the chain."""
+    registry = NamespaceRegistry()
+    
+    for cell in cells:
+        registry.apply_cell(cell)
     
     return registry
 
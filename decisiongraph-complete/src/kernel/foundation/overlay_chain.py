@@ -0,0 +1,159 @@
+"""
+DecisionGraph Core: Copy-on-Write Overlay Chain
+
+A Chain layered over a frozen prefix of another chain. Simulations append
+a handful of shadow cells to "a copy" of the production chain; copying
+its cells list and cell_id index makes every fork O(chain), and anchor
+detection forks up to max_anchor_attempts times per request.
+
+An OverlayChain instead keeps:
+
+- the base chain and the length it had when the overlay was created
+  (later base appends are not visible through the overlay)
+- a delta list holding only the cells appended to the overlay
+- a delta cell_id -> position map for those cells
+
+``overlay.cells`` and ``overlay.index`` are read-through views over both
+layers, so Chain's validation, Scholar's high-water marks, PolicyHead
+timelines and ChainIndex sync all work unchanged. Writes only ever reach
+the delta: the base chain's cells and index are never touched, which is
+what create_contamination_attestation() checks.
+
+Creating an overlay is O(1); appends and lookups cost the same as on a
+plain Chain. Scholars over an overlay read through to the base Scholar's
+indexes (see Scholar and LayeredScholarIndex).
+"""
+
+from collections.abc import MutableMapping, Sequence
+from itertools import chain as iter_chain, islice
+from typing import Dict, Iterator, List, Optional
+
+from .cell import DecisionCell
+from .chain import Chain
+from .chain_index import ChainIndex
+
+
+class OverlayCells(Sequence):
+    """cells view: base_cells[:base_length] followed by the delta."""
+
+    __slots__ = ("base_cells", "base_length", "delta")
+
+    def __init__(self, base_cells: Sequence, base_length: int):
+        self.base_cells = base_cells
+        self.base_length = base_length
+        self.delta: List[DecisionCell] = []
+
+    def __len__(self) -> int:
+        return self.base_length + len(self.delta)
+
+    def __getitem__(self, position):
+        base_length = self.base_length
+        if isinstance(position, slice):
+            start, stop, step = position.indices(len(self))
+            if step == 1 and start >= base_length:
+                return self.delta[start - base_length:stop - base_length]
+            return [self[i] for i in range(start, stop, step)]
+        if position < 0:
+            position += len(self)
+            if position < 0:
+                raise IndexError("chain index out of range")
+        if position < base_length:
+            return self.base_cells[position]
+        return self.delta[position - base_length]
+
+    def __iter__(self) -> Iterator[DecisionCell]:
+        return iter_chain(islice(self.base_cells, self.base_length), self.delta)
+
+    def append(self, cell: DecisionCell) -> None:
+        self.delta.append(cell)
+
+
+class OverlayIndex(MutableMapping):
+    """index view: base positions below base_length, then the delta's."""
+
+    __slots__ = ("base_index", "base_length", "delta")
+
+    def __init__(self, base_index, base_length: int):
+        self.base_index = base_index
+        self.base_length = base_length
+        self.delta: Dict[str, int] = {}
+
+    def __getitem__(self, cell_id: str) -> int:
+        position = self.delta.get(cell_id)
+        if position is not None:
+            return position
+        position = self.base_index[cell_id]
+        if position >= self.base_length:
+            raise KeyError(cell_id)  # appended to the base after the overlay was made
+        return position
+
+    def __contains__(self, cell_id) -> bool:
+        if cell_id in self.delta:
+            return True
+        return self.base_index.get(cell_id, self.base_length) < self.base_length
+
+    def __setitem__(self, cell_id: str, position: int) -> None:
+        self.delta[cell_id] = position
+
+    def __delitem__(self, cell_id: str) -> None:
+        del self.delta[cell_id]  # base entries are read-only
+
+    def __iter__(self) -> Iterator[str]:
+        base_length = self.base_length
+        for cell_id, position in self.base_index.items():
+            if position < base_length and cell_id not in self.delta:
+                yield cell_id
+        yield from self.delta
+
+    def __len__(self) -> int:
+        return min(len(self.base_index), self.base_length) + len(self.delta)
+
+
+class OverlayChain(Chain):
+    """
+    Copy-on-write Chain over a frozen prefix of ``base_chain``.
+
+    Behaves like fork_shadow_chain()'s full copy (same validation on
+    append, same query results) while sharing the base chain's storage.
+    Overlays can be layered over other overlays.
+    """
+
+    def __init__(self, base_chain: Chain):
+        base_length = len(base_chain.cells)
+        super().__init__(
+            cells=OverlayCells(base_chain.cells, base_length),
+            index=OverlayIndex(base_chain.index, base_length),
+            _graph_id=base_chain.graph_id,
+            _root_namespace=base_chain.root_namespace,
+            _hash_scheme=base_chain._hash_scheme,
+            secondary_indexes=base_chain.secondary_indexes,
+        )
+        self.base_chain = base_chain
+        self.base_length = base_length
+        if base_chain._policy_timeline is not None:
+            # Start from the base PolicyHead timeline; shadow heads are synced on use
+            self._policy_timeline = base_chain._policy_timeline.copy(self)
+
+    @property
+    def delta(self) -> List[DecisionCell]:
+        """Cells appended to this overlay (not part of the base chain)."""
+        return self.cells.delta
+
+    def in_base(self, cell: DecisionCell) -> bool:
+        """True if ``cell`` is part of the frozen base prefix."""
+        return self.base_chain.index.get(cell.cell_id, self.base_length) < self.base_length
+
+    def _indexes(self) -> Optional[ChainIndex]:
+        if self.secondary_indexes and self._secondary is None:
+            # Seed from the base's indexes (copied on first find_*, not on fork)
+            base_index = self.base_chain._indexes()
+            if base_index is not None and base_index.indexed_upto == self.base_length:
+                self._secondary = base_index.copy()
+        return super()._indexes()
+
+
+__all__ = [
+    'OverlayChain',
+    'OverlayCells',
+    'OverlayIndex',
+]
@@ -0,0 +1,541 @@
+"""
+DecisionGraph Core: Persistent Chain Module
+
+A Chain whose cells are durably appended to a segmented WAL, and which can
+be rehydrated from that WAL on startup.
+
+DESIGN:
+1. Write-ahead: every accepted cell is written to the WAL before it becomes
+   visible in memory (Chain._store hook).
+2. WAL is the source of truth; the in-memory Chain is rebuilt from it.
+3. Checkpoint: after a sync, a small checkpoint file records the last
+   validated sequence and its record hash. On reopen, records up to that
+   sequence are restored without recomputing cell seals or re-running
+   append validation; only the tail past the checkpoint is fully verified.
+4. Checkpoint metadata: owners can stamp a checkpoint with what the chain
+   was built from (e.g. a seed configuration digest). It is restored only
+   when the checkpoint matches the WAL.
+
+TRUST MODEL:
+    The WAL reader always checks per-record CRC32C, cell_hash and the
+    record hash chain (C-speed). If the record at the checkpoint sequence
+    has the checkpointed record hash, every earlier record is byte-identical
+    to what was validated when the checkpoint was written, so re-deriving
+    cell_ids (pure-Python canonical JSON) for that prefix is redundant.
+    If the checkpoint does not match the WAL, it is ignored and the whole
+    chain is verified.
+
+RECORD PAYLOAD:
+    Compact, key-sorted JSON of DecisionCell.to_dict() (UTF-8). This keeps
+    the stored cell lossless (float confidence, signature, merkle_root),
+    which the canonical hashing dict deliberately is not.
+
+USAGE:
+    >>> chain = PersistentChain.create("data/wal", root_namespace="banking",
+    ...                                hash_scheme="canon:rfc8785:v1")
+    >>> chain.append(cell)
+    >>> chain.close()                       # syncs and writes checkpoint
+    >>>
+    >>> chain = PersistentChain.open("data/wal")   # verifies only the tail
+"""
+
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .cell import DecisionCell, HASH_SCHEME_LEGACY
+from .chain import Chain, ChainError
+from .genesis import DEFAULT_ROOT_NAMESPACE
+from .segmented_wal import (
+    DEFAULT_MAX_SEGMENT_BYTES,
+    SegmentedWALReader,
+    SegmentedWALWriter,
+    list_segment_files,
+)
+from .wal import WALError
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_FILENAME = "chain_checkpoint.json"
+
+# Checkpoint metadata written once a seeded chain's bulk load completes
+SEED_CONFIG_DIGEST_KEY = "seed_config_digest"
+SEED_COUNT_KEY = "seed_count"
+
+
+class PersistentChainError(ChainError):
+    """Raised when the persistent backing store cannot be used."""
+    pass
+
+
+# =============================================================================
+# RECORD ENCODING
+# =============================================================================
+
+def cell_to_record_bytes(cell: DecisionCell) -> bytes:
+    """Serialize a cell to the WAL record payload."""
+    return json.dumps(
+        cell.to_dict(),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def cell_from_record_bytes(data: bytes, trusted: bool = False) -> DecisionCell:
+    """
+    Deserialize a cell from a WAL record payload.
+
+    Args:
+        data: Record payload bytes
+        trusted: If True, restore without recomputing the cell seal
+                 (only for records covered by a verified checkpoint)
+    """
+    cell_dict = json.loads(data)
+    if trusted:
+        return DecisionCell.from_trusted_dict(cell_dict)
+    return DecisionCell.from_dict(cell_dict)
+
+
+# =============================================================================
+# CHECKPOINT
+# =============================================================================
+
+@dataclass(frozen=True)
+class ChainCheckpoint:
+    """Validated prefix of a persistent chain's WAL."""
+    version: int
+    graph_id: str
+    hash_scheme: str
+    cell_count: int
+    last_sequence: int
+    last_record_hash: str  # hex
+    head_cell_id: str
+    metadata: Dict[str, Any] = field(default_factory=dict)  # owner-defined, JSON-safe
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "graph_id": self.graph_id,
+            "hash_scheme": self.hash_scheme,
+            "cell_count": self.cell_count,
+            "last_sequence": self.last_sequence,
+            "last_record_hash": self.last_record_hash,
+            "head_cell_id": self.head_cell_id,
+            "metadata": self.metadata,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ChainCheckpoint':
+        return ChainCheckpoint(
+            version=data["version"],
+            graph_id=data["graph_id"],
+            hash_scheme=data["hash_scheme"],
+            cell_count=data["cell_count"],
+            last_sequence=data["last_sequence"],
+            last_record_hash=data["last_record_hash"],
+            head_cell_id=data["head_cell_id"],
+            metadata=data.get("metadata") or {},
+        )
+
+
+def checkpoint_path(wal_dir: Path) -> Path:
+    """Get path to the chain checkpoint file."""
+    return Path(wal_dir) / CHECKPOINT_FILENAME
+
+
+def write_checkpoint_atomic(wal_dir: Path, checkpoint: ChainCheckpoint) -> None:
+    """Write checkpoint via tmp file + fsync + atomic rename."""
+    wal_dir = Path(wal_dir)
+    target = checkpoint_path(wal_dir)
+    tmp_file = wal_dir / (CHECKPOINT_FILENAME + ".tmp")
+
+    with open(tmp_file, 'w') as f:
+        f.write(json.dumps(checkpoint.to_dict(), indent=2))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_file, target)
+
+    dir_fd = os.open(str(wal_dir), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def read_checkpoint(wal_dir: Path) -> Optional[ChainCheckpoint]:
+    """Read checkpoint. Returns None if missing, corrupted or unsupported."""
+    target = checkpoint_path(Path(wal_dir))
+    if not target.exists():
+        return None
+    try:
+        with open(target, 'r') as f:
+            checkpoint = ChainCheckpoint.from_dict(json.load(f))
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None
+    if checkpoint.version != CHECKPOINT_VERSION:
+        return None
+    return checkpoint
+
+
+@dataclass(frozen=True)
+class RehydrationStats:
+    """How a PersistentChain was rebuilt from its WAL."""
+    used_checkpoint: bool
+    trusted_cells: int   # restored from the checkpointed prefix
+    verified_cells: int  # fully re-validated tail
+
+
+class _CheckpointMismatch(Exception):
+    """Internal: checkpoint does not describe this WAL."""
+    pass
+
+
+# =============================================================================
+# PERSISTENT CHAIN
+# =============================================================================
+
+@dataclass
+class PersistentChain(Chain):
+    """
+    Chain backed by a SegmentedWALWriter.
+
+    Behaves exactly like Chain (same validation on append); in addition every
+    accepted cell is appended to the WAL in ``wal_dir`` before it is stored
+    in memory. The WAL is created lazily when Genesis is stored.
+
+    Use ``create()`` for a new graph and ``open()`` to rehydrate an existing
+    one. Call ``checkpoint()`` (or ``close()``) to make the validated prefix
+    trusted for the next ``open()``.
+
+    ``checkpoint_metadata`` is written with every checkpoint. open() restores
+    it only from a checkpoint that matches the WAL; otherwise (no checkpoint,
+    a stale one, or verify="full") it is empty.
+    """
+
+    wal_dir: Optional[Path] = None
+    max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES
+    fsync_policy: str = "per_record"
+    read_only: bool = False
+    last_rehydration: Optional[RehydrationStats] = field(default=None, repr=False)
+    checkpoint_metadata: Dict[str, Any] = field(default_factory=dict, repr=False)
+    _writer: Optional[SegmentedWALWriter] = field(default=None, repr=False)
+    _replaying: bool = field(default=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.wal_dir is not None:
+            self.wal_dir = Path(self.wal_dir)
+
+    @staticmethod
+    def exists(wal_dir: Union[str, Path]) -> bool:
+        """Check whether ``wal_dir`` already holds a persisted chain."""
+        return bool(list_segment_files(Path(wal_dir)))
+
+    @classmethod
+    def create(
+        cls,
+        wal_dir: Union[str, Path],
+        graph_name: str = "UniversalDecisionGraph",
+        root_namespace: str = DEFAULT_ROOT_NAMESPACE,
+        creator: Optional[str] = None,
+        system_time: Optional[str] = None,
+        hash_scheme: Optional[str] = None,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        fsync_policy: str = "per_record",
+    ) -> 'PersistentChain':
+        """
+        Create a new persistent chain and write its Genesis cell.
+
+        Raises:
+            FileExistsError: If ``wal_dir`` already contains files
+        """
+        wal_dir = Path(wal_dir)
+        if wal_dir.exists() and any(wal_dir.iterdir()):
+            raise FileExistsError(f"WAL directory not empty: {wal_dir}")
+
+        chain = cls(
+            wal_dir=wal_dir,
+            max_segment_bytes=max_segment_bytes,
+            fsync_policy=fsync_policy,
+        )
+        chain.initialize(
+            graph_name=graph_name,
+            root_namespace=root_namespace,
+            creator=creator,
+            system_time=system_time,
+            hash_scheme=hash_scheme,
+        )
+        return chain
+
+    @classmethod
+    def open(
+        cls,
+        wal_dir: Union[str, Path],
+        verify: str = "tail",
+        fsync_policy: str = "per_record",
+        read_only: bool = False,
+    ) -> 'PersistentChain':
+        """
+        Rehydrate a persistent chain from its WAL.
+
+        Args:
+            wal_dir: Directory holding the segmented WAL
+            verify: "tail" trusts the checkpointed prefix and fully verifies
+                    only later records; "full" verifies every record
+            fsync_policy: Sync policy for subsequent appends
+            read_only: Replay without opening a writer (no tail recovery,
+                       appends rejected). Safe for several processes
+                       reading a WAL that one process owns.
+
+        Returns:
+            PersistentChain positioned for further appends
+
+        Raises:
+            FileNotFoundError: If no WAL exists in ``wal_dir``
+            ChainError: If a record fails chain validation
+            WALChainError: If the record hash chain is broken
+        """
+        if verify not in ("tail", "full"):
+            raise ValueError(f"verify must be 'tail' or 'full', got {verify!r}")
+
+        wal_dir = Path(wal_dir)
+        if not cls.exists(wal_dir):
+            raise FileNotFoundError(f"No WAL segments found in: {wal_dir}")
+
+        checkpoint = read_checkpoint(wal_dir) if verify == "tail" else None
+        if checkpoint is not None:
+            try:
+                return cls._rehydrate(wal_dir, checkpoint, fsync_policy, read_only)
+            except _CheckpointMismatch:
+                pass  # Stale or foreign checkpoint - fall back to full verification
+        return cls._rehydrate(wal_dir, None, fsync_policy, read_only)
+
+    @classmethod
+    def _rehydrate(
+        cls,
+        wal_dir: Path,
+        checkpoint: Optional[ChainCheckpoint],
+        fsync_policy: str,
+        read_only: bool = False,
+    ) -> 'PersistentChain':
+        """Replay the WAL into a new chain (see open())."""
+        if read_only:
+            writer = None
+            max_bytes = SegmentedWALReader(wal_dir).manifest.roll_policy.get(
+                "max_bytes", DEFAULT_MAX_SEGMENT_BYTES
+            )
+        else:
+            # Opening the writer first recovers a torn tail in the active segment
+            writer = SegmentedWALWriter.open(wal_dir, fsync_policy=fsync_policy)
+            max_bytes = writer.max_bytes
+        chain = cls(
+            wal_dir=wal_dir,
+            max_segment_bytes=max_bytes,
+            fsync_policy=fsync_policy,
+            read_only=read_only,
+        )
+
+        trusted_through = checkpoint.last_sequence if checkpoint else -1
+        trusted = verified = 0
+        chain._replaying = True
+        try:
+            for record in SegmentedWALReader(wal_dir):
+                if record.sequence <= trusted_through:
+                    chain._store(cell_from_record_bytes(record.canonical_bytes, trusted=True))
+                    trusted += 1
+                    if record.sequence == trusted_through:
+                        cls._check_checkpoint(chain, checkpoint, record.compute_record_hash())
+                else:
+                    chain.append(cell_from_record_bytes(record.canonical_bytes))
+                    verified += 1
+            if trusted_through >= 0 and trusted <= trusted_through:
+                raise _CheckpointMismatch("WAL ends before checkpoint")
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            raise
+        finally:
+            chain._replaying = False
+
+        chain._writer = writer
+        if checkpoint is not None:
+            chain.checkpoint_metadata = dict(checkpoint.metadata)
+        chain.last_rehydration = RehydrationStats(
+            used_checkpoint=checkpoint is not None,
+            trusted_cells=trusted,
+            verified_cells=verified,
+        )
+        return chain
+
+    @staticmethod
+    def _check_checkpoint(
+        chain: 'PersistentChain',
+        checkpoint: ChainCheckpoint,
+        record_hash: bytes,
+    ) -> None:
+        """Confirm the replayed prefix is the one the checkpoint describes."""
+        if (
+            record_hash.hex() != checkpoint.last_record_hash
+            or len(chain.cells) != checkpoint.cell_count
+            or chain.head.cell_id != checkpoint.head_cell_id
+            or chain.graph_id != checkpoint.graph_id
+        ):
+            raise _CheckpointMismatch("Checkpoint does not match WAL")
+
+    def _store(self, cell: DecisionCell) -> None:
+        """Write-ahead: persist the cell, then make it visible in memory."""
+        if not self._replaying:
+            self._persist(cell)
+        super()._store(cell)
+
+    def _persist(self, cell: DecisionCell) -> None:
+        """Append a validated cell to the WAL (creating it on Genesis)."""
+        if self.wal_dir is None:
+            raise PersistentChainError("PersistentChain requires wal_dir")
+        if self.read_only:
+            raise PersistentChainError("PersistentChain was opened read-only")
+        if self._writer is None:
+            if self.cells:
+                raise PersistentChainError("WAL writer is closed")
+            self._writer = SegmentedWALWriter.create(
+                self.wal_dir,
+                hash_scheme=cell.header.hash_scheme or HASH_SCHEME_LEGACY,
+                graph_id=cell.header.graph_id,
+                max_bytes=self.max_segment_bytes,
+                fsync_policy=self.fsync_policy,
+            )
+        self._writer.append(cell_to_record_bytes(cell), cell_id=cell.cell_id)
+
+    def checkpoint(self) -> ChainCheckpoint:
+        """
+        Sync the WAL and record the current head as the trusted prefix.
+
+        Every cell in the WAL entered through validated append (or was
+        verified on rehydration), so the whole WAL is covered.
+        """
+        if self._writer is None or self.head is None:
+            raise PersistentChainError("Nothing to checkpoint")
+
+        self._writer.sync()
+        checkpoint = ChainCheckpoint(
+            version=CHECKPOINT_VERSION,
+            graph_id=self.graph_id,
+            hash_scheme=self.hash_scheme or HASH_SCHEME_LEGACY,
+            cell_count=len(self.cells),
+            last_sequence=self._writer.next_sequence - 1,
+            last_record_hash=self._writer.prev_hash.hex(),
+            head_cell_id=self.head.cell_id,
+            metadata=dict(self.checkpoint_metadata),
+        )
+        write_checkpoint_atomic(self.wal_dir, checkpoint)
+        return checkpoint
+
+    def sync(self) -> None:
+        """Force the WAL to disk without updating the checkpoint."""
+        if self._writer is not None:
+            self._writer.sync()
+
+    def close(self, checkpoint: bool = True) -> None:
+        """
+        Checkpoint and close the WAL. Further appends are rejected.
+
+        Args:
+            checkpoint: False closes without writing a checkpoint (e.g. when
+                the WAL is about to be discarded)
+        """
+        if self._writer is not None:
+            if checkpoint and self.head is not None:
+                self.checkpoint()
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> 'PersistentChain':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+# =============================================================================
+# SEEDED CHAINS
+# =============================================================================
+
+def mark_seed_load_complete(
+    chain: PersistentChain,
+    config_digest: str,
+    seed_count: int,
+) -> ChainCheckpoint:
+    """
+    Checkpoint a fully seeded chain, stamped with its seed configuration.
+
+    Call only after the last seed was appended: a WAL without this metadata
+    is treated as an interrupted load by open_seeded_chain().
+    """
+    chain.checkpoint_metadata = {
+        SEED_CONFIG_DIGEST_KEY: config_digest,
+        SEED_COUNT_KEY: seed_count,
+    }
+    return chain.checkpoint()
+
+
+def open_seeded_chain(
+    wal_dir: Union[str, Path],
+    config_digest: str,
+    read_only: bool = False,
+) -> Optional[PersistentChain]:
+    """
+    Rehydrate a seeded chain if its WAL holds a complete load of
+    ``config_digest``; otherwise return None so the caller regenerates.
+
+    A WAL that cannot be replayed, was built from another configuration, or
+    whose load stopped part-way (no completion metadata) is rejected. Unless
+    ``read_only``, a rejected WAL is moved aside to ``<wal_dir>.stale`` so a
+    fresh one can be written; read-only openers leave it for the owner.
+    """
+    wal_dir = Path(wal_dir)
+    chain: Optional[PersistentChain] = None
+    try:
+        chain = PersistentChain.open(wal_dir, read_only=read_only)
+    except (ChainError, WALError, ValueError):
+        pass  # Corrupt WAL - regenerate
+
+    if chain is not None:
+        metadata = chain.checkpoint_metadata
+        if (metadata.get(SEED_CONFIG_DIGEST_KEY) == config_digest
+                and metadata.get(SEED_COUNT_KEY) == len(chain) - 1):  # exclude Genesis
+            return chain
+        chain.close(checkpoint=False)
+
+    if not read_only:
+        stale_dir = wal_dir.with_name(wal_dir.name + ".stale")
+        shutil.rmtree(stale_dir, ignore_errors=True)
+        wal_dir.rename(stale_dir)
+    return None
+
+
+# Export public interface
+__all__ = [
+    'CHECKPOINT_VERSION',
+    'CHECKPOINT_FILENAME',
+    'PersistentChainError',
+    'ChainCheckpoint',
+    'RehydrationStats',
+    'PersistentChain',
+    'cell_to_record_bytes',
+    'cell_from_record_bytes',
+    'checkpoint_path',
+    'write_checkpoint_atomic',
+    'read_checkpoint',
+    'SEED_CONFIG_DIGEST_KEY',
+    'SEED_COUNT_KEY',
+    'mark_seed_load_complete',
+    'open_seeded_chain',
+]
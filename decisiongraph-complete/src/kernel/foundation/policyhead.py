@@ -26,7 +26,10 @@ INT-01: PolicyHead Signature Verification Audit Trail (v1.5)
 
 import base64
 import json
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING
 
 # Use TYPE_CHECKING to avoid circular import with Chain
 if TYPE_CHECKING:
@@ -455,12 +458,123 @@ def verify_policy_head_signatures(
 # CHAIN OPERATIONS AND QUERIES (POL-03, POL-04)
 # ============================================================================
 
+@dataclass(frozen=True)
+class PolicyHeadEntry:
+    """A PolicyHead cell with its promoted rules pre-parsed."""
+    system_time: str
+    cell: DecisionCell
+    promoted_rule_ids: Optional[FrozenSet[str]]  # None if policy data is malformed
+
+
+class PolicyHeadTimeline:
+    """
+    Per-namespace PolicyHead history, sorted by system_time.
+
+    Kept alongside a chain (see get_policy_head_timeline) and brought up to
+    date by sync(), which only looks at cells appended since the last call.
+    Lookups are a bisect instead of a find_by_type() scan plus JSON parse.
+
+    Ties on system_time keep chain order, and the earliest of tied heads
+    is returned, matching max() over the chain in the original scans.
+
+    Each namespace's (times, entries) pair is an immutable snapshot that
+    sync() replaces with one assignment, so lock-free readers never see a
+    time paired with the wrong entry.
+    """
+
+    def __init__(self, chain: 'Chain'):
+        self.chain = chain
+        self._lock = threading.Lock()
+        # namespace -> (system_times, entries), parallel and sorted
+        self._heads: Dict[str, Tuple[Tuple[str, ...], Tuple[PolicyHeadEntry, ...]]] = {}
+        self._synced_upto = 0
+        self._last_synced: Optional[DecisionCell] = None
+
+    def copy(self, chain: 'Chain') -> 'PolicyHeadTimeline':
+        """Timeline for a chain that extends this one's (e.g. a shadow fork)."""
+        clone = PolicyHeadTimeline(chain)
+        with self._lock:
+            clone._heads = dict(self._heads)  # snapshots are immutable: share them
+            clone._synced_upto = self._synced_upto
+            clone._last_synced = self._last_synced
+        return clone
+
+    def sync(self) -> int:
+        """Index PolicyHead cells appended since the last sync; returns cells scanned."""
+        cells = self.chain.cells
+        if len(cells) == self._synced_upto and (not cells or cells[-1] is self._last_synced):
+            return 0
+        with self._lock:
+            upto = self._synced_upto
+            if upto > len(cells) or (upto and cells[upto - 1] is not self._last_synced):
+                # Chain history was replaced, not extended: rebuild
+                self._heads, upto = {}, 0
+            new_cells = cells[upto:]
+            for cell in new_cells:
+                if cell.header.cell_type == CellType.POLICY_HEAD:
+                    self._add(cell)
+            self._synced_upto = upto + len(new_cells)
+            self._last_synced = new_cells[-1] if new_cells else self._last_synced
+            return len(new_cells)
+
+    def _add(self, cell: DecisionCell) -> None:
+        try:
+            promoted = frozenset(parse_policy_data(cell)["promoted_rule_ids"])
+        except (ValueError, KeyError, TypeError):
+            promoted = None
+        namespace = cell.fact.namespace
+        system_time = cell.header.system_time
+        times, entries = self._heads.get(namespace, ((), ()))
+        position = bisect_right(times, system_time)
+        entry = PolicyHeadEntry(system_time, cell, promoted)
+        self._heads[namespace] = (
+            times[:position] + (system_time,) + times[position:],
+            entries[:position] + (entry,) + entries[position:],
+        )
+
+    def entries(self, namespace: str) -> List[PolicyHeadEntry]:
+        """All PolicyHeads for the namespace, oldest to newest."""
+        return list(self._heads.get(namespace, ((), ()))[1])
+
+    def current(self, namespace: str) -> Optional[PolicyHeadEntry]:
+        """The most recent PolicyHead for the namespace."""
+        heads = self._heads.get(namespace)
+        if heads is None:
+            return None
+        times, entries = heads
+        return entries[bisect_left(times, times[-1])]
+
+    def at_time(self, namespace: str, as_of_time: str) -> Optional[PolicyHeadEntry]:
+        """The latest PolicyHead with system_time <= as_of_time."""
+        heads = self._heads.get(namespace)
+        if heads is None:
+            return None
+        times, entries = heads
+        position = bisect_right(times, as_of_time)
+        if position == 0:
+            return None
+        return entries[bisect_left(times, times[position - 1])]
+
+
+def get_policy_head_timeline(chain: 'Chain') -> PolicyHeadTimeline:
+    """
+    Return the chain's PolicyHead timeline, synced with its latest cells.
+
+    Built on first use, then maintained incrementally as the chain grows.
+    """
+    timeline = chain._policy_timeline
+    if timeline is None or timeline.chain is not chain:
+        timeline = chain._policy_timeline = PolicyHeadTimeline(chain)
+    timeline.sync()
+    return timeline
+
+
 def get_current_policy_head(chain: 'Chain', namespace: str) -> Optional[DecisionCell]:
     """
     Get the current (most recent) PolicyHead for a namespace.
 
-    Scans all PolicyHead cells in the chain and returns the one with the
-    latest system_time for the given namespace.
+    Returns the PolicyHead with the latest system_time for the given
+    namespace, from the chain's PolicyHead timeline.
 
     Args:
         chain: The Chain to search
@@ -475,20 +589,8 @@ def get_current_policy_head(chain: 'Chain', namespace: str) -> Optional[Decision
         ...     data = parse_policy_data(current)
         ...     print(f"Active rules: {data['promoted_rule_ids']}")
     """
-    policy_heads = chain.find_by_type(CellType.POLICY_HEAD)
-
-    # Filter by namespace and find latest
-    namespace_heads = [
-        ph for ph in policy_heads
-        if ph.fact.namespace == namespace
-    ]
-
-    if not namespace_heads:
-        return None
-
-    # Return the one with latest system_time
-    # Since chain is append-only and temporally ordered, the last one is current
-    return max(namespace_heads, key=lambda ph: ph.header.system_time)
+    entry = get_policy_head_timeline(chain).current(namespace)
+    return entry.cell if entry else None
 
 
 def get_policy_head_chain(chain: 'Chain', namespace: str) -> List[DecisionCell]:
@@ -511,16 +613,7 @@ def get_policy_head_chain(chain: 'Chain', namespace: str) -> List[DecisionCell]:
         ...     data = parse_policy_data(ph)
         ...     print(f"{ph.header.system_time}: {len(data['promoted_rule_ids'])} rules")
     """
-    policy_heads = chain.find_by_type(CellType.POLICY_HEAD)
-
-    # Filter by namespace
-    namespace_heads = [
-        ph for ph in policy_heads
-        if ph.fact.namespace == namespace
-    ]
-
-    # Sort by system_time (oldest first)
-    return sorted(namespace_heads, key=lambda ph: ph.header.system_time)
+    return [entry.cell for entry in get_policy_head_timeline(chain).entries(namespace)]
 
 
 def get_policy_head_at_time(
@@ -549,19 +642,8 @@ def get_policy_head_at_time(
         ...     data = parse_policy_data(old_policy)
         ...     print(f"Had {len(data['promoted_rule_ids'])} rules on Jan 15")
     """
-    policy_heads = chain.find_by_type(CellType.POLICY_HEAD)
-
-    # Filter by namespace and time constraint
-    valid_heads = [
-        ph for ph in policy_heads
-        if ph.fact.namespace == namespace and ph.header.system_time <= as_of_time
-    ]
-
-    if not valid_heads:
-        return None
-
-    # Return the most recent one before or at as_of_time
-    return max(valid_heads, key=lambda ph: ph.header.system_time)
+    entry = get_policy_head_timeline(chain).at_time(namespace, as_of_time)
+    return entry.cell if entry else None
 
 
 def validate_policy_head_chain(chain: 'Chain', namespace: str) -> Tuple[bool, List[str]]:
@@ -874,6 +956,9 @@ __all__ = [
     'get_policy_head_chain',
     'get_policy_head_at_time',
     'validate_policy_head_chain',
+    'PolicyHeadEntry',
+    'PolicyHeadTimeline',
+    'get_policy_head_timeline',
 
     # Audit text generation (AUD-01)
     'policy_head_to_audit_text',
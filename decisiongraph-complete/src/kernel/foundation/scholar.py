@@ -14,8 +14,10 @@ Core Principle: Every answer is traceable to sealed cells.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set, Tuple, Any
+from typing import Callable, List, Dict, FrozenSet, Optional, Set, Tuple, Any
 from enum import Enum
+from bisect import bisect_right
+import threading
 
 from .cell import (
     DecisionCell,
@@ -26,12 +28,12 @@ from .cell import (
     get_parent_namespace
 )
 from .chain import Chain
+from .overlay_chain import OverlayChain
 from .namespace import (
     NamespaceRegistry,
-    build_registry_from_chain,
     Permission
 )
-from .policyhead import get_policy_head_at_time, parse_policy_data
+from .policyhead import get_policy_head_timeline, parse_policy_data
 
 
 # ============================================================================
@@ -428,6 +430,127 @@ class VisibilityResult:
 # SCHOLAR INDEX
 # ============================================================================
 
+class BitemporalIndex:
+    """
+    Append-only bitemporal index over one bucket of cells.
+    
+    Answers "as of system_time, valid at valid_time" without testing
+    every historical version:
+    
+    - system_time: cells arrive in chain order, so system times are
+      non-decreasing and "as of" is a bisect to a prefix
+    - valid_time: cells are grouped in fixed-size blocks carrying the
+      block's min(valid_from) and max(valid_to); blocks that cannot
+      contain valid_time are skipped (stabbing query)
+    
+    Results are returned in chain order, i.e. exactly the cells (and
+    order) that Scholar._is_valid_at_time would keep from a full scan.
+    
+    Readers may run without the owner's lock (e.g. read-through shadow
+    Scholars): add() appends to system_times last and query() bounds
+    itself by its length, so a half-added entry is never visited.
+    """
+    
+    BLOCK_SIZE = 64
+    
+    __slots__ = (
+        'cells', 'system_times', 'valid_froms', 'valid_tos',
+        'block_min_from', 'block_max_to', 'system_ordered', 'from_ordered'
+    )
+    
+    def __init__(self):
+        self.cells: List[DecisionCell] = []
+        self.system_times: List[str] = []
+        self.valid_froms: List[str] = []
+        self.valid_tos: List[Optional[str]] = []     # None = open-ended
+        self.block_min_from: List[str] = []
+        self.block_max_to: List[Optional[str]] = []  # None = some interval is open-ended
+        # Cells that bypass Chain.append() may arrive out of order;
+        # the matching bisect is then disabled for this bucket.
+        self.system_ordered = True
+        self.from_ordered = True
+    
+    def __len__(self) -> int:
+        return len(self.system_times)
+    
+    def add(self, cell: DecisionCell):
+        system_time = cell.header.system_time
+        valid_from = cell.fact.valid_from or system_time
+        valid_to = cell.fact.valid_to
+        
+        if self.cells:
+            if system_time < self.system_times[-1]:
+                self.system_ordered = False
+            if valid_from < self.valid_froms[-1]:
+                self.from_ordered = False
+        
+        if len(self.cells) % self.BLOCK_SIZE == 0:
+            self.block_min_from.append(valid_from)
+            self.block_max_to.append(valid_to)
+        else:
+            if valid_from < self.block_min_from[-1]:
+                self.block_min_from[-1] = valid_from
+            block_to = self.block_max_to[-1]
+            if block_to is not None and (valid_to is None or valid_to > block_to):
+                self.block_max_to[-1] = valid_to
+        
+        self.cells.append(cell)
+        self.valid_froms.append(valid_from)
+        self.valid_tos.append(valid_to)
+        # Publishes the entry: query() only visits indexes below len(system_times)
+        self.system_times.append(system_time)
+    
+    def query(self, valid_time: str, system_time: str) -> List[DecisionCell]:
+        """Cells recorded by system_time whose [valid_from, valid_to) contains valid_time."""
+        # Length before flags: add() clears a flag before appending, so the
+        # prefix read here is sorted whenever the flag still reads True
+        end = len(self.system_times)
+        system_ordered = self.system_ordered
+        if system_ordered:
+            end = bisect_right(self.system_times, system_time, 0, end)
+        if self.from_ordered:
+            end = bisect_right(self.valid_froms, valid_time, 0, end)
+        
+        cells = self.cells
+        system_times = self.system_times
+        valid_froms = self.valid_froms
+        valid_tos = self.valid_tos
+        block_min_from = self.block_min_from
+        block_max_to = self.block_max_to
+        check_system = not system_ordered
+        block_size = self.BLOCK_SIZE
+        
+        result = []
+        for block in range((end + block_size - 1) // block_size):
+            if block_min_from[block] > valid_time:
+                continue
+            block_to = block_max_to[block]
+            if block_to is not None and block_to <= valid_time:
+                continue
+            for i in range(block * block_size, min(end, (block + 1) * block_size)):
+                if valid_froms[i] > valid_time:
+                    continue
+                valid_to = valid_tos[i]
+                if valid_to is not None and valid_time >= valid_to:
+                    continue
+                if check_system and system_times[i] > system_time:
+                    continue
+                result.append(cells[i])
+        return result
+    
+    def copy(self) -> 'BitemporalIndex':
+        clone = BitemporalIndex()
+        clone.cells = self.cells.copy()
+        clone.system_times = self.system_times.copy()
+        clone.valid_froms = self.valid_froms.copy()
+        clone.valid_tos = self.valid_tos.copy()
+        clone.block_min_from = self.block_min_from.copy()
+        clone.block_max_to = self.block_max_to.copy()
+        clone.system_ordered = self.system_ordered
+        clone.from_ordered = self.from_ordered
+        return clone
+
+
 @dataclass
 class ScholarIndex:
     """
@@ -447,6 +570,11 @@ class ScholarIndex:
     # (namespace, subject) -> list of cell_ids
     by_ns_subject: Dict[Tuple[str, str], List[str]] = field(default_factory=dict)
     
+    # Bitemporal indexes over the same buckets (see BitemporalIndex)
+    temporal_by_namespace: Dict[str, BitemporalIndex] = field(default_factory=dict)
+    temporal_by_key: Dict[Tuple[str, str, str], BitemporalIndex] = field(default_factory=dict)
+    temporal_by_ns_subject: Dict[Tuple[str, str], BitemporalIndex] = field(default_factory=dict)
+    
     def add_cell(self, cell: DecisionCell):
         """Add a cell to all indexes"""
         cell_id = cell.cell_id
@@ -473,10 +601,33 @@ class ScholarIndex:
         if ns_subj not in self.by_ns_subject:
             self.by_ns_subject[ns_subj] = []
         self.by_ns_subject[ns_subj].append(cell_id)
+        
+        # Bitemporal indexes
+        for buckets, bucket_key in (
+            (self.temporal_by_namespace, ns),
+            (self.temporal_by_key, key),
+            (self.temporal_by_ns_subject, ns_subj),
+        ):
+            temporal = buckets.get(bucket_key)
+            if temporal is None:
+                temporal = buckets[bucket_key] = BitemporalIndex()
+            temporal.add(cell)
     
     def get_cell(self, cell_id: str) -> Optional[DecisionCell]:
         return self.cell_by_id.get(cell_id)
     
+    def copy(self) -> 'ScholarIndex':
+        """Independent copy (cells are shared, id lists are not)."""
+        return ScholarIndex(
+            cell_by_id=dict(self.cell_by_id),
+            by_namespace={k: v.copy() for k, v in self.by_namespace.items()},
+            by_key={k: v.copy() for k, v in self.by_key.items()},
+            by_ns_subject={k: v.copy() for k, v in self.by_ns_subject.items()},
+            temporal_by_namespace={k: v.copy() for k, v in self.temporal_by_namespace.items()},
+            temporal_by_key={k: v.copy() for k, v in self.temporal_by_key.items()},
+            temporal_by_ns_subject={k: v.copy() for k, v in self.temporal_by_ns_subject.items()},
+        )
+    
     def get_by_key(self, namespace: str, subject: str, predicate: str) -> List[DecisionCell]:
         """Get cells by exact (namespace, subject, predicate)"""
         key = (namespace, subject, predicate)
@@ -493,6 +644,164 @@ class ScholarIndex:
         key = (namespace, subject)
         cell_ids = self.by_ns_subject.get(key, [])
         return [self.cell_by_id[cid] for cid in cell_ids if cid in self.cell_by_id]
+    
+    def query_by_key(
+        self, namespace: str, subject: str, predicate: str, valid_time: str, system_time: str
+    ) -> List[DecisionCell]:
+        """Cells for (namespace, subject, predicate) valid at valid_time as of system_time"""
+        temporal = self.temporal_by_key.get((namespace, subject, predicate))
+        return temporal.query(valid_time, system_time) if temporal else []
+    
+    def query_by_subject(
+        self, namespace: str, subject: str, valid_time: str, system_time: str
+    ) -> List[DecisionCell]:
+        """Cells for a subject in a namespace valid at valid_time as of system_time"""
+        temporal = self.temporal_by_ns_subject.get((namespace, subject))
+        return temporal.query(valid_time, system_time) if temporal else []
+    
+    def query_by_namespace(
+        self, namespace: str, valid_time: str, system_time: str
+    ) -> List[DecisionCell]:
+        """Cells in a namespace valid at valid_time as of system_time"""
+        temporal = self.temporal_by_namespace.get(namespace)
+        return temporal.query(valid_time, system_time) if temporal else []
+
+
+class LayeredScholarIndex:
+    """
+    ScholarIndex view over a base index plus a delta of later cells.
+    
+    Scholars over an OverlayChain use it instead of copying the base
+    Scholar's indexes: lookups read through to the base index (never
+    modified here) and append the delta's hits, which follow every base
+    cell in chain order. New cells only reach the delta.
+    
+    ``base_visible`` (set by the owning Scholar to the overlay's
+    ``in_base``) drops base hits for cells the base indexed after the fork.
+    """
+    
+    def __init__(self, base: ScholarIndex, delta: Optional[ScholarIndex] = None):
+        self.base = base
+        self.delta = delta if delta is not None else ScholarIndex()
+        self.base_visible: Optional[Callable[[DecisionCell], bool]] = None
+    
+    def add_cell(self, cell: DecisionCell):
+        self.delta.add_cell(cell)
+    
+    def copy(self) -> 'LayeredScholarIndex':
+        """Independent copy (the base is shared, the delta is not)."""
+        clone = LayeredScholarIndex(self.base, self.delta.copy())
+        clone.base_visible = self.base_visible
+        return clone
+    
+    def _merge(self, base_hits: List[DecisionCell], delta_hits: List[DecisionCell]) -> List[DecisionCell]:
+        if self.base_visible is not None:
+            base_hits = [cell for cell in base_hits if self.base_visible(cell)]
+        if delta_hits:
+            return base_hits + delta_hits
+        return base_hits
+    
+    def get_cell(self, cell_id: str) -> Optional[DecisionCell]:
+        cell = self.delta.get_cell(cell_id)
+        if cell is None:
+            cell = self.base.get_cell(cell_id)
+            if cell is not None and self.base_visible is not None and not self.base_visible(cell):
+                return None
+        return cell
+    
+    def get_by_key(self, namespace: str, subject: str, predicate: str) -> List[DecisionCell]:
+        return self._merge(
+            self.base.get_by_key(namespace, subject, predicate),
+            self.delta.get_by_key(namespace, subject, predicate),
+        )
+    
+    def get_by_namespace(self, namespace: str) -> List[DecisionCell]:
+        return self._merge(self.base.get_by_namespace(namespace), self.delta.get_by_namespace(namespace))
+    
+    def get_by_subject(self, namespace: str, subject: str) -> List[DecisionCell]:
+        return self._merge(
+            self.base.get_by_subject(namespace, subject),
+            self.delta.get_by_subject(namespace, subject),
+        )
+    
+    def query_by_key(
+        self, namespace: str, subject: str, predicate: str, valid_time: str, system_time: str
+    ) -> List[DecisionCell]:
+        return self._merge(
+            self.base.query_by_key(namespace, subject, predicate, valid_time, system_time),
+            self.delta.query_by_key(namespace, subject, predicate, valid_time, system_time),
+        )
+    
+    def query_by_subject(
+        self, namespace: str, subject: str, valid_time: str, system_time: str
+    ) -> List[DecisionCell]:
+        return self._merge(
+            self.base.query_by_subject(namespace, subject, valid_time, system_time),
+            self.delta.query_by_subject(namespace, subject, valid_time, system_time),
+        )
+    
+    def query_by_namespace(
+        self, namespace: str, valid_time: str, system_time: str
+    ) -> List[DecisionCell]:
+        return self._merge(
+            self.base.query_by_namespace(namespace, valid_time, system_time),
+            self.delta.query_by_namespace(namespace, valid_time, system_time),
+        )
+    
+    # Merged id maps, for inspection; O(index), not used by queries
+    
+    def _merged_ids(self, base_ids: Dict, delta_ids: Dict) -> Dict:
+        merged = {}
+        for key, cell_ids in base_ids.items():
+            if self.base_visible is not None:
+                cell_by_id = self.base.cell_by_id
+                cell_ids = [cid for cid in cell_ids if self.base_visible(cell_by_id[cid])]
+            if cell_ids:
+                merged[key] = list(cell_ids)
+        for key, cell_ids in delta_ids.items():
+            merged.setdefault(key, []).extend(cell_ids)
+        return merged
+    
+    @property
+    def cell_by_id(self) -> Dict[str, DecisionCell]:
+        cells = self.base.cell_by_id
+        if self.base_visible is not None:
+            cells = {cid: cell for cid, cell in cells.items() if self.base_visible(cell)}
+        return {**cells, **self.delta.cell_by_id}
+    
+    @property
+    def by_namespace(self) -> Dict[str, List[str]]:
+        return self._merged_ids(self.base.by_namespace, self.delta.by_namespace)
+    
+    @property
+    def by_key(self) -> Dict[Tuple[str, str, str], List[str]]:
+        return self._merged_ids(self.base.by_key, self.delta.by_key)
+    
+    @property
+    def by_ns_subject(self) -> Dict[Tuple[str, str], List[str]]:
+        return self._merged_ids(self.base.by_ns_subject, self.delta.by_ns_subject)
+
+
+# Skip system cells (genesis, namespace_def, access_rule, bridge_rule)
+# We only index "content" cells (fact, rule, decision, evidence, override)
+INDEXED_CELL_TYPES = frozenset({
+    CellType.FACT,
+    CellType.RULE,
+    CellType.DECISION,
+    CellType.EVIDENCE,
+    CellType.OVERRIDE
+})
+
+
+# Cells that can change namespace visibility (see Scholar._invalidate_visibility)
+VISIBILITY_CELL_TYPES = frozenset({
+    CellType.BRIDGE_RULE,
+    CellType.OVERRIDE,
+    CellType.NAMESPACE_DEF
+})
+
+# Max cached requester closures before the cache is reset
+VISIBILITY_CACHE_SIZE = 4096
 
 
 def build_index_from_chain(chain: Chain) -> ScholarIndex:
@@ -500,15 +809,7 @@ def build_index_from_chain(chain: Chain) -> ScholarIndex:
     index = ScholarIndex()
     
     for cell in chain.cells:
-        # Skip system cells (genesis, namespace_def, access_rule, bridge_rule)
-        # We only index "content" cells (fact, rule, decision, evidence, override)
-        if cell.header.cell_type in (
-            CellType.FACT,
-            CellType.RULE,
-            CellType.DECISION,
-            CellType.EVIDENCE,
-            CellType.OVERRIDE
-        ):
+        if cell.header.cell_type in INDEXED_CELL_TYPES:
             index.add_cell(cell)
     
     return index
@@ -562,6 +863,63 @@ def is_bridge_effective(
     return (True, BridgeEffectivenessReason.AUTHORIZED)
 
 
+@dataclass(frozen=True)
+class BridgeInterval:
+    """
+    A bridge a requester can use to reach a target, with its bitemporal
+    validity pre-extracted so evaluation is a pair of interval checks.
+    """
+    cell_id: str
+    via_parent: bool
+    revoked: bool
+    known_from: str             # bridge system_time (Clock A)
+    valid_from: Optional[str]   # Clock B lower bound
+    valid_to: Optional[str]     # Clock B upper bound (None = open-ended)
+    
+    @classmethod
+    def from_cell(cls, bridge_cell: DecisionCell, via_parent: bool, revoked: bool) -> 'BridgeInterval':
+        return cls(
+            cell_id=bridge_cell.cell_id,
+            via_parent=via_parent,
+            revoked=revoked,
+            known_from=bridge_cell.header.system_time,
+            valid_from=bridge_cell.fact.valid_from,
+            valid_to=bridge_cell.fact.valid_to,
+        )
+    
+    def evaluate(
+        self, at_valid_time: str, as_of_system_time: str
+    ) -> Tuple[bool, BridgeEffectivenessReason]:
+        """Same verdicts, in the same order, as is_bridge_effective()."""
+        if self.revoked:
+            return (False, BridgeEffectivenessReason.BRIDGE_REVOKED)
+        if self.known_from > as_of_system_time:
+            return (False, BridgeEffectivenessReason.BRIDGE_NOT_YET_KNOWN)
+        if self.valid_from and self.valid_from > at_valid_time:
+            return (False, BridgeEffectivenessReason.BRIDGE_NOT_ACTIVE)
+        if self.valid_to is not None and self.valid_to <= at_valid_time:
+            return (False, BridgeEffectivenessReason.BRIDGE_EXPIRED)
+        return (True, BridgeEffectivenessReason.AUTHORIZED)
+
+
+@dataclass
+class VisibilityClosure:
+    """
+    Everything a requester namespace can reach through bridges.
+    
+    sources are the requester and its ancestors; bridges_by_target lists,
+    per target namespace, the usable bridges in check order (direct bridge
+    first, then the nearest parent's). relations memoizes the structural
+    parent/child verdict per target and visible caches visible_namespaces().
+    """
+    requester_namespace: str
+    sources: FrozenSet[str]
+    bridges_by_target: Dict[str, Tuple[BridgeInterval, ...]]
+    bridge_ids: FrozenSet[str]
+    relations: Dict[str, str] = field(default_factory=dict)
+    visible: Optional[FrozenSet[str]] = None
+
+
 # ============================================================================
 # SCHOLAR (THE RESOLVER)
 # ============================================================================
@@ -572,17 +930,185 @@ class Scholar:
     
     It does NOT create facts - it only reads and derives.
     Every answer is traceable to sealed cells.
+    
+    Indexes are maintained incrementally: the Scholar subscribes to
+    chain appends and remembers how many chain cells it has indexed
+    (a high-water mark), so new cells cost O(new cells), never a rebuild.
+    
+    A Scholar over an OverlayChain, given the base chain's Scholar, reads
+    through to the base indexes (LayeredScholarIndex) and indexes only
+    the overlay's own cells, so it is built in O(overlay cells).
     """
     
-    def __init__(self, chain: Chain):
+    def __init__(self, chain: Chain, base: Optional['Scholar'] = None):
+        """
+        Args:
+            chain: The chain to read
+            base: Optional Scholar over a prefix of ``chain`` (e.g. the base
+                chain of a fork_shadow_chain() fork). Only the cells past
+                its high-water mark are indexed; its indexes are shared
+                when ``chain`` is an OverlayChain over base.chain, and
+                copied otherwise.
+        """
         self.chain = chain
-        self.index = build_index_from_chain(chain)
-        self.registry = build_registry_from_chain(chain.cells)
+        self._lock = threading.Lock()
+        # requester_namespace -> VisibilityClosure (see _visibility_closure)
+        self._visibility: Dict[str, VisibilityClosure] = {}
+        if base is not None:
+            with base._lock:
+                base._catch_up()
+                if (isinstance(chain, OverlayChain) and chain.base_chain is base.chain
+                        and base._indexed_upto == chain.base_length):
+                    # The base keeps indexing its own chain: hide cells past the fork
+                    self.index = LayeredScholarIndex(base.index)
+                    self.index.base_visible = chain.in_base
+                else:
+                    self.index = base.index.copy()
+                self.registry = base.registry.copy()
+                self._indexed_upto = base._indexed_upto
+                self._last_indexed = base._last_indexed
+        else:
+            self.index = ScholarIndex()
+            self.registry = NamespaceRegistry()
+            self._indexed_upto = 0      # chain.cells[:_indexed_upto] are indexed
+            self._last_indexed = None   # chain.cells[_indexed_upto - 1]
+        self.refresh()
+        chain.subscribe(self._on_append)
+    
+    @property
+    def indexed_upto(self) -> int:
+        """Number of chain cells reflected in the indexes (high-water mark)."""
+        return self._indexed_upto
+    
+    def refresh(self, full: bool = False) -> int:
+        """
+        Bring indexes up to date with the chain.
+        
+        Only cells past the high-water mark are processed. If the chain no
+        longer extends what was indexed (its cell list was replaced), or
+        ``full`` is set, the indexes are rebuilt from scratch.
+        
+        Returns:
+            Number of cells processed
+        """
+        with self._lock:
+            if full:
+                self._reset()
+            return self._catch_up()
+    
+    def _reset(self):
+        self.index = ScholarIndex()
+        self.registry = NamespaceRegistry()
+        self._indexed_upto = 0
+        self._last_indexed = None
+        self._visibility = {}
+    
+    def _catch_up(self) -> int:
+        """Index cells past the high-water mark (caller holds the lock)."""
+        cells = self.chain.cells
+        upto = self._indexed_upto
+        if upto > len(cells) or (upto and cells[upto - 1] is not self._last_indexed):
+            self._reset()
+            upto = 0
+        if upto == len(cells):
+            return 0
+        
+        new_cells = cells[upto:]
+        index_add = self.index.add_cell
+        registry_apply = self.registry.apply_cell
+        for cell in new_cells:
+            cell_type = cell.header.cell_type
+            if cell_type in INDEXED_CELL_TYPES:
+                index_add(cell)
+            registry_apply(cell)
+            if cell_type in VISIBILITY_CELL_TYPES and self._visibility:
+                self._invalidate_visibility(cell)
+        
+        self._indexed_upto = upto + len(new_cells)
+        self._last_indexed = new_cells[-1]
+        return len(new_cells)
     
-    def refresh(self):
-        """Refresh indexes after chain changes"""
-        self.index = build_index_from_chain(self.chain)
-        self.registry = build_registry_from_chain(self.chain.cells)
+    def _on_append(self, cell: DecisionCell):
+        with self._lock:
+            self._catch_up()
+    
+    # ========================================================================
+    # VISIBILITY CLOSURE CACHE
+    # ========================================================================
+    
+    def _visibility_closure(self, requester_namespace: str) -> VisibilityClosure:
+        """Bridge closure for a requester, built once per registry change."""
+        closure = self._visibility.get(requester_namespace)
+        if closure is not None:
+            return closure
+        with self._lock:
+            # Under the lock: registry appends (and their invalidations) cannot
+            # interleave with the build, so no stale closure is ever cached
+            closure = self._visibility.get(requester_namespace)
+            if closure is None:
+                closure = self._build_visibility_closure(requester_namespace)
+                if len(self._visibility) >= VISIBILITY_CACHE_SIZE:
+                    self._visibility.clear()
+                self._visibility[requester_namespace] = closure
+            return closure
+    
+    def _build_visibility_closure(self, requester_namespace: str) -> VisibilityClosure:
+        """Compute a requester's closure from the registry (caller holds the lock)."""
+        # Requester first (depth 0), then ancestors nearest-first
+        depth_by_source = {}
+        namespace = requester_namespace
+        while namespace:
+            depth_by_source[namespace] = len(depth_by_source)
+            namespace = get_parent_namespace(namespace)
+        
+        found: Dict[str, List[Tuple[int, BridgeInterval]]] = {}
+        revoked = self.registry.revoked_bridges
+        for (source, target), bridge_cell in self.registry.bridges.items():
+            depth = depth_by_source.get(source)
+            if depth is None:
+                continue
+            found.setdefault(target, []).append((depth, BridgeInterval.from_cell(
+                bridge_cell, via_parent=depth > 0, revoked=bridge_cell.cell_id in revoked
+            )))
+        
+        bridges_by_target = {
+            target: tuple(bridge for _, bridge in sorted(entries, key=lambda e: e[0]))
+            for target, entries in found.items()
+        }
+        return VisibilityClosure(
+            requester_namespace=requester_namespace,
+            sources=frozenset(depth_by_source),
+            bridges_by_target=bridges_by_target,
+            bridge_ids=frozenset(
+                bridge.cell_id for bridges in bridges_by_target.values() for bridge in bridges
+            ),
+        )
+    
+    def _invalidate_visibility(self, cell: DecisionCell):
+        """Drop only the closures an appended registry cell can change."""
+        cell_type = cell.header.cell_type
+        if cell_type == CellType.BRIDGE_RULE:
+            source = cell.fact.subject
+            stale = [r for r, c in list(self._visibility.items()) if source in c.sources]
+        elif cell_type == CellType.OVERRIDE:
+            if not (cell.fact.namespace == "system.bridges"
+                    and cell.fact.predicate == "status" and cell.fact.object == "revoked"):
+                return
+            bridge_id = cell.fact.subject
+            stale = [r for r, c in list(self._visibility.items()) if bridge_id in c.bridge_ids]
+        else:
+            # NAMESPACE_DEF only affects visible_namespaces()
+            for closure in list(self._visibility.values()):
+                closure.visible = None
+            return
+        for requester in stale:
+            del self._visibility[requester]
+    
+    def _ensure_current(self):
+        """Cheap staleness check run before each query."""
+        cells = self.chain.cells
+        if len(cells) != self._indexed_upto or (cells and cells[-1] is not self._last_indexed):
+            self.refresh()
     
     # ========================================================================
     # VISIBILITY / JURISDICTION
@@ -611,63 +1137,41 @@ class Scholar:
 
         Returns VisibilityResult with bridges_used and bridge_effectiveness for proof.
         """
+        self._ensure_current()
         # Same namespace
         if requester_namespace == target_namespace:
             return VisibilityResult(True, "same_namespace")
 
-        # Parent can see child
-        if is_namespace_prefix(requester_namespace, target_namespace):
-            return VisibilityResult(True, "parent_namespace")
-
-        # Child can see parent
-        if is_namespace_prefix(target_namespace, requester_namespace):
-            return VisibilityResult(True, "child_namespace")
+        closure = self._visibility_closure(requester_namespace)
+        relation = closure.relations.get(target_namespace)
+        if relation is None:
+            if is_namespace_prefix(requester_namespace, target_namespace):
+                relation = "parent_namespace"  # Parent can see child
+            elif is_namespace_prefix(target_namespace, requester_namespace):
+                relation = "child_namespace"   # Child can see parent
+            else:
+                relation = ""
+            closure.relations[target_namespace] = relation
+        if relation:
+            return VisibilityResult(True, relation)
 
-        # Check for bridge with bitemporal validation
-        bridges_used = []
+        # Check for bridge with bitemporal validation: direct bridge first,
+        # then bridges from parent namespaces (precomputed closure)
         bridge_effectiveness_list = []
-
-        # Direct bridge
-        bridge_key = (requester_namespace, target_namespace)
-        if bridge_key in self.registry.bridges:
-            bridge_cell = self.registry.bridges[bridge_key]
-            is_revoked = bridge_cell.cell_id in self.registry.revoked_bridges
-
-            effective, reason = is_bridge_effective(
-                bridge_cell, at_valid_time, as_of_system_time, is_revoked
-            )
+        for bridge in closure.bridges_by_target.get(target_namespace, ()):
+            effective, reason = bridge.evaluate(at_valid_time, as_of_system_time)
             bridge_effectiveness_list.append(
-                BridgeEffectiveness(bridge_cell.cell_id, effective, reason)
+                BridgeEffectiveness(bridge.cell_id, effective, reason)
             )
 
             if effective:
-                bridges_used.append(bridge_cell.cell_id)
                 return VisibilityResult(
-                    True, "bridge", bridges_used, bridge_effectiveness_list
-                )
-
-        # Bridge via parent
-        parent = get_parent_namespace(requester_namespace)
-        while parent:
-            parent_bridge_key = (parent, target_namespace)
-            if parent_bridge_key in self.registry.bridges:
-                bridge_cell = self.registry.bridges[parent_bridge_key]
-                is_revoked = bridge_cell.cell_id in self.registry.revoked_bridges
-
-                effective, reason = is_bridge_effective(
-                    bridge_cell, at_valid_time, as_of_system_time, is_revoked
-                )
-                bridge_effectiveness_list.append(
-                    BridgeEffectiveness(bridge_cell.cell_id, effective, reason)
+                    True,
+                    "bridge_via_parent" if bridge.via_parent else "bridge",
+                    [bridge.cell_id],
+                    bridge_effectiveness_list
                 )
 
-                if effective:
-                    bridges_used.append(bridge_cell.cell_id)
-                    return VisibilityResult(
-                        True, "bridge_via_parent", bridges_used, bridge_effectiveness_list
-                    )
-            parent = get_parent_namespace(parent)
-
         return VisibilityResult(False, "no_access", [], bridge_effectiveness_list)
     
     def visible_namespaces(
@@ -680,6 +1184,19 @@ class Scholar:
         
         Returns deterministically sorted set.
         """
+        self._ensure_current()
+        closure = self._visibility_closure(requester_namespace)
+        visible = closure.visible
+        if visible is not None:
+            return set(visible)
+        with self._lock:
+            # Same registry snapshot as a concurrent NAMESPACE_DEF invalidation
+            visible = self._visible_namespaces(requester_namespace, closure)
+            closure.visible = frozenset(visible)
+        return visible
+    
+    def _visible_namespaces(self, requester_namespace: str, closure: VisibilityClosure) -> Set[str]:
+        """Namespaces visible to a requester (caller holds the lock)."""
         visible = set()
         
         # Own namespace and all children
@@ -695,22 +1212,10 @@ class Scholar:
         if self.chain.root_namespace:
             visible.add(self.chain.root_namespace)
         
-        # Via bridges
-        for (source, target), bridge_cell in self.registry.bridges.items():
-            if bridge_cell.cell_id in self.registry.revoked_bridges:
-                continue
-            
-            # Direct bridge from requester
-            if source == requester_namespace:
+        # Via bridges from the requester or a parent
+        for target, bridges in closure.bridges_by_target.items():
+            if any(not bridge.revoked for bridge in bridges):
                 visible.add(target)
-            
-            # Bridge from parent
-            parent = get_parent_namespace(requester_namespace)
-            while parent:
-                if source == parent:
-                    visible.add(target)
-                parent = get_parent_namespace(parent)
-        
         return visible
     
     # ========================================================================
@@ -947,6 +1452,7 @@ class Scholar:
             QueryResult with facts, candidates, bridges_used, and resolution_events.
             When policy_mode="promoted_only", includes policy_head_id field.
         """
+        self._ensure_current()
         # Default times to now
         now = get_current_timestamp()
         valid_time = at_valid_time or now
@@ -957,9 +1463,10 @@ class Scholar:
         promoted_rule_ids = None
 
         if policy_mode == "promoted_only":
-            policy_head = get_policy_head_at_time(self.chain, namespace, system_time)
+            # One bisect in the chain's PolicyHead timeline (promoted rules pre-parsed)
+            policy_entry = get_policy_head_timeline(self.chain).at_time(namespace, system_time)
 
-            if policy_head is None:
+            if policy_entry is None:
                 # No policy for namespace at this time - return empty result (fail-closed)
                 return QueryResult(
                     facts=[],
@@ -978,9 +1485,11 @@ class Scholar:
                     policy_head_id=None
                 )
 
-            policy_data = parse_policy_data(policy_head)
-            promoted_rule_ids = set(policy_data["promoted_rule_ids"])
-            policy_head_id = policy_head.cell_id
+            promoted_rule_ids = policy_entry.promoted_rule_ids
+            if promoted_rule_ids is None:
+                # Malformed policy data: surface the parse error
+                promoted_rule_ids = set(parse_policy_data(policy_entry.cell)["promoted_rule_ids"])
+            policy_head_id = policy_entry.cell.cell_id
 
         # Check visibility with bitemporal coordinates
         visibility = self.check_visibility(
@@ -1009,16 +1518,19 @@ class Scholar:
                 authorization=authorization
             )
         
-        # Get candidates based on filters
+        # Get candidates based on filters; the bitemporal index applies
+        # the same test as _is_valid_at_time without scanning every version
         if subject and predicate:
             # Exact key lookup
-            candidates = self.index.get_by_key(namespace, subject, predicate)
+            candidates = self.index.query_by_key(
+                namespace, subject, predicate, valid_time, system_time
+            )
         elif subject:
             # All predicates for subject
-            candidates = self.index.get_by_subject(namespace, subject)
+            candidates = self.index.query_by_subject(namespace, subject, valid_time, system_time)
         else:
             # All cells in namespace
-            candidates = self.index.get_by_namespace(namespace)
+            candidates = self.index.query_by_namespace(namespace, valid_time, system_time)
         
         # Filter by predicate if specified (when subject is None)
         if predicate and not subject:
@@ -1027,12 +1539,6 @@ class Scholar:
         # Filter by object if specified
         if object_value:
             candidates = [c for c in candidates if c.fact.object == object_value]
-        
-        # Apply bitemporal filter
-        candidates = [
-            c for c in candidates
-            if self._is_valid_at_time(c, valid_time, system_time)
-        ]
 
         # Filter by promoted rules if policy_mode="promoted_only" (SCH-04)
         if promoted_rule_ids is not None:
@@ -1091,11 +1597,19 @@ class Scholar:
         namespace: str,
         max_depth: int = 10,
         at_valid_time: Optional[str] = None,
-        as_of_system_time: Optional[str] = None
+        as_of_system_time: Optional[str] = None,
+        max_nodes: Optional[int] = None
     ) -> List[Tuple[str, List[DecisionCell]]]:
         """
         Traverse relationships from a starting subject.
         
+        Edges are resolved breadth-first, one whole frontier at a time,
+        straight from the bitemporal key index: one visibility check for
+        the namespace, conflict resolution only for keys with several
+        candidates. The (entity_id, path) results are then emitted in
+        depth-first order, identical to one query_facts() call per
+        (subject, predicate) edge.
+        
         Args:
             requester_namespace: For bridge checking
             start_subject: Starting entity ID
@@ -1104,44 +1618,109 @@ class Scholar:
             max_depth: Maximum traversal depth (cycle protection)
             at_valid_time: Point in valid time
             as_of_system_time: Point in system time
+            max_nodes: Optional budget; stop after this many entities
         
         Returns:
             List of (entity_id, path) tuples reached
         """
+        self._ensure_current()
         now = get_current_timestamp()
         valid_time = at_valid_time or now
         system_time = as_of_system_time or now
         
+        visibility = self.check_visibility(
+            requester_namespace, namespace, valid_time, system_time
+        )
+        
+        def resolve(subjects: List[str]) -> Dict[str, Tuple[DecisionCell, ...]]:
+            return self._resolve_edges(
+                requester_namespace, namespace, subjects, predicates,
+                valid_time, system_time, visibility.allowed
+            )
+        
+        # Phase 1: batched BFS over every subject within max_depth hops
+        edges: Dict[str, Tuple[DecisionCell, ...]] = {}
+        frontier = [start_subject]
+        seen = {start_subject}
+        for _ in range(max_depth + 1):
+            if not frontier:
+                break
+            batch = resolve(frontier)
+            edges.update(batch)
+            if max_nodes is not None and len(seen) >= max_nodes:
+                break
+            next_frontier = []
+            for subject in frontier:
+                for fact in batch[subject]:
+                    next_entity = fact.fact.object
+                    if next_entity not in seen:
+                        seen.add(next_entity)
+                        next_frontier.append(next_entity)
+            frontier = next_frontier
+        
+        # Phase 2: depth-first emission over the resolved edges
         visited = set()
         results = []
-        
-        def _traverse(subject: str, path: List[DecisionCell], depth: int):
-            if depth > max_depth:
-                return
-            if subject in visited:
-                return
+        stack = [(start_subject, [], 0)]
+        while stack:
+            if max_nodes is not None and len(results) >= max_nodes:
+                break
+            subject, path, depth = stack.pop()
+            if depth > max_depth or subject in visited:
+                continue
             
             visited.add(subject)
-            results.append((subject, path.copy()))
+            results.append((subject, path))
             
-            # Find outgoing relationships
-            for pred in predicates:
-                query_result = self.query_facts(
-                    requester_namespace=requester_namespace,
-                    namespace=namespace,
-                    subject=subject,
-                    predicate=pred,
-                    at_valid_time=valid_time,
-                    as_of_system_time=system_time
-                )
-                
-                for fact in query_result.facts:
-                    # The object is the next entity to visit
-                    next_entity = fact.fact.object
-                    _traverse(next_entity, path + [fact], depth + 1)
+            outgoing = edges.get(subject)
+            if outgoing is None:
+                outgoing = edges[subject] = resolve([subject])[subject]
+            # Reversed so the first edge is expanded first
+            for fact in reversed(outgoing):
+                stack.append((fact.fact.object, path + [fact], depth + 1))
         
-        _traverse(start_subject, [], 0)
         return results
+    
+    def _resolve_edges(
+        self,
+        requester_namespace: str,
+        namespace: str,
+        subjects: List[str],
+        predicates: List[str],
+        valid_time: str,
+        system_time: str,
+        allowed: bool
+    ) -> Dict[str, Tuple[DecisionCell, ...]]:
+        """
+        Outgoing facts per subject, in predicate order: the facts
+        query_facts(subject=..., predicate=...) would return for each edge.
+        """
+        if not allowed:
+            return {subject: () for subject in subjects}
+        
+        query_by_key = self.index.query_by_key
+        resolved = {}
+        for subject in subjects:
+            outgoing = []
+            for pred in predicates:
+                if not (subject and pred):
+                    # Not an exact key lookup; defer to the general query path
+                    outgoing.extend(self.query_facts(
+                        requester_namespace=requester_namespace,
+                        namespace=namespace,
+                        subject=subject,
+                        predicate=pred,
+                        at_valid_time=valid_time,
+                        as_of_system_time=system_time
+                    ).facts)
+                    continue
+                candidates = query_by_key(namespace, subject, pred, valid_time, system_time)
+                if len(candidates) == 1:
+                    outgoing.append(candidates[0])
+                elif candidates:
+                    outgoing.append(self._pick_winner(candidates)[0])
+            resolved[subject] = tuple(outgoing)
+        return resolved
 
 
 # ============================================================================
@@ -1173,8 +1752,12 @@ __all__ = [
 
     # Bridge evaluation
     'is_bridge_effective',
+    'BridgeInterval',
+    'VisibilityClosure',
 
     # Index
     'ScholarIndex',
+    'LayeredScholarIndex',
+    'BitemporalIndex',
     'build_index_from_chain',
 ]
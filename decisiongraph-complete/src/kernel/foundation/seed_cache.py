@@ -0,0 +1,466 @@
+"""
+DecisionGraph Seed Cache Module
+
+Content-addressed on-disk cache for generated seed precedent pools.
+
+Seed generators (generate_all_banking_seeds, generate_all_insurance_seeds)
+rebuild thousands of JudgmentPayloads - anchor facts, fingerprints, reporting
+determinations - on every process start. Their output is a function of:
+- the generator's source and scenario configuration (its package files)
+- its arguments (random seed, salt, total), defaults included
+- the UTC date: decided_at is spread backwards from "now"
+precedent_ids are uuid4, so a cache hit also pins them for the day, which
+keeps ids stable across worker processes and restarts.
+
+The cache key is a SHA-256 over those inputs; the file name carries it, so a
+changed generator, argument or date simply misses and regenerates.
+
+FILE FORMAT (little-endian, sections 4-byte aligned):
+    magic          8 bytes   b"DGSEED\\x00\\x01"
+    version        2 bytes
+    key           32 bytes   raw SHA-256 cache key
+    n_records      4 bytes
+    n_fields       4 bytes   columns (every JudgmentPayload field except anchor_facts)
+    n_facts        4 bytes   entries in the anchor fact list
+    meta_len       4 bytes   JSON: field names, generator, params
+    values_len     4 bytes   JSON array of distinct values
+    meta, values
+    columns        n_fields * n_records u32   value index per field per record
+    fact_starts    (n_records + 1) u32        prefix offsets into fact_list
+    fact_list      n_facts u32                value index of each anchor fact
+    crc32c         4 bytes   over everything above
+
+Values are interned: ~60,000 anchor facts in the banking pool are 84 distinct
+dicts, and most other columns have a handful of distinct values. Loading
+memory-maps the file, parses the value table once, and restores payloads
+without re-running JudgmentPayload validation (they were valid when written
+and the file is checksummed). Restored payloads share AnchorFact instances;
+list and dict fields are copied per payload.
+"""
+
+import hashlib
+import inspect
+import json
+import mmap
+import os
+import struct
+import sys
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .judgment import AnchorFact, JudgmentPayload
+from .wal import compute_crc32c
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+SEED_CACHE_MAGIC = b"DGSEED\x00\x01"  # 8 bytes
+SEED_CACHE_VERSION = 1
+SEED_CACHE_SUFFIX = ".dgseeds"
+
+_HEADER = struct.Struct('<8sH32sIIIII')
+_CRC = struct.Struct('<I')
+_SOURCE_SUFFIXES = (".py", ".yaml", ".yml", ".json")
+
+_COLUMN_FIELDS: Tuple[str, ...] = tuple(
+    f.name for f in fields(JudgmentPayload) if f.name != "anchor_facts"
+)
+
+
+class SeedCacheError(Exception):
+    """Seed cache file is missing, corrupted or for a different key."""
+    pass
+
+
+@dataclass(frozen=True)
+class SeedCacheResult:
+    """Outcome of load_or_generate_seeds()."""
+    payloads: List[JudgmentPayload]
+    key: str
+    path: Path
+    hit: bool
+
+
+# =============================================================================
+# CACHE KEY
+# =============================================================================
+
+def _source_digest(module_name: str) -> str:
+    """
+    Hash the generator's source files.
+
+    For a module inside a package this covers every source/config file under
+    the package directory (scenario tables, YAML seed configs, policy shifts).
+    """
+    module = sys.modules[module_name]
+    module_file = Path(module.__file__)
+    if module.__package__:
+        root = module_file.parent
+        files = sorted(
+            p for p in root.rglob("*")
+            if p.suffix in _SOURCE_SUFFIXES and "__pycache__" not in p.parts
+        )
+    else:
+        root, files = module_file.parent, [module_file]
+
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(path.read_bytes())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _generator_name(generator: Callable) -> str:
+    return f"{generator.__module__}.{generator.__qualname__}"
+
+
+def _bound_params(generator: Callable, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Generator arguments with defaults applied, so omitted == explicit."""
+    bound = inspect.signature(generator).bind(**params)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+def generator_digest(generator: Callable) -> str:
+    """
+    Identify a seed generator's code: its name, source files and the
+    JudgmentPayload fields it fills. Unlike seed_cache_key() this ignores
+    arguments and the date.
+
+    Returns:
+        64-char hex SHA-256
+    """
+    material = {
+        "generator": _generator_name(generator),
+        "sources": _source_digest(generator.__module__),
+        "payload_fields": [f.name for f in fields(JudgmentPayload)],
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def seed_cache_key(
+    generator: Callable,
+    params: Optional[Dict[str, Any]] = None,
+    as_of: Optional[str] = None,
+) -> str:
+    """
+    Compute the cache key for ``generator(**params)``.
+
+    Args:
+        generator: Seed generator function
+        params: Keyword arguments for the generator
+        as_of: UTC date (YYYY-MM-DD) the pool is generated for; defaults to today
+
+    Returns:
+        64-char hex SHA-256
+    """
+    material = {
+        "format": SEED_CACHE_VERSION,
+        "generator": _generator_name(generator),
+        "sources": _source_digest(generator.__module__),
+        "payload_fields": [f.name for f in fields(JudgmentPayload)],
+        "params": _bound_params(generator, params or {}),
+        "as_of": as_of or datetime.now(timezone.utc).date().isoformat(),
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def seed_cache_path(cache_dir: Union[str, Path], generator: Callable, key: str) -> Path:
+    """File for ``key``: <cache_dir>/<module.generator>-<key>.dgseeds"""
+    return Path(cache_dir) / f"{_generator_name(generator)}-{key}{SEED_CACHE_SUFFIX}"
+
+
+# =============================================================================
+# SERIALIZATION
+# =============================================================================
+
+def _pad4(data: bytes) -> bytes:
+    return data + b" " * (-len(data) % 4)
+
+
+def _u32_array(values: Sequence[int]) -> bytes:
+    return struct.pack(f'<{len(values)}I', *values)
+
+
+def encode_seed_cache(
+    payloads: Sequence[JudgmentPayload],
+    key: str,
+    meta: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """Serialize payloads to the seed cache format."""
+    values: List[Any] = []
+    value_index: Dict[Any, int] = {}
+
+    def token(value: Any) -> Any:
+        # type() keeps True and 1 apart; JSON text for lists/dicts
+        if value is None or isinstance(value, (str, int, bool)):
+            return (type(value), value)
+        return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+    def intern(key: Any, value: Any) -> int:
+        idx = value_index.get(key)
+        if idx is None:
+            idx = value_index[key] = len(values)
+            values.append(value)
+        return idx
+
+    columns = [
+        [intern(token(v), v) for v in (getattr(p, name) for p in payloads)]
+        for name in _COLUMN_FIELDS
+    ]
+    fact_starts = [0]
+    fact_list: List[int] = []
+    for p in payloads:
+        fact_list.extend(
+            intern(("fact", af.field_id, token(af.value), af.label), af.to_dict())
+            for af in p.anchor_facts
+        )
+        fact_starts.append(len(fact_list))
+
+    meta_bytes = _pad4(json.dumps(
+        {**(meta or {}), "fields": list(_COLUMN_FIELDS)},
+        sort_keys=True, separators=(",", ":"), default=str,
+    ).encode("utf-8"))
+    values_bytes = _pad4(json.dumps(
+        values, separators=(",", ":"), ensure_ascii=False,
+    ).encode("utf-8"))
+
+    parts = [
+        _HEADER.pack(
+            SEED_CACHE_MAGIC,
+            SEED_CACHE_VERSION,
+            bytes.fromhex(key),
+            len(payloads),
+            len(_COLUMN_FIELDS),
+            len(fact_list),
+            len(meta_bytes),
+            len(values_bytes),
+        ),
+        meta_bytes,
+        values_bytes,
+    ]
+    parts.extend(_u32_array(col) for col in columns)
+    parts.append(_u32_array(fact_starts))
+    parts.append(_u32_array(fact_list))
+    body = b"".join(parts)
+    return body + _CRC.pack(compute_crc32c(body))
+
+
+def _clone(value: Any) -> Any:
+    """Deep-copy a JSON list/dict."""
+    if isinstance(value, list):
+        return [_clone(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _clone(v) for k, v in value.items()}
+    return value
+
+
+def _copier(value: Any) -> Callable[[], Any]:
+    """Factory returning a fresh copy of an interned list/dict value."""
+    items = value if isinstance(value, list) else value.values()
+    if any(isinstance(v, (list, dict)) for v in items):
+        return lambda: _clone(value)
+    return value.copy
+
+
+def decode_seed_cache(buf, key: Optional[str] = None) -> List[JudgmentPayload]:
+    """
+    Restore payloads from a seed cache buffer (bytes, mmap or memoryview).
+
+    Raises:
+        SeedCacheError: Bad magic/version/CRC, key mismatch, or a field
+                        layout from a different JudgmentPayload version
+    """
+    view = memoryview(buf)
+    try:
+        if len(view) < _HEADER.size + _CRC.size:
+            raise SeedCacheError("Seed cache truncated")
+        (magic, version, raw_key, n_records, n_fields,
+         n_facts, meta_len, values_len) = _HEADER.unpack_from(view, 0)
+        if magic != SEED_CACHE_MAGIC:
+            raise SeedCacheError("Invalid seed cache magic")
+        if version != SEED_CACHE_VERSION:
+            raise SeedCacheError(f"Unsupported seed cache version: {version}")
+        if key is not None and raw_key.hex() != key:
+            raise SeedCacheError("Seed cache key mismatch")
+
+        expected = (
+            _HEADER.size + meta_len + values_len
+            + 4 * (n_fields * n_records + n_records + 1 + n_facts)
+        )
+        if len(view) != expected + _CRC.size:
+            raise SeedCacheError("Seed cache size does not match header")
+        (stored_crc,) = _CRC.unpack_from(view, expected)
+        if compute_crc32c(view[:expected]) != stored_crc:
+            raise SeedCacheError("Seed cache CRC mismatch")
+
+        pos = _HEADER.size
+        meta = json.loads(bytes(view[pos:pos + meta_len]))
+        pos += meta_len
+        if tuple(meta.get("fields", ())) != _COLUMN_FIELDS:
+            raise SeedCacheError("Seed cache field layout does not match JudgmentPayload")
+        values = json.loads(bytes(view[pos:pos + values_len]))
+        pos += values_len
+
+        def u32s(count: int) -> List[int]:
+            nonlocal pos
+            out = list(struct.unpack_from(f'<{count}I', view, pos))
+            pos += 4 * count
+            return out
+
+        columns = [u32s(n_records) for _ in range(n_fields)]
+        fact_starts = u32s(n_records + 1)
+        fact_list = u32s(n_facts)
+    finally:
+        view.release()
+
+    # Anchor facts are validated once per distinct value and then shared
+    facts: Dict[int, AnchorFact] = {}
+    for idx in set(fact_list):
+        facts[idx] = AnchorFact.from_dict(values[idx])
+
+    # Lists/dicts are interned too; each payload gets its own copy
+    copiers = {
+        i: _copier(values[i])
+        for col in columns for i in set(col)
+        if isinstance(values[i], (list, dict))
+    }
+    mutable = [any(i in copiers for i in set(col)) for col in columns]
+    payloads: List[JudgmentPayload] = []
+    for r in range(n_records):
+        state = {
+            name: (copiers[col[r]]() if col[r] in copiers else values[col[r]])
+            if is_mutable else values[col[r]]
+            for name, col, is_mutable in zip(_COLUMN_FIELDS, columns, mutable)
+        }
+        state["anchor_facts"] = [
+            facts[i] for i in fact_list[fact_starts[r]:fact_starts[r + 1]]
+        ]
+        payload = JudgmentPayload.__new__(JudgmentPayload)
+        payload.__dict__.update(state)
+        payloads.append(payload)
+    return payloads
+
+
+# =============================================================================
+# FILE OPERATIONS
+# =============================================================================
+
+def write_seed_cache(
+    path: Union[str, Path],
+    payloads: Sequence[JudgmentPayload],
+    key: str,
+    meta: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Write a seed cache file atomically (tmp file + rename)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Per-process tmp name: several workers may miss and write concurrently
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(encode_seed_cache(payloads, key, meta))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    finally:
+        if tmp_file.exists():
+            tmp_file.unlink()
+
+
+def read_seed_cache(path: Union[str, Path], key: Optional[str] = None) -> List[JudgmentPayload]:
+    """
+    Memory-map and decode a seed cache file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        SeedCacheError: If the file is corrupted or for a different key
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise SeedCacheError("Seed cache is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return decode_seed_cache(mm, key)
+
+
+def prune_seed_caches(cache_dir: Union[str, Path], generator: Callable, keep: Path) -> int:
+    """Remove this generator's cache files other than ``keep``. Returns count removed."""
+    removed = 0
+    for path in Path(cache_dir).glob(f"{_generator_name(generator)}-*{SEED_CACHE_SUFFIX}"):
+        if path != keep:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def load_or_generate_seeds(
+    generator: Callable[..., List[JudgmentPayload]],
+    cache_dir: Union[str, Path],
+    as_of: Optional[str] = None,
+    **params: Any,
+) -> SeedCacheResult:
+    """
+    Load ``generator(**params)`` from the cache, generating it on a miss.
+
+    A missing, unreadable, corrupted or stale file is a miss. After
+    generating, the pool is written (best effort: an unwritable cache
+    directory is not an error) and older files for the same generator are
+    pruned.
+    """
+    key = seed_cache_key(generator, params, as_of)
+    path = seed_cache_path(cache_dir, generator, key)
+    try:
+        return SeedCacheResult(read_seed_cache(path, key), key, path, hit=True)
+    except (OSError, SeedCacheError, ValueError):
+        pass  # missing, unreadable, corrupted or stale: regenerate
+
+    payloads = generator(**params)
+    try:
+        write_seed_cache(path, payloads, key, meta={
+            "generator": _generator_name(generator),
+            "params": _bound_params(generator, params),
+        })
+        prune_seed_caches(cache_dir, generator, keep=path)
+    except OSError:
+        pass
+    return SeedCacheResult(payloads, key, path, hit=False)
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+__all__ = [
+    # Constants
+    'SEED_CACHE_MAGIC',
+    'SEED_CACHE_VERSION',
+    'SEED_CACHE_SUFFIX',
+
+    # Exceptions
+    'SeedCacheError',
+
+    # Classes
+    'SeedCacheResult',
+
+    # Functions
+    'generator_digest',
+    'seed_cache_key',
+    'seed_cache_path',
+    'encode_seed_cache',
+    'decode_seed_cache',
+    'write_seed_cache',
+    'read_seed_cache',
+    'prune_seed_caches',
+    'load_or_generate_seeds',
+]
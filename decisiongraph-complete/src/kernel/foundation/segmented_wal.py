@@ -13,7 +13,9 @@ DESIGN PRINCIPLES:
 DIRECTORY STRUCTURE:
     wal/
       00000000.wal    # segment 0
+      00000000.idx    # segment 0 sparse index sidecar (cache, see wal_index)
       00000001.wal    # segment 1
+      00000001.idx
       manifest.json   # metadata cache
 
 MANIFEST FORMAT:
@@ -46,11 +48,15 @@ RECOVERY:
 import json
 import os
 import struct
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Tuple
 
 from .wal import (
+    DEFAULT_GROUP_COMMIT_MAX_RECORDS,
+    DEFAULT_GROUP_COMMIT_WINDOW_MS,
     HEADER_SIZE,
     NULL_HASH_BYTES,
     WALChainError,
@@ -63,6 +69,14 @@ from .wal import (
     WALWriter,
     recover_wal,
 )
+from .wal_index import (
+    DEFAULT_INDEX_INTERVAL,
+    SegmentIndex,
+    WALIndex,
+    extract_cell_id,
+    load_segment_index,
+    write_segment_index_atomic,
+)
 
 
 # =============================================================================
@@ -270,6 +284,70 @@ def scan_segment_boundaries(path: Path) -> Optional[SegmentMetadata]:
     )
 
 
+@dataclass(frozen=True)
+class SegmentVerification:
+    """
+    Result of verifying one segment in isolation.
+
+    Records are CRC/cell-hash checked and their prev_hash links verified
+    inside the segment. The boundary hashes let the caller stitch the
+    cross-segment chain without re-reading any record.
+    """
+    segment_id: int
+    record_count: int
+    first_seq: Optional[int]
+    last_seq: Optional[int]
+    prev_hash_at_first: Optional[bytes]
+    last_hash: Optional[bytes]
+    # First in-segment chain break: (sequence, expected_prev, actual_prev)
+    chain_break: Optional[Tuple[int, bytes, bytes]] = None
+
+
+def verify_segment(path: Path) -> Optional[SegmentVerification]:
+    """
+    Verify a single segment file (CRC32C, cell hashes, in-segment chain).
+
+    Module-level so it can run in a process pool. Mirrors the sequential
+    reader: an unreadable header skips the segment (returns None) and the
+    scan stops at the first corrupted or incomplete record.
+    """
+    path = Path(path)
+    try:
+        with open(path, 'rb') as f:
+            header_bytes = f.read(HEADER_SIZE)
+            if len(header_bytes) < HEADER_SIZE:
+                return None
+            header = WALHeader.from_bytes(header_bytes)
+    except WALHeaderError:
+        return None
+
+    count = 0
+    first_seq = last_seq = None
+    first_prev = last_hash = None
+    chain_break = None
+
+    for record, _ in WALReader._iter_records_raw(path, header, start_sequence=None):
+        if count == 0:
+            first_seq = record.sequence
+            first_prev = record.prev_hash
+        elif record.prev_hash != last_hash:
+            chain_break = (record.sequence, last_hash, record.prev_hash)
+            break
+        count += 1
+        last_seq = record.sequence
+        last_hash = record.compute_record_hash()
+
+    return SegmentVerification(
+        segment_id=int(path.stem),
+        record_count=count,
+        first_seq=first_seq,
+        last_seq=last_seq,
+        prev_hash_at_first=first_prev,
+        last_hash=last_hash,
+        chain_break=chain_break,
+    )
+
+
 def rebuild_manifest_from_segments(
     wal_dir: Path,
     max_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
@@ -415,6 +493,12 @@ class SegmentedWALWriter:
     Or open existing:
         writer = SegmentedWALWriter.open(wal_dir)
         writer.append(canonical_bytes)
+
+    The writer is thread-safe. With fsync_policy="group", concurrent
+    appends share one write + fsync per batch (see WALWriter).
+
+    Unless index_interval is None, a sparse index sidecar is maintained for
+    the active segment and written on roll, sync() and close().
     """
 
     def __init__(
@@ -423,11 +507,24 @@ class SegmentedWALWriter:
         manifest: Manifest,
         active_writer: WALWriter,
         active_segment_size: int,
+        fsync_policy: str = "per_record",
+        group_commit_window_ms: float = DEFAULT_GROUP_COMMIT_WINDOW_MS,
+        group_commit_max_records: int = DEFAULT_GROUP_COMMIT_MAX_RECORDS,
+        index_interval: Optional[int] = DEFAULT_INDEX_INTERVAL,
+        active_index: Optional[SegmentIndex] = None,
     ):
         self._wal_dir = wal_dir
         self._manifest = manifest
         self._active_writer = active_writer
         self._active_segment_size = active_segment_size
+        self._fsync_policy = fsync_policy
+        self._group_commit_window_ms = group_commit_window_ms
+        self._group_commit_max_records = group_commit_max_records
+        self._index_interval = index_interval
+        self._active_index = active_index
+        if index_interval is not None and active_index is None:
+            self._active_index = SegmentIndex(manifest.active_segment, index_interval)
+        self._lock = threading.Lock()
         self._closed = False
 
     @property
@@ -456,6 +553,10 @@ class SegmentedWALWriter:
         hash_scheme: str,
         graph_id: str,
         max_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        fsync_policy: str = "per_record",
+        group_commit_window_ms: float = DEFAULT_GROUP_COMMIT_WINDOW_MS,
+        group_commit_max_records: int = DEFAULT_GROUP_COMMIT_MAX_RECORDS,
+        index_interval: Optional[int] = DEFAULT_INDEX_INTERVAL,
     ) -> 'SegmentedWALWriter':
         """
         Create a new segmented WAL.
@@ -465,6 +566,10 @@ class SegmentedWALWriter:
             hash_scheme: Hash scheme for all segments
             graph_id: Graph identifier
             max_bytes: Max segment size before rolling
+            fsync_policy: WALWriter sync policy, applied to every segment
+            group_commit_window_ms: Group commit latency window
+            group_commit_max_records: Group commit batch size
+            index_interval: Sparse index every Kth sequence (None disables sidecars)
 
         Returns:
             SegmentedWALWriter instance
@@ -477,7 +582,14 @@ class SegmentedWALWriter:
 
         # Create first segment
         seg_path = segment_path(wal_dir, 0)
-        active_writer = WALWriter.create(seg_path, hash_scheme, graph_id)
+        active_writer = WALWriter.create(
+            seg_path,
+            hash_scheme,
+            graph_id,
+            fsync_policy=fsync_policy,
+            group_commit_window_ms=group_commit_window_ms,
+            group_commit_max_records=group_commit_max_records,
+        )
 
         # Create manifest
         manifest = Manifest.create(hash_scheme, graph_id, max_bytes)
@@ -498,15 +610,32 @@ class SegmentedWALWriter:
             manifest=manifest,
             active_writer=active_writer,
             active_segment_size=HEADER_SIZE,
+            fsync_policy=fsync_policy,
+            group_commit_window_ms=group_commit_window_ms,
+            group_commit_max_records=group_commit_max_records,
+            index_interval=index_interval,
         )
 
     @staticmethod
-    def open(wal_dir: Path) -> 'SegmentedWALWriter':
+    def open(
+        wal_dir: Path,
+        fsync_policy: str = "per_record",
+        group_commit_window_ms: float = DEFAULT_GROUP_COMMIT_WINDOW_MS,
+        group_commit_max_records: int = DEFAULT_GROUP_COMMIT_MAX_RECORDS,
+        index_interval: Optional[int] = DEFAULT_INDEX_INTERVAL,
+    ) -> 'SegmentedWALWriter':
         """
         Open an existing segmented WAL for appending.
 
         Rebuilds manifest from segments if missing/corrupted.
         Recovers active segment if needed.
+
+        Args:
+            wal_dir: Directory containing segment files
+            fsync_policy: WALWriter sync policy, applied to every segment
+            group_commit_window_ms: Group commit latency window
+            group_commit_max_records: Group commit batch size
+            index_interval: Sparse index every Kth sequence (None disables sidecars)
         """
         wal_dir = Path(wal_dir)
         if not wal_dir.exists():
@@ -589,52 +718,80 @@ class SegmentedWALWriter:
             header=header,
             next_sequence=total_last_seq + 1,
             prev_hash=total_last_hash,
-            fsync_policy="per_record",
+            fsync_policy=fsync_policy,
+            group_commit_window_ms=group_commit_window_ms,
+            group_commit_max_records=group_commit_max_records,
         )
 
+        # Resume the active segment's index (rebuilt if missing/stale)
+        active_index = None
+        if index_interval is not None:
+            active_index = load_segment_index(active_path, index_interval)
+
         return SegmentedWALWriter(
             wal_dir=wal_dir,
             manifest=manifest,
             active_writer=active_writer,
             active_segment_size=active_size,
+            fsync_policy=fsync_policy,
+            group_commit_window_ms=group_commit_window_ms,
+            group_commit_max_records=group_commit_max_records,
+            index_interval=index_interval,
+            active_index=active_index,
         )
 
-    def append(self, canonical_bytes: bytes) -> Tuple[int, bytes, int]:
+    def append(self, canonical_bytes: bytes, cell_id: Optional[str] = None) -> Tuple[int, bytes, int]:
         """
         Append a cell to the WAL.
 
         Automatically rolls to new segment if size exceeds max_bytes.
+        Under the "group" policy the segment lock is released before
+        waiting for the batch fsync, so concurrent appends can batch.
 
         Args:
             canonical_bytes: RFC 8785 canonical cell bytes
+            cell_id: Cell ID for the index sidecar (extracted from the
+                     record's JSON if omitted)
 
         Returns:
             Tuple of (sequence, record_hash, segment_id)
         """
-        if self._closed:
-            raise SegmentedWALError("SegmentedWAL is closed")
-
-        # Check if we need to roll BEFORE writing
-        # (ensures each segment stays under max_bytes)
-        estimated_record_size = 82 + len(canonical_bytes)  # MIN_RECORD_SIZE + payload
-        if self._active_segment_size + estimated_record_size > self.max_bytes:
-            self._roll_segment()
-
-        # Write to active segment
-        seq, record_hash, offset = self._active_writer.append(canonical_bytes)
-        self._active_segment_size = offset
-
-        # Update manifest metadata for active segment
-        active_meta = self._manifest.segments[-1]
-        if active_meta.first_hash is None:
-            # First record in segment
-            active_meta.first_seq = seq
-            active_meta.first_hash = record_hash.hex()
-            # prev_hash_at_first was set when segment was created
-        active_meta.last_seq = seq
-        active_meta.last_hash = record_hash.hex()
-
-        return (seq, record_hash, self._manifest.active_segment)
+        with self._lock:
+            if self._closed:
+                raise SegmentedWALError("SegmentedWAL is closed")
+
+            # Check if we need to roll BEFORE writing
+            # (ensures each segment stays under max_bytes)
+            estimated_record_size = 82 + len(canonical_bytes)  # MIN_RECORD_SIZE + payload
+            if self._active_segment_size + estimated_record_size > self.max_bytes:
+                self._roll_segment()
+
+            # Write (or stage, for group commit) to active segment
+            writer = self._active_writer
+            record_offset = self._active_segment_size
+            seq, record_hash, offset = writer.append_nowait(canonical_bytes)
+            self._active_segment_size = offset
+
+            if self._active_index is not None:
+                if cell_id is None:
+                    cell_id = extract_cell_id(canonical_bytes)
+                self._active_index.add(seq, record_offset, offset - record_offset, cell_id)
+
+            # Update manifest metadata for active segment
+            active_meta = self._manifest.segments[-1]
+            if active_meta.first_hash is None:
+                # First record in segment
+                active_meta.first_seq = seq
+                active_meta.first_hash = record_hash.hex()
+                # prev_hash_at_first was set when segment was created
+            active_meta.last_seq = seq
+            active_meta.last_hash = record_hash.hex()
+            segment_id = self._manifest.active_segment
+
+        # A roll closes (and therefore drains) the old writer, so waiting on
+        # it after another thread rolled returns immediately.
+        writer.wait_durable(seq)
+        return (seq, record_hash, segment_id)
 
     def _roll_segment(self) -> None:
         """
@@ -650,6 +807,7 @@ class SegmentedWALWriter:
 
         # Close current segment
         self._active_writer.close()
+        self._write_active_index()
 
         # Mark current segment as sealed
         current_meta = self._manifest.segments[-1]
@@ -664,10 +822,14 @@ class SegmentedWALWriter:
             new_path,
             self._manifest.hash_scheme,
             self._manifest.graph_id,
+            fsync_policy=self._fsync_policy,
+            group_commit_window_ms=self._group_commit_window_ms,
+            group_commit_max_records=self._group_commit_max_records,
         )
 
         # Manually set the writer's state to continue the chain
         new_writer._next_sequence = next_seq
+        new_writer._durable_sequence = next_seq - 1
         new_writer._prev_hash = prev_hash
 
         # Update manifest
@@ -687,19 +849,33 @@ class SegmentedWALWriter:
         # Update internal state
         self._active_writer = new_writer
         self._active_segment_size = HEADER_SIZE
+        if self._index_interval is not None:
+            self._active_index = SegmentIndex(new_segment_id, self._index_interval)
+
+    def _write_active_index(self) -> None:
+        """Persist the active segment's index sidecar (if enabled)."""
+        if self._active_index is not None:
+            write_segment_index_atomic(
+                segment_path(self._wal_dir, self._manifest.active_segment),
+                self._active_index,
+            )
 
     def sync(self) -> None:
         """Force sync active segment and manifest."""
-        if not self._closed:
-            self._active_writer.sync()
-            write_manifest_atomic(self._wal_dir, self._manifest)
+        with self._lock:
+            if not self._closed:
+                self._active_writer.sync()
+                self._write_active_index()
+                write_manifest_atomic(self._wal_dir, self._manifest)
 
     def close(self) -> None:
         """Close the segmented WAL."""
-        if not self._closed:
-            self._active_writer.close()
-            write_manifest_atomic(self._wal_dir, self._manifest)
-            self._closed = True
+        with self._lock:
+            if not self._closed:
+                self._active_writer.close()
+                self._write_active_index()
+                write_manifest_atomic(self._wal_dir, self._manifest)
+                self._closed = True
 
     def __enter__(self) -> 'SegmentedWALWriter':
         return self
@@ -718,11 +894,15 @@ class SegmentedWALReader:
 
     Iterates records across all segments in order.
     Validates cross-segment hash chain continuity.
+
+    get(sequence) and get_cell(cell_id) seek via the index sidecars
+    (see wal_index) instead of scanning from segment 0.
     """
 
     def __init__(self, wal_dir: Path):
         self._wal_dir = Path(wal_dir)
         self._manifest: Optional[Manifest] = None
+        self._index: Optional[WALIndex] = None
 
     @property
     def wal_dir(self) -> Path:
@@ -737,6 +917,26 @@ class SegmentedWALReader:
                 self._manifest = rebuild_manifest_from_segments(self._wal_dir)
         return self._manifest
 
+    @property
+    def index(self) -> WALIndex:
+        """Get random-access index (loads sidecars, rebuilding missing ones)."""
+        if self._index is None:
+            self._index = WALIndex(self._wal_dir)
+        return self._index
+
+    def get(self, sequence: int) -> Optional[WALRecord]:
+        """
+        Read the record with ``sequence`` without scanning earlier records.
+
+        The record's CRC and cell hash are verified; the hash chain is not
+        (use validate()). Returns None if the sequence is not in the WAL.
+        """
+        return self.index.get(sequence)
+
+    def get_cell(self, cell_id: str) -> Optional[WALRecord]:
+        """Read the record carrying ``cell_id`` (None if not in the WAL)."""
+        return self.index.get_cell(cell_id)
+
     def __iter__(self) -> Iterator[WALRecord]:
         """
         Iterate all records across all segments.
@@ -778,22 +978,69 @@ class SegmentedWALReader:
                 yield record
                 prev_hash = record.compute_record_hash()
 
-    def validate(self) -> Tuple[int, bytes]:
+    def validate(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Tuple[int, bytes]:
         """
         Validate entire segmented WAL.
 
+        Args:
+            parallel: Verify segments concurrently in a process pool, then
+                      stitch the cross-segment prev_hash chain in order.
+                      Same result and same errors as the sequential pass.
+            max_workers: Pool size (defaults to os.cpu_count())
+
         Returns:
             Tuple of (last_sequence, last_record_hash)
             Returns (-1, NULL_HASH_BYTES) if empty
+
+        Raises:
+            WALChainError: If the hash chain breaks within or across segments
         """
+        segment_files = list_segment_files(self._wal_dir)
+        if not parallel or len(segment_files) < 2:
+            last_seq = -1
+            last_hash = NULL_HASH_BYTES
+
+            for record in self:
+                last_seq = record.sequence
+                last_hash = record.compute_record_hash()
+
+            return last_seq, last_hash
+
+        paths = [path for _, path in segment_files]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(verify_segment, paths))
+        return self._stitch(results)
+
+    @staticmethod
+    def _stitch(results: List[Optional[SegmentVerification]]) -> Tuple[int, bytes]:
+        """Check cross-segment continuity over per-segment verification results."""
         last_seq = -1
-        last_hash = NULL_HASH_BYTES
+        prev_hash = NULL_HASH_BYTES
 
-        for record in self:
-            last_seq = record.sequence
-            last_hash = record.compute_record_hash()
+        for result in results:
+            if result is None or result.record_count == 0:
+                continue
+            if result.prev_hash_at_first != prev_hash:
+                raise WALChainError(
+                    f"Hash chain break at seq {result.first_seq} in segment {result.segment_id}: "
+                    f"expected prev_hash={prev_hash.hex()[:16]}..., "
+                    f"got={result.prev_hash_at_first.hex()[:16]}..."
+                )
+            if result.chain_break is not None:
+                seq, expected, actual = result.chain_break
+                raise WALChainError(
+                    f"Hash chain break at seq {seq} in segment {result.segment_id}: "
+                    f"expected prev_hash={expected.hex()[:16]}..., "
+                    f"got={actual.hex()[:16]}..."
+                )
+            last_seq = result.last_seq
+            prev_hash = result.last_hash
 
-        return last_seq, last_hash
+        return last_seq, prev_hash
 
     def count(self) -> int:
         """Count total records across all segments."""
@@ -822,6 +1069,7 @@ __all__ = [
     # Data structures
     'SegmentMetadata',
     'Manifest',
+    'SegmentVerification',
 
     # Core classes
     'SegmentedWALWriter',
@@ -833,6 +1081,7 @@ __all__ = [
     'scan_segment',
     'scan_segment_boundaries',
     'rebuild_manifest_from_segments',
+    'verify_segment',
     'write_manifest_atomic',
     'read_manifest',
 ]
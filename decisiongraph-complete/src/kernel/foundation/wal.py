@@ -5,7 +5,7 @@ Append-only, crash-safe, hash-chained persistence for DecisionGraph cells.
 
 WAL GUARANTEES:
 1. Append-only: No rewrites, no reordering
-2. Crash-safe: fsync after each record (configurable)
+2. Crash-safe: fsync after each record, or per group commit (configurable)
 3. Replay-deterministic: fold([], records) = chain
 4. Hash-chained: prev_hash[n] = SHA256(record[n-1])
 5. Version-aware: Header locks hash_scheme for all records
@@ -39,12 +39,15 @@ RECORD_HASH (for chain linking):
 """
 
 import hashlib
+import mmap
 import os
 import struct
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from enum import IntFlag
 from pathlib import Path
-from typing import BinaryIO, Iterator, Optional, Tuple, Union
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 
 # Try to use hardware-accelerated CRC32C, fall back to zlib CRC32
 try:
@@ -71,6 +74,19 @@ MIN_RECORD_SIZE = 4 + 8 + 2 + 32 + 32 + 0 + 4  # record_len + seq + flags + prev
 MAX_RECORD_SIZE = 64 * 1024 * 1024  # 64MB default max
 NULL_HASH_BYTES = b'\x00' * 32
 
+# fsync policies:
+#   per_record - write + fsync inside every append (safe, slowest)
+#   group      - concurrent appends are batched into one write + fsync;
+#                append returns only after its batch is durable
+#   manual     - write only; durability on sync()/close() (fast, less safe)
+FSYNC_POLICIES = ("per_record", "group", "manual")
+DEFAULT_GROUP_COMMIT_WINDOW_MS = 2.0
+DEFAULT_GROUP_COMMIT_MAX_RECORDS = 256
+
+# Fixed-layout prefix: record_len, sequence, flags
+_RECORD_PREFIX = struct.Struct('<IQH')
+_U32 = struct.Struct('<I')
+
 
 class RecordFlags(IntFlag):
     """Record flags for future extensibility."""
@@ -204,6 +220,8 @@ class WALRecord:
     cell_hash: bytes  # 32 bytes
     canonical_bytes: bytes
     record_crc: int
+    # SHA-256 of the serialized record, when known at parse/create time
+    _record_hash: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     @property
     def record_len(self) -> int:
@@ -235,7 +253,12 @@ class WALRecord:
 
         record_hash = SHA256(record_len || sequence || flags || prev_hash ||
                             cell_hash || canonical_bytes || record_crc)
+
+        This is the hash of the serialized record, so records produced by
+        create()/from_buffer() carry it precomputed.
         """
+        if self._record_hash is not None:
+            return self._record_hash
         data = (
             struct.pack('<I', self.record_len) +
             struct.pack('<Q', self.sequence) +
@@ -257,14 +280,27 @@ class WALRecord:
         - CRC integrity
         - Sequence (if expected_sequence provided)
         """
-        if len(data) < MIN_RECORD_SIZE:
-            raise WALCorruptionError(f"Record too small: {len(data)} < {MIN_RECORD_SIZE}")
+        return WALRecord.from_buffer(data, expected_sequence)
 
-        record_len = struct.unpack('<I', data[0:4])[0]
+    @staticmethod
+    def from_buffer(buf, expected_sequence: Optional[int] = None) -> 'WALRecord':
+        """
+        Deserialize a record from any buffer (bytes, memoryview over an mmap).
+
+        CRC, cell hash and record hash are computed directly over slices of
+        ``buf``; only the hash fields and canonical_bytes are copied out.
+        Performs the same validation as from_bytes().
+        """
+        view = memoryview(buf)
+        size = view.nbytes
+        if size < MIN_RECORD_SIZE:
+            raise WALCorruptionError(f"Record too small: {size} < {MIN_RECORD_SIZE}")
 
-        if record_len != len(data):
+        record_len, sequence, raw_flags = _RECORD_PREFIX.unpack_from(view, 0)
+
+        if record_len != size:
             raise WALCorruptionError(
-                f"Record length mismatch: header says {record_len}, got {len(data)}"
+                f"Record length mismatch: header says {record_len}, got {size}"
             )
 
         if record_len > MAX_RECORD_SIZE:
@@ -272,15 +308,11 @@ class WALRecord:
                 f"Record too large: {record_len} > {MAX_RECORD_SIZE}"
             )
 
-        sequence = struct.unpack('<Q', data[4:12])[0]
-        flags = RecordFlags(struct.unpack('<H', data[12:14])[0])
-        prev_hash = data[14:46]
-        cell_hash = data[46:78]
-        canonical_bytes = data[78:-4]
-        stored_crc = struct.unpack('<I', data[-4:])[0]
+        body_end = size - 4
+        stored_crc = _U32.unpack_from(view, body_end)[0]
 
         # Verify CRC
-        computed_crc = compute_crc32c(data[:-4])
+        computed_crc = compute_crc32c(view[:body_end])
         if computed_crc != stored_crc:
             raise WALCorruptionError(
                 f"Record CRC mismatch at seq {sequence}: "
@@ -294,7 +326,8 @@ class WALRecord:
             )
 
         # Verify cell_hash matches canonical_bytes
-        computed_cell_hash = hashlib.sha256(canonical_bytes).digest()
+        cell_hash = bytes(view[46:78])
+        computed_cell_hash = hashlib.sha256(view[78:body_end]).digest()
         if computed_cell_hash != cell_hash:
             raise WALCorruptionError(
                 f"Cell hash mismatch at seq {sequence}: "
@@ -303,11 +336,12 @@ class WALRecord:
 
         return WALRecord(
             sequence=sequence,
-            flags=flags,
-            prev_hash=prev_hash,
+            flags=RecordFlags(raw_flags),
+            prev_hash=bytes(view[14:46]),
             cell_hash=cell_hash,
-            canonical_bytes=canonical_bytes,
+            canonical_bytes=bytes(view[78:body_end]),
             record_crc=stored_crc,
+            _record_hash=hashlib.sha256(view).digest(),
         )
 
     @staticmethod
@@ -350,6 +384,7 @@ class WALRecord:
             cell_hash=cell_hash,
             canonical_bytes=canonical_bytes,
             record_crc=record_crc,
+            _record_hash=hashlib.sha256(payload + _U32.pack(record_crc)).digest(),
         )
 
 
@@ -369,6 +404,18 @@ class WALWriter:
     Or with context manager:
         with WALWriter.create(path, hash_scheme, graph_id) as writer:
             writer.append(canonical_bytes)
+
+    Group commit (fsync_policy="group"):
+        Appends are staged in memory. The first caller waiting for durability
+        becomes the batch leader and writes the whole batch with one write()
+        and one fsync(); records staged meanwhile form the next batch. If the
+        previous batch held more than one record (concurrent writers), the
+        leader first waits up to group_commit_window_ms for the batch to grow
+        back to that size (capped at group_commit_max_records). A lone writer
+        never waits. Every caller returns only once its record is durable.
+        A failed group write is sticky: the writer rejects further appends.
+
+    The writer is thread-safe under all policies.
     """
 
     def __init__(
@@ -378,13 +425,34 @@ class WALWriter:
         next_sequence: int,
         prev_hash: bytes,
         fsync_policy: str = "per_record",
+        group_commit_window_ms: float = DEFAULT_GROUP_COMMIT_WINDOW_MS,
+        group_commit_max_records: int = DEFAULT_GROUP_COMMIT_MAX_RECORDS,
     ):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Unknown fsync_policy '{fsync_policy}'. Must be one of: {FSYNC_POLICIES}"
+            )
+        if group_commit_max_records < 1:
+            raise ValueError("group_commit_max_records must be at least 1")
+
         self._file = file
         self._header = header
         self._next_sequence = next_sequence
         self._prev_hash = prev_hash
         self._fsync_policy = fsync_policy
         self._closed = False
+        self._closing = False
+        self._offset = file.tell()
+
+        # Group commit state (guarded by _cond)
+        self._cond = threading.Condition()
+        self._group_window = group_commit_window_ms / 1000.0
+        self._group_max_records = group_commit_max_records
+        self._pending: List[bytes] = []
+        self._durable_sequence = next_sequence - 1
+        self._flushing = False
+        self._last_batch_size = 0
+        self._group_error: Optional[BaseException] = None
 
     @property
     def header(self) -> WALHeader:
@@ -398,12 +466,18 @@ class WALWriter:
     def prev_hash(self) -> bytes:
         return self._prev_hash
 
+    @property
+    def fsync_policy(self) -> str:
+        return self._fsync_policy
+
     @staticmethod
     def create(
         path: Union[str, Path],
         hash_scheme: str,
         graph_id: str,
         fsync_policy: str = "per_record",
+        group_commit_window_ms: float = DEFAULT_GROUP_COMMIT_WINDOW_MS,
+        group_commit_max_records: int = DEFAULT_GROUP_COMMIT_MAX_RECORDS,
     ) -> 'WALWriter':
         """
         Create a new WAL file.
@@ -412,7 +486,10 @@ class WALWriter:
             path: File path for WAL
             hash_scheme: Hash scheme (must match all cells)
             graph_id: Graph identifier
-            fsync_policy: "per_record" (safe) or "manual" (fast, less safe)
+            fsync_policy: "per_record" (safe), "group" (safe, batched) or
+                          "manual" (fast, less safe)
+            group_commit_window_ms: Max time a group leader waits for more records
+            group_commit_max_records: Batch size that triggers an immediate flush
 
         Returns:
             WALWriter instance
@@ -446,12 +523,16 @@ class WALWriter:
             next_sequence=0,
             prev_hash=NULL_HASH_BYTES,
             fsync_policy=fsync_policy,
+            group_commit_window_ms=group_commit_window_ms,
+            group_commit_max_records=group_commit_max_records,
         )
 
     @staticmethod
     def open(
         path: Union[str, Path],
         fsync_policy: str = "per_record",
+        group_commit_window_ms: float = DEFAULT_GROUP_COMMIT_WINDOW_MS,
+        group_commit_max_records: int = DEFAULT_GROUP_COMMIT_MAX_RECORDS,
     ) -> 'WALWriter':
         """
         Open an existing WAL file for appending.
@@ -461,6 +542,8 @@ class WALWriter:
         Args:
             path: Path to existing WAL file
             fsync_policy: Sync policy
+            group_commit_window_ms: Group commit latency window
+            group_commit_max_records: Group commit batch size
 
         Returns:
             WALWriter positioned at end
@@ -497,12 +580,17 @@ class WALWriter:
             next_sequence=last_sequence + 1,
             prev_hash=last_hash,
             fsync_policy=fsync_policy,
+            group_commit_window_ms=group_commit_window_ms,
+            group_commit_max_records=group_commit_max_records,
         )
 
     def append(self, canonical_bytes: bytes) -> Tuple[int, bytes, int]:
         """
         Append a cell to the WAL.
 
+        Under "per_record" and "group" the record is durable when this
+        returns; under "manual" it is durable after sync()/close().
+
         Args:
             canonical_bytes: RFC 8785 canonical cell bytes
 
@@ -510,55 +598,176 @@ class WALWriter:
             Tuple of (sequence, record_hash, file_offset_end)
 
         Raises:
-            WALError: If WAL is closed
+            WALError: If WAL is closed or a group commit failed
             ValueError: If canonical_bytes is empty
         """
-        if self._closed:
-            raise WALError("WAL is closed")
+        result = self.append_nowait(canonical_bytes)
+        self.wait_durable(result[0])
+        return result
+
+    def append_nowait(self, canonical_bytes: bytes) -> Tuple[int, bytes, int]:
+        """
+        Append a record without waiting for a group commit.
 
+        Identical to append() for "per_record" and "manual". Under "group"
+        the record is only staged; call wait_durable(sequence) before
+        acknowledging it. Lets callers (e.g. SegmentedWALWriter) release
+        their own locks before blocking on the batch fsync.
+
+        Returns:
+            Tuple of (sequence, record_hash, file_offset_end)
+        """
         if not canonical_bytes:
             raise ValueError("canonical_bytes cannot be empty")
 
-        # Create record
-        record = WALRecord.create(
-            sequence=self._next_sequence,
-            canonical_bytes=canonical_bytes,
-            prev_hash=self._prev_hash,
-        )
+        with self._cond:
+            if self._closed or self._closing:
+                raise WALError("WAL is closed")
+            self._check_group_error()
 
-        # Validate size
-        if record.record_len > MAX_RECORD_SIZE:
-            raise ValueError(f"Record too large: {record.record_len} > {MAX_RECORD_SIZE}")
+            # Create record
+            record = WALRecord.create(
+                sequence=self._next_sequence,
+                canonical_bytes=canonical_bytes,
+                prev_hash=self._prev_hash,
+            )
+
+            # Validate size
+            if record.record_len > MAX_RECORD_SIZE:
+                raise ValueError(f"Record too large: {record.record_len} > {MAX_RECORD_SIZE}")
+
+            record_bytes = record.to_bytes()
+
+            if self._fsync_policy == "group":
+                # Stage for the next batch and wake a leader waiting for it
+                self._pending.append(record_bytes)
+                self._cond.notify_all()
+            else:
+                # Write atomically
+                self._file.write(record_bytes)
+
+                # Sync based on policy
+                if self._fsync_policy == "per_record":
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+
+            # Update state
+            record_hash = record.compute_record_hash()
+            self._offset += len(record_bytes)
+            self._prev_hash = record_hash
+            self._next_sequence += 1
 
-        # Write atomically
-        record_bytes = record.to_bytes()
-        self._file.write(record_bytes)
+            return (record.sequence, record_hash, self._offset)
+
+    def wait_durable(self, sequence: int) -> None:
+        """
+        Block until the record with ``sequence`` is durable (group policy).
+
+        No-op for "per_record" (already durable) and "manual".
+
+        Raises:
+            WALError: If the group commit carrying this record failed
+        """
+        if self._fsync_policy != "group":
+            return
+        with self._cond:
+            while self._durable_sequence < sequence:
+                self._check_group_error()
+                if self._flushing:
+                    self._cond.wait()
+                    continue
+
+                # Become the leader for the next batch; only delay the
+                # flush when writers are actually arriving concurrently
+                self._flushing = True
+                try:
+                    target = min(self._last_batch_size, self._group_max_records)
+                    deadline = time.monotonic() + self._group_window
+                    while len(self._pending) < target:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    self._flush_pending_locked()
+                finally:
+                    self._flushing = False
+                    self._cond.notify_all()
+
+    def _check_group_error(self) -> None:
+        """Raise if an earlier group commit failed (caller holds _cond)."""
+        if self._group_error is not None:
+            raise WALError(f"WAL group commit failed: {self._group_error}")
+
+    def _flush_pending_locked(self) -> None:
+        """
+        Write and fsync the staged batch (caller holds _cond, _flushing set).
 
-        # Sync based on policy
-        if self._fsync_policy == "per_record":
+        The lock is released during I/O so other appends can stage the next
+        batch; _flushing keeps a second leader from writing concurrently.
+        """
+        batch = self._pending
+        if not batch:
+            return
+        last_sequence = self._next_sequence - 1
+        self._pending = []
+        self._last_batch_size = len(batch)
+
+        error: Optional[BaseException] = None
+        self._cond.release()
+        try:
+            self._file.write(b"".join(batch))
             self._file.flush()
             os.fsync(self._file.fileno())
+        except BaseException as e:
+            error = e
+        finally:
+            self._cond.acquire()
+
+        if error is not None:
+            self._group_error = error
+            raise WALError(f"WAL group commit failed: {error}") from error
+        self._durable_sequence = last_sequence
 
-        # Update state
-        record_hash = record.compute_record_hash()
-        offset_end = self._file.tell()
-        self._prev_hash = record_hash
-        self._next_sequence += 1
+    def _drain_locked(self) -> None:
+        """
+        Flush every staged group batch (caller holds _cond).
 
-        return (record.sequence, record_hash, offset_end)
+        Each flush releases the lock during I/O, so appends staged meanwhile
+        are picked up by the next pass; returns with nothing pending.
+        """
+        while self._flushing or self._pending:
+            if self._flushing:
+                self._cond.wait()
+                continue
+            self._flushing = True
+            try:
+                self._flush_pending_locked()
+            finally:
+                self._flushing = False
+                self._cond.notify_all()
 
     def sync(self) -> None:
-        """Force sync to disk."""
-        if not self._closed:
-            self._file.flush()
-            os.fsync(self._file.fileno())
+        """Force sync to disk (flushes any staged group batch first)."""
+        with self._cond:
+            if not self._closed:
+                self._drain_locked()
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._durable_sequence = self._next_sequence - 1
 
     def close(self) -> None:
-        """Close the WAL file."""
-        if not self._closed:
-            self.sync()
+        """Close the WAL file. Appends are rejected once close has begun."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closing = True
+            self._drain_locked()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._durable_sequence = self._next_sequence - 1
             self._file.close()
             self._closed = True
+            self._cond.notify_all()
 
     def __enter__(self) -> 'WALWriter':
         return self
@@ -605,6 +814,7 @@ class WALReader:
         path: Path,
         header: WALHeader,
         start_sequence: Optional[int] = 0,
+        start_offset: int = HEADER_SIZE,
     ) -> Iterator[Tuple[WALRecord, int]]:
         """
         Iterate records without chain validation.
@@ -618,46 +828,50 @@ class WALReader:
             start_sequence: Expected starting sequence number.
                            If None, sequence validation is skipped.
                            If 0 (default), expects sequences starting from 0.
+            start_offset: File offset of the first record to read (must be a
+                          record boundary, e.g. from an index sidecar).
+
+        The file is memory-mapped and each record is parsed from a
+        memoryview slice (no per-record read() syscalls or concatenation).
         """
         with open(path, 'rb') as f:
-            f.seek(HEADER_SIZE)
-            offset = HEADER_SIZE
-            expected_sequence = start_sequence
-
-            while True:
-                # Try to read record length
-                len_bytes = f.read(4)
-                if len(len_bytes) == 0:
-                    # Clean EOF
-                    break
-                if len(len_bytes) < 4:
-                    # Incomplete length - truncation point
-                    break
-
-                record_len = struct.unpack('<I', len_bytes)[0]
-
-                # Sanity checks
-                if record_len < MIN_RECORD_SIZE or record_len > MAX_RECORD_SIZE:
-                    # Corrupt length - truncation point
-                    break
-
-                # Read rest of record
-                rest_bytes = f.read(record_len - 4)
-                if len(rest_bytes) < record_len - 4:
-                    # Incomplete record - truncation point
-                    break
-
-                record_bytes = len_bytes + rest_bytes
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size <= max(HEADER_SIZE, start_offset):
+                # Header only (or less) - nothing to map
+                return
 
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
                 try:
-                    record = WALRecord.from_bytes(record_bytes, expected_sequence)
-                    yield record, offset
-                    offset += record_len
-                    if expected_sequence is not None:
-                        expected_sequence += 1
-                except (WALCorruptionError, WALSequenceError):
-                    # Corruption detected - truncation point
-                    break
+                    offset = start_offset
+                    expected_sequence = start_sequence
+
+                    # Fewer than 4 bytes left = clean EOF or truncated length
+                    while offset + 4 <= file_size:
+                        record_len = _U32.unpack_from(view, offset)[0]
+
+                        # Sanity checks
+                        if record_len < MIN_RECORD_SIZE or record_len > MAX_RECORD_SIZE:
+                            # Corrupt length - truncation point
+                            break
+
+                        end = offset + record_len
+                        if end > file_size:
+                            # Incomplete record - truncation point
+                            break
+
+                        try:
+                            record = WALRecord.from_buffer(view[offset:end], expected_sequence)
+                        except (WALCorruptionError, WALSequenceError):
+                            # Corruption detected - truncation point
+                            break
+
+                        yield record, offset
+                        offset = end
+                        if expected_sequence is not None:
+                            expected_sequence += 1
+                finally:
+                    view.release()
 
     def __iter__(self) -> Iterator[WALRecord]:
         """
@@ -773,6 +987,9 @@ __all__ = [
     'MAX_RECORD_SIZE',
     'NULL_HASH_BYTES',
     'CRC_IMPL',
+    'FSYNC_POLICIES',
+    'DEFAULT_GROUP_COMMIT_WINDOW_MS',
+    'DEFAULT_GROUP_COMMIT_MAX_RECORDS',
 
     # Flags
     'RecordFlags',
@@ -0,0 +1,454 @@
+"""
+DecisionGraph WAL Index Module
+
+Sparse random-access index sidecars for segmented WALs.
+
+Each segment file NNNNNNNN.wal gets a sidecar NNNNNNNN.idx holding:
+- the byte offset of the segment's first record and of every Kth sequence
+- cell_id -> byte offset for every record that carries a cell_id
+
+With these, SegmentedWALReader.get(sequence) and get_cell(cell_id) are a
+bisect plus at most K-1 record parses, instead of a scan from segment 0.
+
+DESIGN PRINCIPLES:
+1. Segment files are SOURCE OF TRUTH
+2. Sidecars are a CACHE (rebuilt by scanning a segment, like the manifest)
+3. The active segment's sidecar may lag its file; the tail is scanned on load
+4. Random-access reads verify each record (CRC, cell hash) but not the
+   hash chain - use SegmentedWALReader.validate() for that
+
+SIDECAR FORMAT (little-endian):
+    magic          8 bytes   b"DGWIDX\\x00\\x01"
+    version        2 bytes
+    interval       4 bytes   K
+    covered_end    8 bytes   file offset up to which records are indexed
+    last_seq       8 bytes   signed, -1 if the segment has no records
+    n_sparse       4 bytes
+    n_cells        4 bytes
+    sparse         n_sparse * (sequence 8 bytes, offset 8 bytes)
+    cells          n_cells * (cell_id 32 bytes, offset 8 bytes)
+    crc32c         4 bytes   over everything above
+
+cell_ids are stored as their 32 raw SHA-256 bytes; records whose cell_id is
+not a 64-char hex digest are not cell-indexed.
+"""
+
+import json
+import os
+import struct
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .wal import (
+    HEADER_SIZE,
+    WALError,
+    WALHeader,
+    WALHeaderError,
+    WALReader,
+    WALRecord,
+    compute_crc32c,
+)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+INDEX_MAGIC = b"DGWIDX\x00\x01"  # 8 bytes
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+DEFAULT_INDEX_INTERVAL = 64
+
+_INDEX_HEADER = struct.Struct('<8sHIQqII')
+_SPARSE_ENTRY = struct.Struct('<QQ')
+_CELL_ENTRY = struct.Struct('<32sQ')
+_CRC = struct.Struct('<I')
+
+
+class WALIndexError(WALError):
+    """Index sidecar is missing, corrupted or inconsistent."""
+    pass
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def index_path(segment_file: Path) -> Path:
+    """Get sidecar path for a segment file (NNNNNNNN.wal -> NNNNNNNN.idx)."""
+    return Path(segment_file).with_suffix(INDEX_SUFFIX)
+
+
+def extract_cell_id(canonical_bytes: bytes) -> Optional[str]:
+    """
+    Extract the top-level "cell_id" of a JSON record, if any.
+
+    Used when rebuilding sidecars from segments, and when a writer is not
+    given the cell_id explicitly.
+    """
+    try:
+        data = json.loads(canonical_bytes)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if isinstance(data, dict):
+        cell_id = data.get("cell_id")
+        if isinstance(cell_id, str):
+            return cell_id
+    return None
+
+
+def _cell_key(cell_id: Optional[str]) -> Optional[bytes]:
+    """Convert a hex cell_id to its 32-byte key (None if not a SHA-256 hex)."""
+    if cell_id is None or len(cell_id) != 64:
+        return None
+    try:
+        return bytes.fromhex(cell_id)
+    except ValueError:
+        return None
+
+
+# =============================================================================
+# SEGMENT INDEX
+# =============================================================================
+
+class SegmentIndex:
+    """
+    In-memory index of one segment, serializable to its sidecar.
+
+    Maintained incrementally by SegmentedWALWriter.append() and by
+    catch_up() when a sidecar lags its segment.
+    """
+
+    def __init__(self, segment_id: int, interval: int = DEFAULT_INDEX_INTERVAL):
+        if interval < 1:
+            raise ValueError("index interval must be at least 1")
+        self.segment_id = segment_id
+        self.interval = interval
+        self.covered_end = HEADER_SIZE
+        self.last_seq = -1
+        self.sparse_seqs: List[int] = []
+        self.sparse_offsets: List[int] = []
+        self.cells: Dict[bytes, int] = {}
+
+    @property
+    def first_seq(self) -> Optional[int]:
+        return self.sparse_seqs[0] if self.sparse_seqs else None
+
+    def add(self, sequence: int, offset: int, record_len: int, cell_id: Optional[str] = None) -> None:
+        """Index a record written at ``offset`` (must follow the covered range)."""
+        if not self.sparse_seqs or (sequence - self.sparse_seqs[0]) % self.interval == 0:
+            self.sparse_seqs.append(sequence)
+            self.sparse_offsets.append(offset)
+        key = _cell_key(cell_id)
+        if key is not None:
+            self.cells[key] = offset
+        self.last_seq = sequence
+        self.covered_end = offset + record_len
+
+    def locate(self, sequence: int) -> Optional[int]:
+        """Offset of the nearest indexed record at or before ``sequence``."""
+        if not self.sparse_seqs or sequence < self.sparse_seqs[0] or sequence > self.last_seq:
+            return None
+        i = bisect_right(self.sparse_seqs, sequence) - 1
+        return self.sparse_offsets[i]
+
+    def locate_cell(self, cell_id: str) -> Optional[int]:
+        """Offset of the record carrying ``cell_id``."""
+        key = _cell_key(cell_id)
+        return self.cells.get(key) if key is not None else None
+
+    def catch_up(self, segment_file: Path, header: WALHeader) -> int:
+        """
+        Index records past covered_end (active segment tail).
+
+        Returns:
+            Number of records added
+        """
+        added = 0
+        for record, offset in WALReader._iter_records_raw(
+            segment_file, header, start_sequence=None, start_offset=self.covered_end
+        ):
+            self.add(record.sequence, offset, record.record_len,
+                     extract_cell_id(record.canonical_bytes))
+            added += 1
+        return added
+
+    def to_bytes(self) -> bytes:
+        """Serialize to sidecar bytes."""
+        parts = [_INDEX_HEADER.pack(
+            INDEX_MAGIC,
+            INDEX_VERSION,
+            self.interval,
+            self.covered_end,
+            self.last_seq,
+            len(self.sparse_seqs),
+            len(self.cells),
+        )]
+        parts.extend(
+            _SPARSE_ENTRY.pack(seq, off)
+            for seq, off in zip(self.sparse_seqs, self.sparse_offsets)
+        )
+        parts.extend(_CELL_ENTRY.pack(key, off) for key, off in self.cells.items())
+        body = b"".join(parts)
+        return body + _CRC.pack(compute_crc32c(body))
+
+    @staticmethod
+    def from_bytes(data: bytes, segment_id: int) -> 'SegmentIndex':
+        """
+        Deserialize sidecar bytes.
+
+        Raises:
+            WALIndexError: If magic, version, CRC or sizes are invalid
+        """
+        if len(data) < _INDEX_HEADER.size + _CRC.size:
+            raise WALIndexError("Index sidecar too small")
+        body, stored_crc = data[:-4], _CRC.unpack_from(data, len(data) - 4)[0]
+        if compute_crc32c(body) != stored_crc:
+            raise WALIndexError("Index sidecar CRC mismatch")
+
+        magic, version, interval, covered_end, last_seq, n_sparse, n_cells = (
+            _INDEX_HEADER.unpack_from(body, 0)
+        )
+        if magic != INDEX_MAGIC:
+            raise WALIndexError(f"Invalid index magic: {magic!r}")
+        if version != INDEX_VERSION:
+            raise WALIndexError(f"Unsupported index version: {version}")
+        expected = _INDEX_HEADER.size + n_sparse * _SPARSE_ENTRY.size + n_cells * _CELL_ENTRY.size
+        if len(body) != expected:
+            raise WALIndexError(f"Index size mismatch: expected {expected}, got {len(body)}")
+
+        index = SegmentIndex(segment_id, interval)
+        index.covered_end = covered_end
+        index.last_seq = last_seq
+        pos = _INDEX_HEADER.size
+        for seq, off in _SPARSE_ENTRY.iter_unpack(body[pos:pos + n_sparse * _SPARSE_ENTRY.size]):
+            index.sparse_seqs.append(seq)
+            index.sparse_offsets.append(off)
+        pos += n_sparse * _SPARSE_ENTRY.size
+        index.cells = dict(_CELL_ENTRY.iter_unpack(body[pos:]))
+        return index
+
+
+# =============================================================================
+# SIDECAR I/O
+# =============================================================================
+
+def write_segment_index_atomic(segment_file: Path, index: SegmentIndex) -> None:
+    """Write a sidecar atomically (tmp file + rename)."""
+    target = index_path(segment_file)
+    tmp_file = target.with_name(target.name + ".tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(index.to_bytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, target)
+
+
+def read_segment_index(segment_file: Path) -> Optional[SegmentIndex]:
+    """Read a segment's sidecar. Returns None if missing or corrupted."""
+    target = index_path(segment_file)
+    if not target.exists():
+        return None
+    try:
+        return SegmentIndex.from_bytes(target.read_bytes(), int(Path(segment_file).stem))
+    except WALIndexError:
+        return None
+
+
+def _read_header(segment_file: Path) -> Optional[WALHeader]:
+    try:
+        with open(segment_file, 'rb') as f:
+            header_bytes = f.read(HEADER_SIZE)
+        if len(header_bytes) < HEADER_SIZE:
+            return None
+        return WALHeader.from_bytes(header_bytes)
+    except (OSError, WALHeaderError):
+        return None
+
+
+def rebuild_segment_index(
+    segment_file: Path,
+    interval: int = DEFAULT_INDEX_INTERVAL,
+) -> SegmentIndex:
+    """Build a segment's index from scratch by scanning the segment."""
+    segment_file = Path(segment_file)
+    index = SegmentIndex(int(segment_file.stem), interval)
+    header = _read_header(segment_file)
+    if header is not None:
+        index.catch_up(segment_file, header)
+    return index
+
+
+def load_segment_index(
+    segment_file: Path,
+    interval: int = DEFAULT_INDEX_INTERVAL,
+) -> SegmentIndex:
+    """
+    Load a segment's index, repairing it against the segment file.
+
+    - Missing/corrupt sidecar: rebuilt by scanning the segment
+    - Sidecar beyond end of file (segment was truncated): rebuilt
+    - Sidecar behind end of file (active segment): tail is scanned
+    """
+    segment_file = Path(segment_file)
+    index = read_segment_index(segment_file)
+    if index is None or index.covered_end > segment_file.stat().st_size:
+        return rebuild_segment_index(segment_file, interval)
+    if index.covered_end < segment_file.stat().st_size:
+        header = _read_header(segment_file)
+        if header is not None:
+            index.catch_up(segment_file, header)
+    return index
+
+
+def rebuild_indexes_from_segments(
+    wal_dir: Path,
+    interval: int = DEFAULT_INDEX_INTERVAL,
+) -> int:
+    """
+    Rebuild and write every sidecar in a WAL directory.
+
+    Returns:
+        Number of sidecars written
+    """
+    written = 0
+    for segment_file in sorted(Path(wal_dir).glob("*.wal")):
+        if not segment_file.stem.isdigit():
+            continue
+        write_segment_index_atomic(segment_file, rebuild_segment_index(segment_file, interval))
+        written += 1
+    return written
+
+
+# =============================================================================
+# WAL INDEX (ALL SEGMENTS)
+# =============================================================================
+
+class WALIndex:
+    """
+    Random-access index over all segments of a WAL directory.
+
+    Usage:
+        index = WALIndex(wal_dir)
+        record = index.get(sequence)
+        record = index.get_cell(cell_id)
+    """
+
+    def __init__(self, wal_dir: Path, interval: int = DEFAULT_INDEX_INTERVAL):
+        self._wal_dir = Path(wal_dir)
+        self._interval = interval
+        self._segments: Dict[int, SegmentIndex] = {}
+        self._paths: Dict[int, Path] = {}
+        self._first_seqs: List[int] = []
+        self._first_ids: List[int] = []
+        self._cells: Dict[bytes, Tuple[int, int]] = {}
+        self.refresh()
+
+    @property
+    def segments(self) -> Dict[int, SegmentIndex]:
+        return self._segments
+
+    def refresh(self) -> None:
+        """Load new segments and catch up the last known one."""
+        segment_files = sorted(
+            (int(p.stem), p) for p in self._wal_dir.glob("*.wal") if p.stem.isdigit()
+        )
+        known_last = max(self._segments) if self._segments else None
+        for segment_id, path in segment_files:
+            if segment_id in self._segments and segment_id != known_last:
+                continue
+            if segment_id == known_last:
+                seg_index = self._segments[segment_id]
+                header = _read_header(path)
+                if header is not None and seg_index.covered_end < path.stat().st_size:
+                    seg_index.catch_up(path, header)
+            else:
+                seg_index = load_segment_index(path, self._interval)
+                self._segments[segment_id] = seg_index
+                self._paths[segment_id] = path
+            for key, offset in seg_index.cells.items():
+                self._cells[key] = (segment_id, offset)
+
+        firsts = sorted(
+            (idx.first_seq, seg_id) for seg_id, idx in self._segments.items()
+            if idx.first_seq is not None
+        )
+        self._first_seqs = [seq for seq, _ in firsts]
+        self._first_ids = [seg_id for _, seg_id in firsts]
+
+    def locate(self, sequence: int) -> Optional[Tuple[int, int]]:
+        """(segment_id, offset) of the nearest indexed record at or before ``sequence``."""
+        i = bisect_right(self._first_seqs, sequence) - 1
+        if i < 0:
+            return None
+        segment_id = self._first_ids[i]
+        offset = self._segments[segment_id].locate(sequence)
+        return (segment_id, offset) if offset is not None else None
+
+    def locate_cell(self, cell_id: str) -> Optional[Tuple[int, int]]:
+        """(segment_id, offset) of the record carrying ``cell_id``."""
+        key = _cell_key(cell_id)
+        return self._cells.get(key) if key is not None else None
+
+    def get(self, sequence: int) -> Optional[WALRecord]:
+        """Read the record with ``sequence`` (None if not in the WAL)."""
+        location = self.locate(sequence)
+        if location is None:
+            self.refresh()
+            location = self.locate(sequence)
+            if location is None:
+                return None
+        segment_id, offset = location
+        for record, _ in WALReader._iter_records_raw(
+            self._paths[segment_id], None, start_sequence=None, start_offset=offset
+        ):
+            if record.sequence == sequence:
+                return record
+            if record.sequence > sequence:
+                break
+        return None
+
+    def get_cell(self, cell_id: str) -> Optional[WALRecord]:
+        """Read the record carrying ``cell_id`` (None if not indexed)."""
+        location = self.locate_cell(cell_id)
+        if location is None:
+            self.refresh()
+            location = self.locate_cell(cell_id)
+            if location is None:
+                return None
+        segment_id, offset = location
+        for record, _ in WALReader._iter_records_raw(
+            self._paths[segment_id], None, start_sequence=None, start_offset=offset
+        ):
+            return record
+        return None
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+__all__ = [
+    # Constants
+    'INDEX_MAGIC',
+    'INDEX_VERSION',
+    'INDEX_SUFFIX',
+    'DEFAULT_INDEX_INTERVAL',
+
+    # Exceptions
+    'WALIndexError',
+
+    # Core classes
+    'SegmentIndex',
+    'WALIndex',
+
+    # Utilities
+    'index_path',
+    'extract_cell_id',
+    'write_segment_index_atomic',
+    'read_segment_index',
+    'rebuild_segment_index',
+    'load_segment_index',
+    'rebuild_indexes_from_segments',
+]
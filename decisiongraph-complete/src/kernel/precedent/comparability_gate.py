@@ -14,15 +14,20 @@ Gate rules:
   4. Missing gate field → broadest class fallback + warning.
   5. Gates are defined in the DomainRegistry, not hardcoded.
   6. Excluded precedents do not exist for confidence calculations.
+
+GateClassIndex applies the same rules without per-pair evaluation: each
+precedent's gate classes are computed once into a tuple key, and a case
+is matched by looking its compatible class tuples up in a dictionary.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Optional
 
-from kernel.precedent.domain_registry import DomainRegistry
+from kernel.precedent.domain_registry import ComparabilityGate, DomainRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -197,6 +202,118 @@ def extract_gate_facts_from_precedent(
     return gate_facts
 
 
+# ---------------------------------------------------------------------------
+# Gate-class inverted index
+# ---------------------------------------------------------------------------
+
+# A gate key holds one entry per gate: the class name, or None for a present
+# but unclassifiable value (which passes that gate against anything).
+GateKey = tuple[Optional[str], ...]
+
+
+def _gate_class(gate: ComparabilityGate, value: Any, source: str) -> str | None:
+    """Class used for gating, with evaluate_gates() fallbacks (Rules 2 and 4)."""
+    if value is None:
+        broadest = gate.broadest_class()
+        logger.warning(
+            "Gate field '%s' missing from %s; using broadest class '%s' as fallback",
+            gate.field, source, broadest,
+        )
+        return broadest
+    return gate.classify(value)
+
+
+def _compatible(case_key: GateKey, prec_key: GateKey) -> bool:
+    return all(
+        c is None or p is None or c == p
+        for c, p in zip(case_key, prec_key)
+    )
+
+
+class GateClassIndex:
+    """Precedents bucketed by their tuple of gate classes.
+
+    add() classifies a precedent once (at load) and files it under its
+    gate key. compatible() returns the set of stored keys that pass every
+    gate for a case, computed over the distinct keys (a handful of class
+    combinations) rather than over the precedents. Layer 1 filtering is
+    then one set lookup per precedent, with the same outcome as
+    evaluate_gates(). Precedents are keyed by precedent_id.
+    """
+
+    def __init__(self, domain: DomainRegistry) -> None:
+        self.domain = domain
+        self._gates = list(domain.comparability_gates)
+        self._keys: dict[str, GateKey] = {}
+        self._buckets: dict[GateKey, list[str]] = {}
+        self._compatible_cache: dict[GateKey, frozenset[GateKey]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def gate_key(self, gate_facts: dict[str, Any], source: str = "precedent") -> GateKey:
+        """Gate classes for a gate-facts dict, one per gate."""
+        return tuple(
+            _gate_class(gate, gate_facts.get(gate.field), source)
+            for gate in self._gates
+        )
+
+    def add(self, key: str, gate_facts: dict[str, Any]) -> GateKey:
+        """Index a precedent's gate facts; returns its gate key."""
+        gate_key = self._keys.get(key)
+        if gate_key is not None:
+            return gate_key
+        gate_key = self.gate_key(gate_facts)
+        with self._lock:
+            if key not in self._keys:
+                self._keys[key] = gate_key
+                if gate_key not in self._buckets:
+                    self._buckets[gate_key] = []
+                    self._compatible_cache.clear()
+                self._buckets[gate_key].append(key)
+        return gate_key
+
+    def add_payload(self, payload: Any) -> GateKey:
+        """add() a JudgmentPayload by precedent_id."""
+        gate_key = self._keys.get(payload.precedent_id)
+        if gate_key is not None:
+            return gate_key
+        return self.add(payload.precedent_id, extract_gate_facts_from_precedent(
+            {af.field_id: af.value for af in payload.anchor_facts},
+            jurisdiction_code=payload.jurisdiction_code,
+            disposition_basis=getattr(payload, "disposition_basis", "UNKNOWN"),
+        ))
+
+    def key_of(self, key: str) -> GateKey | None:
+        """Gate key of an indexed precedent, or None."""
+        return self._keys.get(key)
+
+    def compatible(self, case_gate_facts: dict[str, Any]) -> frozenset[GateKey]:
+        """Stored gate keys whose precedents pass every gate for this case.
+
+        Covers the precedents added so far: add() candidates before asking.
+        """
+        case_key = self.gate_key(case_gate_facts, source="case")
+        cached = self._compatible_cache.get(case_key)
+        if cached is None:
+            with self._lock:
+                cached = frozenset(
+                    prec_key for prec_key in self._buckets
+                    if _compatible(case_key, prec_key)
+                )
+                self._compatible_cache[case_key] = cached
+        return cached
+
+    def candidates(self, case_gate_facts: dict[str, Any]) -> list[str]:
+        """Keys of all indexed precedents that pass the gates for this case."""
+        return [
+            key
+            for gate_key in self.compatible(case_gate_facts)
+            for key in self._buckets[gate_key]
+        ]
+
+
 # ---------------------------------------------------------------------------
 # Exports
 # ---------------------------------------------------------------------------
@@ -206,4 +323,6 @@ __all__ = [
     "evaluate_gates",
     "extract_gate_facts_from_case",
     "extract_gate_facts_from_precedent",
+    "GateKey",
+    "GateClassIndex",
 ]
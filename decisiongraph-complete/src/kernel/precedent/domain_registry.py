@@ -15,6 +15,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 
@@ -77,6 +78,15 @@ _LEVEL_ORDER: dict[ConfidenceLevel, int] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Value normalization
+# ---------------------------------------------------------------------------
+
+def normalize_value(value: Any) -> str:
+    """Normalize a raw value for class/ordinal lookup: lowercased, stripped string."""
+    return str(value).lower().strip()
+
+
 # ---------------------------------------------------------------------------
 # Core data structures
 # ---------------------------------------------------------------------------
@@ -109,6 +119,23 @@ class FieldDefinition:
         if self.comparison == ComparisonFn.STEP and not self.ordered_values:
             raise ValueError(f"STEP comparison requires ordered_values for {self.name}")
 
+    @cached_property
+    def class_of(self) -> dict[str, str]:
+        """Normalized value -> equivalence class (a later class wins a shared value)."""
+        return {
+            normalize_value(member): class_name
+            for class_name, members in self.equivalence_classes.items()
+            for member in members
+        }
+
+    @cached_property
+    def index_of(self) -> dict[str, int]:
+        """Normalized value -> position in ordered_values (first occurrence wins)."""
+        lookup: dict[str, int] = {}
+        for i, value in enumerate(self.ordered_values):
+            lookup.setdefault(normalize_value(value), i)
+        return lookup
+
 
 @dataclass(frozen=True)
 class ComparabilityGate:
@@ -120,19 +147,28 @@ class ComparabilityGate:
     field: str                                      # field name (may be a virtual field like "jurisdiction_regime")
     equivalence_classes: dict[str, list[str]]       # class_name -> [raw values...]
 
+    @cached_property
+    def class_of(self) -> dict[str, str]:
+        """Normalized value -> class name (the first class listing a value wins)."""
+        lookup: dict[str, str] = {}
+        for class_name, members in self.equivalence_classes.items():
+            for member in members:
+                lookup.setdefault(normalize_value(member), class_name)
+        return lookup
+
     def classify(self, value: Any) -> str | None:
         """Return the equivalence class name for a value, or None if not found."""
         if value is None:
             return None
-        v = str(value).lower().strip()
-        for class_name, members in self.equivalence_classes.items():
-            if v in [str(m).lower().strip() for m in members]:
-                return class_name
-        return None
+        return self.class_of.get(normalize_value(value))
+
+    @cached_property
+    def _broadest(self) -> str:
+        return max(self.equivalence_classes, key=lambda k: len(self.equivalence_classes[k]))
 
     def broadest_class(self) -> str:
         """Return the class with the most members (fallback for missing fields)."""
-        return max(self.equivalence_classes, key=lambda k: len(self.equivalence_classes[k]))
+        return self._broadest
 
 
 @dataclass
@@ -190,6 +226,7 @@ class DomainRegistry:
 # ---------------------------------------------------------------------------
 
 __all__ = [
+    "normalize_value",
     "FieldType",
     "ComparisonFn",
     "FieldTier",
@@ -8,14 +8,16 @@ Each function compares a case value to a precedent value and returns
 a similarity score in [0.0, 1.0].
 
 The dispatcher compare_field() reads a FieldDefinition and routes
-to the correct comparison function automatically.
+to the correct comparison function automatically, using the field's
+precompiled value->class and value->index lookups (FieldDefinition.class_of
+/ index_of) instead of re-normalizing the class and ordinal lists per call.
 """
 
 from __future__ import annotations
 
 from typing import Any
 
-from kernel.precedent.domain_registry import ComparisonFn, FieldDefinition
+from kernel.precedent.domain_registry import ComparisonFn, FieldDefinition, normalize_value
 
 
 # ---------------------------------------------------------------------------
@@ -47,17 +49,21 @@ def compare_equivalence_class(
     """
     if case_value is None or prec_value is None:
         return 0.0
-    case_str = str(case_value).lower().strip()
-    prec_str = str(prec_value).lower().strip()
-
-    case_class = None
-    prec_class = None
-    for class_name, members in classes.items():
-        lower_members = [str(m).lower().strip() for m in members]
-        if case_str in lower_members:
-            case_class = class_name
-        if prec_str in lower_members:
-            prec_class = class_name
+    class_of = {
+        normalize_value(m): class_name
+        for class_name, members in classes.items()
+        for m in members
+    }
+    return _match_class(case_value, prec_value, class_of)
+
+
+def _match_class(case_value: Any, prec_value: Any, class_of: dict[str, str]) -> float:
+    """EQUIVALENCE_CLASS against a precompiled value->class lookup."""
+    case_str = normalize_value(case_value)
+    prec_str = normalize_value(prec_value)
+
+    case_class = class_of.get(case_str)
+    prec_class = class_of.get(prec_str)
 
     if case_class is None or prec_class is None:
         # Unknown value — fall back to exact match
@@ -102,18 +108,28 @@ def compare_step(
     if not ordered_values:
         return 1.0 if case_value == prec_value else 0.0
 
-    lower_ordered = [str(v).lower().strip() for v in ordered_values]
-    case_str = str(case_value).lower().strip()
-    prec_str = str(prec_value).lower().strip()
+    index_of: dict[str, int] = {}
+    for i, v in enumerate(ordered_values):
+        index_of.setdefault(normalize_value(v), i)
+    return _match_step(case_value, prec_value, index_of, len(ordered_values) - 1)
 
-    try:
-        case_idx = lower_ordered.index(case_str)
-        prec_idx = lower_ordered.index(prec_str)
-    except ValueError:
+
+def _match_step(
+    case_value: Any,
+    prec_value: Any,
+    index_of: dict[str, int],
+    max_steps: int,
+) -> float:
+    """STEP against a precompiled value->index lookup."""
+    case_str = normalize_value(case_value)
+    prec_str = normalize_value(prec_value)
+
+    case_idx = index_of.get(case_str)
+    prec_idx = index_of.get(prec_str)
+    if case_idx is None or prec_idx is None:
         # Value not in ordered list — fall back to exact match
         return 1.0 if case_str == prec_str else 0.0
 
-    max_steps = len(ordered_values) - 1
     if max_steps <= 0:
         return 1.0
     return max(0.0, 1.0 - abs(case_idx - prec_idx) / max_steps)
@@ -163,9 +179,7 @@ def compare_field(
         return compare_exact(case_value, prec_value)
 
     if fn == ComparisonFn.EQUIVALENCE_CLASS:
-        return compare_equivalence_class(
-            case_value, prec_value, field_def.equivalence_classes,
-        )
+        return _match_class(case_value, prec_value, field_def.class_of)
 
     if fn == ComparisonFn.DISTANCE_DECAY:
         return compare_distance_decay(
@@ -173,8 +187,10 @@ def compare_field(
         )
 
     if fn == ComparisonFn.STEP:
-        return compare_step(
-            case_value, prec_value, field_def.ordered_values,
+        if not field_def.ordered_values:
+            return compare_step(case_value, prec_value, field_def.ordered_values)
+        return _match_step(
+            case_value, prec_value, field_def.index_of, len(field_def.ordered_values) - 1,
         )
 
     if fn == ComparisonFn.JACCARD:
@@ -0,0 +1,406 @@
+"""
+Precedent Feature Matrix — columnar, vectorized v3 Layer 2 scoring.
+
+score_similarity() compares one case to one precedent, field by field,
+through compare_field(). Scoring a case against a pool that way costs
+(precedents x fields) Python calls. PrecedentMatrix encodes each
+precedent once, when it is added, into one column per scoring field:
+
+  EXACT              value ids (case-folded strings)
+  EQUIVALENCE_CLASS  class ids, plus value ids for unclassified values
+  STEP               ordinal indexes, plus value ids for unknown values
+  DISTANCE_DECAY     float64 values (NaN when not numeric)
+  JACCARD            membership bitmap (precedent x element)
+
+It also keeps a presence mask and a decision-driver mask per field. A case
+is then scored against any subset of the pool with NumPy array operations.
+The scores and non-transferable flags are identical to score_similarity(),
+including the floating-point summation order. The full SimilarityResult
+breakdown is built only for the rows that need it (similarity()).
+
+A value the encoders cannot represent exactly (e.g. unhashable, or a
+float that overflows) marks that cell for per-pair compare_field(), so the
+results never differ from the reference scorer. NumPy is optional: without
+it, score() falls back to score_similarity() per row.
+
+Rows are keyed by precedent_id. A JUDGMENT's payload never changes after
+it is appended, so a precedent is encoded once per process even when the
+registry re-parses it on every query.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from typing import Any, Iterable, Optional
+
+from kernel.precedent.domain_registry import (
+    ComparisonFn,
+    DomainRegistry,
+    FieldDefinition,
+    normalize_value,
+)
+from kernel.precedent.field_comparators import compare_field
+from kernel.precedent.precedent_scorer import (
+    SimilarityResult,
+    anchor_facts_to_dict,
+    score_similarity,
+)
+
+# Optional vectorized backend
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Tags case-folded strings in EXACT keys, so they never collide with a
+# tuple value
+_STR = object()
+
+# Value id / class id / ordinal meaning "absent or not encodable"
+_NO_ID = -1
+
+
+def _exact_key(value: Any) -> Any:
+    """Hashable key with compare_exact() equality, or raise TypeError."""
+    if isinstance(value, str):
+        return (_STR, value.lower().strip())
+    if isinstance(value, float) and math.isnan(value):
+        raise TypeError("NaN never equals itself")
+    hash(value)
+    return value
+
+
+class _Column:
+    """Encoded values of one scoring field, one entry per matrix row."""
+
+    def __init__(self, fd: FieldDefinition) -> None:
+        self.fd = fd
+        self.kind = fd.comparison
+        self.present: list[bool] = []
+        self.driver: list[bool] = []
+        self.fallback: list[bool] = []
+        self.codes: list[Any] = []      # value id, float, or element ids (JACCARD)
+        self.aux: list[int] = []        # class id (EQUIVALENCE_CLASS) / ordinal (STEP)
+        self.vocab: dict[Any, int] = {}
+        self.arrays: dict[str, Any] = {}
+
+        if self.kind == ComparisonFn.EQUIVALENCE_CLASS:
+            class_ids = {name: i for i, name in enumerate(fd.equivalence_classes)}
+            self.classes = {value: class_ids[name] for value, name in fd.class_of.items()}
+
+    def _id(self, key: Any, add: bool) -> int:
+        found = self.vocab.get(key)
+        if found is None:
+            if not add:
+                return _NO_ID
+            found = self.vocab[key] = len(self.vocab)
+        return found
+
+    def encode(self, value: Any, add: bool = True) -> tuple[Any, int]:
+        """(code, aux) for a value; raises if the value needs compare_field()."""
+        kind = self.kind
+        if kind == ComparisonFn.EXACT:
+            return self._id(_exact_key(value), add), _NO_ID
+        if kind == ComparisonFn.EQUIVALENCE_CLASS:
+            folded = normalize_value(value)
+            return self._id(folded, add), self.classes.get(folded, _NO_ID)
+        if kind == ComparisonFn.STEP:
+            folded = normalize_value(value)
+            return self._id(folded, add), self.fd.index_of.get(folded, _NO_ID)
+        if kind == ComparisonFn.DISTANCE_DECAY:
+            try:
+                return float(value), _NO_ID
+            except (TypeError, ValueError):
+                return math.nan, _NO_ID  # scores 0.0, like the comparator
+        if kind == ComparisonFn.JACCARD:
+            elements = value if isinstance(value, set) else set(value)
+            return sorted({self._id(e, add) for e in elements}), len(elements)
+        raise ValueError(f"Unknown comparison function: {kind} for field {self.fd.name}")
+
+    def append(self, value: Any, is_driver: bool) -> None:
+        code, aux, fallback = _NO_ID, _NO_ID, False
+        if value is not None:
+            try:
+                code, aux = self.encode(value)
+            except Exception:
+                fallback = True
+        if self.kind == ComparisonFn.JACCARD and (value is None or fallback):
+            code, aux = [], 0
+        self.present.append(value is not None)
+        self.driver.append(is_driver)
+        self.fallback.append(fallback)
+        self.codes.append(code)
+        self.aux.append(aux)
+
+    def compile(self) -> None:
+        """Materialize the row lists as arrays."""
+        arrays = {
+            "present": np.array(self.present, dtype=bool),
+            "driver": np.array(self.driver, dtype=bool),
+            "fallback": np.array(self.fallback, dtype=bool),
+        }
+        if self.kind == ComparisonFn.DISTANCE_DECAY:
+            arrays["codes"] = np.array(
+                [c if isinstance(c, float) else math.nan for c in self.codes], dtype=np.float64,
+            )
+        elif self.kind == ComparisonFn.JACCARD:
+            bitmap = np.zeros((len(self.codes), len(self.vocab)), dtype=np.uint8)
+            for row, element_ids in enumerate(self.codes):
+                bitmap[row, element_ids] = 1
+            arrays["bitmap"] = bitmap
+            arrays["sizes"] = np.array(self.aux, dtype=np.int64)
+        else:
+            arrays["codes"] = np.array(self.codes, dtype=np.int64)
+            arrays["aux"] = np.array(self.aux, dtype=np.int64)
+        self.arrays = arrays
+
+    def scores(self, case_value: Any, rows: Any) -> Optional[Any]:
+        """
+        Vectorized compare_field(case_value, row value) for ``rows``.
+
+        Entries for absent rows are meaningless (the caller masks them).
+        Returns None when the case value itself needs compare_field().
+        """
+        try:
+            code, aux = self.encode(case_value, add=False)
+        except Exception:
+            return None
+
+        a = self.arrays
+        kind = self.kind
+        if kind == ComparisonFn.EXACT:
+            return (a["codes"][rows] == code).astype(np.float64) if code != _NO_ID \
+                else np.zeros(len(rows))
+
+        if kind in (ComparisonFn.EQUIVALENCE_CLASS, ComparisonFn.STEP):
+            if aux == _NO_ID:
+                # Unknown case value: plain folded-string equality
+                if code == _NO_ID:
+                    return np.zeros(len(rows))
+                return (a["codes"][rows] == code).astype(np.float64)
+            other = a["aux"][rows]
+            known = other != _NO_ID
+            if kind == ComparisonFn.EQUIVALENCE_CLASS:
+                return (known & (other == aux)).astype(np.float64)
+            max_steps = len(self.fd.ordered_values) - 1
+            if max_steps <= 0:
+                return known.astype(np.float64)
+            step = 1.0 - np.abs(aux - other) / max_steps
+            return np.where(known & (step > 0.0), step, 0.0)
+
+        if kind == ComparisonFn.DISTANCE_DECAY:
+            other = a["codes"][rows]
+            max_distance = self.fd.max_distance
+            with np.errstate(invalid="ignore"):
+                if max_distance <= 0:
+                    return (other == code).astype(np.float64)
+                decay = 1.0 - np.abs(code - other) / max_distance
+            return np.where(decay > 0.0, decay, 0.0)  # NaN -> 0.0, like max()
+
+        # JACCARD: intersections from the bitmap columns of the case's elements.
+        # Ids at or past the compiled width were added after compile(), so
+        # no compiled row holds them; they only count toward the union.
+        case_size = aux
+        width = a["bitmap"].shape[1]
+        known_ids = [i for i in code if 0 <= i < width]
+        inter = a["bitmap"][np.ix_(rows, known_ids)].sum(axis=1, dtype=np.int64) \
+            if known_ids else np.zeros(len(rows), dtype=np.int64)
+        union = a["sizes"][rows] + case_size - inter
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(union > 0, inter / np.where(union > 0, union, 1), 1.0)
+
+
+class PrecedentMatrix:
+    """
+    Columnar encoding of a precedent pool for one DomainRegistry.
+
+    Rows are appended (add / add_payload) and never change; arrays are
+    rebuilt lazily on the first score() after new rows arrive.
+
+    Examples:
+        >>> matrix = PrecedentMatrix(domain)
+        >>> rows = [matrix.add_payload(p) for p in payloads]
+        >>> scores, non_transferable = matrix.score(case_facts, rows)
+        >>> breakdown = matrix.similarity(rows[0], case_facts)
+    """
+
+    def __init__(self, domain: DomainRegistry) -> None:
+        self.domain = domain
+        self._fields = domain.get_scoring_fields()
+        self._columns = [_Column(fd) for fd in self._fields]
+        self._rows: dict[str, int] = {}
+        self._facts: list[dict[str, Any]] = []
+        self._drivers: list[list[str]] = []
+        self._compiled = -1  # rows covered by the column arrays
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._facts)
+
+    @property
+    def vectorized(self) -> bool:
+        """True when NumPy is available."""
+        return np is not None
+
+    def add(self, key: str, facts: dict[str, Any], drivers: Optional[list[str]] = None) -> int:
+        """
+        Encode a precedent and return its row (existing row if key is known).
+
+        Args:
+            key: Stable precedent identity (precedent_id)
+            facts: Precedent field values (canonical names)
+            drivers: Decision-driver field names for the precedent
+        """
+        row = self._rows.get(key)
+        if row is not None:
+            return row
+        with self._lock:
+            row = self._rows.get(key)
+            if row is not None:
+                return row
+            driver_set = set(drivers or [])
+            for column in self._columns:
+                column.append(facts.get(column.fd.name), column.fd.name in driver_set)
+            row = len(self._facts)
+            self._facts.append(facts)
+            self._drivers.append(list(drivers or []))
+            self._rows[key] = row
+            return row
+
+    def add_payload(self, payload: Any) -> int:
+        """add() a JudgmentPayload by precedent_id, from its anchor facts."""
+        row = self._rows.get(payload.precedent_id)
+        if row is not None:
+            return row
+        return self.add(
+            payload.precedent_id,
+            anchor_facts_to_dict(payload.anchor_facts),
+            getattr(payload, "decision_drivers", []) or [],
+        )
+
+    def _sync(self) -> None:
+        if self._compiled == len(self._facts):
+            return
+        with self._lock:
+            if self._compiled != len(self._facts):
+                for column in self._columns:
+                    column.compile()
+                self._compiled = len(self._facts)
+
+    def score(
+        self,
+        case_facts: dict[str, Any],
+        rows: Optional[Iterable[int]] = None,
+    ) -> tuple[Any, Any]:
+        """
+        Score a case against ``rows`` (all rows by default).
+
+        Returns:
+            (scores, non_transferable), aligned with ``rows``: float64 and
+            bool arrays with NumPy, lists without. Each entry equals
+            score_similarity(...).score / .non_transferable for that row.
+        """
+        rows = list(range(len(self._facts))) if rows is None else list(rows)
+        if np is None:
+            results = [self.similarity(row, case_facts) for row in rows]
+            return [r.score for r in results], [r.non_transferable for r in results]
+
+        self._sync()
+        idx = np.array(rows, dtype=np.int64)
+        raw = np.zeros(len(idx))
+        total = np.zeros(len(idx))
+        non_transferable = np.zeros(len(idx), dtype=bool)
+
+        for column in self._columns:
+            fd = column.fd
+            present = column.arrays["present"][idx]
+            driver = column.arrays["driver"][idx]
+            case_val = case_facts.get(fd.name)
+            if case_val is None:
+                # Driver absent from case (precedent has it) -> non-transferable
+                non_transferable |= present & driver
+                continue
+
+            scores = self._column_scores(column, case_val, idx, rows)
+            weight = fd.weight * np.where(driver, 2.0, 1.0)
+            raw += np.where(present, weight * scores, 0.0)
+            total += np.where(present, weight, 0.0)
+            non_transferable |= present & driver & (scores == 0.0)
+
+        normalized = np.where(total > 0, raw / np.where(total > 0, total, 1.0), 0.0)
+        return normalized, non_transferable
+
+    def _column_scores(self, column: _Column, case_val: Any, idx: Any, rows: list[int]) -> Any:
+        """compare_field() of one field for ``rows``, vectorized where possible."""
+        fd = column.fd
+        scores = column.scores(case_val, idx)
+        if scores is None:
+            return np.array([
+                compare_field(fd, case_val, self._facts[row].get(fd.name)) for row in rows
+            ])
+        for pos in np.flatnonzero(column.arrays["fallback"][idx]):
+            scores[pos] = compare_field(fd, case_val, self._facts[rows[pos]].get(fd.name))
+        return scores
+
+    def upper_bounds(
+        self,
+        case_facts: dict[str, Any],
+        rows: Optional[Iterable[int]] = None,
+        probe_weight: float = 0.5,
+    ) -> Any:
+        """
+        Upper bounds on score() for ``rows``, cheaper than scoring.
+
+        The normalizing weight of a row depends only on which fields are
+        present and which are drivers, so it is exact. The heaviest
+        fields, up to ``probe_weight`` of the domain's scoring weight, are
+        compared exactly. Every other field is assumed to match fully.
+
+        Fields are summed in weight order rather than domain order, so a
+        bound can sit an ulp below the exact score; callers add a slack.
+
+        Returns:
+            Bounds aligned with ``rows`` (1.0 for every row without NumPy)
+        """
+        rows = list(range(len(self._facts))) if rows is None else list(rows)
+        if np is None:
+            return [1.0] * len(rows)
+
+        self._sync()
+        idx = np.array(rows, dtype=np.int64)
+        raw = np.zeros(len(idx))
+        total = np.zeros(len(idx))
+
+        budget = probe_weight * sum(c.fd.weight for c in self._columns)
+        for column in sorted(self._columns, key=lambda c: -c.fd.weight):
+            fd = column.fd
+            case_val = case_facts.get(fd.name)
+            if case_val is None:
+                continue
+            present = column.arrays["present"][idx]
+            weight = np.where(present, fd.weight * np.where(column.arrays["driver"][idx], 2.0, 1.0), 0.0)
+            total += weight
+            if budget > 0.0:
+                raw += weight * self._column_scores(column, case_val, idx, rows)
+                budget -= fd.weight
+            else:
+                raw += weight
+
+        return np.where(total > 0, raw / np.where(total > 0, total, 1.0), 0.0)
+
+    def similarity(self, row: int, case_facts: dict[str, Any]) -> SimilarityResult:
+        """The full score_similarity() breakdown for one row."""
+        return score_similarity(
+            self.domain, case_facts, self._facts[row], precedent_drivers=self._drivers[row],
+        )
+
+
+# ---------------------------------------------------------------------------
+# Exports
+# ---------------------------------------------------------------------------
+
+__all__ = [
+    "PrecedentMatrix",
+]
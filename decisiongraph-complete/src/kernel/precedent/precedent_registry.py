@@ -7,6 +7,7 @@ The registry provides a stateless query layer for JUDGMENT cells in the chain.
 Key components:
 - PrecedentStatistics: Aggregated statistics for a set of precedents
 - PrecedentRegistry: Stateless chain-sourced precedent lookup
+- IndexedPrecedentRegistry: Opt-in variant backed by incremental postings lists
 
 Design Principles:
 - Stateless: Always rebuilds from chain state (no caching)
@@ -39,9 +40,12 @@ Usage Example:
 
 from __future__ import annotations
 
+import threading
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, TYPE_CHECKING
+from heapq import merge
+from typing import Any, Iterable, Optional, TYPE_CHECKING
 
 from kernel.foundation.cell import CellType, DecisionCell, validate_timestamp
 from kernel.foundation.judgment import JudgmentPayload, parse_judgment_payload, is_judgment_cell
@@ -153,6 +157,51 @@ class PrecedentStatistics:
         }
 
 
+def compute_precedent_statistics(payloads: Iterable[JudgmentPayload]) -> PrecedentStatistics:
+    """
+    Aggregate PrecedentStatistics over payloads in a single pass.
+
+    Args:
+        payloads: JUDGMENT payloads to aggregate (any iterable)
+
+    Returns:
+        PrecedentStatistics (empty if no payloads)
+    """
+    stats = PrecedentStatistics()
+
+    for payload in payloads:
+        stats.total_matched += 1
+
+        # Count by outcome
+        outcome = payload.outcome_code
+        stats.by_outcome[outcome] = stats.by_outcome.get(outcome, 0) + 1
+
+        # Count by decision level
+        level = payload.decision_level
+        stats.by_decision_level[level] = stats.by_decision_level.get(level, 0) + 1
+
+        # Appeal statistics
+        if payload.appealed:
+            stats.appeal_stats.total_appealed += 1
+            if payload.appeal_outcome == "upheld":
+                stats.appeal_stats.upheld += 1
+            elif payload.appeal_outcome == "overturned":
+                stats.appeal_stats.overturned += 1
+            elif payload.appeal_outcome == "settled":
+                stats.appeal_stats.settled += 1
+            elif payload.appeal_outcome == "pending":
+                stats.appeal_stats.pending += 1
+
+        # Track temporal range
+        decided_at = payload.decided_at
+        if stats.most_recent_decided_at is None or decided_at > stats.most_recent_decided_at:
+            stats.most_recent_decided_at = decided_at
+        if stats.oldest_decided_at is None or decided_at < stats.oldest_decided_at:
+            stats.oldest_decided_at = decided_at
+
+    return stats
+
+
 # =============================================================================
 # Precedent Registry
 # =============================================================================
@@ -369,41 +418,7 @@ class PrecedentRegistry:
             PrecedentStatistics for matching precedents
         """
         matches = self.find_by_fingerprint(fingerprint_hash, namespace_prefix, as_of)
-
-        if not matches:
-            return PrecedentStatistics()
-
-        stats = PrecedentStatistics(total_matched=len(matches))
-
-        for payload in matches:
-            # Count by outcome
-            outcome = payload.outcome_code
-            stats.by_outcome[outcome] = stats.by_outcome.get(outcome, 0) + 1
-
-            # Count by decision level
-            level = payload.decision_level
-            stats.by_decision_level[level] = stats.by_decision_level.get(level, 0) + 1
-
-            # Appeal statistics
-            if payload.appealed:
-                stats.appeal_stats.total_appealed += 1
-                if payload.appeal_outcome == "upheld":
-                    stats.appeal_stats.upheld += 1
-                elif payload.appeal_outcome == "overturned":
-                    stats.appeal_stats.overturned += 1
-                elif payload.appeal_outcome == "settled":
-                    stats.appeal_stats.settled += 1
-                elif payload.appeal_outcome == "pending":
-                    stats.appeal_stats.pending += 1
-
-            # Track temporal range
-            decided_at = payload.decided_at
-            if stats.most_recent_decided_at is None or decided_at > stats.most_recent_decided_at:
-                stats.most_recent_decided_at = decided_at
-            if stats.oldest_decided_at is None or decided_at < stats.oldest_decided_at:
-                stats.oldest_decided_at = decided_at
-
-        return stats
+        return compute_precedent_statistics(matches)
 
     def get_statistics_by_codes(
         self,
@@ -424,45 +439,43 @@ class PrecedentRegistry:
         Returns:
             PrecedentStatistics for matching precedents
         """
-        matches = self.find_by_exclusion_codes(
+        _, stats = self.find_with_statistics_by_codes(
             exclusion_codes, namespace_prefix, min_overlap=min_overlap, as_of=as_of
         )
+        return stats
 
-        if not matches:
-            return PrecedentStatistics()
+    def find_with_statistics_by_codes(
+        self,
+        codes: list[str],
+        namespace_prefix: str,
+        outcome: Optional[str] = None,
+        min_overlap: int = 1,
+        as_of: Optional[str] = None,
+    ) -> tuple[list[tuple[JudgmentPayload, int]], PrecedentStatistics]:
+        """
+        Find precedents by exclusion codes and aggregate their statistics.
 
-        payloads = [payload for payload, _ in matches]
-        stats = PrecedentStatistics(total_matched=len(payloads))
+        Equivalent to calling find_by_exclusion_codes() followed by
+        get_statistics_by_codes() with the same arguments, but the chain is
+        scanned (and payloads parsed) only once.
 
-        for payload in payloads:
-            # Count by outcome
-            outcome = payload.outcome_code
-            stats.by_outcome[outcome] = stats.by_outcome.get(outcome, 0) + 1
-
-            # Count by decision level
-            level = payload.decision_level
-            stats.by_decision_level[level] = stats.by_decision_level.get(level, 0) + 1
-
-            # Appeal statistics
-            if payload.appealed:
-                stats.appeal_stats.total_appealed += 1
-                if payload.appeal_outcome == "upheld":
-                    stats.appeal_stats.upheld += 1
-                elif payload.appeal_outcome == "overturned":
-                    stats.appeal_stats.overturned += 1
-                elif payload.appeal_outcome == "settled":
-                    stats.appeal_stats.settled += 1
-                elif payload.appeal_outcome == "pending":
-                    stats.appeal_stats.pending += 1
-
-            # Track temporal range
-            decided_at = payload.decided_at
-            if stats.most_recent_decided_at is None or decided_at > stats.most_recent_decided_at:
-                stats.most_recent_decided_at = decided_at
-            if stats.oldest_decided_at is None or decided_at < stats.oldest_decided_at:
-                stats.oldest_decided_at = decided_at
+        Args:
+            codes: List of exclusion codes to match
+            namespace_prefix: Namespace prefix to search
+            outcome: If provided, only match precedents with this outcome
+            min_overlap: Minimum number of codes that must overlap
+            as_of: Bitemporal cutoff timestamp
 
-        return stats
+        Returns:
+            Tuple of (matches sorted as find_by_exclusion_codes, PrecedentStatistics)
+        """
+        matches = self.find_by_exclusion_codes(
+            codes, namespace_prefix, outcome=outcome, min_overlap=min_overlap, as_of=as_of
+        )
+        return matches, compute_precedent_statistics(payload for payload, _ in matches)
+
+    # Alias: banking domain uses "signal_codes" instead of "exclusion_codes"
+    find_with_statistics_by_signal_codes = find_with_statistics_by_codes
 
     def count_by_outcome(
         self,
@@ -538,6 +551,304 @@ class PrecedentRegistry:
         return payloads
 
 
+# =============================================================================
+# Indexed Precedent Registry
+# =============================================================================
+
+class IndexedPrecedentRegistry(PrecedentRegistry):
+    """
+    PrecedentRegistry backed by incrementally maintained inverted indexes.
+
+    Same public API and result ordering as PrecedentRegistry, but every
+    JUDGMENT payload is parsed exactly once and queries are answered from
+    postings lists instead of a full chain scan.
+
+    The chain remains the source of truth: the registry keeps a high-water
+    mark into ``chain.cells`` and indexes any cells appended past it before
+    answering each query. Because the chain is append-only, postings lists
+    are always in chain order, which preserves the stateless ordering
+    semantics exactly.
+
+    Indexes (entry ids are positions in the parsed-payload list):
+    - fingerprint_hash -> ids
+    - exclusion code -> ids
+    - reason code -> ids
+    - namespace -> ids (prefix queries merge the matching namespaces)
+    - outcome_code -> ids
+    - system_time array for ``as_of`` bisection
+
+    Examples:
+        >>> registry = IndexedPrecedentRegistry(chain)
+        >>> chain.append(judgment_cell)  # picked up on the next query
+        >>> matches = registry.find_by_fingerprint(fp_hash, "claims")
+    """
+
+    def __init__(self, chain: Chain) -> None:
+        """
+        Create an IndexedPrecedentRegistry and index the current chain.
+
+        Args:
+            chain: The Chain instance to index and query
+        """
+        super().__init__(chain)
+        self._lock = threading.Lock()
+        self._high_water_mark = 0
+        self._payloads: list[JudgmentPayload] = []
+        self._namespaces: list[str] = []
+        self._system_times: list[str] = []
+        self._times_monotonic = True
+        self._by_fingerprint: dict[str, list[int]] = {}
+        self._by_exclusion_code: dict[str, list[int]] = {}
+        self._by_reason_code: dict[str, list[int]] = {}
+        self._by_namespace: dict[str, list[int]] = {}
+        self._by_outcome: dict[str, list[int]] = {}
+        self._prefix_cache: dict[str, frozenset[str]] = {}
+        self.refresh()
+
+    @property
+    def indexed_count(self) -> int:
+        """Number of JUDGMENT payloads currently indexed."""
+        return len(self._payloads)
+
+    def refresh(self) -> int:
+        """
+        Index cells appended to the chain since the last refresh.
+
+        Called automatically before every query; cost is O(new cells).
+
+        Returns:
+            Number of JUDGMENT payloads added to the index
+        """
+        cells = self.chain.cells
+        if self._high_water_mark >= len(cells):
+            return 0
+
+        with self._lock:
+            added = 0
+            end = len(cells)
+            if self._high_water_mark >= end:
+                return 0
+            for position in range(self._high_water_mark, end):
+                if self._index_cell(cells[position]):
+                    added += 1
+            self._high_water_mark = end
+            return added
+
+    def _index_cell(self, cell: DecisionCell) -> bool:
+        """Parse one cell and add it to every index. Returns True if indexed."""
+        if not is_judgment_cell(cell):
+            return False
+        try:
+            payload = parse_judgment_payload(cell)
+        except Exception:
+            # Skip malformed JUDGMENT cells (same as the stateless scan)
+            return False
+
+        entry_id = len(self._payloads)
+        namespace = cell.fact.namespace
+        system_time = cell.header.system_time
+
+        if self._system_times and system_time < self._system_times[-1]:
+            self._times_monotonic = False
+
+        self._payloads.append(payload)
+        self._namespaces.append(namespace)
+        self._system_times.append(system_time)
+
+        self._by_fingerprint.setdefault(payload.fingerprint_hash, []).append(entry_id)
+        for code in set(payload.exclusion_codes):
+            self._by_exclusion_code.setdefault(code, []).append(entry_id)
+        for code in set(payload.reason_codes):
+            self._by_reason_code.setdefault(code, []).append(entry_id)
+        self._by_outcome.setdefault(payload.outcome_code, []).append(entry_id)
+
+        if namespace not in self._by_namespace:
+            self._by_namespace[namespace] = []
+            self._prefix_cache.clear()
+        self._by_namespace[namespace].append(entry_id)
+        return True
+
+    def _matching_namespaces(self, namespace_prefix: str) -> frozenset[str]:
+        """Indexed namespaces selected by a prefix (same rule as the scan)."""
+        with self._lock:
+            # Under the lock: a refresh adding a namespace must not interleave
+            # with computing (or storing) the cached set
+            cached = self._prefix_cache.get(namespace_prefix)
+            if cached is None:
+                cached = frozenset(
+                    ns for ns in self._by_namespace if ns.startswith(namespace_prefix)
+                )
+                self._prefix_cache[namespace_prefix] = cached
+            return cached
+
+    def _prepare(
+        self,
+        namespace_prefix: str,
+        as_of: Optional[str],
+    ) -> tuple[frozenset[str], int]:
+        """
+        Validate query arguments, sync the index and resolve filters.
+
+        Returns:
+            (matching namespaces, system_time cutoff). Entries with id below
+            the cutoff satisfy ``as_of`` when system_times are monotonic;
+            otherwise the cutoff is the index size and ``_visible`` checks
+            each entry individually.
+        """
+        if as_of is not None and not validate_timestamp(as_of):
+            raise InvalidQueryError(f"Invalid as_of timestamp format: {as_of}")
+
+        self.refresh()
+
+        cutoff = len(self._payloads)
+        if as_of is not None and self._times_monotonic:
+            cutoff = bisect_right(self._system_times, as_of)
+        return self._matching_namespaces(namespace_prefix), cutoff
+
+    def _visible(
+        self,
+        entry_id: int,
+        namespaces: frozenset[str],
+        cutoff: int,
+        as_of: Optional[str],
+    ) -> bool:
+        """Check namespace and bitemporal constraints for one entry."""
+        if entry_id >= cutoff:
+            return False
+        if self._namespaces[entry_id] not in namespaces:
+            return False
+        if as_of is not None and not self._times_monotonic:
+            return self._system_times[entry_id] <= as_of
+        return True
+
+    def _overlap_counts(
+        self,
+        codes: set[str],
+        postings: dict[str, list[int]],
+    ) -> dict[int, int]:
+        """Count how many of ``codes`` each entry carries."""
+        counts: dict[int, int] = {}
+        for code in codes:
+            for entry_id in postings.get(code, ()):
+                counts[entry_id] = counts.get(entry_id, 0) + 1
+        return counts
+
+    def find_by_fingerprint(
+        self,
+        fingerprint_hash: str,
+        namespace_prefix: str,
+        as_of: Optional[str] = None,
+    ) -> list[JudgmentPayload]:
+        """Find precedents with exact fingerprint match (Tier 0), via index."""
+        if not fingerprint_hash:
+            raise InvalidQueryError("fingerprint_hash cannot be empty")
+        if len(fingerprint_hash) != 64:
+            raise InvalidQueryError("fingerprint_hash must be 64-character hex string")
+
+        namespaces, cutoff = self._prepare(namespace_prefix, as_of)
+        return [
+            self._payloads[entry_id]
+            for entry_id in self._by_fingerprint.get(fingerprint_hash, ())
+            if self._visible(entry_id, namespaces, cutoff, as_of)
+        ]
+
+    def find_by_exclusion_codes(
+        self,
+        codes: list[str],
+        namespace_prefix: str,
+        outcome: Optional[str] = None,
+        min_overlap: int = 1,
+        as_of: Optional[str] = None,
+    ) -> list[tuple[JudgmentPayload, int]]:
+        """Find precedents with overlapping exclusion codes (Tier 0.5/1), via index."""
+        if not codes:
+            raise InvalidQueryError("codes cannot be empty")
+        if min_overlap < 1:
+            raise InvalidQueryError("min_overlap must be at least 1")
+
+        namespaces, cutoff = self._prepare(namespace_prefix, as_of)
+        counts = self._overlap_counts(set(codes), self._by_exclusion_code)
+
+        results: list[tuple[JudgmentPayload, int]] = []
+        for entry_id in sorted(counts):
+            overlap = counts[entry_id]
+            if overlap < min_overlap:
+                continue
+            if not self._visible(entry_id, namespaces, cutoff, as_of):
+                continue
+            payload = self._payloads[entry_id]
+            if outcome is not None and payload.outcome_code != outcome:
+                continue
+            results.append((payload, overlap))
+
+        # Same ordering as the stateless scan
+        results.sort(key=lambda x: (-x[1], x[0].decided_at), reverse=False)
+        results.sort(key=lambda x: x[1], reverse=True)
+
+        return results
+
+    def find_by_reason_codes(
+        self,
+        reason_codes: list[str],
+        namespace_prefix: str,
+        min_overlap: int = 1,
+        as_of: Optional[str] = None,
+    ) -> list[tuple[JudgmentPayload, int]]:
+        """Find precedents with overlapping reason codes, via index."""
+        if not reason_codes:
+            raise InvalidQueryError("reason_codes cannot be empty")
+        if min_overlap < 1:
+            raise InvalidQueryError("min_overlap must be at least 1")
+
+        namespaces, cutoff = self._prepare(namespace_prefix, as_of)
+        counts = self._overlap_counts(set(reason_codes), self._by_reason_code)
+
+        results: list[tuple[JudgmentPayload, int]] = []
+        for entry_id in sorted(counts):
+            overlap = counts[entry_id]
+            if overlap >= min_overlap and self._visible(entry_id, namespaces, cutoff, as_of):
+                results.append((self._payloads[entry_id], overlap))
+
+        results.sort(key=lambda x: x[1], reverse=True)
+        return results
+
+    find_by_signal_codes = find_by_exclusion_codes
+
+    def count_by_outcome(
+        self,
+        namespace_prefix: str,
+        as_of: Optional[str] = None,
+    ) -> dict[str, int]:
+        """Count all precedents by outcome code, via the outcome index."""
+        namespaces, cutoff = self._prepare(namespace_prefix, as_of)
+        with self._lock:
+            # Snapshot postings: concurrent refreshes append to them
+            postings = [(outcome, entry_ids[:]) for outcome, entry_ids in self._by_outcome.items()]
+        counts: dict[str, int] = {}
+        for outcome, entry_ids in postings:
+            matched = sum(
+                1 for entry_id in entry_ids
+                if self._visible(entry_id, namespaces, cutoff, as_of)
+            )
+            if matched:
+                counts[outcome] = matched
+        return counts
+
+    def _scan_judgment_cells(
+        self,
+        namespace_prefix: str,
+        as_of: Optional[str] = None,
+    ) -> list[JudgmentPayload]:
+        """Return indexed payloads for a namespace prefix in chain order."""
+        namespaces, cutoff = self._prepare(namespace_prefix, as_of)
+        postings = [self._by_namespace[ns] for ns in sorted(namespaces)]
+        return [
+            self._payloads[entry_id]
+            for entry_id in merge(*postings)
+            if self._visible(entry_id, namespaces, cutoff, as_of)
+        ]
+
+
 # =============================================================================
 # Exports
 # =============================================================================
@@ -550,7 +861,9 @@ __all__ = [
     # Data classes
     "AppealStatistics",
     "PrecedentStatistics",
+    "compute_precedent_statistics",
 
     # Registry
     "PrecedentRegistry",
+    "IndexedPrecedentRegistry",
 ]
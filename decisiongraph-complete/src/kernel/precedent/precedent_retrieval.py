@@ -0,0 +1,229 @@
+"""
+Top-K Precedent Retrieval — bucketed selection with score upper bounds.
+
+Precedent samples are stratified: the best ``cap`` matches of each
+classification bucket (e.g. 35 supporting, 10 contrary, 15 neutral),
+ranked by score. Sorting the whole scored pool to take those few is
+wasted work:
+
+  BucketedTopK keeps one bounded heap per bucket. It selects exactly
+  what a stable descending sort followed by per-bucket caps selects.
+
+  retrieve_top_k() also avoids scoring most of the pool. It takes cheap
+  upper bounds from PrecedentMatrix.upper_bounds() (exact normalizing
+  weights, exact scores for the heaviest fields, the remaining domain
+  weight assumed to match). Precedents whose bound is below the
+  similarity floor are dropped. The rest are scored in batches, highest
+  bound first, and scoring stops once no remaining bound can beat the
+  current K-th best of any bucket the precedent could land in.
+
+Work then grows with the caps rather than with the pool, while the
+selection is identical to scoring every precedent.
+
+Pool-level statistics (average similarity, confidence inputs) still need
+every score; callers that report them score the pool with
+PrecedentMatrix.score() and use BucketedTopK for the sample.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from kernel.precedent.precedent_matrix import PrecedentMatrix
+
+# Added to every bound so float rounding can never prune a selectable row
+BOUND_SLACK = 1e-9
+
+DEFAULT_BATCH_SIZE = 64
+
+
+# ---------------------------------------------------------------------------
+# Bounded per-bucket heaps
+# ---------------------------------------------------------------------------
+
+class BucketedTopK:
+    """The ``cap`` highest-ranked items of each bucket.
+
+    Equivalent to stable-sorting every offered item by rank (descending)
+    and keeping the first ``cap`` per bucket: on equal rank, the lower
+    ``order`` wins. Items offered to a bucket without a cap are dropped.
+    """
+
+    def __init__(self, caps: dict[str, int]) -> None:
+        self.caps = dict(caps)
+        self._heaps: dict[str, list[tuple[float, int, Any]]] = {b: [] for b in self.caps}
+
+    def offer(self, bucket: str, rank: float, order: int, item: Any) -> bool:
+        """Keep ``item`` if it is among the bucket's best so far."""
+        heap = self._heaps.get(bucket)
+        cap = self.caps.get(bucket, 0)
+        if heap is None or cap <= 0:
+            return False
+        entry = (rank, -order, item)  # orders are unique, so items never compare
+        if len(heap) < cap:
+            heapq.heappush(heap, entry)
+            return True
+        if (rank, -order) > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+            return True
+        return False
+
+    def is_full(self, bucket: str) -> bool:
+        return len(self._heaps.get(bucket, ())) >= self.caps.get(bucket, 0)
+
+    def may_enter(self, bucket: str, rank_bound: float) -> bool:
+        """False only if no item ranked at most ``rank_bound`` can enter."""
+        if self.caps.get(bucket, 0) <= 0:
+            return False
+        heap = self._heaps[bucket]
+        return len(heap) < self.caps[bucket] or rank_bound >= heap[0][0]
+
+    def ranked(self, bucket: str) -> list[Any]:
+        """Kept items of one bucket, best first."""
+        return [item for _, _, item in sorted(self._heaps.get(bucket, ()), reverse=True)]
+
+    def selected(self, limit: Optional[int] = None) -> list[Any]:
+        """Buckets concatenated in caps order, each best first, cut at ``limit``."""
+        items = [item for bucket in self.caps for item in self.ranked(bucket)]
+        return items if limit is None else items[:limit]
+
+    def counts(self) -> dict[str, int]:
+        return {bucket: len(heap) for bucket, heap in self._heaps.items()}
+
+
+# ---------------------------------------------------------------------------
+# Retrieval
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class RetrievedPrecedent:
+    """One selected precedent."""
+    position: int               # index into the rows passed to retrieve_top_k
+    row: int                    # PrecedentMatrix row
+    score: float                # exact similarity (== score_similarity().score)
+    non_transferable: bool
+    bucket: str
+    rank: float
+
+
+@dataclass
+class RetrievalResult:
+    """Selected precedents plus how much of the pool had to be scored."""
+    selected: list[RetrievedPrecedent]
+    counts: dict[str, int]
+    scored: int
+    pruned: int
+
+
+def retrieve_top_k(
+    matrix: PrecedentMatrix,
+    case_facts: dict[str, Any],
+    rows: Sequence[int],
+    caps: dict[str, int],
+    bucket_of: Callable[[int, float, bool], Optional[str]],
+    floor: float = 0.0,
+    limit: Optional[int] = None,
+    rank_of: Optional[Callable[[int, float], float]] = None,
+    rank_weights: Optional[Sequence[float]] = None,
+    possible_buckets: Optional[Callable[[int], Iterable[str]]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    probe_weight: float = 0.5,
+) -> RetrievalResult:
+    """
+    Select the stratified top-K of ``rows`` without scoring the whole pool.
+
+    The result equals scoring every row, dropping scores below ``floor``,
+    stable-sorting by rank and keeping ``caps[bucket]`` per bucket.
+
+    Args:
+        matrix: Encoded precedent pool
+        case_facts: Case field values (canonical names)
+        rows: Candidate matrix rows; their positions break rank ties
+        caps: Bucket -> maximum kept, in output order
+        bucket_of: (position, score, non_transferable) -> bucket, or None
+            to drop the precedent
+        floor: Minimum similarity score
+        limit: Maximum total selected (applied after the caps)
+        rank_of: (position, score) -> rank; the score by default
+        rank_weights: Per-position w with rank_of(p, s) <= s * w, used to
+            bound ranks (required for pruning when rank_of is given)
+        possible_buckets: position -> buckets bucket_of can return for it,
+            which lets a precedent be skipped once those buckets are full
+        batch_size: Precedents scored per vectorized batch
+        probe_weight: Share of domain weight compared exactly for bounds
+    """
+    if rank_of is None:
+        rank_of = lambda position, score: score  # noqa: E731
+    elif rank_weights is None:
+        # Ranks cannot be bounded: the similarity floor is the only pruning
+        rank_weights = [float("inf")] * len(rows)
+
+    bounds = matrix.upper_bounds(case_facts, rows, probe_weight)
+    limits: list[float] = []
+    candidates: list[int] = []
+    for position, bound in enumerate(bounds):
+        bound = float(bound) + BOUND_SLACK
+        weight = 1.0 if rank_weights is None else rank_weights[position]
+        limits.append(bound * weight * (1.0 + BOUND_SLACK) if weight else 0.0)
+        if bound >= floor:
+            candidates.append(position)
+    candidates.sort(key=lambda p: -limits[p])
+
+    heaps = BucketedTopK(caps)
+    open_buckets = [b for b, cap in caps.items() if cap > 0]
+    scored = 0
+
+    def flush(batch: list[int]) -> None:
+        scores, non_transferable = matrix.score(case_facts, [rows[p] for p in batch])
+        for position, score, nt in zip(batch, scores, non_transferable):
+            score, nt = float(score), bool(nt)
+            if score < floor:
+                continue
+            bucket = bucket_of(position, score, nt)
+            if bucket is None:
+                continue
+            rank = rank_of(position, score)
+            heaps.offer(bucket, rank, position, RetrievedPrecedent(
+                position=position, row=rows[position], score=score,
+                non_transferable=nt, bucket=bucket, rank=rank,
+            ))
+
+    batch: list[int] = []
+    for position in candidates:
+        limit_rank = limits[position]
+        if not any(heaps.may_enter(b, limit_rank) for b in open_buckets):
+            break  # candidates are in descending bound order
+        if possible_buckets is not None and not any(
+            heaps.may_enter(b, limit_rank) for b in possible_buckets(position)
+        ):
+            continue
+        batch.append(position)
+        if len(batch) >= batch_size:
+            flush(batch)
+            scored += len(batch)
+            batch = []
+    if batch:
+        flush(batch)
+        scored += len(batch)
+
+    return RetrievalResult(
+        selected=heaps.selected(limit),
+        counts=heaps.counts(),
+        scored=scored,
+        pruned=len(rows) - scored,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Exports
+# ---------------------------------------------------------------------------
+
+__all__ = [
+    "BOUND_SLACK",
+    "BucketedTopK",
+    "RetrievedPrecedent",
+    "RetrievalResult",
+    "retrieve_top_k",
+]
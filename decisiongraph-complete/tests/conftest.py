@@ -14,3 +14,26 @@ sys.path.insert(0, str(_ROOT))
 
 # Allow ``from main import ...`` (main.py lives inside service/)
 sys.path.insert(0, str(_ROOT / "service"))
+
+
+# Shared fixtures (cell builders live in test_utils.py)
+import pytest  # noqa: E402
+
+from decisiongraph import create_chain, create_namespace_definition  # noqa: E402
+
+from test_utils import T0, ts  # noqa: E402
+
+
+@pytest.fixture
+def chain():
+    """TestCorp chain with corp.hr and corp.sales namespaces defined."""
+    chain = create_chain(graph_name="TestCorp", root_namespace="corp", creator="test", system_time=T0)
+    for i, ns in enumerate(("corp.hr", "corp.sales")):
+        chain.append(create_namespace_definition(
+            namespace=ns,
+            owner="role:owner",
+            graph_id=chain.graph_id,
+            prev_cell_hash=chain.head.cell_id,
+            system_time=ts(i)
+        ))
+    return chain
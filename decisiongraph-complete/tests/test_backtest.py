@@ -21,10 +21,11 @@ from decisiongraph import (
     LogicAnchor,
     Proof,
     CellType,
+    DecisionGraphError,
     SourceQuality,
 )
 from decisiongraph.backtest import _sort_results, _count_cells_in_simulation
-from decisiongraph.simulation import SimulationResult, DeltaReport
+from decisiongraph.simulation import SimulationResult, DeltaReport, fork_shadow_chain
 from decisiongraph.engine import Engine
 from decisiongraph.cell import get_current_timestamp
 
@@ -538,3 +539,104 @@ class TestBacktestEdgeCases:
 
         # Should complete with defaults (1000 cases, 60s, 100000 cells)
         assert result.backtest_incomplete is False
+
+
+# ============================================================================
+# Batch Sessions and Process Pool (shared shadow session, global budget)
+# ============================================================================
+
+def _hr_engine(employees: int = 12):
+    """Engine over a chain with one salary fact per employee."""
+    ts = get_current_timestamp()
+    chain = create_chain('test_graph', system_time=ts)
+    fact_ids = []
+    for i in range(employees):
+        cell = DecisionCell(
+            header=Header(
+                version="1.3",
+                graph_id=chain.graph_id,
+                cell_type=CellType.FACT,
+                system_time=ts,
+                prev_cell_hash=chain.cells[-1].cell_id
+            ),
+            fact=Fact(
+                namespace='corp.hr',
+                subject=f'employee:e{i:02d}',
+                predicate='has_salary',
+                object=str(50000 + i),
+                source_quality=SourceQuality.VERIFIED,
+                confidence=1.0,
+                valid_from=ts,
+                valid_to=None
+            ),
+            logic_anchor=LogicAnchor(rule_id="manual:entry", rule_logic_hash=""),
+            proof=Proof()
+        )
+        chain.append(cell)
+        fact_ids.append(cell.cell_id)
+    rfas = [
+        {'namespace': 'corp.hr', 'requester_namespace': 'corp.hr',
+         'requester_id': 'analyst', 'subject': f'employee:e{i:02d}'}
+        for i in reversed(range(employees))
+    ]
+    spec = {'shadow_facts': [{'base_cell_id': fact_ids[3], 'object': '99999'}]}
+    return Engine(chain), rfas, spec, ts
+
+
+def _comparable(batch: BatchBacktestResult):
+    """Batch outcome without per-run ids and timings."""
+    return (
+        batch.backtest_incomplete,
+        batch.cases_processed,
+        batch.cells_touched,
+        [(r.rfa_dict, r.base_result, r.shadow_result, r.delta_report)
+         for r in batch.results],
+    )
+
+
+class TestBatchBacktest:
+    """run_backtest shares one shadow session per batch and can shard across a pool."""
+
+    def test_one_shadow_fork_per_batch(self):
+        engine, rfas, _, ts = _hr_engine()
+        with patch('decisiongraph.simulation.fork_shadow_chain',
+                   wraps=fork_shadow_chain) as fork:
+            result = engine.run_backtest(rfas, {}, ts, ts)
+        assert result.cases_processed == len(rfas)
+        assert fork.call_count == 1
+
+    def test_batch_matches_per_rfa_simulation(self):
+        engine, rfas, spec, ts = _hr_engine()
+        result = engine.run_backtest(rfas, spec, ts, ts)
+        expected = _sort_results([engine.simulate_rfa(rfa, spec, ts, ts) for rfa in rfas])
+        assert [r.shadow_result for r in result.results] == [r.shadow_result for r in expected]
+        assert [r.anchors for r in result.results] == [r.anchors for r in expected]
+
+    @pytest.mark.parametrize("limits", [
+        {},
+        {'max_cases': 5},
+        {'max_cells_touched': 9},
+    ])
+    def test_pool_matches_sequential(self, limits):
+        engine, rfas, spec, ts = _hr_engine()
+        sequential = engine.run_backtest(rfas, spec, ts, ts, **limits)
+        pooled = engine.run_backtest(rfas, spec, ts, ts, workers=2, chunk_size=2, **limits)
+        assert _comparable(pooled) == _comparable(sequential)
+        assert [r.rfa_dict['subject'] for r in pooled.results] == \
+            sorted(r.rfa_dict['subject'] for r in pooled.results)  # BAT-03
+
+    def test_pool_runtime_budget_is_global(self):
+        engine, rfas, spec, ts = _hr_engine()
+        result = engine.run_backtest(rfas * 20, spec, ts, ts, max_runtime_ms=1,
+                                     workers=2, chunk_size=2)
+        assert result.backtest_incomplete is True
+        assert result.cases_processed < len(rfas) * 20
+
+    def test_pool_raises_first_invalid_rfa(self):
+        engine, rfas, spec, ts = _hr_engine()
+        rfas = rfas[:5] + [{'namespace': 'corp.hr'}] + rfas[5:]
+        with pytest.raises(DecisionGraphError):
+            engine.run_backtest(rfas, spec, ts, ts, workers=2, chunk_size=2)
+        # ...unless a sequential run would stop at the limit before reaching it
+        result = engine.run_backtest(rfas, spec, ts, ts, max_cases=5, workers=2, chunk_size=2)
+        assert result.cases_processed == 5
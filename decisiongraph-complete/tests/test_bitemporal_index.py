@@ -0,0 +1,129 @@
+"""
+Tests for the Scholar bitemporal index.
+
+Tests cover:
+1. BitemporalIndex.query matches a full _is_valid_at_time scan (randomized)
+2. Out-of-order inserts fall back to per-cell checks
+   and lock-free readers never see a half-added entry
+3. Scholar.query_facts over deep fact histories matches the full scan
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from decisiongraph import Scholar, create_scholar
+from decisiongraph.scholar import BitemporalIndex
+
+from test_utils import fact_cell, ts
+
+
+def stub_cell(i: int, system_time: str, valid_from, valid_to):
+    return SimpleNamespace(
+        cell_id=f"cell_{i}",
+        header=SimpleNamespace(system_time=system_time),
+        fact=SimpleNamespace(valid_from=valid_from, valid_to=valid_to),
+    )
+
+
+def full_scan(cells, valid_time, system_time):
+    return [c for c in cells if Scholar._is_valid_at_time(None, c, valid_time, system_time)]
+
+
+def random_cells(rng, count, ordered=True):
+    cells = []
+    for i in range(count):
+        system_time = ts(i if ordered else rng.randrange(count))
+        valid_from = rng.choice([None, system_time, ts(rng.randrange(count))])
+        valid_to = rng.choice([None, None, ts(rng.randrange(count + 10))])
+        cells.append(stub_cell(i, system_time, valid_from, valid_to))
+    return cells
+
+
+class TestBitemporalIndex:
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_matches_full_scan(self, ordered):
+        rng = random.Random(7)
+        cells = random_cells(rng, 500, ordered)
+        index = BitemporalIndex()
+        for cell in cells:
+            index.add(cell)
+        assert index.system_ordered is ordered
+
+        for _ in range(300):
+            valid_time = ts(rng.randrange(520))
+            system_time = ts(rng.randrange(520))
+            assert index.query(valid_time, system_time) == full_scan(cells, valid_time, system_time)
+
+    def test_closed_history_prunes_by_valid_time(self):
+        # Each version is valid until the next one is recorded
+        index = BitemporalIndex()
+        cells = [stub_cell(i, ts(i), ts(i), ts(i + 1)) for i in range(1000)]
+        for cell in cells:
+            index.add(cell)
+        assert index.query(ts(500), ts(999)) == [cells[500]]
+        assert index.query(ts(500), ts(400)) == []
+        assert index.query(ts(2000), ts(2000)) == []
+
+    def test_copy_is_independent(self):
+        index = BitemporalIndex()
+        index.add(stub_cell(0, ts(0), None, None))
+        clone = index.copy()
+        clone.add(stub_cell(1, ts(1), None, None))
+        assert (len(index), len(clone)) == (1, 2)
+
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_query_during_add_sees_only_published_entries(self, ordered):
+        """A reader interleaved with add() never indexes past the published prefix."""
+        rng = random.Random(11)
+        cells = random_cells(rng, 200, ordered)
+        index = BitemporalIndex()
+        published = []
+
+        class PublishingList(list):
+            def append(self, value):
+                # Every other field of the entry is already written here
+                for _ in range(3):
+                    valid_time = ts(rng.randrange(210))
+                    system_time = ts(rng.randrange(210))
+                    assert index.query(valid_time, system_time) == full_scan(
+                        published, valid_time, system_time
+                    )
+                super().append(value)
+
+        index.system_times = PublishingList()
+        for cell in cells:
+            index.add(cell)
+            published.append(cell)
+        assert len(index) == len(cells)
+
+class TestQueryFactsDeepHistory:
+
+    def test_query_facts_matches_full_scan(self, chain):
+        rng = random.Random(11)
+        for i in range(10, 400):
+            chain.append(fact_cell(chain, i, subject=f"employee:{rng.randrange(5)}"))
+        scholar = create_scholar(chain)
+        cells = [c for c in chain.cells if c.fact.namespace == "corp.hr" and c.fact.valid_from]
+
+        for _ in range(50):
+            valid_time, system_time = ts(rng.randrange(420)), ts(rng.randrange(420))
+            subject = rng.choice([None, "employee:1", "employee:4"])
+            predicate = rng.choice([None, "attr_0"])
+            result = scholar.query_facts(
+                requester_namespace="corp.hr",
+                namespace="corp.hr",
+                subject=subject,
+                predicate=predicate,
+                at_valid_time=valid_time,
+                as_of_system_time=system_time,
+            )
+            expected = [
+                c for c in full_scan(cells, valid_time, system_time)
+                if (subject is None or c.fact.subject == subject)
+                and (predicate is None or c.fact.predicate == predicate)
+            ]
+            assert {c.cell_id for c in result.candidates} == {c.cell_id for c in expected}
@@ -0,0 +1,163 @@
+"""
+Differential tests: fast canonical encoder vs the reference encoder.
+
+canonical_json_bytes() now runs the iterative, cache-backed encoder; the
+original recursive _encode_value is kept as the reference. Every value in
+the corpus must encode to identical bytes, and every invalid value must
+raise the identical exception (type and message).
+"""
+
+import json
+import random
+from decimal import Decimal
+from enum import Enum, IntEnum
+
+import pytest
+
+from decisiongraph.canon import (
+    CanonicalEncodingError,
+    canonical_json_bytes,
+    canonical_json_string,
+    cell_to_canonical_dict,
+)
+from decisiongraph.cell import (
+    CellType,
+    DecisionCell,
+    Evidence,
+    Fact,
+    Header,
+    LogicAnchor,
+    Proof,
+    SourceQuality,
+)
+from kernel.foundation import canon
+
+
+class Color(Enum):
+    RED = "red"
+    NESTED = {"b": 1, "a": [Decimal("1")]}
+
+
+class Level(IntEnum):
+    LOW = 1
+
+
+class Tag(str, Enum):
+    HOT = "h\"ot"
+
+
+def reference(value) -> bytes:
+    return canon._encode_value(value).encode("utf-8")
+
+
+CORPUS = [
+    None, True, False, 0, -1, 2 ** 80, "", "plain ascii", "café 日本 \U0001f600",
+    "quote\" backslash\\ slash/ tab\t nl\n cr\r nul\x00 esc\x1b del\x7f",
+    "\\\\\"\"", "  ", [], (), {}, [[[]]], [None, 1, "a", [2, (3,)]],
+    {"b": 1, "a": 2, "A": 3, "_": 4, "": 5},
+    {"\U0001f600": 1, "￿": 2, "é": 3, "e": 4, "z": 5},
+    {"k\"ey": {"ne\nsted": ["x", {"y": None}]}, "k\\ey": True},
+    {"deep": {"a": {"b": {"c": {"d": [1, [2, [3, {"e": "f"}]]]}}}}},
+    CellType.JUDGMENT, SourceQuality.VERIFIED, Color.RED, Level.LOW, Tag.HOT,
+    {"enum": Color.RED, "str_enum": Tag.HOT, "int_enum": Level.LOW, Tag.HOT: "as key"},
+    [True, 1, False, 0],
+]
+
+INVALID = [
+    1.5, Decimal("1.0"), {"a": {"b": [1, 2.5]}}, [{"x": Decimal("2")}], {1: "a"},
+    {"a": {2: "b"}}, {"a": object()}, Color.NESTED, {"ok": "\ud800"}, {"\ud800": 1},
+]
+
+
+def random_value(rng, depth=0):
+    kind = rng.randrange(8 if depth < 4 else 4)
+    if kind == 0:
+        return rng.choice([None, True, False, rng.randrange(-10 ** 6, 10 ** 6)])
+    if kind in (1, 2, 3):
+        alphabet = "ab\"\\\n\t\x01 é日\U0001f600/"
+        return "".join(rng.choice(alphabet) for _ in range(rng.randrange(12)))
+    if kind in (4, 5):
+        return [random_value(rng, depth + 1) for _ in range(rng.randrange(5))]
+    keys = [random_value(rng, 99) if rng.random() < 0.5 else f"k{rng.randrange(6)}"
+            for _ in range(rng.randrange(6))]
+    return {k if isinstance(k, str) else str(k): random_value(rng, depth + 1) for k in keys}
+
+
+def judgment_cell(i: int) -> DecisionCell:
+    payload = {
+        "precedent_id": f"prec-{i}",
+        "facts": {"amount": str(1000 + i), "note": "Cliente \"VIP\"\nété"},
+        "reasons": [f"RC-{j}" for j in range(i % 5)],
+    }
+    return DecisionCell(
+        header=Header(
+            version="1.3",
+            graph_id="graph:00000000-0000-4000-8000-000000000000",
+            cell_type=CellType.JUDGMENT,
+            system_time="2026-01-27T11:00:00Z",
+            prev_cell_hash="a" * 64,
+            hash_scheme="canon:rfc8785:v1",
+        ),
+        fact=Fact(
+            namespace="corp.claims",
+            subject=f"case:{i}",
+            predicate="judged",
+            object=json.dumps(payload, ensure_ascii=False),
+            confidence=0.85,
+            source_quality=SourceQuality.SELF_REPORTED,
+            valid_from="2026-01-27T11:00:00Z",
+        ),
+        logic_anchor=LogicAnchor(rule_id="rule:x", rule_logic_hash="b" * 64),
+        evidence=[Evidence(type="doc", cid=f"cid-{j}", description="dé") for j in range(i % 3)],
+        proof=Proof(signer_id="system:test"),
+    )
+
+
+class TestByteIdentical:
+
+    @pytest.mark.parametrize("value", CORPUS, ids=range(len(CORPUS)))
+    def test_corpus(self, value):
+        assert canonical_json_bytes(value) == reference(value)
+        assert canonical_json_string(value) == canon._encode_value(value)
+
+    def test_randomized(self):
+        rng = random.Random(1234)
+        for _ in range(2000):
+            value = random_value(rng)
+            assert canonical_json_bytes(value) == reference(value)
+
+    def test_cell_payloads(self):
+        for i in range(20):
+            cell = judgment_cell(i)
+            payload = cell_to_canonical_dict(cell)
+            assert canonical_json_bytes(payload) == reference(payload)
+            assert cell.verify_integrity()
+
+
+class TestErrorsIdentical:
+
+    @pytest.mark.parametrize("value", INVALID, ids=range(len(INVALID)))
+    def test_same_exception(self, value):
+        with pytest.raises(Exception) as expected:
+            reference(value)
+        with pytest.raises(expected.type) as actual:
+            canonical_json_bytes(value)
+        assert str(actual.value) == str(expected.value)
+
+    def test_paths_in_messages(self):
+        with pytest.raises(CanonicalEncodingError, match=r"path 'a.b\[1\]'"):
+            canonical_json_bytes({"a": {"b": [1, 2.5]}})
+
+
+class TestKeyOrderCache:
+
+    def test_shapes_are_cached_and_bounded(self, monkeypatch):
+        monkeypatch.setattr(canon, "KEY_ORDER_CACHE_SIZE", 4)
+        monkeypatch.setattr(canon, "_key_orders", {})
+        canonical_json_bytes({"b": 1, "a": 2})
+        assert canon._key_orders[("b", "a")][0] == ("a", "b")
+        for i in range(10):
+            canonical_json_bytes({f"k{i}": i})
+        assert len(canon._key_orders) <= 4
+        # Same keys in a different insertion order are a different shape
+        assert canonical_json_bytes({"a": 2, "b": 1}) == canonical_json_bytes({"b": 1, "a": 2})
@@ -0,0 +1,172 @@
+"""
+Tests for the optional Chain secondary indexes.
+
+Tests cover:
+1. Indexed find_* results equal the full scans (randomized chains)
+2. Namespace prefix vs exact lookups
+3. Incremental maintenance on append and rebuild when cells are replaced
+4. Per-chain toggle, stats / memory reporting, shadow fork copies
+"""
+
+import random
+
+import pytest
+
+from decisiongraph import (
+    CellType,
+    ChainIndex,
+    DecisionCell,
+    Fact,
+    Header,
+    LogicAnchor,
+    Proof,
+    SourceQuality,
+    compute_rule_logic_hash,
+    fork_shadow_chain,
+)
+
+from test_utils import bridge_cell, ts
+
+NAMESPACES = ["corp.hr", "corp.hr.payroll", "corp.hr.payroll.eu", "corp.sales", "corp.hrx"]
+RULES = ["rule:a", "rule:b", "rule:c"]
+
+
+def cell(chain, i, namespace, subject, rule_id, cell_type=CellType.FACT, rule_text=None):
+    return DecisionCell(
+        header=Header(
+            version="1.3",
+            graph_id=chain.graph_id,
+            cell_type=cell_type,
+            system_time=ts(i),
+            prev_cell_hash=chain.head.cell_id
+        ),
+        fact=Fact(
+            namespace=namespace,
+            subject=subject,
+            predicate="status",
+            object=str(i),
+            confidence=1.0,
+            source_quality=SourceQuality.VERIFIED,
+            valid_from=ts(i)
+        ),
+        logic_anchor=LogicAnchor(
+            rule_id=rule_id,
+            rule_logic_hash=compute_rule_logic_hash(rule_text or rule_id)
+        ),
+        proof=Proof(signer_id="system:test")
+    )
+
+
+def populate(chain, start, count, seed=5):
+    rng = random.Random(seed)
+    for i in range(start, start + count):
+        chain.append(cell(
+            chain, i,
+            rng.choice(NAMESPACES),
+            f"entity:{rng.randrange(12)}",
+            rng.choice(RULES),
+            rng.choice([CellType.FACT, CellType.DECISION]),
+            rule_text=rng.choice([None, "stale logic"]),
+        ))
+
+
+def ids(cells):
+    return [c.cell_id for c in cells]
+
+
+def assert_matches_scan(chain):
+    indexed = chain
+    scan = fork_shadow_chain(chain)
+    scan.disable_secondary_indexes()
+    for cell_type in CellType:
+        assert ids(indexed.find_by_type(cell_type)) == ids(scan.find_by_type(cell_type))
+    for n in range(13):
+        assert ids(indexed.find_by_subject(f"entity:{n}")) == ids(scan.find_by_subject(f"entity:{n}"))
+    for rule_id in RULES + ["rule:missing"]:
+        assert ids(indexed.find_by_rule(rule_id)) == ids(scan.find_by_rule(rule_id))
+    for ns in NAMESPACES + ["corp", "corp.missing", "corp.hr.payroll.eu.x"]:
+        for include_children in (True, False):
+            assert ids(indexed.find_by_namespace(ns, include_children)) == \
+                ids(scan.find_by_namespace(ns, include_children))
+    official = {rule_id: compute_rule_logic_hash(rule_id) for rule_id in RULES[:2]}
+    assert ids(indexed.find_decisions_with_rule_mismatch(official)) == \
+        ids(scan.find_decisions_with_rule_mismatch(official))
+
+
+class TestMatchesScan:
+
+    def test_random_chain(self, chain):
+        chain.enable_secondary_indexes()
+        populate(chain, 10, 300)
+        assert_matches_scan(chain)
+
+    def test_enable_after_appends(self, chain):
+        populate(chain, 10, 200)
+        chain.enable_secondary_indexes()
+        assert_matches_scan(chain)
+
+    def test_namespace_prefix_is_segment_aware(self, chain):
+        chain.enable_secondary_indexes()
+        for i, ns in enumerate(NAMESPACES, start=10):
+            chain.append(cell(chain, i, ns, "entity:0", "rule:a"))
+        found = {c.fact.namespace for c in chain.find_by_namespace("corp.hr")}
+        assert found == {"corp.hr", "corp.hr.payroll", "corp.hr.payroll.eu"}
+        exact = chain.find_by_namespace("corp.hr.payroll", include_children=False)
+        assert [c.fact.namespace for c in exact] == ["corp.hr.payroll"]
+
+
+class TestMaintenance:
+
+    def test_append_is_incremental(self, chain):
+        chain.enable_secondary_indexes()
+        populate(chain, 10, 50)
+        index = chain._secondary
+        assert index.indexed_upto == len(chain.cells)
+        chain.append(bridge_cell(chain, 100, "corp.sales", "corp.hr"))
+        assert index.indexed_upto == len(chain.cells)
+        assert chain.find_by_type(CellType.BRIDGE_RULE) == [chain.head]
+
+    def test_replaced_cells_rebuild(self, chain):
+        index = ChainIndex()
+        index.sync(chain.cells)
+        other = fork_shadow_chain(chain)
+        populate(other, 10, 20)
+        # Same length, different cells: the high-water mark no longer applies
+        assert index.sync(other.cells[-len(chain.cells):]) == len(chain.cells)
+        assert index.sync(other.cells) == len(other.cells)
+        assert index.sync(other.cells) == 0
+
+
+class TestToggleAndStats:
+
+    def test_disabled_by_default(self, chain):
+        populate(chain, 10, 20)
+        assert chain.secondary_index_stats() == {"enabled": False}
+        assert chain._secondary is None
+
+    def test_stats_report_memory(self, chain):
+        chain.enable_secondary_indexes()
+        populate(chain, 10, 100)
+        stats = chain.secondary_index_stats()
+        assert stats["enabled"] and stats["cells"] == len(chain.cells)
+        assert stats["rules"] == len({c.logic_anchor.rule_id for c in chain.cells})
+        memory = stats["memory_bytes"]
+        assert memory["total"] == sum(v for k, v in memory.items() if k != "total") > 0
+
+        chain.disable_secondary_indexes()
+        assert chain._secondary is None
+        assert len(chain.find_by_rule("rule:a")) > 0
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_shadow_fork(self, chain, enabled):
+        if enabled:
+            chain.enable_secondary_indexes()
+        populate(chain, 10, 50)
+        shadow = fork_shadow_chain(chain)
+        assert shadow.secondary_indexes is enabled
+        populate(shadow, 100, 20, seed=9)
+        if enabled:
+            assert shadow._secondary is not chain._secondary
+            assert chain._secondary.indexed_upto == len(chain.cells)
+            assert_matches_scan(shadow)
+        assert len(chain.find_by_subject("entity:1")) < len(chain.cells)
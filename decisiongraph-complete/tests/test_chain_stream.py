@@ -0,0 +1,137 @@
+"""
+Tests for streaming chain import/export.
+
+Tests cover:
+1. JSON Lines round trips (paths, binary and text files), identical cells
+2. Cells are read lazily, one record at a time
+3. Trusted bulk load: batched (and pooled) seal checks, linkage still enforced
+4. Tampered, malformed and headerless streams are rejected
+5. Optional msgpack format
+"""
+
+import io
+import json
+import sys
+
+import pytest
+
+from decisiongraph import (
+    ChainBreak,
+    ChainStreamError,
+    IntegrityViolation,
+    export_chain,
+    import_chain,
+    iter_cells,
+)
+
+from test_utils import fact_cell
+
+
+@pytest.fixture
+def long_chain(chain):
+    for i in range(10, 110):
+        chain.append(fact_cell(chain, i))
+    return chain
+
+
+def to_jsonl(chain) -> bytes:
+    buffer = io.BytesIO()
+    export_chain(chain, buffer)
+    return buffer.getvalue()
+
+
+def edit_line(data: bytes, position: int, edit) -> bytes:
+    """Apply `edit` to the cell record at `position` (line 0 is the header)."""
+    lines = data.splitlines(keepends=True)
+    record = json.loads(lines[position + 1])
+    edit(record)
+    lines[position + 1] = (json.dumps(record) + "\n").encode("utf-8")
+    return b"".join(lines)
+
+
+def ids(chain):
+    return [c.cell_id for c in chain.cells]
+
+
+class TestRoundTrip:
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_path(self, long_chain, tmp_path, trusted):
+        path = tmp_path / "chain.jsonl"
+        assert export_chain(long_chain, path) == len(long_chain.cells)
+        restored = import_chain(path, trusted=trusted, batch_size=16)
+        assert ids(restored) == ids(long_chain)
+        assert restored.validate().is_valid
+
+    def test_text_file_and_header(self, long_chain):
+        buffer = io.StringIO()
+        export_chain(long_chain, buffer)
+        header = json.loads(buffer.getvalue().splitlines()[0])
+        assert (header["format"], header["graph_id"]) == ("decisiongraph.chain", long_chain.graph_id)
+        restored = import_chain(io.StringIO(buffer.getvalue()))
+        assert ids(restored) == ids(long_chain)
+
+    def test_trusted_with_pool(self, long_chain):
+        restored = import_chain(io.BytesIO(to_jsonl(long_chain)), trusted=True, workers=2, batch_size=32)
+        assert ids(restored) == ids(long_chain)
+
+
+class TestStreaming:
+
+    def test_iter_cells_is_lazy(self, long_chain):
+        data = to_jsonl(long_chain) + b"{not json\n"
+        cells = iter_cells(io.BytesIO(data))
+        assert next(cells).cell_id == long_chain.cells[0].cell_id
+        with pytest.raises(ChainStreamError, match="Malformed JSON"):
+            list(cells)
+
+
+class TestRejection:
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_tampered_cell(self, long_chain, trusted):
+        data = edit_line(to_jsonl(long_chain), 50, lambda r: r["fact"].update(object="forged"))
+        with pytest.raises(IntegrityViolation):
+            import_chain(io.BytesIO(data), trusted=trusted, batch_size=16)
+        with pytest.raises(IntegrityViolation):
+            list(iter_cells(io.BytesIO(data)))
+
+    def test_trusted_still_enforces_linkage(self, long_chain):
+        data = to_jsonl(long_chain)
+        lines = data.splitlines(keepends=True)
+        # Drop a cell: its successor's prev_cell_hash is now dangling
+        with pytest.raises(ChainBreak):
+            import_chain(io.BytesIO(b"".join(lines[:30] + lines[31:])), trusted=True)
+        # Swap two cells: the first now points at a cell not yet loaded
+        swapped = lines[:30] + [lines[31], lines[30]] + lines[32:]
+        with pytest.raises(ChainBreak):
+            import_chain(io.BytesIO(b"".join(swapped)), trusted=True)
+
+    def test_bad_streams(self, long_chain):
+        with pytest.raises(ChainStreamError, match="Empty"):
+            import_chain(io.BytesIO(b""))
+        body = b"".join(to_jsonl(long_chain).splitlines(keepends=True)[1:])
+        with pytest.raises(ChainStreamError, match="missing header"):
+            import_chain(io.BytesIO(body))
+        data = edit_line(to_jsonl(long_chain), 3, lambda r: r.pop("header"))
+        with pytest.raises(ChainStreamError, match="position 3"):
+            import_chain(io.BytesIO(data))
+        with pytest.raises(ChainStreamError, match="empty chain"):
+            import_chain(io.BytesIO(to_jsonl(long_chain)), chain=long_chain)
+        with pytest.raises(ChainStreamError, match="Unknown stream format"):
+            export_chain(long_chain, io.BytesIO(), fmt="xml")
+
+
+class TestMsgpack:
+
+    def test_round_trip(self, long_chain):
+        pytest.importorskip("msgpack")
+        buffer = io.BytesIO()
+        export_chain(long_chain, buffer, fmt="msgpack")
+        buffer.seek(0)
+        assert ids(import_chain(buffer, fmt="msgpack", trusted=True)) == ids(long_chain)
+
+    def test_missing_dependency(self, long_chain, monkeypatch):
+        monkeypatch.setattr(sys.modules[export_chain.__module__], "msgpack", None)
+        with pytest.raises(ChainStreamError, match="msgpack"):
+            export_chain(long_chain, io.BytesIO(), fmt="msgpack")
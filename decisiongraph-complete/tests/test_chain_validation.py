@@ -0,0 +1,218 @@
+"""
+Tests for the chain validation engine.
+
+Tests cover:
+1. validate() reports exactly what the original sequential loop reported
+   (clean chains and tampered / broken / reordered cells)
+2. Process-pool seal checks agree with in-process hashing
+3. Signed verified-prefix checkpoints: only the tail is re-validated;
+   stale, foreign or forged checkpoints are ignored with a warning
+"""
+
+import copy
+from typing import Optional, Set
+
+import pytest
+
+from decisiongraph import (
+    ChainError,
+    NULL_HASH,
+    ValidationCheckpoint,
+    create_validation_checkpoint,
+    generate_ed25519_keypair,
+    read_validation_checkpoint,
+    write_validation_checkpoint,
+)
+from decisiongraph.genesis import is_genesis, verify_genesis
+
+from test_utils import fact_cell, ts
+
+
+def reference_validate(chain):
+    """The original single-threaded Chain.validate() loop: (errors, warnings)."""
+    errors, warnings = [], []
+    if not is_genesis(chain.cells[0]):
+        errors.append("First cell is not Genesis")
+    else:
+        is_valid, failed_checks = verify_genesis(chain.cells[0])
+        errors.extend(f"Genesis: {check}" for check in failed_checks if not is_valid)
+    genesis_count = sum(1 for c in chain.cells if is_genesis(c))
+    if genesis_count > 1:
+        errors.append(f"Multiple Genesis cells found: {genesis_count}")
+
+    graph_id = chain.cells[0].header.graph_id
+    seen_ids: Set[str] = set()
+    prev_timestamp: Optional[str] = None
+    for i, cell in enumerate(chain.cells):
+        if cell.cell_id in seen_ids:
+            errors.append(f"Duplicate cell_id at position {i}: {cell.cell_id[:16]}...")
+        seen_ids.add(cell.cell_id)
+        if not cell.verify_integrity():
+            errors.append(f"Integrity violation at position {i}: {cell.cell_id[:16]}...")
+        if cell.header.graph_id != graph_id:
+            errors.append(
+                f"Graph ID mismatch at position {i}: "
+                f"expected '{graph_id}', got '{cell.header.graph_id}'"
+            )
+        if i > 0:
+            if cell.header.prev_cell_hash == NULL_HASH:
+                errors.append(f"Non-genesis cell at position {i} has NULL_HASH")
+            elif not chain.cell_exists(cell.header.prev_cell_hash):
+                errors.append(
+                    f"Broken chain at position {i}: prev_cell_hash "
+                    f"{cell.header.prev_cell_hash[:16]}... not found"
+                )
+        if prev_timestamp and cell.header.system_time < prev_timestamp:
+            warnings.append(
+                f"Temporal inconsistency at position {i}: "
+                f"{cell.header.system_time} < {prev_timestamp}"
+            )
+        prev_timestamp = cell.header.system_time
+    return errors, warnings
+
+
+@pytest.fixture
+def long_chain(chain):
+    for i in range(10, 130):
+        chain.append(fact_cell(chain, i))
+    return chain
+
+
+def tamper(chain, position, part, field, value):
+    """Swap in a tampered copy of the cell at `position` (cell_id unchanged)."""
+    cell = copy.deepcopy(chain.cells[position])
+    object.__setattr__(getattr(cell, part), field, value)
+    chain.cells[position] = cell
+
+
+@pytest.fixture
+def keys():
+    return generate_ed25519_keypair()
+
+
+class TestMatchesReference:
+
+    def test_clean_chain(self, long_chain):
+        result = long_chain.validate()
+        assert result.is_valid and result.cells_checked == len(long_chain.cells)
+        assert (result.errors, result.warnings) == ([], []) == reference_validate(long_chain)
+
+    def test_broken_chain(self, long_chain):
+        tamper(long_chain, 20, "fact", "object", "forged")
+        tamper(long_chain, 30, "header", "prev_cell_hash", "f" * 64)
+        tamper(long_chain, 40, "header", "prev_cell_hash", NULL_HASH)
+        tamper(long_chain, 50, "header", "graph_id", "graph:other")
+        tamper(long_chain, 60, "header", "system_time", ts(1))
+        long_chain.cells[70] = long_chain.cells[69]
+        long_chain.cells.append(long_chain.cells[0])
+
+        result = long_chain.validate()
+        assert not result.is_valid
+        assert (result.errors, result.warnings) == reference_validate(long_chain)
+        assert any("Multiple Genesis" in e for e in result.errors)
+
+    def test_first_cell_not_genesis(self, long_chain):
+        long_chain.cells.pop(0)
+        result = long_chain.validate()
+        assert result.errors[0] == "First cell is not Genesis"
+        assert (result.errors, result.warnings) == reference_validate(long_chain)
+
+
+class TestParallelSeals:
+
+    def test_pool_matches_in_process(self, long_chain):
+        for position in (3, 64, 65, 122):
+            tamper(long_chain, position, "fact", "object", "forged")
+        serial = long_chain.validate()
+        parallel = long_chain.validate(workers=2, chunk_size=16)
+        assert parallel.errors == serial.errors
+        assert [i for i, _ in long_chain.find_integrity_violations(workers=2)] == [3, 64, 65, 122]
+
+
+class TestCheckpoints:
+
+    def test_only_tail_is_validated(self, long_chain, keys, tmp_path):
+        priv, pub = keys
+        checkpoint = create_validation_checkpoint(long_chain, long_chain.validate(), priv, "auditor:test")
+        path = tmp_path / "validated.json"
+        write_validation_checkpoint(path, checkpoint)
+
+        for i in range(200, 210):
+            long_chain.append(fact_cell(long_chain, i))
+        result = long_chain.validate(checkpoint=read_validation_checkpoint(path), public_key=pub)
+        assert result.is_valid and result.warnings == []
+        assert (result.trusted_cells, result.cells_checked) == (checkpoint.cell_count, 10)
+
+        # Tail problems are still found, with chain positions
+        original = long_chain.cells[-2]
+        tamper(long_chain, len(long_chain.cells) - 2, "fact", "object", "forged")
+        long_chain.cells.append(long_chain.cells[5])
+        result = long_chain.validate(checkpoint=checkpoint, public_key=pub)
+        assert (result.errors, result.warnings) == reference_validate(long_chain)
+
+        # Extending the checkpoint over the new tail
+        long_chain.cells.pop()
+        long_chain.cells[-2] = original
+        extended = create_validation_checkpoint(
+            long_chain, long_chain.validate(checkpoint=checkpoint, public_key=pub), priv, "auditor:test"
+        )
+        assert extended.cell_count == len(long_chain.cells)
+        # The running digest extended over the tail equals one over the whole chain
+        full = create_validation_checkpoint(long_chain, long_chain.validate(), priv, "auditor:test")
+        assert extended.cell_ids_digest == full.cell_ids_digest
+
+    def test_trusted_prefix_is_never_read(self, long_chain, keys):
+        """With a trusted checkpoint only Genesis, the head and the tail are touched."""
+        priv, pub = keys
+        checkpoint = create_validation_checkpoint(long_chain, long_chain.validate(), priv, "auditor:test")
+        for i in range(200, 205):
+            long_chain.append(fact_cell(long_chain, i))
+
+        class Untouchable:
+            def __getattr__(self, name):
+                raise AssertionError("trusted prefix cell was read")
+
+        head = checkpoint.cell_count - 1
+        for position in range(1, head):
+            long_chain.cells[position] = Untouchable()
+
+        result = long_chain.validate(checkpoint=checkpoint, public_key=pub)
+        assert result.is_valid and result.warnings == []
+        assert (result.trusted_cells, result.cells_checked) == (checkpoint.cell_count, 5)
+        extended = create_validation_checkpoint(long_chain, result, priv, "auditor:test")
+        assert extended.cell_count == len(long_chain.cells)
+
+    @pytest.mark.parametrize("problem", ["forged", "no_key", "changed_head", "truncated"])
+    def test_untrusted_checkpoint_falls_back(self, long_chain, keys, problem):
+        priv, pub = keys
+        checkpoint = create_validation_checkpoint(long_chain, long_chain.validate(), priv, "auditor:test")
+        public_key = pub
+        if problem == "forged":
+            checkpoint = ValidationCheckpoint(**{**checkpoint.to_dict(), "cell_count": 5})
+        elif problem == "no_key":
+            public_key = None
+        elif problem == "changed_head":
+            long_chain.cells[-2], long_chain.cells[-1] = long_chain.cells[-1], long_chain.cells[-2]
+        else:
+            long_chain.cells.pop()
+
+        result = long_chain.validate(checkpoint=checkpoint, public_key=public_key)
+        assert result.trusted_cells == 0 and result.cells_checked == len(long_chain.cells)
+        assert result.warnings[0].startswith("Validation checkpoint ignored")
+        assert result.errors == reference_validate(long_chain)[0]
+
+    def test_refuses_invalid_or_stale_results(self, long_chain, keys):
+        priv, _ = keys
+        result = long_chain.validate()
+        long_chain.append(fact_cell(long_chain, 300))
+        with pytest.raises(ChainError):
+            create_validation_checkpoint(long_chain, result, priv, "auditor:test")
+
+        tamper(long_chain, 12, "fact", "object", "forged")
+        with pytest.raises(ChainError):
+            create_validation_checkpoint(long_chain, long_chain.validate(), priv, "auditor:test")
+
+    def test_read_missing_or_corrupt(self, tmp_path):
+        assert read_validation_checkpoint(tmp_path / "missing.json") is None
+        (tmp_path / "bad.json").write_text("{not json")
+        assert read_validation_checkpoint(tmp_path / "bad.json") is None
@@ -1,9 +1,12 @@
 """Tests for v3 Comparability Gate engine."""
 
+import random
+
 import pytest
 
 from decisiongraph.banking_domain import create_banking_domain_registry
 from decisiongraph.comparability_gate import (
+    GateClassIndex,
     GateResult,
     evaluate_gates,
     extract_gate_facts_from_case,
@@ -242,3 +245,52 @@ class TestExtractGateFacts:
             {"customer.type": "individual", "txn.type": "eft", "jurisdiction": "CA"},
         )
         assert facts["jurisdiction_regime"] == "CA"
+
+
+# ---------------------------------------------------------------------------
+# GateClassIndex — precomputed gate keys
+# ---------------------------------------------------------------------------
+
+class TestGateClassIndex:
+    @pytest.fixture
+    def registry(self) -> DomainRegistry:
+        return create_banking_domain_registry()
+
+    @staticmethod
+    def _random_gate_facts(registry, rng) -> dict:
+        facts = {}
+        for gate in registry.comparability_gates:
+            members = [m for ms in gate.equivalence_classes.values() for m in ms]
+            facts[gate.field] = rng.choice(members + [m.upper() for m in members[:2]] + ["unlisted", None])
+        return facts
+
+    def test_matches_evaluate_gates(self, registry):
+        rng = random.Random(22)
+        index = GateClassIndex(registry)
+        pool = {f"p{i}": self._random_gate_facts(registry, rng) for i in range(400)}
+        for key, facts in pool.items():
+            index.add(key, facts)
+        assert len(index) == len(pool)
+
+        for _ in range(100):
+            case = self._random_gate_facts(registry, rng)
+            compatible = index.compatible(case)
+            expected = {k for k, facts in pool.items() if evaluate_gates(registry, case, facts)[0]}
+            assert {k for k in pool if index.key_of(k) in compatible} == expected
+            assert set(index.candidates(case)) == expected
+
+    def test_new_keys_reset_compatible_cache(self, registry):
+        index = GateClassIndex(registry)
+        case = {"jurisdiction_regime": "CA", "customer_segment": "individual",
+                "channel_family": "cash", "disposition_basis": "DISCRETIONARY"}
+        index.add("same", dict(case))
+        assert index.candidates(case) == ["same"]
+        index.add("same", {**case, "jurisdiction_regime": "US"})  # already indexed
+        index.add("unclassifiable", {**case, "channel_family": "carrier_pigeon"})
+        index.add("other_regime", {**case, "jurisdiction_regime": "US"})
+        assert sorted(index.candidates(case)) == ["same", "unclassifiable"]
+
+    def test_gate_lookup_keeps_first_class(self):
+        gate = ComparabilityGate(field="f", equivalence_classes={"a": ["x", "Y"], "b": ["y", "z"]})
+        assert gate.classify(" y") == "a"
+        assert gate.classify("q") is None and gate.classify(None) is None
@@ -0,0 +1,145 @@
+"""
+Tests for the /decide pipeline executor (service/decision_executor.py).
+
+Tests cover:
+1. inline and thread modes run the function and return its result
+2. Admission control: ExecutorSaturated past max_pending
+3. Configuration validation
+4. Process workers import the serving process's seed pool (same precedent_ids)
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from service.decision_executor import DecisionExecutor, ExecutorSaturated
+from service.seed_pool import SeedPool, reset_seed_pool, set_seed_pool
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestModes:
+
+    @pytest.mark.parametrize("mode", ["inline", "thread"])
+    def test_submit_returns_result(self, mode):
+        executor = DecisionExecutor(mode=mode, max_workers=2)
+        try:
+            assert run(executor.submit(pow, 2, 10)) == 1024
+            assert executor.stats()["completed"] == 1
+            assert executor.pending == 0
+        finally:
+            executor.shutdown()
+
+    def test_thread_mode_runs_off_event_loop(self):
+        executor = DecisionExecutor(mode="thread", max_workers=1)
+
+        async def main():
+            return threading.get_ident(), await executor.submit(threading.get_ident)
+
+        try:
+            loop_thread, worker_thread = run(main())
+            assert loop_thread != worker_thread
+        finally:
+            executor.shutdown()
+
+    def test_exception_propagates_and_releases_slot(self):
+        executor = DecisionExecutor(mode="thread", max_workers=1, max_pending=1)
+        try:
+            with pytest.raises(ZeroDivisionError):
+                run(executor.submit(divmod, 1, 0))
+            assert executor.pending == 0
+            assert run(executor.submit(divmod, 7, 2)) == (3, 1)
+        finally:
+            executor.shutdown()
+
+
+class TestAdmission:
+
+    def test_saturated_past_max_pending(self):
+        executor = DecisionExecutor(mode="thread", max_workers=1, max_pending=2)
+        release = threading.Event()
+
+        async def main():
+            running = [
+                asyncio.ensure_future(executor.submit(release.wait, 5)) for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            with pytest.raises(ExecutorSaturated):
+                await executor.submit(int)
+            release.set()
+            return await asyncio.gather(*running)
+
+        try:
+            assert run(main()) == [True, True]
+            stats = executor.stats()
+            assert stats["rejected"] == 1
+            assert stats["completed"] == 2
+            assert stats["pending"] == 0
+        finally:
+            executor.shutdown()
+
+
+class TestConfiguration:
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown executor mode"):
+            DecisionExecutor(mode="fiber")
+
+    def test_limits_must_be_positive(self):
+        with pytest.raises(ValueError):
+            DecisionExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            DecisionExecutor(max_pending=0)
+
+    def test_inline_has_no_pool(self):
+        executor = DecisionExecutor(mode="inline")
+        executor.start()
+        assert executor._pool is None
+
+
+def worker_precedent_ids():
+    """Precedent ids of the chain a decision worker loaded (runs in the worker)."""
+    from kernel.foundation.judgment import is_judgment_cell, parse_judgment_payload
+    from service import main
+
+    return [
+        parse_judgment_payload(cell).precedent_id
+        for cell in main.PRECEDENT_CHAIN.cells
+        if is_judgment_cell(cell)
+    ]
+
+
+class TestProcessWorkers:
+
+    def test_worker_shares_parent_precedent_ids(self, monkeypatch):
+        from service import main
+
+        monkeypatch.delenv("DG_PRECEDENT_WAL_DIR", raising=False)
+        monkeypatch.delenv("DG_SEED_CACHE_DIR", raising=False)
+        pool = SeedPool.generate(total=60)
+        set_seed_pool(pool)
+        executor = DecisionExecutor(
+            mode="process", max_workers=1, initializer=main._init_decision_worker,
+        )
+        monkeypatch.setattr(main, "DECISION_EXECUTOR", executor)
+        try:
+            executor.start(initargs=main._decision_worker_initargs())
+            worker_ids = run(executor.submit(worker_precedent_ids))
+        finally:
+            executor.shutdown()
+            reset_seed_pool()
+            if main._SEED_POOL_HANDOFF_DIR:
+                import shutil
+                shutil.rmtree(main._SEED_POOL_HANDOFF_DIR, ignore_errors=True)
+                monkeypatch.setattr(main, "_SEED_POOL_HANDOFF_DIR", None)
+
+        assert worker_ids == [p.precedent_id for p in pool.payloads]
+
+    def test_non_process_modes_export_nothing(self, monkeypatch):
+        from service import main
+
+        monkeypatch.setattr(main, "DECISION_EXECUTOR", DecisionExecutor(mode="thread"))
+        assert main._decision_worker_initargs() == ()
@@ -233,3 +233,25 @@ class TestCompareField:
             comparison=ComparisonFn.EXACT, weight=0.05, tier=FieldTier.BEHAVIORAL,
         )
         assert compare_field(fd, None, True) == 0.0
+
+    def test_precompiled_lookups_keep_overlap_rules(self):
+        """compare_field's compiled maps resolve shared values like the primitives."""
+        classes = {"first": ["Shared", "a"], "second": [" shared ", "b"]}
+        fd = FieldDefinition(
+            name="test", label="Test", type=FieldType.CATEGORICAL,
+            comparison=ComparisonFn.EQUIVALENCE_CLASS, weight=0.05,
+            tier=FieldTier.BEHAVIORAL, equivalence_classes=classes,
+        )
+        assert fd.class_of["shared"] == "second"  # later class wins
+        for case, prec in [("shared", "b"), ("shared", "a"), ("x", "X "), ("x", "a")]:
+            assert compare_field(fd, case, prec) == compare_equivalence_class(case, prec, classes)
+
+        ordered = ["low", "Mid", "high", "mid"]
+        fd = FieldDefinition(
+            name="test", label="Test", type=FieldType.ORDINAL,
+            comparison=ComparisonFn.STEP, weight=0.05,
+            tier=FieldTier.BEHAVIORAL, ordered_values=ordered,
+        )
+        assert fd.index_of["mid"] == 1  # first occurrence wins
+        for case, prec in [("mid", "high"), ("LOW", "mid"), ("odd", "ODD"), ("odd", "low")]:
+            assert compare_field(fd, case, prec) == compare_step(case, prec, ordered)
@@ -0,0 +1,174 @@
+"""
+Tests for copy-on-write overlay chains and read-through Scholars.
+
+Tests cover:
+1. fork_shadow_chain() copies nothing and never writes to the base chain
+2. The overlay is frozen at fork time: later base appends stay invisible
+3. A read-through Scholar answers exactly like a Scholar over a full copy
+4. Contamination attestation still holds for simulations
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from decisiongraph import (
+    Chain,
+    OverlayChain,
+    Scholar,
+    create_scholar,
+    fork_shadow_chain,
+)
+from decisiongraph.scholar import LayeredScholarIndex
+from decisiongraph.shadow import OverlayContext, create_shadow_cell
+from decisiongraph.simulation import SimulationContext, create_contamination_attestation
+
+from test_utils import assert_matches_full_build, bridge_cell, fact_cell, query, ts
+
+
+@pytest.fixture
+def populated(chain):
+    for i in range(10, 60):
+        chain.append(fact_cell(chain, i, namespace="corp.sales" if i % 5 == 0 else "corp.hr"))
+    return chain
+
+
+def full_copy(chain) -> Chain:
+    """The pre-overlay fork: copies of the cells list and index."""
+    return Chain(
+        cells=list(chain.cells),
+        index=dict(chain.index),
+        _graph_id=chain.graph_id,
+        _root_namespace=chain.root_namespace
+    )
+
+
+def bundles(scholar):
+    results = []
+    for requester in ("corp.hr", "corp.sales"):
+        for subject in [None] + [f"employee:{n}" for n in range(7)] + ["employee:shadow"]:
+            for at in (ts(15), ts(45), ts(3599)):
+                results.append(query(scholar, requester=requester, subject=subject, at=at).to_proof_bundle())
+    return results
+
+
+class TestOverlayChain:
+
+    def test_fork_copies_nothing(self, populated):
+        shadow = fork_shadow_chain(populated)
+        assert isinstance(shadow, OverlayChain)
+        assert shadow.cells.base_cells is populated.cells
+        assert shadow.index.base_index is populated.index
+        assert shadow.delta == [] and len(shadow) == len(populated)
+
+    def test_appends_only_reach_delta(self, populated):
+        base_cells, base_index = list(populated.cells), dict(populated.index)
+        shadow = fork_shadow_chain(populated)
+        for i in range(60, 65):
+            shadow.append(fact_cell(shadow, i))
+
+        assert populated.cells == base_cells and populated.index == base_index
+        assert len(shadow.delta) == 5 and len(shadow) == len(populated) + 5
+        assert shadow.cells[-5:] == shadow.delta
+        assert shadow.cells[len(populated) - 1] is populated.head
+        assert list(shadow.cells) == list(populated.cells) + shadow.delta
+        assert shadow.index[shadow.head.cell_id] == len(shadow) - 1
+        assert len(shadow.index) == len(populated.index) + 5
+        assert shadow.validate().is_valid
+
+    def test_frozen_at_fork_time(self, populated):
+        shadow = fork_shadow_chain(populated)
+        shadow.append(fact_cell(shadow, 70, subject="employee:shadow"))
+        later = fact_cell(populated, 80, subject="employee:late")
+        populated.append(later)
+
+        assert later.cell_id not in shadow.index
+        assert shadow.get_cell(later.cell_id) is None
+        assert later not in list(shadow.cells)
+        assert not shadow.in_base(later) and shadow.in_base(populated.cells[5])
+
+    def test_nested_overlays(self, populated):
+        shadow = fork_shadow_chain(populated)
+        shadow.append(fact_cell(shadow, 60))
+        nested = fork_shadow_chain(shadow)
+        nested.append(fact_cell(nested, 61))
+        assert len(shadow) == len(populated) + 1
+        assert list(nested.cells) == list(shadow.cells) + nested.delta
+        assert nested.validate().is_valid
+
+
+class TestReadThroughScholar:
+
+    def test_matches_scholar_over_full_copy(self, populated):
+        base = create_scholar(populated)
+        shadow = fork_shadow_chain(populated)
+        expected_chain = full_copy(populated)
+        for target in (shadow, expected_chain):
+            target.append(bridge_cell(target, 60, "corp.sales", "corp.hr"))
+            for i in range(61, 70):
+                target.append(fact_cell(target, i, subject="employee:shadow" if i % 2 else None))
+
+        forked = Scholar(shadow, base=base)
+        assert isinstance(forked.index, LayeredScholarIndex)
+        assert forked.index.base is base.index
+        assert bundles(forked) == bundles(create_scholar(expected_chain))
+        assert_matches_full_build(forked)
+        assert query(base, subject="employee:shadow").count == 0
+
+    def test_base_appends_after_fork_stay_hidden(self, populated):
+        base = create_scholar(populated)
+        shadow = fork_shadow_chain(populated)
+        forked = Scholar(shadow, base=base)
+        before = bundles(forked)
+
+        populated.append(fact_cell(populated, 80, subject="employee:late"))
+        assert query(base, subject="employee:late").count == 1
+        assert query(forked, subject="employee:late").count == 0
+        assert bundles(forked) == before
+        assert_matches_full_build(forked)
+
+    def test_base_append_during_query_stays_hidden(self, populated, monkeypatch):
+        base = create_scholar(populated)
+        forked = Scholar(fork_shadow_chain(populated), base=base)
+        check_visibility = forked.check_visibility
+
+        def check_then_append(*args):
+            # The base indexes a new cell between the visibility check and the index read
+            visibility = check_visibility(*args)
+            populated.append(fact_cell(populated, 80, subject="employee:late"))
+            return visibility
+
+        monkeypatch.setattr(forked, "check_visibility", check_then_append)
+        assert query(forked, subject="employee:late").count == 0
+        assert query(base, subject="employee:late").count == 1
+
+    def test_unrelated_base_falls_back_to_copy(self, populated):
+        other = create_scholar(full_copy(populated))
+        forked = Scholar(fork_shadow_chain(populated), base=other)
+        assert not isinstance(forked.index, LayeredScholarIndex)
+        assert_matches_full_build(forked)
+
+
+class TestContamination:
+
+    def test_simulation_attestation(self, populated):
+        base = create_scholar(populated)
+        head_before = populated.head.cell_id
+        overlay = OverlayContext()
+        target = populated.head
+        # Later system_time, so the shadow wins conflict resolution outright
+        shadow = create_shadow_cell(
+            target,
+            fact=replace(target.fact, object="shadow", valid_from=ts(3000)),
+            header=replace(target.header, system_time=ts(3000)),
+        )
+        overlay.add_shadow_fact(shadow, target.cell_id)
+
+        with SimulationContext(populated, overlay, ts(3599), ts(3599), base_scholar=base) as sim:
+            shadow_objects = {c.fact.object for c in query(sim.shadow_scholar, subject=target.fact.subject).facts}
+            assert "shadow" in shadow_objects
+            assert len(sim.shadow_chain.delta) == 1
+
+        attestation = create_contamination_attestation(head_before, populated.head.cell_id, "sim-1")
+        assert not attestation.contamination_detected
+        assert "shadow" not in {c.fact.object for c in query(base, subject=target.fact.subject).facts}
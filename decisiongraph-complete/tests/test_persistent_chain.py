@@ -0,0 +1,294 @@
+"""
+Tests for DecisionGraph PersistentChain Module
+
+Tests cover:
+1. Write-ahead persistence of every accepted cell
+2. Rehydration from the segmented WAL
+3. Checkpointed rehydration (trusted prefix, verified tail)
+4. Stale/foreign checkpoints fall back to full verification
+5. Rejected cells never reach the WAL
+6. Seeded chains are reused only for a complete load of their configuration
+"""
+
+import json
+
+import pytest
+
+from decisiongraph.cell import HASH_SCHEME_CANONICAL, NULL_HASH
+from decisiongraph.chain import ChainBreak
+from decisiongraph.judgment import AnchorFact, JudgmentPayload, create_judgment_cell
+from decisiongraph.persistent_chain import (
+    CHECKPOINT_FILENAME,
+    PersistentChain,
+    PersistentChainError,
+    mark_seed_load_complete,
+    open_seeded_chain,
+    read_checkpoint,
+)
+from decisiongraph.segmented_wal import SegmentedWALReader, list_segment_files
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def wal_dir(tmp_path):
+    """Provide a temporary WAL directory."""
+    return tmp_path / "chain_wal"
+
+
+def make_judgment(chain, i, namespace="claims.precedents"):
+    """Create a JUDGMENT cell linked to the chain head."""
+    payload = JudgmentPayload.create(
+        case_id_hash=f"{i:064x}",
+        jurisdiction_code="CA-ON",
+        fingerprint_hash="f" * 64,
+        fingerprint_schema_id="test:v1",
+        exclusion_codes=["4.2.1"],
+        reason_codes=["RC-1"],
+        reason_code_registry_id="test:v1",
+        outcome_code="deny",
+        certainty="high",
+        anchor_facts=[AnchorFact(field_id="t", value=i, label="T")],
+        policy_pack_hash="c" * 64,
+        policy_pack_id="test",
+        policy_version="1.0",
+        decision_level="adjuster",
+        decided_at="2026-01-15T12:00:00Z",
+        decided_by_role="adjuster",
+    )
+    return create_judgment_cell(
+        payload=payload,
+        namespace=namespace,
+        graph_id=chain.graph_id,
+        prev_cell_hash=chain.head.cell_id,
+    )
+
+
+def build_chain(wal_dir, count, **kwargs):
+    """Create a persistent chain with ``count`` judgment cells."""
+    chain = PersistentChain.create(
+        wal_dir,
+        graph_name="TestGraph",
+        root_namespace="claims",
+        hash_scheme=HASH_SCHEME_CANONICAL,
+        **kwargs,
+    )
+    for i in range(count):
+        chain.append(make_judgment(chain, i))
+    return chain
+
+
+# =============================================================================
+# PERSISTENCE
+# =============================================================================
+
+class TestPersistence:
+    """Every accepted cell is written to the WAL."""
+
+    def test_create_writes_genesis(self, wal_dir):
+        chain = build_chain(wal_dir, 0)
+        chain.close()
+
+        records = list(SegmentedWALReader(wal_dir))
+        assert len(records) == 1
+        assert json.loads(records[0].canonical_bytes)["cell_id"] == chain.genesis.cell_id
+
+    def test_appends_are_persisted_in_order(self, wal_dir):
+        chain = build_chain(wal_dir, 5)
+        chain.close()
+
+        stored = [json.loads(r.canonical_bytes)["cell_id"] for r in SegmentedWALReader(wal_dir)]
+        assert stored == [c.cell_id for c in chain.cells]
+
+    def test_rejected_cell_not_persisted(self, wal_dir):
+        chain = build_chain(wal_dir, 1)
+        bad = make_judgment(chain, 99)
+        object.__setattr__(bad.header, "prev_cell_hash", "a" * 64)
+        bad.cell_id = bad.compute_cell_id()
+
+        with pytest.raises(ChainBreak):
+            chain.append(bad)
+        chain.close()
+
+        assert SegmentedWALReader(wal_dir).count() == 2
+
+    def test_create_fails_if_not_empty(self, wal_dir):
+        build_chain(wal_dir, 0).close()
+        with pytest.raises(FileExistsError):
+            build_chain(wal_dir, 0)
+
+    def test_append_after_close_rejected(self, wal_dir):
+        chain = build_chain(wal_dir, 1)
+        chain.close()
+        with pytest.raises(PersistentChainError):
+            chain.append(make_judgment(chain, 2))
+
+    def test_rolls_segments(self, wal_dir):
+        chain = build_chain(wal_dir, 10, max_segment_bytes=4096)
+        chain.close()
+        assert len(list_segment_files(wal_dir)) > 1
+
+
+# =============================================================================
+# REHYDRATION
+# =============================================================================
+
+class TestRehydration:
+    """open() rebuilds the same chain from the WAL."""
+
+    def test_open_restores_identical_chain(self, wal_dir):
+        chain = build_chain(wal_dir, 8, max_segment_bytes=4096)
+        chain.close()
+
+        reopened = PersistentChain.open(wal_dir)
+        assert [c.cell_id for c in reopened.cells] == [c.cell_id for c in chain.cells]
+        assert reopened.graph_id == chain.graph_id
+        assert reopened.hash_scheme == HASH_SCHEME_CANONICAL
+        assert reopened.validate().is_valid
+        reopened.close()
+
+    def test_checkpoint_trusts_prefix(self, wal_dir):
+        build_chain(wal_dir, 6).close()
+
+        reopened = PersistentChain.open(wal_dir)
+        stats = reopened.last_rehydration
+        assert stats.used_checkpoint
+        assert stats.trusted_cells == 7
+        assert stats.verified_cells == 0
+        assert all(c.verify_integrity() for c in reopened.cells)
+        reopened.close()
+
+    def test_only_tail_is_verified(self, wal_dir):
+        chain = build_chain(wal_dir, 4)
+        chain.checkpoint()
+        for i in range(4, 7):
+            chain.append(make_judgment(chain, i))
+        chain.sync()
+        # Simulate a crash: no close(), so the checkpoint covers 5 cells only
+        chain._writer.close()
+
+        reopened = PersistentChain.open(wal_dir)
+        assert reopened.last_rehydration.trusted_cells == 5
+        assert reopened.last_rehydration.verified_cells == 3
+        assert len(reopened) == 8
+        reopened.close()
+
+    def test_full_verify_ignores_checkpoint(self, wal_dir):
+        build_chain(wal_dir, 3).close()
+
+        reopened = PersistentChain.open(wal_dir, verify="full")
+        assert not reopened.last_rehydration.used_checkpoint
+        assert reopened.last_rehydration.verified_cells == 4
+        reopened.close()
+
+    def test_mismatched_checkpoint_falls_back_to_full(self, wal_dir):
+        build_chain(wal_dir, 3).close()
+        cp_file = wal_dir / CHECKPOINT_FILENAME
+        data = json.loads(cp_file.read_text())
+        data["last_record_hash"] = "0" * 64
+        cp_file.write_text(json.dumps(data))
+
+        reopened = PersistentChain.open(wal_dir)
+        assert not reopened.last_rehydration.trusted_cells
+        assert reopened.last_rehydration.verified_cells == 4
+        reopened.close()
+
+    def test_checkpoint_metadata_restored_only_from_matching_checkpoint(self, wal_dir):
+        chain = build_chain(wal_dir, 3)
+        chain.checkpoint_metadata = {"seed_config_digest": "abc", "seed_count": 3}
+        chain.close()
+
+        reopened = PersistentChain.open(wal_dir, read_only=True)
+        assert reopened.checkpoint_metadata == {"seed_config_digest": "abc", "seed_count": 3}
+        assert PersistentChain.open(wal_dir, verify="full", read_only=True).checkpoint_metadata == {}
+
+        cp_file = wal_dir / CHECKPOINT_FILENAME
+        data = json.loads(cp_file.read_text())
+        data["cell_count"] = 5
+        cp_file.write_text(json.dumps(data))
+        assert PersistentChain.open(wal_dir, read_only=True).checkpoint_metadata == {}
+
+    def test_reopened_chain_accepts_appends(self, wal_dir):
+        build_chain(wal_dir, 2).close()
+
+        reopened = PersistentChain.open(wal_dir)
+        reopened.append(make_judgment(reopened, 10))
+        reopened.close()
+
+        again = PersistentChain.open(wal_dir)
+        assert len(again) == 4
+        assert read_checkpoint(wal_dir).cell_count == 4
+        again.close()
+
+    def test_open_missing_wal(self, wal_dir):
+        with pytest.raises(FileNotFoundError):
+            PersistentChain.open(wal_dir)
+
+    def test_exists(self, wal_dir):
+        assert not PersistentChain.exists(wal_dir)
+        build_chain(wal_dir, 0).close()
+        assert PersistentChain.exists(wal_dir)
+
+    def test_genesis_prev_hash_preserved(self, wal_dir):
+        build_chain(wal_dir, 0).close()
+        reopened = PersistentChain.open(wal_dir)
+        assert reopened.genesis.header.prev_cell_hash == NULL_HASH
+        reopened.close()
+
+    def test_read_only_open(self, wal_dir):
+        build_chain(wal_dir, 3).close()
+        sizes = {p: p.stat().st_size for _, p in list_segment_files(wal_dir)}
+
+        reader = PersistentChain.open(wal_dir, read_only=True)
+        assert len(reader) == 4
+        with pytest.raises(PersistentChainError, match="read-only"):
+            reader.append(make_judgment(reader, 10))
+        reader.close()
+
+        assert {p: p.stat().st_size for _, p in list_segment_files(wal_dir)} == sizes
+        assert len(PersistentChain.open(wal_dir)) == 4
+
+
+# =============================================================================
+# SEEDED CHAINS
+# =============================================================================
+
+class TestSeededChain:
+
+    def test_complete_load_reused(self, wal_dir):
+        chain = build_chain(wal_dir, 3)
+        mark_seed_load_complete(chain, "digest", 3)
+        chain.close()
+
+        reopened = open_seeded_chain(wal_dir, "digest")
+        assert len(reopened) == 4
+        assert reopened.last_rehydration.used_checkpoint
+        reopened.close()
+
+    def test_other_config_moved_aside(self, wal_dir):
+        chain = build_chain(wal_dir, 3)
+        mark_seed_load_complete(chain, "digest", 3)
+        chain.close()
+
+        assert open_seeded_chain(wal_dir, "other") is None
+        assert not PersistentChain.exists(wal_dir)
+        assert PersistentChain.exists(wal_dir.with_name(wal_dir.name + ".stale"))
+
+    def test_interrupted_load_rejected(self, wal_dir):
+        build_chain(wal_dir, 3).close()  # checkpointed, but never marked complete
+        assert open_seeded_chain(wal_dir, "digest") is None
+        assert not PersistentChain.exists(wal_dir)
+
+    def test_corrupt_wal_rejected(self, wal_dir):
+        chain = build_chain(wal_dir, 3)
+        mark_seed_load_complete(chain, "digest", 3)
+        chain.close()
+        for _, path in list_segment_files(wal_dir):
+            path.write_bytes(b"garbage" * 20)
+
+        assert open_seeded_chain(wal_dir, "digest", read_only=True) is None
+        assert PersistentChain.exists(wal_dir)  # left for the owning process
+        assert open_seeded_chain(wal_dir, "digest") is None
+        assert not PersistentChain.exists(wal_dir)
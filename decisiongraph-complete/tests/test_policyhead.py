@@ -1838,3 +1838,124 @@ class TestPolicyHeadChainToDot:
                 # Count quotes (should be even number)
                 quote_count = line.count('"')
                 assert quote_count % 2 == 0, f"Unbalanced quotes in: {line}"
+
+
+class TestPolicyHeadTimeline:
+    """Tests for the incremental per-namespace PolicyHead timeline"""
+
+    @pytest.fixture
+    def test_chain(self):
+        """Chain with PolicyHeads in two namespaces, including a system_time tie"""
+        chain = create_chain(graph_name="TestGraph", root_namespace="corp", system_time=T0)
+        for namespace, rules, system_time in [
+            ("corp.hr", ["rule:a"], T1),
+            ("corp.finance", ["rule:f"], T2),
+            ("corp.hr", ["rule:a", "rule:b"], T3),
+            ("corp.hr", ["rule:c"], T3),
+            ("corp.hr", ["rule:d"], T5),
+        ]:
+            chain.append(create_policy_head(
+                namespace=namespace,
+                promoted_rule_ids=rules,
+                graph_id=chain.graph_id,
+                prev_cell_hash=chain.head.cell_id,
+                system_time=system_time
+            ))
+        return chain
+
+    @staticmethod
+    def scan_at_time(chain, namespace, as_of_time):
+        """Reference: the original find_by_type() scan"""
+        heads = [
+            ph for ph in chain.find_by_type(CellType.POLICY_HEAD)
+            if ph.fact.namespace == namespace and ph.header.system_time <= as_of_time
+        ]
+        return max(heads, key=lambda ph: ph.header.system_time) if heads else None
+
+    def test_matches_chain_scan(self, test_chain):
+        for namespace in ("corp.hr", "corp.finance", "corp.sales"):
+            for as_of in (T0, T1, T2, T3, T4, T5, "2099-01-01T00:00:00Z"):
+                assert get_policy_head_at_time(test_chain, namespace, as_of) is \
+                    self.scan_at_time(test_chain, namespace, as_of)
+            assert get_current_policy_head(test_chain, namespace) is \
+                self.scan_at_time(test_chain, namespace, "9999")
+        history = get_policy_head_chain(test_chain, "corp.hr")
+        assert [parse_policy_data(ph)["promoted_rule_ids"] for ph in history] == \
+            [["rule:a"], ["rule:a", "rule:b"], ["rule:c"], ["rule:d"]]
+
+    def test_tie_returns_earliest_appended(self, test_chain):
+        head = get_policy_head_at_time(test_chain, "corp.hr", T4)
+        assert parse_policy_data(head)["promoted_rule_ids"] == ["rule:a", "rule:b"]
+
+    def test_promoted_rule_ids_preparsed(self, test_chain):
+        from decisiongraph.policyhead import get_policy_head_timeline
+
+        entry = get_policy_head_timeline(test_chain).at_time("corp.hr", T5)
+        assert entry.promoted_rule_ids == frozenset({"rule:d"})
+        assert isinstance(entry.promoted_rule_ids, frozenset)
+
+    def test_incremental_sync(self, test_chain):
+        from decisiongraph.policyhead import get_policy_head_timeline
+
+        timeline = get_policy_head_timeline(test_chain)
+        assert timeline.sync() == 0
+
+        test_chain.append(create_policy_head(
+            namespace="corp.finance",
+            promoted_rule_ids=["rule:g"],
+            graph_id=test_chain.graph_id,
+            prev_cell_hash=test_chain.head.cell_id,
+            system_time="2026-02-01T00:00:00Z"
+        ))
+        assert get_policy_head_timeline(test_chain) is timeline
+        assert timeline.sync() == 0  # already synced by the lookup above
+        current = get_current_policy_head(test_chain, "corp.finance")
+        assert parse_policy_data(current)["promoted_rule_ids"] == ["rule:g"]
+
+    def test_lookups_do_not_scan_chain(self, test_chain, monkeypatch):
+        get_current_policy_head(test_chain, "corp.hr")
+
+        def no_scan(cell_type):
+            raise AssertionError("find_by_type scan")
+        monkeypatch.setattr(test_chain, "find_by_type", no_scan)
+        assert get_policy_head_at_time(test_chain, "corp.hr", T2) is not None
+        assert len(get_policy_head_chain(test_chain, "corp.hr")) == 4
+
+    def test_shadow_fork_does_not_leak(self, test_chain):
+        from decisiongraph.shadow import fork_shadow_chain
+
+        base_current = get_current_policy_head(test_chain, "corp.hr")
+        shadow = fork_shadow_chain(test_chain)
+        shadow.append(create_policy_head(
+            namespace="corp.hr",
+            promoted_rule_ids=["rule:shadow"],
+            graph_id=shadow.graph_id,
+            prev_cell_hash=shadow.head.cell_id,
+            system_time="2026-02-01T00:00:00Z"
+        ))
+        assert parse_policy_data(get_current_policy_head(shadow, "corp.hr"))["promoted_rule_ids"] == \
+            ["rule:shadow"]
+        assert get_current_policy_head(test_chain, "corp.hr") is base_current
+
+    def test_sync_publishes_new_snapshots(self, test_chain):
+        from decisiongraph.policyhead import get_policy_head_timeline
+
+        timeline = get_policy_head_timeline(test_chain)
+        before = timeline._heads["corp.hr"]
+        fork = timeline.copy(test_chain)
+        test_chain.append(create_policy_head(
+            namespace="corp.hr",
+            promoted_rule_ids=["rule:e"],
+            graph_id=test_chain.graph_id,
+            prev_cell_hash=test_chain.head.cell_id,
+            system_time=T5
+        ))
+        timeline.sync()
+
+        # A reader holding the old pair still sees a consistent (unchanged) pair
+        assert timeline._heads["corp.hr"] is not before
+        assert len(before[0]) == len(before[1]) == 4
+        assert fork._heads["corp.hr"] is before
+        times, entries = timeline._heads["corp.hr"]
+        assert [e.system_time for e in entries] == list(times)
+        assert timeline.current("corp.hr").promoted_rule_ids == frozenset({"rule:d"})  # tie: earliest
@@ -0,0 +1,186 @@
+"""Tests for the columnar precedent matrix — vectorized v3 Layer 2 scoring."""
+
+import random
+import sys
+
+import pytest
+
+from decisiongraph.banking_domain import create_banking_domain_registry
+from decisiongraph.domain_registry import (
+    ComparisonFn,
+    DomainRegistry,
+    FieldDefinition,
+    FieldTier,
+    FieldType,
+)
+from decisiongraph.precedent_matrix import PrecedentMatrix
+from decisiongraph.precedent_scorer_v3 import score_similarity
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def _field(name, comparison, weight, **kwargs) -> FieldDefinition:
+    return FieldDefinition(
+        name=name, label=name.title(), type=FieldType.CATEGORICAL,
+        comparison=comparison, weight=weight, tier=FieldTier.BEHAVIORAL, **kwargs,
+    )
+
+
+@pytest.fixture
+def mixed_domain() -> DomainRegistry:
+    """One field per comparison function, with awkward definitions."""
+    fields = [
+        _field("exact", ComparisonFn.EXACT, 0.3),
+        _field("equiv", ComparisonFn.EQUIVALENCE_CLASS, 0.2, equivalence_classes={
+            "electronic": ["wire", "EFT", " ach "], "paper": ["cheque", "draft"],
+            "mixed": ["draft", "money_order"],
+        }),
+        _field("step", ComparisonFn.STEP, 0.15, ordered_values=["low", "Mid", "high", "mid"]),
+        _field("single_step", ComparisonFn.STEP, 0.05, ordered_values=["only"]),
+        _field("decay", ComparisonFn.DISTANCE_DECAY, 0.1, max_distance=3),
+        _field("flat_decay", ComparisonFn.DISTANCE_DECAY, 0.05, max_distance=0),
+        _field("tags", ComparisonFn.JACCARD, 0.15),
+    ]
+    return DomainRegistry(
+        domain="test", version="3.0",
+        fields={f.name: f for f in fields}, comparability_gates=[],
+    )
+
+
+VALUES = {
+    "exact": [True, False, 1, 0, "Cash", "cash ", "wire", 2, None, ["unhashable"], float("nan")],
+    "equiv": ["wire", "eft", "ACH", "cheque", "draft", "money_order", "crypto", 7, None],
+    "step": ["low", "mid", "MID", "high", "extreme", None, 3],
+    "single_step": ["only", "other", None],
+    "decay": [0, 1, 2, 3, 5, "2", "x", True, 2.5, None, [1]],
+    "flat_decay": [0, 1, "1", None],
+    "tags": [set(), {"a"}, {"a", "b"}, ["b", "c", "c"], "ab", (1, True), None],
+}
+
+
+def _random_facts(rng: random.Random) -> dict:
+    facts = {}
+    for name, values in VALUES.items():
+        value = rng.choice(values)
+        if value is not None:
+            facts[name] = value
+    return facts
+
+
+def _assert_matches(matrix, domain, case, rows, pool):
+    scores, non_transferable = matrix.score(case, rows)
+    for row, score, nt in zip(rows, scores, non_transferable):
+        facts, drivers = pool[row]
+        expected = score_similarity(domain, case, facts, precedent_drivers=drivers)
+        assert score == expected.score  # bit-identical, not approximate
+        assert nt == expected.non_transferable
+
+
+# ---------------------------------------------------------------------------
+# Equivalence with score_similarity
+# ---------------------------------------------------------------------------
+
+class TestEquivalence:
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_mixed_domain_randomized(self, mixed_domain, monkeypatch, vectorized):
+        if vectorized:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(sys.modules[PrecedentMatrix.__module__], "np", None)
+
+        rng = random.Random(21)
+        matrix = PrecedentMatrix(mixed_domain)
+        pool = []
+        for i in range(300):
+            facts = _random_facts(rng)
+            drivers = rng.sample(list(VALUES), rng.randrange(3))
+            pool.append((facts, drivers))
+            assert matrix.add(f"p{i}", facts, drivers) == i
+        assert matrix.vectorized is vectorized
+
+        for _ in range(40):
+            case = _random_facts(rng)
+            rows = sorted(rng.sample(range(len(pool)), 120))
+            _assert_matches(matrix, mixed_domain, case, rows, pool)
+
+    def test_banking_domain(self):
+        pytest.importorskip("numpy")
+        domain = create_banking_domain_registry()
+        rng = random.Random(7)
+        choices = {
+            fd.name: (fd.ordered_values or [True, False, 0, 1, 2, 4]) + [None]
+            for fd in domain.get_scoring_fields()
+        }
+        matrix = PrecedentMatrix(domain)
+        pool = []
+        for i in range(200):
+            facts = {k: rng.choice(v) for k, v in choices.items()}
+            drivers = rng.sample(list(choices), 3)
+            pool.append((facts, drivers))
+            matrix.add(f"p{i}", facts, drivers)
+
+        for _ in range(20):
+            case = {k: rng.choice(v) for k, v in choices.items()}
+            _assert_matches(matrix, domain, case, list(range(len(pool))), pool)
+
+    def test_comparator_errors_propagate(self, mixed_domain):
+        matrix = PrecedentMatrix(mixed_domain)
+        matrix.add("p0", {"tags": {"a"}})
+        matrix.add("p1", {"tags": [["unhashable"]]})
+        with pytest.raises(TypeError):
+            score_similarity(mixed_domain, {"tags": ["a"]}, {"tags": [["unhashable"]]})
+        with pytest.raises(TypeError):
+            matrix.score({"tags": ["a"]})
+        assert list(matrix.score({"tags": ["a"]}, [0])[0]) == [1.0]
+
+    def test_similarity_is_full_breakdown(self, mixed_domain):
+        matrix = PrecedentMatrix(mixed_domain)
+        facts = {"exact": "cash", "equiv": "wire", "tags": {"a"}}
+        row = matrix.add("p", facts, ["equiv", "step"])
+        case = {"exact": "CASH", "equiv": "cheque", "tags": ["a", "b"]}
+        expected = score_similarity(mixed_domain, case, facts, precedent_drivers=["equiv", "step"])
+        assert matrix.similarity(row, case) == expected
+        assert expected.non_transferable and expected.mismatched_drivers == ["equiv"]
+
+
+# ---------------------------------------------------------------------------
+# Pool maintenance
+# ---------------------------------------------------------------------------
+
+class TestPool:
+    def test_rows_keyed_and_appended_after_scoring(self, mixed_domain):
+        pytest.importorskip("numpy")
+        matrix = PrecedentMatrix(mixed_domain)
+        first = matrix.add("p0", {"exact": "cash"})
+        assert matrix.add("p0", {"exact": "wire"}) == first  # existing key keeps its row
+        scores, _ = matrix.score({"exact": "cash"})
+        assert list(scores) == [1.0]
+
+        # New rows (and new vocabulary) are picked up by the next score()
+        matrix.add("p1", {"exact": "wire", "tags": ["z"]})
+        scores, _ = matrix.score({"exact": "wire", "tags": ["z"]})
+        assert list(scores) == [0.0, 1.0]
+        assert len(matrix) == 2
+
+    def test_vocab_grown_after_compile(self, mixed_domain):
+        # A concurrent add() can grow the vocab between _sync() and scoring
+        pytest.importorskip("numpy")
+        matrix = PrecedentMatrix(mixed_domain)
+        matrix.add("p0", {"tags": ["a", "b"]})
+        matrix.score({"tags": ["a"]})
+        matrix.add("p1", {"tags": ["y", "z"]})
+        sync, matrix._sync = matrix._sync, lambda: None
+
+        scores, _ = matrix.score({"tags": ["a", "z"]}, [0])
+        assert list(scores) == [score_similarity(
+            mixed_domain, {"tags": ["a", "z"]}, {"tags": ["a", "b"]}).score]
+
+        matrix._sync = sync
+        scores, _ = matrix.score({"tags": ["a", "z"]})
+        assert list(scores) == [1 / 3, 1 / 3]
+
+    def test_empty_rows(self, mixed_domain):
+        scores, non_transferable = PrecedentMatrix(mixed_domain).score({"exact": "cash"}, [])
+        assert len(scores) == 0 and len(non_transferable) == 0
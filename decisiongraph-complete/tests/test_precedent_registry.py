@@ -9,6 +9,8 @@ Tests cover:
 - Bitemporal filtering
 """
 
+import threading
+
 import pytest
 from decisiongraph.chain import Chain
 from decisiongraph.cell import HASH_SCHEME_CANONICAL
@@ -18,6 +20,7 @@ from decisiongraph.judgment import (
     create_judgment_cell,
 )
 from decisiongraph.precedent_registry import (
+    IndexedPrecedentRegistry,
     PrecedentRegistry,
     PrecedentStatistics,
     AppealStatistics,
@@ -537,3 +540,186 @@ class TestBitemporalQueries:
 
         with pytest.raises(InvalidQueryError, match="Invalid as_of"):
             registry.find_by_fingerprint("a" * 64, "claims", as_of="invalid")
+
+
+# =============================================================================
+# IndexedPrecedentRegistry Tests
+# =============================================================================
+
+def _make_payload(i, outcome, codes, reasons, fingerprint):
+    """Build a distinct JUDGMENT payload for the parity corpus."""
+    return JudgmentPayload.create(
+        case_id_hash=f"{i:064x}",
+        jurisdiction_code="CA-ON",
+        fingerprint_hash=fingerprint,
+        fingerprint_schema_id="test:v1",
+        exclusion_codes=codes,
+        reason_codes=reasons,
+        reason_code_registry_id="test:v1",
+        outcome_code=outcome,
+        certainty="high",
+        anchor_facts=[AnchorFact(field_id="t", value=i, label="T")],
+        policy_pack_hash="c" * 64,
+        policy_pack_id="test",
+        policy_version="1.0",
+        decision_level="adjuster" if i % 2 else "manager",
+        decided_at=f"2026-01-{1 + i % 28:02d}T12:00:00Z",
+        decided_by_role="adjuster",
+    )
+
+
+@pytest.fixture
+def parity_chain(test_chain):
+    """Chain with a mix of namespaces, codes, outcomes and fingerprints."""
+    namespaces = ["claims.precedents", "claims.auto", "claimsx.other", "claims.auto.sub"]
+    code_pool = ["4.2.1", "4.3.3", "4.4.1", "5.1"]
+    for i in range(40):
+        add_judgment_to_chain(
+            test_chain,
+            _make_payload(
+                i,
+                outcome=["deny", "pay", "partial"][i % 3],
+                codes=[code_pool[i % 4], code_pool[(i * 3) % 4]],
+                reasons=[f"RC-{i % 5}"],
+                fingerprint=("f" if i % 2 else "e") * 64,
+            ),
+            namespace=namespaces[i % 4],
+        )
+    return test_chain
+
+
+class TestIndexedPrecedentRegistry:
+    """IndexedPrecedentRegistry must answer exactly like the stateless scan."""
+
+    @pytest.mark.parametrize("prefix", ["claims", "claims.auto", "claims.precedents", "none"])
+    def test_query_parity(self, parity_chain, prefix):
+        """All query methods return identical results in identical order."""
+        scan = PrecedentRegistry(parity_chain)
+        indexed = IndexedPrecedentRegistry(parity_chain)
+
+        for fp in ("e" * 64, "f" * 64, "0" * 64):
+            assert indexed.find_by_fingerprint(fp, prefix) == scan.find_by_fingerprint(fp, prefix)
+
+        for codes, outcome, min_overlap in [
+            (["4.2.1"], None, 1),
+            (["4.2.1", "4.4.1"], None, 2),
+            (["4.3.3", "5.1"], "deny", 1),
+        ]:
+            assert indexed.find_by_exclusion_codes(
+                codes, prefix, outcome=outcome, min_overlap=min_overlap
+            ) == scan.find_by_exclusion_codes(
+                codes, prefix, outcome=outcome, min_overlap=min_overlap
+            )
+
+        assert indexed.find_by_reason_codes(["RC-1", "RC-3"], prefix) == \
+            scan.find_by_reason_codes(["RC-1", "RC-3"], prefix)
+        assert indexed.count_by_outcome(prefix) == scan.count_by_outcome(prefix)
+        assert indexed.get_statistics_by_codes(["4.2.1"], prefix).to_dict() == \
+            scan.get_statistics_by_codes(["4.2.1"], prefix).to_dict()
+
+    def test_as_of_parity(self, parity_chain):
+        """Bitemporal cutoffs select the same prefix of the chain."""
+        scan = PrecedentRegistry(parity_chain)
+        indexed = IndexedPrecedentRegistry(parity_chain)
+
+        for cell in parity_chain.cells[1::7]:
+            as_of = cell.header.system_time
+            assert indexed.find_by_fingerprint("f" * 64, "claims", as_of=as_of) == \
+                scan.find_by_fingerprint("f" * 64, "claims", as_of=as_of)
+            assert indexed.count_by_outcome("claims", as_of=as_of) == \
+                scan.count_by_outcome("claims", as_of=as_of)
+
+    def test_picks_up_appended_cells(self, test_chain, sample_payload):
+        """Cells appended after construction are indexed on the next query."""
+        registry = IndexedPrecedentRegistry(test_chain)
+        assert registry.find_by_fingerprint(sample_payload.fingerprint_hash, "claims") == []
+
+        add_judgment_to_chain(test_chain, sample_payload)
+
+        matches = registry.find_by_fingerprint(sample_payload.fingerprint_hash, "claims")
+        assert [m.precedent_id for m in matches] == [sample_payload.precedent_id]
+        assert registry.indexed_count == 1
+
+    def test_refresh_is_incremental(self, parity_chain):
+        """refresh() only processes cells past the high-water mark."""
+        registry = IndexedPrecedentRegistry(parity_chain)
+        assert registry.indexed_count == 40
+        assert registry.refresh() == 0
+
+        add_judgment_to_chain(
+            parity_chain, _make_payload(99, "deny", ["4.2.1"], ["RC-0"], "e" * 64)
+        )
+        assert registry.refresh() == 1
+        assert registry.indexed_count == 41
+
+    def test_count_by_outcome_tolerates_concurrent_refresh(self, parity_chain):
+        """A refresh landing mid-count (new outcome key) does not break iteration."""
+        registry = IndexedPrecedentRegistry(parity_chain)
+        expected = registry.count_by_outcome("claims")
+        visible = registry._visible
+
+        def interleaved(*args):
+            if registry.indexed_count == 40:
+                add_judgment_to_chain(
+                    parity_chain, _make_payload(98, "escalate", ["5.1"], ["RC-0"], "e" * 64)
+                )
+                registry.refresh()
+            return visible(*args)
+
+        registry._visible = interleaved
+        assert registry.count_by_outcome("claims") == expected
+        del registry._visible
+        assert registry.count_by_outcome("claims")["escalate"] == 1
+
+    def test_prefix_cache_tolerates_concurrent_refresh(self, parity_chain):
+        """A refresh adding a namespace mid-lookup neither breaks nor poisons the cache."""
+        registry = IndexedPrecedentRegistry(parity_chain)
+        registry._prefix_cache.clear()
+
+        def add_namespace():
+            add_judgment_to_chain(
+                parity_chain,
+                _make_payload(97, "deny", ["4.2.1"], ["RC-0"], "e" * 64),
+                namespace="claims.marine",
+            )
+            registry.refresh()
+
+        class RacingDict(dict):
+            def __iter__(self):
+                keys = super().__iter__()
+                if not racers:
+                    worker = threading.Thread(target=add_namespace)
+                    racers.append(worker)
+                    worker.start()
+                    worker.join(0.2)  # blocks on the registry lock when guarded
+                return keys
+
+        racers = []
+        registry._by_namespace = RacingDict(registry._by_namespace)
+        registry._matching_namespaces("claims")
+        for worker in racers:
+            worker.join()
+
+        assert "claims.marine" in registry._matching_namespaces("claims")
+        assert len(registry.find_by_exclusion_codes(["4.2.1"], "claims.marine")) == 1
+
+    def test_find_with_statistics_parity(self, parity_chain):
+        """Fused query matches find + get_statistics_by_codes on both registries."""
+        for registry in (PrecedentRegistry(parity_chain), IndexedPrecedentRegistry(parity_chain)):
+            matches, stats = registry.find_with_statistics_by_codes(["4.2.1", "5.1"], "claims")
+            assert matches == registry.find_by_exclusion_codes(["4.2.1", "5.1"], "claims")
+            assert stats.to_dict() == registry.get_statistics_by_codes(
+                ["4.2.1", "5.1"], "claims"
+            ).to_dict()
+            assert stats.total_matched == len(matches)
+
+    def test_validation_errors_preserved(self, test_chain):
+        """Invalid arguments raise the same errors as the stateless registry."""
+        registry = IndexedPrecedentRegistry(test_chain)
+
+        with pytest.raises(InvalidQueryError, match="Invalid as_of"):
+            registry.find_by_fingerprint("a" * 64, "claims", as_of="invalid")
+        with pytest.raises(InvalidQueryError):
+            registry.find_by_fingerprint("abc", "claims")
+        with pytest.raises(InvalidQueryError):
+            registry.find_by_exclusion_codes([], "claims")
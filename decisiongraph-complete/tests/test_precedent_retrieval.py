@@ -0,0 +1,154 @@
+"""Tests for top-K precedent retrieval — bucketed heaps and bound pruning."""
+
+import random
+import sys
+
+import pytest
+
+from decisiongraph.banking_domain import create_banking_domain_registry
+from decisiongraph.precedent_matrix import PrecedentMatrix
+from decisiongraph.precedent_retrieval import BOUND_SLACK, BucketedTopK, retrieve_top_k
+from decisiongraph.precedent_scorer_v3 import classify_match_v3, score_similarity
+
+
+CAPS = {"supporting": 35, "contrary": 10, "neutral": 15}
+DISPOSITIONS = ["ALLOW", "BLOCK", "EDD", "UNKNOWN"]
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def pool():
+    """A banking precedent pool clustered around a few profiles."""
+    domain = create_banking_domain_registry()
+    fields = domain.get_scoring_fields()
+    rng = random.Random(23)
+    profiles = [
+        {fd.name: rng.choice(fd.ordered_values or [True, False]) for fd in fields}
+        for _ in range(4)
+    ]
+    precedents = []
+    for _ in range(1500):
+        facts = dict(rng.choice(profiles))
+        for fd in rng.sample(fields, rng.randrange(12)):
+            facts[fd.name] = rng.choice((fd.ordered_values or [True, False, 0, 3]) + [None])
+        precedents.append({
+            "facts": facts,
+            "drivers": [fd.name for fd in rng.sample(fields, rng.randrange(4))],
+            "disposition": rng.choice(DISPOSITIONS),
+            # decision-level and recency weights, as in query_similar_precedents_v3
+            "dw": rng.choice([1.0, 1.1, 1.25]),
+            "rw": rng.choice([1.0, 0.95, 0.9, 0.8]),
+        })
+    matrix = PrecedentMatrix(domain)
+    rows = [matrix.add(f"p{i}", p["facts"], p["drivers"]) for i, p in enumerate(precedents)]
+    return domain, matrix, rows, precedents, profiles
+
+
+def _classify(precedent, case_disposition, non_transferable):
+    return classify_match_v3(
+        case_disposition, precedent["disposition"], "DISCRETIONARY", "DISCRETIONARY",
+        non_transferable=non_transferable,
+    )
+
+
+def _exhaustive(domain, precedents, case, case_disposition, floor):
+    """The service path: score all, floor, rank, stable sort, per-bucket caps."""
+    scored = []
+    for position, p in enumerate(precedents):
+        sim = score_similarity(domain, case, p["facts"], precedent_drivers=p["drivers"])
+        if sim.score < floor:
+            continue
+        combined = sim.score * p["dw"] * p["rw"]
+        scored.append((position, _classify(p, case_disposition, sim.non_transferable), combined))
+    scored.sort(key=lambda t: t[2], reverse=True)
+    buckets = {b: [] for b in CAPS}
+    for position, cls, _ in scored:
+        if len(buckets[cls]) < CAPS[cls]:
+            buckets[cls].append(position)
+    return [p for b in CAPS for p in buckets[b]][:50], {b: len(v) for b, v in buckets.items()}
+
+
+# ---------------------------------------------------------------------------
+# retrieve_top_k vs exhaustive scoring
+# ---------------------------------------------------------------------------
+
+class TestRetrieveTopK:
+    @pytest.mark.parametrize("floor", [0.0, 0.6, 0.8])
+    def test_same_sample_as_exhaustive(self, pool, floor):
+        domain, matrix, rows, precedents, profiles = pool
+        rng = random.Random(int(floor * 10))
+        pruned = 0
+        for case_number in range(12):
+            case = dict(profiles[case_number % len(profiles)])
+            for name in rng.sample(list(case), 4):
+                case[name] = None
+            disposition = rng.choice(DISPOSITIONS[:3])
+
+            result = retrieve_top_k(
+                matrix, case, rows, CAPS,
+                bucket_of=lambda pos, score, nt: _classify(precedents[pos], disposition, nt),
+                floor=floor,
+                limit=50,
+                rank_of=lambda pos, score: score * precedents[pos]["dw"] * precedents[pos]["rw"],
+                rank_weights=[p["dw"] * p["rw"] for p in precedents],
+                possible_buckets=lambda pos: {
+                    _classify(precedents[pos], disposition, False),
+                    _classify(precedents[pos], disposition, True),
+                },
+                batch_size=32,
+            )
+            expected, counts = _exhaustive(domain, precedents, case, disposition, floor)
+            assert [r.position for r in result.selected] == expected
+            assert result.counts == counts
+            assert result.scored + result.pruned == len(rows)
+            pruned += result.pruned
+        assert pruned > 0
+
+    def test_bounds_never_below_scores(self, pool):
+        domain, matrix, rows, precedents, profiles = pool
+        for probe_weight in (0.0, 0.5, 1.0):
+            bounds = matrix.upper_bounds(profiles[1], rows, probe_weight)
+            scores, _ = matrix.score(profiles[1], rows)
+            assert all(b + BOUND_SLACK >= s for b, s in zip(bounds, scores))
+
+    def test_without_numpy_scores_everything(self, pool, monkeypatch):
+        domain, matrix, rows, precedents, profiles = pool
+        expected = retrieve_top_k(matrix, profiles[2], rows, {"all": 10}, bucket_of=lambda *_: "all")
+        monkeypatch.setattr(sys.modules[PrecedentMatrix.__module__], "np", None)
+        result = retrieve_top_k(matrix, profiles[2], rows, {"all": 10}, bucket_of=lambda *_: "all")
+        assert [r.position for r in result.selected] == [r.position for r in expected.selected]
+
+    def test_default_rank_is_score(self, pool):
+        domain, matrix, rows, precedents, profiles = pool
+        case = profiles[0]
+        result = retrieve_top_k(matrix, case, rows, {"all": 5}, bucket_of=lambda *_: "all")
+        scores = sorted(
+            (score_similarity(domain, case, p["facts"], p["drivers"]).score for p in precedents),
+            reverse=True,
+        )
+        assert [r.score for r in result.selected] == scores[:5]
+        assert result.scored < len(rows)
+
+
+# ---------------------------------------------------------------------------
+# BucketedTopK
+# ---------------------------------------------------------------------------
+
+class TestBucketedTopK:
+    def test_matches_stable_sort_with_ties(self):
+        rng = random.Random(5)
+        items = [(rng.choice("abc"), rng.choice([0.1, 0.5, 0.5, 0.9])) for _ in range(200)]
+        caps = {"a": 3, "b": 0, "c": 7}
+        heaps = BucketedTopK(caps)
+        for order, (bucket, rank) in enumerate(items):
+            heaps.offer(bucket, rank, order, order)
+
+        ordered = sorted(range(len(items)), key=lambda i: items[i][1], reverse=True)
+        for bucket, cap in caps.items():
+            assert heaps.ranked(bucket) == [i for i in ordered if items[i][0] == bucket][:cap]
+        assert heaps.counts() == {"a": 3, "b": 0, "c": 7}
+        assert len(heaps.selected(limit=5)) == 5
+        assert not heaps.offer("z", 1.0, 999, "unknown bucket")
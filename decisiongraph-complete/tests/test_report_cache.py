@@ -0,0 +1,123 @@
+"""Tests for memoized report compilation (service/routers/report/cache.py)."""
+
+import copy
+
+import pytest
+
+from service.routers.report import compile_report, compile_report_context
+from service.routers.report.cache import ReportCache, report_cache
+from service.routers.report.pipeline import PIPELINE_VERSION
+
+
+@pytest.fixture(scope="module")
+def client():
+    from fastapi.testclient import TestClient
+    from service.main import app
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def decisions(client):
+    from service.demo_cases import DEMO_CASES
+    packs = []
+    for case in DEMO_CASES[:3]:
+        resp = client.post("/decide", json=case)
+        assert resp.status_code == 200
+        packs.append(resp.json())
+    return packs
+
+
+# Filled from the wall clock when the pack carries no timestamp
+VOLATILE_KEYS = ("timestamp", "sla_timeline")
+
+
+def stable(view_model):
+    return {k: v for k, v in view_model.items() if k not in VOLATILE_KEYS}
+
+
+def with_id(decision, decision_id):
+    pack = copy.deepcopy(decision)
+    pack["meta"]["decision_id"] = decision_id
+    return pack
+
+
+class TestReportCache:
+
+    def test_hit_returns_same_stages(self, decisions):
+        cache = ReportCache(max_entries=4)
+        first = cache.compile(decisions[0])
+        assert cache.compile(decisions[0]) is first
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_matches_uncached_pipeline(self, decisions):
+        cache = ReportCache(max_entries=4)
+        decision = decisions[1]
+        assert stable(cache.context(decision)) == stable(compile_report_context(decision))
+        assert cache.markdown(decision) == cache.markdown(decision)
+        assert len(cache.markdown(decision)) == len(compile_report(decision))
+        stats = cache.stats()
+        assert (stats["markdown_misses"], stats["markdown_hits"]) == (1, 2)
+
+    def test_lru_eviction(self, decisions):
+        cache = ReportCache(max_entries=2)
+        a, b, c = (with_id(decisions[0], f"{i:064x}") for i in range(3))
+        cache.compile(a)
+        cache.compile(b)
+        cache.compile(a)  # a is now most recent
+        cache.compile(c)  # evicts b
+        assert cache.stats()["evictions"] == 1
+        cache.compile(a)
+        assert cache.stats()["hits"] == 2
+        cache.compile(b)
+        assert cache.stats()["misses"] == 4
+
+    def test_replaced_decision_recompiles(self, decisions):
+        cache = ReportCache(max_entries=4)
+        original = decisions[0]
+        rerun = copy.deepcopy(original)
+        rerun["decision"]["verdict"] = "RERUN"
+        first = cache.compile(original)
+        second = cache.compile(rerun)
+        assert second is not first
+        assert second.decision is rerun
+        assert cache.stats()["entries"] == 1
+
+    def test_disabled_or_missing_id_not_cached(self, decisions):
+        disabled = ReportCache(max_entries=0)
+        disabled.compile(decisions[0])
+        disabled.compile(decisions[0])
+        assert disabled.stats()["misses"] == 2
+
+        cache = ReportCache(max_entries=4)
+        anonymous = copy.deepcopy(decisions[0])
+        anonymous["meta"].pop("decision_id")
+        cache.compile(anonymous)
+        assert cache.stats()["entries"] == 0
+
+
+class TestReportEndpoints:
+
+    def test_formats_share_one_compilation(self, client, decisions):
+        decision_id = decisions[2]["meta"]["decision_id"]
+        report_cache.clear()
+        before = report_cache.stats()
+
+        assert client.get(f"/report/{decision_id}/json").status_code == 200
+        assert client.get(f"/report/{decision_id}/markdown").status_code == 200
+        assert client.get(f"/report/{decision_id}/json").status_code == 200
+        assert client.get(f"/report/{decision_id}/markdown").status_code == 200
+
+        stats = client.get("/report/cache/stats").json()
+        assert stats["pipeline_version"] == PIPELINE_VERSION
+        assert stats["misses"] - before["misses"] == 1
+        assert stats["hits"] - before["hits"] == 3
+
+        assert stats["markdown_misses"] - before["markdown_misses"] == 1
+        assert stats["markdown_hits"] - before["markdown_hits"] == 1
+
+    def test_html_does_not_leak_request_into_cache(self, client, decisions):
+        decision_id = decisions[2]["meta"]["decision_id"]
+        client.get(f"/report/{decision_id}")
+        stored = client.get(f"/report/{decision_id}/json").json()["report"]
+        assert "request" not in stored
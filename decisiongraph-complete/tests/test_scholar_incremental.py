@@ -0,0 +1,126 @@
+"""
+Tests for incremental Scholar index maintenance.
+
+Tests cover:
+1. Appends are indexed through the chain subscription (no refresh needed)
+2. refresh() only processes cells past the high-water mark
+3. Incremental indexes equal a full rebuild
+4. Bridges and revocations reach the namespace registry incrementally
+5. Forked Scholars (SimulationContext) reuse the base indexes
+"""
+
+import gc
+
+from decisiongraph import (
+    Scholar,
+    create_chain,
+    create_scholar,
+    fork_shadow_chain,
+)
+from decisiongraph.simulation import SimulationContext
+from decisiongraph.shadow import OverlayContext
+
+from test_utils import T0, assert_matches_full_build, bridge_cell, fact_cell, query, ts
+
+
+class TestAppendSubscription:
+
+    def test_append_visible_without_refresh(self, chain):
+        scholar = create_scholar(chain)
+        assert query(scholar).count == 0
+
+        chain.append(fact_cell(chain, 10, subject="employee:jane"))
+        assert scholar.indexed_upto == len(chain)
+        assert [c.fact.object for c in query(scholar, subject="employee:jane").facts] == ["10"]
+
+    def test_refresh_processes_only_new_cells(self, chain):
+        scholar = create_scholar(chain)
+        assert scholar.refresh() == 0
+
+        # A cell that bypasses append() is caught up by the next refresh/query
+        cell = fact_cell(chain, 10)
+        chain.cells.append(cell)
+        chain.index[cell.cell_id] = len(chain.cells) - 1
+        assert scholar.refresh() == 1
+        assert scholar.refresh() == 0
+
+        stray = fact_cell(chain, 11, subject="employee:stray")
+        chain.cells.append(stray)
+        chain.index[stray.cell_id] = len(chain.cells) - 1
+        assert query(scholar, subject="employee:stray").count == 1
+        assert scholar.indexed_upto == len(chain)
+
+    def test_matches_full_build(self, chain):
+        scholar = create_scholar(chain)
+        for i in range(10, 70):
+            chain.append(fact_cell(chain, i, namespace="corp.hr" if i % 2 else "corp.sales"))
+            if i == 40:
+                chain.append(bridge_cell(chain, 41, "corp.sales", "corp.hr"))
+        assert_matches_full_build(scholar)
+        assert scholar.refresh(full=True) == len(chain)
+        assert_matches_full_build(scholar)
+
+    def test_bridge_and_revocation_incremental(self, chain):
+        from decisiongraph import create_bridge_revocation
+
+        chain.append(fact_cell(chain, 10))
+        scholar = create_scholar(chain)
+        assert query(scholar, requester="corp.sales").count == 0
+
+        bridge = bridge_cell(chain, 11, "corp.sales", "corp.hr")
+        chain.append(bridge)
+        assert query(scholar, requester="corp.sales").bridges_used == [bridge.cell_id]
+
+        chain.append(create_bridge_revocation(
+            bridge_cell_id=bridge.cell_id,
+            revoked_by="role:owner",
+            reason="test",
+            graph_id=chain.graph_id,
+            prev_cell_hash=chain.head.cell_id
+        ))
+        assert bridge.cell_id in scholar.registry.revoked_bridges
+        assert_matches_full_build(scholar)
+
+    def test_replaced_cell_list_rebuilds(self, chain):
+        scholar = create_scholar(chain)
+        chain.append(fact_cell(chain, 10))
+        other = create_chain(graph_name="Other", root_namespace="corp", creator="test", system_time=T0)
+        chain.cells = list(other.cells)
+        chain.index = dict(other.index)
+        assert scholar.refresh() == 1
+        assert scholar.index.cell_by_id == {}
+
+    def test_collected_scholar_unsubscribes(self, chain):
+        create_scholar(chain)
+        gc.collect()
+        chain.append(fact_cell(chain, 10))
+        assert chain._subscribers == []
+
+
+class TestFork:
+
+    def test_fork_reuses_base_indexes(self, chain):
+        for i in range(10, 20):
+            chain.append(fact_cell(chain, i))
+        base = create_scholar(chain)
+
+        shadow_chain = fork_shadow_chain(chain)
+        shadow_chain.append(fact_cell(shadow_chain, 30, subject="employee:shadow"))
+        forked = Scholar(shadow_chain, base=base)
+
+        assert forked.indexed_upto == len(shadow_chain)
+        assert query(forked, subject="employee:shadow").count == 1
+        assert query(base, subject="employee:shadow").count == 0
+        assert base.indexed_upto == len(chain)
+        assert_matches_full_build(forked)
+        assert_matches_full_build(base)
+
+    def test_simulation_context_with_base_scholar(self, chain):
+        for i in range(10, 20):
+            chain.append(fact_cell(chain, i))
+        base = create_scholar(chain)
+        overlay = OverlayContext()
+        with SimulationContext(chain, overlay, ts(3599), ts(3599), base_scholar=base) as sim:
+            assert sim.shadow_scholar is not base
+            assert query(sim.shadow_scholar).count == query(base).count
+            assert_matches_full_build(sim.shadow_scholar)
@@ -0,0 +1,150 @@
+"""
+Tests for the batched Scholar.traverse().
+
+Tests cover:
+1. Results identical to the per-edge query_facts depth-first traversal
+   (random ownership graphs with cycles, shared owners and conflicts)
+2. Visibility denied / bridged traversals
+3. max_nodes budget
+"""
+
+import random
+
+import pytest
+
+from decisiongraph import (
+    CellType,
+    DecisionCell,
+    Fact,
+    Header,
+    LogicAnchor,
+    Proof,
+    SourceQuality,
+    compute_rule_logic_hash,
+    create_scholar,
+)
+
+from test_utils import bridge_cell, ts
+
+QUALITIES = [SourceQuality.VERIFIED, SourceQuality.SELF_REPORTED, SourceQuality.INFERRED]
+
+
+def edge_cell(chain, i, subject, predicate, obj, quality, valid_to=None):
+    return DecisionCell(
+        header=Header(
+            version="1.3",
+            graph_id=chain.graph_id,
+            cell_type=CellType.FACT,
+            system_time=ts(i),
+            prev_cell_hash=chain.head.cell_id
+        ),
+        fact=Fact(
+            namespace="corp.hr",
+            subject=subject,
+            predicate=predicate,
+            object=obj,
+            confidence=1.0 if quality == SourceQuality.VERIFIED else 0.8,
+            source_quality=quality,
+            valid_from=ts(i),
+            valid_to=valid_to
+        ),
+        logic_anchor=LogicAnchor(
+            rule_id="source:registry",
+            rule_logic_hash=compute_rule_logic_hash("Corporate registry")
+        ),
+        proof=Proof(signer_id="system:registry")
+    )
+
+
+def reference_traverse(scholar, requester, start, predicates, namespace, max_depth, vt, st):
+    """The original recursive traversal: one query_facts per edge."""
+    visited = set()
+    results = []
+
+    def _traverse(subject, path, depth):
+        if depth > max_depth or subject in visited:
+            return
+        visited.add(subject)
+        results.append((subject, path.copy()))
+        for pred in predicates:
+            query_result = scholar.query_facts(
+                requester_namespace=requester,
+                namespace=namespace,
+                subject=subject,
+                predicate=pred,
+                at_valid_time=vt,
+                as_of_system_time=st
+            )
+            for fact in query_result.facts:
+                _traverse(fact.fact.object, path + [fact], depth + 1)
+
+    _traverse(start, [], 0)
+    return results
+
+
+def as_ids(results):
+    return [(entity, [c.cell_id for c in path]) for entity, path in results]
+
+
+@pytest.fixture
+def ownership(chain):
+    rng = random.Random(3)
+    for i in range(10, 400):
+        owner = f"entity:{rng.randrange(40)}"
+        owned = f"entity:{rng.randrange(40)}"
+        valid_to = ts(i + rng.randrange(1, 200)) if rng.random() < 0.3 else None
+        chain.append(edge_cell(
+            chain, i, owner, rng.choice(["owns", "controls"]), owned,
+            rng.choice(QUALITIES), valid_to
+        ))
+    return chain
+
+
+class TestMatchesReference:
+
+    @pytest.mark.parametrize("max_depth", [0, 1, 3, 10])
+    def test_random_graphs(self, ownership, max_depth):
+        scholar = create_scholar(ownership)
+        rng = random.Random(max_depth)
+        for _ in range(15):
+            start = f"entity:{rng.randrange(40)}"
+            vt, st = ts(rng.randrange(10, 450)), ts(rng.randrange(10, 450))
+            predicates = rng.choice([["owns"], ["owns", "controls"], ["controls", "owns"]])
+            expected = reference_traverse(scholar, "corp.hr", start, predicates, "corp.hr", max_depth, vt, st)
+            actual = scholar.traverse("corp.hr", start, predicates, "corp.hr", max_depth, vt, st)
+            assert as_ids(actual) == as_ids(expected)
+
+    def test_empty_object_uses_general_query(self, chain):
+        chain.append(edge_cell(chain, 10, "entity:a", "owns", "", SourceQuality.VERIFIED))
+        chain.append(edge_cell(chain, 11, "entity:b", "owns", "entity:c", SourceQuality.VERIFIED))
+        scholar = create_scholar(chain)
+        args = ("corp.hr", "entity:a", ["owns"], "corp.hr", 5, ts(100), ts(100))
+        assert as_ids(scholar.traverse(*args)) == as_ids(reference_traverse(scholar, *args))
+
+
+class TestVisibility:
+
+    def test_denied_returns_start_only(self, ownership):
+        scholar = create_scholar(ownership)
+        assert scholar.traverse("corp.sales", "entity:1", ["owns"], "corp.hr",
+                                at_valid_time=ts(450), as_of_system_time=ts(450)) == [("entity:1", [])]
+
+    def test_bridged_requester(self, ownership):
+        ownership.append(bridge_cell(ownership, 500, "corp.sales", "corp.hr"))
+        scholar = create_scholar(ownership)
+        args = ("corp.sales", "entity:1", ["owns", "controls"], "corp.hr", 10, ts(600), ts(600))
+        assert as_ids(scholar.traverse(*args)) == as_ids(reference_traverse(scholar, *args))
+
+
+class TestBudget:
+
+    def test_max_nodes_is_prefix(self, ownership):
+        scholar = create_scholar(ownership)
+        full = scholar.traverse("corp.hr", "entity:1", ["owns", "controls"], "corp.hr",
+                                at_valid_time=ts(450), as_of_system_time=ts(450))
+        assert len(full) > 3
+        for budget in (1, 3, len(full) + 5):
+            limited = scholar.traverse("corp.hr", "entity:1", ["owns", "controls"], "corp.hr",
+                                       at_valid_time=ts(450), as_of_system_time=ts(450),
+                                       max_nodes=budget)
+            assert as_ids(limited) == as_ids(full[:budget])
@@ -0,0 +1,166 @@
+"""
+Tests for the DecisionCell verified-seal memo.
+
+Tests cover:
+1. verify_integrity() does not rehash an unchanged, already-verified cell
+2. Any change to a seal input (attribute, object.__setattr__, the evidence
+   list) is still detected; structured objects are always rehashed
+3. reverify() always rehashes; trusted restores start unverified
+4. Re-appending shadow cells to many forks costs no hashing
+"""
+
+import copy
+
+import pytest
+
+from decisiongraph import (
+    CellType,
+    DecisionCell,
+    Evidence,
+    Fact,
+    Header,
+    LogicAnchor,
+    Proof,
+    SourceQuality,
+    compute_rule_logic_hash,
+    fork_shadow_chain,
+)
+from decisiongraph.cell import HASH_SCHEME_CANONICAL
+
+from test_utils import fact_cell, ts
+
+
+@pytest.fixture
+def hashes(monkeypatch):
+    """Count compute_cell_id() calls."""
+    calls = []
+    original = DecisionCell.compute_cell_id
+
+    def counting(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(DecisionCell, "compute_cell_id", counting)
+    return calls
+
+
+PAYLOAD = {"outcome": "pay", "reasons": ["RC-1", "RC-2"], "amount": 100, "approved": True}
+
+
+def canonical_cell(chain, i: int, obj="pay") -> DecisionCell:
+    """Canonical-scheme cell (seals confidence, evidence and proof too)."""
+    return DecisionCell(
+        header=Header(
+            version="1.3",
+            graph_id=chain.graph_id,
+            cell_type=CellType.JUDGMENT,
+            system_time=ts(i),
+            prev_cell_hash=chain.head.cell_id,
+            hash_scheme=HASH_SCHEME_CANONICAL
+        ),
+        fact=Fact(
+            namespace="corp.hr",
+            subject=f"case:{i}",
+            predicate="judged",
+            object=obj,
+            confidence=0.9,
+            source_quality=SourceQuality.SELF_REPORTED,
+            valid_from=ts(i)
+        ),
+        logic_anchor=LogicAnchor(rule_id="rule:x", rule_logic_hash=compute_rule_logic_hash("x")),
+        evidence=[Evidence(type="doc", cid="cid-1")],
+        proof=Proof(signer_id="system:test")
+    )
+
+
+class TestMemo:
+
+    def test_verified_cell_is_not_rehashed(self, chain, hashes):
+        cell = canonical_cell(chain, 10)
+        assert len(hashes) == 1  # construction
+        for _ in range(5):
+            assert cell.verify_integrity()
+        assert len(hashes) == 1
+
+    def test_structured_object_always_rehashed(self, chain, hashes):
+        cell = canonical_cell(chain, 10, copy.deepcopy(PAYLOAD))
+        assert cell.verify_integrity() and cell.verify_integrity()
+        assert len(hashes) == 3
+        assert cell._seal_memo is None  # no copy of the payload is kept
+
+    def test_reverify_always_hashes(self, chain, hashes):
+        cell = canonical_cell(chain, 10)
+        assert cell.reverify() and cell.reverify()
+        assert len(hashes) == 3
+
+    @pytest.mark.parametrize("tamper", [
+        lambda c: setattr(c.fact, "object", "TAMPERED"),
+        lambda c: object.__setattr__(c.header, "system_time", ts(99)),
+        lambda c: setattr(c.fact, "confidence", 1.0),
+        lambda c: c.evidence.append(Evidence(type="doc", cid="cid-2")),
+        lambda c: setattr(c.evidence[0], "cid", "cid-forged"),
+        lambda c: setattr(c.proof, "signature_required", True),
+        lambda c: setattr(c, "fact", Fact(**{**vars(c.fact), "subject": "employee:forged"})),
+    ])
+    def test_tampering_is_detected(self, chain, tamper):
+        cell = canonical_cell(chain, 10)
+        assert cell.verify_integrity()
+        tamper(cell)
+        assert not cell.verify_integrity()
+        assert not cell.verify_integrity()  # failures are never memoized
+
+    @pytest.mark.parametrize("tamper", [
+        lambda o: o["reasons"].append("RC-3"),
+        lambda o: o.update(amount=101),
+        lambda o: o.update(approved=1),  # == True, but hashes differently
+    ])
+    def test_structured_tampering_is_detected(self, chain, tamper):
+        cell = canonical_cell(chain, 10, copy.deepcopy(PAYLOAD))
+        assert cell.verify_integrity()
+        tamper(cell.fact.object)
+        assert not cell.verify_integrity()
+
+    def test_deep_copy_keeps_memo_but_sees_tampering(self, chain, hashes):
+        cell = canonical_cell(chain, 10)
+        clone = copy.deepcopy(cell)
+        assert clone.verify_integrity() and len(hashes) == 1
+        object.__setattr__(clone.fact, "predicate", "forged")
+        assert not clone.verify_integrity()
+        assert cell.verify_integrity()
+
+    def test_trusted_restore_starts_unverified(self, chain, hashes):
+        data = canonical_cell(chain, 10).to_dict()
+        restored = DecisionCell.from_trusted_dict(data)
+        assert len(hashes) == 1
+        assert restored.verify_integrity() and len(hashes) == 2
+        assert restored.verify_integrity() and len(hashes) == 2
+
+        data["fact"]["subject"] = "case:forged"
+        assert not DecisionCell.from_trusted_dict(data).verify_integrity()
+
+
+class TestChainUse:
+
+    def test_shadow_reappends_cost_no_hashing(self, chain, hashes):
+        shadow_cells = []
+        base = fork_shadow_chain(chain)
+        for i in range(10, 20):
+            cell = fact_cell(base, i)
+            base.append(cell)
+            shadow_cells.append(cell)
+        hashes.clear()
+
+        for _ in range(50):
+            fork = fork_shadow_chain(chain)
+            for cell in shadow_cells:
+                fork.append(cell)
+        assert hashes == []
+
+    def test_validate_reverify(self, chain, hashes):
+        for i in range(10, 20):
+            chain.append(fact_cell(chain, i))
+        hashes.clear()
+        assert chain.validate().is_valid
+        assert len(hashes) == 0
+        assert chain.validate(reverify=True).is_valid
+        assert len(hashes) == len(chain.cells)
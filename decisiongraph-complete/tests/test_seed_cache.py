@@ -0,0 +1,144 @@
+"""
+Tests for DecisionGraph Seed Cache Module
+
+Tests cover:
+1. Round trip: cached payloads equal the generated ones
+2. load_or_generate_seeds hit/miss behaviour
+3. Cache key covers arguments (defaults included) and the as-of date
+4. Corrupted or foreign files are misses, never errors
+5. Pruning of superseded files
+"""
+
+import pytest
+
+from decisiongraph.aml_seed_generator import generate_all_banking_seeds
+from decisiongraph.seed_cache import (
+    SeedCacheError,
+    decode_seed_cache,
+    encode_seed_cache,
+    load_or_generate_seeds,
+    read_seed_cache,
+    seed_cache_key,
+    seed_cache_path,
+)
+
+CALLS = []
+
+
+def small_banking_seeds(total: int = 40, random_seed: int = 42):
+    """Counting wrapper so tests can see when generation actually runs."""
+    CALLS.append(total)
+    return generate_all_banking_seeds(total=total, random_seed=random_seed)
+
+
+def other_generator(total: int = 40):
+    return generate_all_banking_seeds(total=total)
+
+
+@pytest.fixture(scope="module")
+def seeds():
+    return generate_all_banking_seeds(total=40)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    CALLS.clear()
+    return tmp_path / "seed_cache"
+
+
+KEY = "ab" * 32
+
+
+class TestRoundTrip:
+
+    def test_payloads_identical(self, seeds):
+        restored = decode_seed_cache(encode_seed_cache(seeds, KEY), KEY)
+        assert restored == seeds
+        assert [p.to_dict() for p in restored] == [p.to_dict() for p in seeds]
+
+    def test_mutable_fields_not_shared(self, seeds):
+        restored = decode_seed_cache(encode_seed_cache(seeds, KEY))
+        same_codes = [p for p in restored if p.exclusion_codes == restored[0].exclusion_codes]
+        assert len(same_codes) > 1
+        assert same_codes[0].exclusion_codes is not same_codes[1].exclusion_codes
+        assert restored[0].anchor_facts is not restored[1].anchor_facts
+
+    def test_interning_keeps_bool_and_int_apart(self, seeds):
+        payload = decode_seed_cache(encode_seed_cache(seeds, KEY))[0]
+        assert payload.appealed is False
+        assert all(
+            type(a.value) is type(b.value)
+            for p, q in zip(seeds, decode_seed_cache(encode_seed_cache(seeds, KEY)))
+            for a, b in zip(p.anchor_facts, q.anchor_facts)
+        )
+
+
+class TestLoadOrGenerate:
+
+    def test_miss_then_hit(self, cache_dir):
+        first = load_or_generate_seeds(small_banking_seeds, cache_dir)
+        second = load_or_generate_seeds(small_banking_seeds, cache_dir)
+        assert (first.hit, second.hit) == (False, True)
+        assert CALLS == [40]
+        assert second.payloads == first.payloads
+        assert second.path.exists()
+
+    def test_hit_pins_precedent_ids(self, cache_dir):
+        first = load_or_generate_seeds(small_banking_seeds, cache_dir)
+        second = load_or_generate_seeds(small_banking_seeds, cache_dir)
+        assert [p.precedent_id for p in first.payloads] == [p.precedent_id for p in second.payloads]
+
+    def test_corrupt_file_regenerated(self, cache_dir):
+        first = load_or_generate_seeds(small_banking_seeds, cache_dir)
+        data = bytearray(first.path.read_bytes())
+        data[len(data) // 2] ^= 0xFF
+        first.path.write_bytes(bytes(data))
+
+        with pytest.raises(SeedCacheError, match="CRC"):
+            read_seed_cache(first.path)
+        again = load_or_generate_seeds(small_banking_seeds, cache_dir)
+        assert not again.hit
+        assert read_seed_cache(again.path, again.key) == again.payloads
+
+    def test_wrong_key_rejected(self, cache_dir):
+        first = load_or_generate_seeds(small_banking_seeds, cache_dir)
+        with pytest.raises(SeedCacheError, match="key"):
+            read_seed_cache(first.path, KEY)
+
+    def test_unwritable_cache_dir_still_generates(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x")
+        result = load_or_generate_seeds(small_banking_seeds, blocker / "cache")
+        assert not result.hit
+        assert len(result.payloads) > 0
+
+
+class TestCacheKey:
+
+    def test_defaults_bound(self):
+        assert seed_cache_key(small_banking_seeds, {}, "2026-01-01") == \
+            seed_cache_key(small_banking_seeds, {"total": 40, "random_seed": 42}, "2026-01-01")
+
+    def test_params_and_date_change_key(self):
+        base = seed_cache_key(small_banking_seeds, {}, "2026-01-01")
+        assert seed_cache_key(small_banking_seeds, {"total": 41}, "2026-01-01") != base
+        assert seed_cache_key(small_banking_seeds, {"random_seed": 7}, "2026-01-01") != base
+        assert seed_cache_key(small_banking_seeds, {}, "2026-01-02") != base
+        assert seed_cache_key(other_generator, {}, "2026-01-01") != base
+
+    def test_unknown_param_rejected(self):
+        with pytest.raises(TypeError):
+            seed_cache_key(small_banking_seeds, {"salt": "x"})
+
+
+class TestPruning:
+
+    def test_superseded_files_removed(self, cache_dir):
+        old = load_or_generate_seeds(small_banking_seeds, cache_dir, as_of="2026-01-01")
+        other = load_or_generate_seeds(other_generator, cache_dir, as_of="2026-01-01")
+        new = load_or_generate_seeds(small_banking_seeds, cache_dir, as_of="2026-01-02")
+
+        assert not old.path.exists()
+        assert new.path.exists()
+        assert other.path.exists()
+        assert new.path == seed_cache_path(cache_dir, small_banking_seeds, new.key)
@@ -0,0 +1,179 @@
+"""
+Tests for the process-wide seed pool (service/seed_pool.py).
+
+Tests cover:
+1. Precomputed views (by id, scenario histogram, simulator seed dicts)
+2. Generated once per process and shared by the routers
+3. Recovery from a precedent chain keeps the persisted precedent_ids
+4. The service reuses its precedent WAL only for a complete load of the
+   current seed configuration
+"""
+
+from pathlib import Path
+
+import pytest
+
+from decisiongraph.chain import Chain
+from decisiongraph.judgment import create_judgment_cell
+from decisiongraph.persistent_chain import PersistentChain
+from service import seed_pool
+from service.seed_pool import SeedPool, get_seed_pool, reset_seed_pool, set_seed_pool
+
+
+@pytest.fixture(scope="module")
+def pool():
+    return SeedPool.generate(total=60)
+
+
+@pytest.fixture
+def installed(pool):
+    set_seed_pool(pool)
+    yield pool
+    reset_seed_pool()
+
+
+class TestViews:
+
+    def test_by_id(self, pool):
+        for payload in pool.payloads:
+            assert pool.get(payload.precedent_id) is payload
+        assert pool.get("missing") is None
+
+    def test_scenario_histogram(self, pool):
+        assert sum(s["count"] for s in pool.scenario_histogram) == len(pool)
+        for entry in pool.scenario_histogram:
+            assert pool.get(entry["sample_id"]).scenario_code == entry["scenario_code"]
+
+    def test_seed_dicts(self, pool):
+        assert len(pool.seed_dicts) == len(pool)
+        seed = pool.seed_dicts_by_id[pool.payloads[0].precedent_id]
+        assert seed["outcome"]["reporting"] == pool.payloads[0].reporting_obligation
+        assert seed["outcome"]["disposition"] in {"ALLOW", "EDD", "BLOCK"}
+
+
+class TestProcessWide:
+
+    def test_generated_once(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            SeedPool, "generate", classmethod(lambda cls, **kwargs: calls.append(1) or cls([]))
+        )
+        reset_seed_pool()
+        try:
+            assert get_seed_pool() is get_seed_pool()
+            assert calls == [1]
+        finally:
+            reset_seed_pool()
+
+    def test_routers_share_pool(self, installed, monkeypatch):
+        from service.routers import policy_shifts, simulate
+
+        monkeypatch.setattr(simulate, "_cache", {})
+        monkeypatch.setattr(policy_shifts, "_cache", {})
+        assert simulate._get_simulator().seeds is installed.seed_dicts
+        seeds, _, lookup = policy_shifts._ensure_shadows()
+        assert seeds is installed.seed_dicts
+        assert lookup is installed.seed_dicts_by_id
+
+
+class TestFromChain:
+
+    def test_round_trip_keeps_ids(self, pool):
+        chain = Chain()
+        genesis = chain.initialize(
+            graph_name="BankingPrecedents",
+            root_namespace="banking",
+            hash_scheme="canon:rfc8785:v1",
+        )
+        for payload in pool.payloads[:10]:
+            chain.append(create_judgment_cell(
+                payload=payload,
+                namespace="banking.aml.txn",
+                graph_id=genesis.header.graph_id,
+                prev_cell_hash=chain.head.cell_id,
+            ))
+
+        recovered = SeedPool.from_chain(chain)
+        assert recovered.source == "chain"
+        assert recovered.payloads == pool.payloads[:10]
+        assert seed_pool.payload_to_seed_dict(recovered.payloads[0]) == pool.seed_dicts[0]
+
+
+@pytest.fixture
+def service(installed, tmp_path, monkeypatch):
+    """service.main with a fresh precedent WAL dir; its globals are restored."""
+    from service import main
+
+    for name in ("PRECEDENT_CHAIN", "PRECEDENT_REGISTRY", "PRECEDENTS_LOADED",
+                 "PRECEDENT_COUNT", "_PRECEDENT_INDEXES"):
+        monkeypatch.setattr(main, name, getattr(main, name))
+    monkeypatch.setattr(main, "DG_PRECEDENT_WAL_DIR", str(tmp_path / "wal"))
+    yield main
+    if isinstance(main.PRECEDENT_CHAIN, PersistentChain):
+        main.PRECEDENT_CHAIN.close()
+
+
+class TestPrecedentWAL:
+
+    def boot(self, service):
+        if isinstance(service.PRECEDENT_CHAIN, PersistentChain):
+            service.PRECEDENT_CHAIN.close()
+        return service.load_precedent_seeds()
+
+    def test_warm_start_reuses_wal(self, service, installed):
+        assert self.boot(service) == len(installed)
+        assert service.PRECEDENT_CHAIN.last_rehydration is None  # generated
+
+        assert self.boot(service) == len(installed)
+        assert service.PRECEDENT_CHAIN.last_rehydration.used_checkpoint
+        assert get_seed_pool().source == "chain"
+
+    def test_salt_change_regenerates(self, service, installed, monkeypatch):
+        self.boot(service)
+        monkeypatch.setattr(service, "DG_PRECEDENT_SALT", "rotated-salt")
+
+        assert self.boot(service) == len(installed)
+        assert service.PRECEDENT_CHAIN.last_rehydration is None
+        assert (Path(service.DG_PRECEDENT_WAL_DIR).parent / "wal.stale").is_dir()
+
+        assert self.boot(service) == len(installed)  # new WAL carries the new digest
+        assert service.PRECEDENT_CHAIN.last_rehydration.used_checkpoint
+
+    def test_truncated_seed_load_regenerates(self, service, installed, monkeypatch):
+        create_cell = service.create_judgment_cell
+
+        def crash_after_ten(*args, **kwargs):
+            if len(service.PRECEDENT_CHAIN) > 10:
+                raise RuntimeError("killed mid-load")
+            return create_cell(*args, **kwargs)
+
+        monkeypatch.setattr(service, "create_judgment_cell", crash_after_ten)
+        assert self.boot(service) == 0
+        partial = service.PRECEDENT_CHAIN
+        partial.close(checkpoint=False)  # the process died: records on disk, no checkpoint
+        assert PersistentChain.exists(service.DG_PRECEDENT_WAL_DIR)
+        monkeypatch.setattr(service, "create_judgment_cell", create_cell)
+
+        assert self.boot(service) == len(installed)
+        assert service.PRECEDENT_CHAIN.last_rehydration is None
+        assert len(service.PRECEDENT_CHAIN) == len(installed) + 1
+
+    def test_corrupt_wal_regenerates(self, service, installed):
+        self.boot(service)
+        service.PRECEDENT_CHAIN.close()
+        wal_dir = Path(service.DG_PRECEDENT_WAL_DIR)
+        for segment in wal_dir.glob("*.wal"):
+            segment.write_bytes(b"garbage" * 20)
+
+        assert self.boot(service) == len(installed)
+        assert service.PRECEDENTS_LOADED
+        assert service.PRECEDENT_CHAIN.last_rehydration is None
+
+    def test_read_only_worker_leaves_rejected_wal(self, service, installed, monkeypatch):
+        self.boot(service)
+        service.PRECEDENT_CHAIN.close()
+        monkeypatch.setattr(service, "DG_ENGINE_VERSION", "other-engine")
+
+        assert service.load_precedent_seeds(read_only=True) == len(installed)
+        assert not isinstance(service.PRECEDENT_CHAIN, PersistentChain)
+        assert PersistentChain.exists(service.DG_PRECEDENT_WAL_DIR)
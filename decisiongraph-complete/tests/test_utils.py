@@ -5,6 +5,21 @@ Fixed test times to ensure deterministic, non-flaky tests.
 Rule: tests must NOT call now() or get_current_timestamp().
 """
 
+from decisiongraph import (
+    CellType,
+    DecisionCell,
+    Fact,
+    Header,
+    LogicAnchor,
+    Proof,
+    Signature,
+    SourceQuality,
+    compute_rule_logic_hash,
+    create_bridge_rule,
+)
+from decisiongraph.namespace import build_registry_from_chain
+from decisiongraph.scholar import build_index_from_chain
+
 # Base test time - all tests use offsets from this
 BASE_TEST_TIME = "2026-01-27T10:00:00Z"
 
@@ -23,3 +38,68 @@ T_FUTURE = "2026-02-01T00:00:00Z"
 T_PAST_JAN = "2025-01-15T00:00:00Z"
 T_PAST_JUN = "2025-06-01T00:00:00Z"
 T_PAST_AUG = "2025-08-15T00:00:00Z"
+
+
+# Shared cell builders (the ``chain`` fixture lives in conftest.py)
+
+def ts(i: int) -> str:
+    """The i-th second after 11:00 on the base test day."""
+    return f"2026-01-27T11:{i // 60:02d}:{i % 60:02d}Z"
+
+
+def fact_cell(chain, i: int, namespace: str = "corp.hr", subject: str = None) -> DecisionCell:
+    return DecisionCell(
+        header=Header(
+            version="1.3",
+            graph_id=chain.graph_id,
+            cell_type=CellType.FACT,
+            system_time=ts(i),
+            prev_cell_hash=chain.head.cell_id
+        ),
+        fact=Fact(
+            namespace=namespace,
+            subject=subject or f"employee:{i % 7}",
+            predicate=f"attr_{i % 3}",
+            object=str(i),
+            confidence=1.0,
+            source_quality=SourceQuality.VERIFIED,
+            valid_from=ts(i)
+        ),
+        logic_anchor=LogicAnchor(
+            rule_id="source:hris",
+            rule_logic_hash=compute_rule_logic_hash("HRIS Export")
+        ),
+        proof=Proof(signer_id="system:hris")
+    )
+
+
+def bridge_cell(chain, i: int, source: str, target: str) -> DecisionCell:
+    return create_bridge_rule(
+        source_namespace=source,
+        target_namespace=target,
+        source_owner_signature=Signature(signer_id="role:a", signature="sig_a", timestamp=ts(i)),
+        target_owner_signature=Signature(signer_id="role:b", signature="sig_b", timestamp=ts(i)),
+        graph_id=chain.graph_id,
+        prev_cell_hash=chain.head.cell_id,
+        system_time=ts(i),
+        valid_from=ts(i)
+    )
+
+
+def query(scholar, requester="corp.hr", subject=None, at=None):
+    return scholar.query_facts(
+        requester_namespace=requester,
+        namespace="corp.hr",
+        subject=subject,
+        at_valid_time=at or ts(3599),
+        as_of_system_time=at or ts(3599)
+    )
+
+
+def assert_matches_full_build(scholar):
+    full_index = build_index_from_chain(scholar.chain)
+    full_registry = build_registry_from_chain(scholar.chain.cells)
+    assert scholar.index.by_namespace == full_index.by_namespace
+    assert scholar.index.by_key == full_index.by_key
+    assert scholar.index.by_ns_subject == full_index.by_ns_subject
+    assert scholar.registry == full_registry
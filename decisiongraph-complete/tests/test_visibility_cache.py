@@ -0,0 +1,179 @@
+"""
+Tests for the Scholar namespace visibility / bridge closure cache.
+
+Tests cover:
+1. Closures are built once per requester and reused across checks
+2. Bridge verdicts (direct, via parent, not yet known, expired, revoked)
+3. Invalidation only for requesters an appended bridge/revocation affects
+4. visible_namespaces shares the closure and tracks namespace definitions
+5. Appends racing a closure build never leave a stale closure cached
+"""
+
+import threading
+import time
+
+from decisiongraph import (
+    BridgeEffectivenessReason,
+    Scholar,
+    Signature,
+    create_bridge_revocation,
+    create_bridge_rule,
+    create_namespace_definition,
+    create_scholar,
+)
+
+from test_utils import bridge_cell, fact_cell, ts
+
+
+def check(scholar, requester, target="corp.hr", at=3000, known=3000):
+    return scholar.check_visibility(requester, target, ts(at), ts(known))
+
+
+class TestClosureReuse:
+
+    def test_closure_built_once(self, chain):
+        chain.append(bridge_cell(chain, 10, "corp.sales", "corp.hr"))
+        scholar = create_scholar(chain)
+        first = check(scholar, "corp.sales")
+        closure = scholar._visibility["corp.sales"]
+        for at in range(20, 40):
+            assert check(scholar, "corp.sales", at=at) == first
+        assert scholar._visibility["corp.sales"] is closure
+
+    def test_traverse_reuses_closure(self, chain):
+        for i in range(10, 20):
+            chain.append(fact_cell(chain, i, subject=f"employee:{i}"))
+        chain.append(bridge_cell(chain, 30, "corp.sales", "corp.hr"))
+        scholar = create_scholar(chain)
+        scholar.traverse("corp.sales", "employee:10", ["attr_0", "attr_1"], namespace="corp.hr",
+                         at_valid_time=ts(3000), as_of_system_time=ts(3000))
+        closure = scholar._visibility["corp.sales"]
+        scholar.traverse("corp.sales", "employee:11", ["attr_0", "attr_1"], namespace="corp.hr",
+                         at_valid_time=ts(3000), as_of_system_time=ts(3000))
+        assert scholar._visibility["corp.sales"] is closure
+
+
+class TestBridgeVerdicts:
+
+    def test_direct_and_via_parent(self, chain):
+        bridge = bridge_cell(chain, 10, "corp.sales", "corp.hr")
+        chain.append(bridge)
+        scholar = create_scholar(chain)
+
+        direct = check(scholar, "corp.sales")
+        assert (direct.allowed, direct.reason, direct.bridges_used) == (True, "bridge", [bridge.cell_id])
+
+        child = check(scholar, "corp.sales.emea")
+        assert (child.allowed, child.reason, child.bridges_used) == \
+            (True, "bridge_via_parent", [bridge.cell_id])
+
+        assert check(scholar, "corp.finance").reason == "no_access"
+
+    def test_bitemporal_clocks(self, chain):
+        bridge = create_bridge_rule(
+            source_namespace="corp.sales",
+            target_namespace="corp.hr",
+            source_owner_signature=Signature(signer_id="a", signature="sig_a", timestamp=ts(10)),
+            target_owner_signature=Signature(signer_id="b", signature="sig_b", timestamp=ts(10)),
+            graph_id=chain.graph_id,
+            prev_cell_hash=chain.head.cell_id,
+            system_time=ts(10),
+            valid_from=ts(100),
+            expiry=ts(200),
+        )
+        chain.append(bridge)
+        scholar = create_scholar(chain)
+
+        def reason(at, known):
+            return check(scholar, "corp.sales", at=at, known=known).bridge_effectiveness[0].reason
+
+        assert reason(150, 5) == BridgeEffectivenessReason.BRIDGE_NOT_YET_KNOWN
+        assert reason(50, 3000) == BridgeEffectivenessReason.BRIDGE_NOT_ACTIVE
+        assert reason(150, 3000) == BridgeEffectivenessReason.AUTHORIZED
+        assert reason(250, 3000) == BridgeEffectivenessReason.BRIDGE_EXPIRED
+
+
+class TestInvalidation:
+
+    def test_new_bridge_invalidates_affected_requesters_only(self, chain):
+        scholar = create_scholar(chain)
+        assert not check(scholar, "corp.sales.emea").allowed
+        check(scholar, "corp.finance")
+        finance_closure = scholar._visibility["corp.finance"]
+
+        chain.append(bridge_cell(chain, 10, "corp.sales", "corp.hr"))
+        assert "corp.sales.emea" not in scholar._visibility
+        assert scholar._visibility["corp.finance"] is finance_closure
+        assert check(scholar, "corp.sales.emea").allowed
+
+    def test_revocation(self, chain):
+        bridge = bridge_cell(chain, 10, "corp.sales", "corp.hr")
+        chain.append(bridge)
+        scholar = create_scholar(chain)
+        assert check(scholar, "corp.sales").allowed
+
+        chain.append(create_bridge_revocation(
+            bridge_cell_id=bridge.cell_id,
+            revoked_by="role:owner",
+            reason="test",
+            graph_id=chain.graph_id,
+            prev_cell_hash=chain.head.cell_id
+        ))
+        result = check(scholar, "corp.sales")
+        assert not result.allowed
+        assert result.bridge_effectiveness[0].reason == BridgeEffectivenessReason.BRIDGE_REVOKED
+
+
+class TestVisibleNamespaces:
+
+    def test_bridges_and_namespace_defs(self, chain):
+        scholar = create_scholar(chain)
+        assert scholar.visible_namespaces("corp.sales") == {"corp", "corp.sales"}
+
+        chain.append(bridge_cell(chain, 10, "corp.sales", "corp.hr"))
+        assert scholar.visible_namespaces("corp.sales") == {"corp", "corp.sales", "corp.hr"}
+
+        chain.append(create_namespace_definition(
+            namespace="corp.sales.emea",
+            owner="role:owner",
+            graph_id=chain.graph_id,
+            prev_cell_hash=chain.head.cell_id,
+            system_time=ts(11)
+        ))
+        visible = scholar.visible_namespaces("corp.sales")
+        assert visible == {"corp", "corp.sales", "corp.sales.emea", "corp.hr"}
+
+        visible.add("mutated")
+        assert "mutated" not in scholar.visible_namespaces("corp.sales")
+
+
+class TestConcurrentAppends:
+
+    def test_revocation_during_closure_build(self, chain, monkeypatch):
+        bridge = bridge_cell(chain, 10, "corp.sales", "corp.hr")
+        chain.append(bridge)
+        scholar = create_scholar(chain)
+        revocation = create_bridge_revocation(
+            bridge_cell_id=bridge.cell_id,
+            revoked_by="role:owner",
+            reason="test",
+            graph_id=chain.graph_id,
+            prev_cell_hash=chain.head.cell_id
+        )
+        appender = threading.Thread(target=chain.append, args=(revocation,))
+        build = Scholar._build_visibility_closure
+
+        def racing_build(self, requester_namespace):
+            closure = build(self, requester_namespace)
+            appender.start()
+            time.sleep(0.05)  # give the append every chance to land before the insert
+            return closure
+
+        monkeypatch.setattr(Scholar, "_build_visibility_closure", racing_build)
+        check(scholar, "corp.sales")
+        appender.join()
+        monkeypatch.undo()
+
+        result = check(scholar, "corp.sales")
+        assert not result.allowed
+        assert result.bridge_effectiveness[0].reason == BridgeEffectivenessReason.BRIDGE_REVOKED
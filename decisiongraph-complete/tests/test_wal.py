@@ -15,6 +15,7 @@ import hashlib
 import os
 import struct
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -538,6 +539,152 @@ class TestCrashRecovery:
         reader = WALReader(temp_wal_path)
         assert reader.count() == 2
 
+    def test_unknown_policy_rejected(self, temp_wal_path):
+        with pytest.raises(ValueError, match="fsync_policy"):
+            WALWriter.create(temp_wal_path, "test", "graph", fsync_policy="sometimes")
+
+    def test_group_policy_single_writer(self, temp_wal_path, sample_canonical_bytes_list):
+        """A lone group-commit writer flushes after the window expires."""
+        with WALWriter.create(
+            temp_wal_path, "test", "graph",
+            fsync_policy="group", group_commit_window_ms=0.5,
+        ) as writer:
+            results = [writer.append(b) for b in sample_canonical_bytes_list]
+            # Durable on return: the bytes are already in the file
+            assert os.path.getsize(temp_wal_path) == results[-1][2]
+
+        records = list(WALReader(temp_wal_path))
+        assert [r.canonical_bytes for r in records] == sample_canonical_bytes_list
+        assert [r.compute_record_hash() for r in records] == [h for _, h, _ in results]
+
+    def test_group_policy_concurrent_writers(self, temp_wal_path):
+        """Concurrent appends are batched and every caller gets its own record."""
+        writer = WALWriter.create(
+            temp_wal_path, "test", "graph",
+            fsync_policy="group", group_commit_window_ms=5.0, group_commit_max_records=8,
+        )
+        results = {}
+
+        def worker(t):
+            for i in range(25):
+                payload = f'{{"t":{t},"i":{i}}}'.encode()
+                results[payload] = writer.append(payload)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.close()
+
+        records = list(WALReader(temp_wal_path))
+        assert len(records) == 200
+        assert [r.sequence for r in records] == list(range(200))
+        for record in records:
+            seq, record_hash, _ = results[record.canonical_bytes]
+            assert seq == record.sequence
+            assert record_hash == record.compute_record_hash()
+
+    def test_group_nowait_flushed_on_close(self, temp_wal_path, sample_canonical_bytes):
+        writer = WALWriter.create(temp_wal_path, "test", "graph", fsync_policy="group")
+        writer.append_nowait(sample_canonical_bytes)
+        writer.append_nowait(sample_canonical_bytes)
+        assert os.path.getsize(temp_wal_path) == HEADER_SIZE
+        writer.close()
+
+        assert WALReader(temp_wal_path).count() == 2
+
+    def test_group_reopen_continues_chain(self, temp_wal_path, sample_canonical_bytes):
+        with WALWriter.create(temp_wal_path, "test", "graph", fsync_policy="group") as writer:
+            writer.append(sample_canonical_bytes)
+        with WALWriter.open(temp_wal_path, fsync_policy="group") as writer:
+            seq, _, _ = writer.append(sample_canonical_bytes)
+        assert seq == 1
+        assert WALReader(temp_wal_path).count() == 2
+
+    @staticmethod
+    def _block_first_write(writer):
+        """Make the writer's first write() wait on an event (lock released)."""
+        entered = threading.Event()
+        release = threading.Event()
+        real_file = writer._file
+        calls = []
+
+        def write(data):
+            calls.append(data)
+            if len(calls) == 1:
+                entered.set()
+                release.wait(5)
+            return real_file.write(data)
+
+        writer._file = type("Blocking", (), {
+            "write": staticmethod(write),
+            "flush": real_file.flush,
+            "fileno": real_file.fileno,
+            "close": real_file.close,
+        })()
+        return entered, release
+
+    def test_group_append_during_close_rejected(self, temp_wal_path, sample_canonical_bytes):
+        """Appends racing a draining close() fail instead of being dropped."""
+        writer = WALWriter.create(temp_wal_path, "test", "graph", fsync_policy="group")
+        writer.append_nowait(sample_canonical_bytes)
+        entered, release = self._block_first_write(writer)
+
+        closer = threading.Thread(target=writer.close)
+        closer.start()
+        assert entered.wait(5)
+        try:
+            with pytest.raises(WALError, match="closed"):
+                writer.append(sample_canonical_bytes)
+        finally:
+            release.set()
+            closer.join()
+
+        assert [r.sequence for r in WALReader(temp_wal_path)] == [0]
+
+    def test_group_sync_drains_records_staged_mid_flush(self, temp_wal_path, sample_canonical_bytes):
+        """Records staged while sync() is writing are flushed before it returns."""
+        writer = WALWriter.create(temp_wal_path, "test", "graph", fsync_policy="group")
+        writer.append_nowait(sample_canonical_bytes)
+        entered, release = self._block_first_write(writer)
+
+        syncer = threading.Thread(target=writer.sync)
+        syncer.start()
+        assert entered.wait(5)
+        seq, _, offset = writer.append_nowait(sample_canonical_bytes)
+        release.set()
+        syncer.join()
+
+        assert seq == 1
+        assert writer._durable_sequence == 1
+        assert os.path.getsize(temp_wal_path) == offset
+        writer.close()
+        assert WALReader(temp_wal_path).count() == 2
+
+    def test_group_write_failure_is_sticky(self, temp_wal_path, sample_canonical_bytes):
+        writer = WALWriter.create(
+            temp_wal_path, "test", "graph",
+            fsync_policy="group", group_commit_window_ms=0.1,
+        )
+
+        def broken_write(data):
+            raise OSError("disk full")
+
+        real_file = writer._file
+        writer._file = type("Broken", (), {
+            "write": staticmethod(broken_write),
+            "flush": real_file.flush,
+            "fileno": real_file.fileno,
+            "close": real_file.close,
+        })()
+
+        with pytest.raises(WALError, match="group commit failed"):
+            writer.append(sample_canonical_bytes)
+        with pytest.raises(WALError, match="group commit failed"):
+            writer.append(sample_canonical_bytes)
+        real_file.close()
+
     def test_recover_partial_record_write(self, temp_wal_path, sample_canonical_bytes_list):
         """Simulate crash during record body write."""
         with WALWriter.create(temp_wal_path, "test", "graph") as writer:
@@ -754,6 +901,42 @@ class TestEdgeCases:
             writer.append(sample_canonical_bytes)
 
 
+# =============================================================================
+# TEST: BUFFER PARSING
+# =============================================================================
+
+class TestFromBuffer:
+    """WALRecord.from_buffer parses memoryview slices like from_bytes."""
+
+    def test_memoryview_matches_bytes(self, sample_canonical_bytes):
+        data = WALRecord.create(3, sample_canonical_bytes, b"\x11" * 32).to_bytes()
+        framed = memoryview(b"pad" + data + b"pad")[3:3 + len(data)]
+
+        from_view = WALRecord.from_buffer(framed, expected_sequence=3)
+        assert from_view == WALRecord.from_bytes(data)
+        assert isinstance(from_view.canonical_bytes, bytes)
+
+    def test_precomputed_record_hash_matches_repack(self, sample_canonical_bytes):
+        record = WALRecord.from_bytes(
+            WALRecord.create(0, sample_canonical_bytes, NULL_HASH_BYTES).to_bytes()
+        )
+        repacked = WALRecord(
+            sequence=record.sequence,
+            flags=record.flags,
+            prev_hash=record.prev_hash,
+            cell_hash=record.cell_hash,
+            canonical_bytes=record.canonical_bytes,
+            record_crc=record.record_crc,
+        )
+        assert record.compute_record_hash() == repacked.compute_record_hash()
+
+    def test_corrupt_buffer_rejected(self, sample_canonical_bytes):
+        data = bytearray(WALRecord.create(0, sample_canonical_bytes, NULL_HASH_BYTES).to_bytes())
+        data[80] ^= 0xFF
+        with pytest.raises(WALCorruptionError, match="CRC mismatch"):
+            WALRecord.from_buffer(memoryview(data))
+
+
 # =============================================================================
 # TEST: FSYNC POLICY
 # =============================================================================
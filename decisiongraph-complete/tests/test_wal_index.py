@@ -0,0 +1,200 @@
+"""
+Tests for DecisionGraph WAL Index Module
+
+Tests cover:
+1. Sidecars built during SegmentedWALWriter.append
+2. Random access by sequence and by cell_id
+3. Sidecar serialization and corruption handling
+4. Rebuilding sidecars from segments (sidecars are a cache)
+5. Lagging sidecars on the active segment
+"""
+
+import json
+
+import pytest
+
+from decisiongraph.segmented_wal import SegmentedWALReader, SegmentedWALWriter, list_segment_files
+from decisiongraph.wal_index import (
+    SegmentIndex,
+    WALIndex,
+    WALIndexError,
+    index_path,
+    load_segment_index,
+    read_segment_index,
+    rebuild_indexes_from_segments,
+)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def wal_dir(tmp_path):
+    """Provide a temporary WAL directory."""
+    return tmp_path / "wal"
+
+
+def cell_id_for(i):
+    return f"{i:064x}"
+
+
+def record_bytes(i):
+    return json.dumps({"cell_id": cell_id_for(i), "i": i}, sort_keys=True).encode()
+
+
+def write_wal(wal_dir, count, max_bytes=2048, index_interval=4, **kwargs):
+    with SegmentedWALWriter.create(
+        wal_dir, "test", "graph", max_bytes=max_bytes, index_interval=index_interval, **kwargs
+    ) as writer:
+        for i in range(count):
+            writer.append(record_bytes(i))
+
+
+# =============================================================================
+# TEST: BUILT DURING APPEND
+# =============================================================================
+
+class TestSidecarsOnAppend:
+    """The writer maintains a sidecar per segment."""
+
+    def test_sidecar_per_segment(self, wal_dir):
+        write_wal(wal_dir, 60)
+        segments = list_segment_files(wal_dir)
+        assert len(segments) > 1
+        for _, path in segments:
+            assert index_path(path).exists()
+
+    def test_sparse_entries_every_interval(self, wal_dir):
+        write_wal(wal_dir, 10, max_bytes=1 << 20, index_interval=4)
+        index = read_segment_index(list_segment_files(wal_dir)[0][1])
+        assert index.sparse_seqs == [0, 4, 8]
+        assert index.last_seq == 9
+        assert len(index.cells) == 10
+
+    def test_disabled_index_writes_no_sidecars(self, wal_dir):
+        write_wal(wal_dir, 5, index_interval=None)
+        assert not list(wal_dir.glob("*.idx"))
+
+    def test_explicit_cell_id(self, wal_dir):
+        with SegmentedWALWriter.create(wal_dir, "test", "graph") as writer:
+            writer.append(b'{"payload":1}', cell_id=cell_id_for(7))
+        record = SegmentedWALReader(wal_dir).get_cell(cell_id_for(7))
+        assert record.canonical_bytes == b'{"payload":1}'
+
+
+# =============================================================================
+# TEST: RANDOM ACCESS
+# =============================================================================
+
+class TestRandomAccess:
+    """get(sequence) and get_cell(cell_id) match a full scan."""
+
+    def test_get_every_sequence(self, wal_dir):
+        write_wal(wal_dir, 50)
+        reader = SegmentedWALReader(wal_dir)
+        by_seq = {r.sequence: r for r in reader}
+        for seq, record in by_seq.items():
+            assert reader.get(seq) == record
+
+    def test_get_cell(self, wal_dir):
+        write_wal(wal_dir, 50)
+        reader = SegmentedWALReader(wal_dir)
+        record = reader.get_cell(cell_id_for(37))
+        assert json.loads(record.canonical_bytes)["i"] == 37
+
+    def test_missing_lookups(self, wal_dir):
+        write_wal(wal_dir, 5)
+        reader = SegmentedWALReader(wal_dir)
+        assert reader.get(5) is None
+        assert reader.get(-1) is None
+        assert reader.get_cell(cell_id_for(99)) is None
+        assert reader.get_cell("not-a-cell-id") is None
+
+    def test_index_refreshes_after_new_appends(self, wal_dir):
+        writer = SegmentedWALWriter.create(wal_dir, "test", "graph", max_bytes=2048, index_interval=4)
+        for i in range(5):
+            writer.append(record_bytes(i))
+        writer.sync()
+        reader = SegmentedWALReader(wal_dir)
+        assert reader.get(4) is not None
+
+        for i in range(5, 40):
+            writer.append(record_bytes(i))
+        writer.sync()
+        assert json.loads(reader.get(39).canonical_bytes)["i"] == 39
+        assert reader.get_cell(cell_id_for(38)) is not None
+        writer.close()
+
+
+# =============================================================================
+# TEST: SIDECARS ARE A CACHE
+# =============================================================================
+
+class TestRebuild:
+    """Missing, corrupt or lagging sidecars are repaired from segments."""
+
+    def test_round_trip(self, wal_dir):
+        write_wal(wal_dir, 20, max_bytes=1 << 20)
+        path = list_segment_files(wal_dir)[0][1]
+        index = read_segment_index(path)
+        again = SegmentIndex.from_bytes(index.to_bytes(), index.segment_id)
+        assert again.sparse_seqs == index.sparse_seqs
+        assert again.sparse_offsets == index.sparse_offsets
+        assert again.cells == index.cells
+        assert again.covered_end == index.covered_end
+
+    def test_corrupt_sidecar_rejected(self, wal_dir):
+        write_wal(wal_dir, 5)
+        path = list_segment_files(wal_dir)[0][1]
+        data = bytearray(index_path(path).read_bytes())
+        data[20] ^= 0xFF
+        with pytest.raises(WALIndexError, match="CRC"):
+            SegmentIndex.from_bytes(bytes(data), 0)
+
+        index_path(path).write_bytes(bytes(data))
+        assert read_segment_index(path) is None
+        assert load_segment_index(path, 4).last_seq == 4
+
+    def test_missing_sidecars_rebuilt_on_read(self, wal_dir):
+        write_wal(wal_dir, 40)
+        expected = {r.sequence: r for r in SegmentedWALReader(wal_dir)}
+        for idx in wal_dir.glob("*.idx"):
+            idx.unlink()
+
+        reader = SegmentedWALReader(wal_dir)
+        assert reader.get(33) == expected[33]
+        assert reader.get_cell(cell_id_for(2)) == expected[2]
+
+    def test_rebuild_matches_incremental(self, wal_dir):
+        write_wal(wal_dir, 40)
+        built = {p: index_path(p).read_bytes() for _, p in list_segment_files(wal_dir)}
+        for idx in wal_dir.glob("*.idx"):
+            idx.unlink()
+
+        assert rebuild_indexes_from_segments(wal_dir, interval=4) == len(built)
+        for path, data in built.items():
+            assert index_path(path).read_bytes() == data
+
+    def test_lagging_sidecar_catches_up(self, wal_dir):
+        writer = SegmentedWALWriter.create(wal_dir, "test", "graph", index_interval=4)
+        for i in range(3):
+            writer.append(record_bytes(i))
+        writer.sync()  # sidecar covers 3 records
+        for i in range(3, 9):
+            writer.append(record_bytes(i))
+        writer._active_writer.close()  # crash: sidecar not rewritten
+
+        index = WALIndex(wal_dir)
+        assert index.segments[0].last_seq == 8
+        assert json.loads(index.get(8).canonical_bytes)["i"] == 8
+
+    def test_reopen_resumes_active_index(self, wal_dir):
+        write_wal(wal_dir, 6, max_bytes=1 << 20)
+        with SegmentedWALWriter.open(wal_dir, index_interval=4) as writer:
+            for i in range(6, 12):
+                writer.append(record_bytes(i))
+
+        index = read_segment_index(list_segment_files(wal_dir)[0][1])
+        assert index.sparse_seqs == [0, 4, 8]
+        assert len(index.cells) == 12